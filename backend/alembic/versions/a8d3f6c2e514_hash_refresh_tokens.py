@@ -0,0 +1,80 @@
+"""hash refresh tokens and track retired ones
+
+Revision ID: a8d3f6c2e514
+Revises: f4c2d8a1b9e7
+Create Date: 2026-10-19 15:47:52.118306
+
+"""
+
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d3f6c2e514"
+down_revision: Union[str, None] = "f4c2d8a1b9e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("sessions", sa.Column("refresh_token_hash", sa.String(length=64), nullable=True))
+
+    # Backfill digests so live sessions keep working, then drop the raw tokens.
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("UPDATE sessions SET refresh_token_hash = encode(sha256(convert_to(refresh_token, 'UTF8')), 'hex')")
+    else:
+        sessions = sa.table(
+            "sessions",
+            sa.column("id", sa.Integer),
+            sa.column("refresh_token", sa.String),
+            sa.column("refresh_token_hash", sa.String),
+        )
+        rows = bind.execute(sa.select(sessions.c.id, sessions.c.refresh_token)).all()
+        for row in rows:
+            bind.execute(
+                sessions.update()
+                .where(sessions.c.id == row.id)
+                .values(refresh_token_hash=hashlib.sha256(row.refresh_token.encode("utf-8")).hexdigest())
+            )
+
+    with op.batch_alter_table("sessions") as batch:
+        batch.alter_column("refresh_token_hash", existing_type=sa.String(length=64), nullable=False)
+        batch.create_unique_constraint("uq_sessions_refresh_token_hash", ["refresh_token_hash"])
+        batch.drop_column("refresh_token")
+
+    op.create_index("ix_sessions_expires_at", "sessions", ["expires_at"])
+    op.create_index(
+        "ix_sessions_revoked_updated_at",
+        "sessions",
+        ["updated_at"],
+        sqlite_where=sa.text("is_active = 0"),
+        postgresql_where=sa.text("NOT is_active"),
+    )
+
+    op.create_table(
+        "retired_refresh_tokens",
+        sa.Column("id", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("token_hash", sa.String(length=64), nullable=False, unique=True),
+        sa.Column("session_id", sa.Integer(), sa.ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False),
+    )
+    op.create_index("ix_retired_refresh_tokens_session_id", "retired_refresh_tokens", ["session_id"])
+
+
+def downgrade() -> None:
+    # Raw tokens cannot be recovered from digests; existing sessions are invalidated.
+    op.drop_index("ix_retired_refresh_tokens_session_id", table_name="retired_refresh_tokens")
+    op.drop_table("retired_refresh_tokens")
+    op.drop_index("ix_sessions_revoked_updated_at", table_name="sessions")
+    op.drop_index("ix_sessions_expires_at", table_name="sessions")
+    op.execute("DELETE FROM sessions")
+    with op.batch_alter_table("sessions") as batch:
+        batch.drop_constraint("uq_sessions_refresh_token_hash", type_="unique")
+        batch.drop_column("refresh_token_hash")
+        batch.add_column(sa.Column("refresh_token", sa.String(length=512), nullable=False))
@@ -0,0 +1,60 @@
+"""add hot path indexes
+
+Revision ID: c3a7e5d91f42
+Revises: 246426a8952d
+Create Date: 2026-10-19 10:12:41.208334
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a7e5d91f42"
+down_revision: Union[str, None] = "246426a8952d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # These tables are written on every request, so on PostgreSQL the indexes are
+    # built CONCURRENTLY (outside the migration transaction) to avoid blocking writes.
+    # Other dialects ignore the ``postgresql_*`` options.
+    with op.get_context().autocommit_block():
+        # Conversations are always filtered by creator; updated_at keeps ordered listings sort-free.
+        op.create_index(
+            "ix_conversations_creator_id_updated_at",
+            "conversations",
+            ["creator_id", "updated_at"],
+            postgresql_concurrently=True,
+        )
+        # Message history and the "last message" lookup are per conversation, newest first.
+        op.create_index(
+            "ix_messages_conversation_id_timestamp",
+            "messages",
+            ["conversation_id", "timestamp"],
+            postgresql_concurrently=True,
+        )
+        op.create_index("ix_messages_sender_id", "messages", ["sender_id"], postgresql_concurrently=True)
+        # Only live sessions are looked up per account, so a partial index stays small.
+        op.create_index(
+            "ix_sessions_account_id_active",
+            "sessions",
+            ["account_id"],
+            postgresql_where=sa.text("is_active"),
+            sqlite_where=sa.text("is_active = 1"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_sessions_account_id_active", table_name="sessions", postgresql_concurrently=True)
+        op.drop_index("ix_messages_sender_id", table_name="messages", postgresql_concurrently=True)
+        op.drop_index("ix_messages_conversation_id_timestamp", table_name="messages", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_conversations_creator_id_updated_at", table_name="conversations", postgresql_concurrently=True
+        )
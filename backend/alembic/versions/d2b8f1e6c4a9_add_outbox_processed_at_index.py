@@ -0,0 +1,31 @@
+"""add outbox processed_at index
+
+Revision ID: d2b8f1e6c4a9
+Revises: b5e1c9d7a3f8
+Create Date: 2026-10-19 18:05:42.118304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b8f1e6c4a9"
+down_revision: Union[str, None] = "b5e1c9d7a3f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The relay's retention step deletes delivered messages oldest first by ``processed_at``.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_outbox_messages_processed_at", "outbox_messages", ["processed_at"], postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_outbox_messages_processed_at", table_name="outbox_messages", postgresql_concurrently=True)
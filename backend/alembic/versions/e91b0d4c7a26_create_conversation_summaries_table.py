@@ -0,0 +1,47 @@
+"""create conversation summaries table
+
+Revision ID: e91b0d4c7a26
+Revises: c3a7e5d91f42
+Create Date: 2026-10-19 10:31:05.774120
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e91b0d4c7a26"
+down_revision: Union[str, None] = "c3a7e5d91f42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Denormalized read table behind the conversation list; it is maintained from
+    # domain events and can be repopulated at any time with
+    # ``RebuildConversationSummariesCommand``, hence no foreign keys.
+    op.create_table(
+        "conversation_summaries",
+        sa.Column("id", sa.String(), primary_key=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("creator_id", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("is_archived", sa.Boolean(), nullable=True),
+        sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_message_preview", sa.String(), nullable=True),
+        sa.Column("last_activity_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_conversation_summaries_creator_activity",
+        "conversation_summaries",
+        ["creator_id", "last_activity_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_conversation_summaries_creator_activity", table_name="conversation_summaries")
+    op.drop_table("conversation_summaries")
@@ -0,0 +1,30 @@
+"""add accounts keyset index
+
+Revision ID: f4c2d8a1b9e7
+Revises: e91b0d4c7a26
+Create Date: 2026-10-19 13:02:17.540981
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4c2d8a1b9e7"
+down_revision: Union[str, None] = "e91b0d4c7a26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Account listings page with ``(created_at, id) > cursor ORDER BY created_at, id``;
+    # this index turns every page into a range read.
+    with op.get_context().autocommit_block():
+        op.create_index("ix_accounts_created_at_id", "accounts", ["created_at", "id"], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_accounts_created_at_id", table_name="accounts", postgresql_concurrently=True)
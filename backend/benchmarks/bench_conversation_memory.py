@@ -0,0 +1,70 @@
+"""
+Benchmark prompt size over a long conversation: the whole history against a memory window.
+
+Replays ``--turns`` question/answer turns and, before each, formats the next prompt
+with ``LlamaFormatter`` from the full history (the previous behaviour) and from a
+``ConversationMemory`` window with a rolling summary. Reports prompt tokens at a few
+points, the prefill tokens summed over the conversation (what the model pays, turn
+after turn) and the cost of ``add_turn``. Tokens are estimated at four characters each.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_conversation_memory --turns 200 --window-tokens 1536
+"""
+
+import argparse
+import random
+import time
+
+from src.modules.llm_backend.infrastructure.processing.formatters import LlamaFormatter
+from src.modules.llm_backend.infrastructure.processing.memory import ConversationMemory, approximate_token_count
+
+WORDS = "model solver variable constraint objective bound integer linear feasible optimal dual".split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--window-tokens", type=int, default=1536)
+    parser.add_argument("--summary-tokens", type=int, default=256)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    formatter = LlamaFormatter(tokenizer=None)
+    memory = ConversationMemory(window_tokens=args.window_tokens, summary_tokens=args.summary_tokens)
+    history: list[dict[str, str]] = []
+    totals = {"full history": 0, "memory window": 0}
+    add_turn_seconds = 0.0
+    checkpoints = {1, 10, 50, args.turns // 2, args.turns}
+
+    print(f"{'turn':>5} {'full history':>13} {'memory window':>14}  (prompt tokens)")
+    for turn in range(1, args.turns + 1):
+        question = " ".join(sentence(rng, 12) for _ in range(2)) + "?"
+        answer = " ".join(sentence(rng, 18) for _ in range(rng.randint(3, 8)))
+        window = memory.window("conversation")
+        sizes = {
+            "full history": approximate_token_count(formatter.format(question, "", history)),
+            "memory window": approximate_token_count(
+                formatter.format(question, "", window.chat_history(), summary=window.summary)
+            ),
+        }
+        for label, size in sizes.items():
+            totals[label] += size
+        if turn in checkpoints:
+            print(f"{turn:>5} {sizes['full history']:>13} {sizes['memory window']:>14}")
+
+        history.append({"question": question, "answer": answer})
+        started = time.perf_counter()
+        memory.add_turn("conversation", question, answer)
+        add_turn_seconds += time.perf_counter() - started
+
+    print(f"{'total':>5} {totals['full history']:>13} {totals['memory window']:>14}  (prefill tokens)")
+    print(f"add_turn: {add_turn_seconds / args.turns * 1e6:.1f} us per turn")
+
+
+if __name__ == "__main__":
+    main()
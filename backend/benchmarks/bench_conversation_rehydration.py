@@ -0,0 +1,81 @@
+"""
+Benchmark ``find_all`` row mapping: factory-based mapping vs. the rehydration constructor.
+
+Rows are plain stand-ins for ``ConversationDBModel`` instances, so only the cost of
+turning persisted state into aggregates is measured (no database round trip).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_conversation_rehydration --rows 1000 --repeat 20
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.modules.chats.domain.conversations.conversation import Conversation
+from src.modules.chats.domain.conversations.value_objects.conversation_id import ConversationId
+from src.modules.chats.domain.members.value_objects.member_id import MemberId
+from src.modules.chats.infrastructure.persistence.repositories.sql_conversation_repo import map_to_entity
+
+
+def make_rows(count: int) -> list[SimpleNamespace]:
+    now = datetime.now(timezone.utc)
+    creator_id = str(uuid.uuid4())
+    return [
+        SimpleNamespace(
+            id=str(uuid.uuid4()),
+            title=f"Conversation {index}",
+            creator_id=creator_id,
+            chat_id="",
+            is_archived=index % 10 == 0,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def map_with_factory(row: SimpleNamespace) -> Conversation:
+    """The previous mapping: run the ``create`` factory, then overwrite its generated state."""
+    conversation = Conversation.create(
+        creator_id=MemberId.create(uuid.UUID(row.creator_id)), creator_name="creator", title=row.title
+    )
+    conversation._id = ConversationId.create(uuid.UUID(str(row.id)))
+    conversation._is_archived = row.is_archived
+    return conversation
+
+
+def measure(mapper, rows: list[SimpleNamespace], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        [mapper(row) for row in rows]
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def report(label: str, timings: list[float], rows: int) -> None:
+    best = min(timings)
+    print(
+        f"{label:<12} best {best * 1e3:8.2f} ms  median {statistics.median(timings) * 1e3:8.2f} ms  "
+        f"{rows / best:12,.0f} rows/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    report("factory", measure(map_with_factory, rows, args.repeat), args.rows)
+    report("rehydrate", measure(map_to_entity, rows, args.repeat), args.rows)
+
+
+if __name__ == "__main__":
+    main()
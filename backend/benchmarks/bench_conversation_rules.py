@@ -0,0 +1,96 @@
+"""
+Benchmark ``add_participant`` validation on conversations with thousands of participants.
+
+Rows, per conversation size:
+
+* ``rule objects``: the previous checks, a fresh rule dataclass per rule and call, with a
+  linear scan of the participant list for the membership rule;
+* ``rule set``: the conversation's precompiled ``RuleSet`` with the member-id index;
+* ``add_participant``: the full operation (validation, participant, index, event).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_conversation_rules --participants 100 1000 10000
+"""
+
+import argparse
+import timeit
+import uuid
+from datetime import datetime, timezone
+
+from src.building_blocks.domain.exceptions import BusinessRuleValidationException
+from src.building_blocks.domain.rule import BaseBusinessRule
+from src.modules.chats.domain.conversations import conversation as conversation_module
+from src.modules.chats.domain.conversations.conversation import Conversation
+from src.modules.chats.domain.conversations.entities.creator import Creator
+from src.modules.chats.domain.conversations.entities.participant import Participant
+from src.modules.chats.domain.conversations.enums.participant_role import ParticipantRole
+from src.modules.chats.domain.conversations.rules import ConversationCannotBeModifiedIfArchivedRule
+from src.modules.chats.domain.conversations.value_objects.conversation_id import ConversationId
+from src.modules.chats.domain.members.value_objects.member_id import MemberId
+
+
+class LinearParticipantRule(BaseBusinessRule):
+    """The membership rule as it was: a scan over the participant list."""
+
+    def __init__(self, participants, participant_id):
+        self.participants, self.participant_id = participants, participant_id
+
+    def is_broken(self) -> bool:
+        return any(p.id == self.participant_id for p in self.participants)
+
+
+def check_rules(*rules: BaseBusinessRule) -> None:
+    for rule in rules:
+        if rule.is_broken():
+            raise BusinessRuleValidationException(rule)
+
+
+def conversation_with(participants: int) -> Conversation:
+    now = datetime.now(timezone.utc)
+    creator = Creator.rehydrate(member_id=MemberId(uuid.uuid4()), name="creator", created_at=now, updated_at=now)
+    return Conversation.rehydrate(
+        conversation_id=ConversationId(uuid.uuid4()),
+        title="Support",
+        creator=creator,
+        created_at=now,
+        updated_at=now,
+        participants=[
+            Participant.create(MemberId(uuid.uuid4()), None, ParticipantRole.VIEWER) for _ in range(participants)
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--participants", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    rule_set = conversation_module._ADD_PARTICIPANT_RULES
+    for size in args.participants:
+        conversation = conversation_with(size)
+        # A newcomer: the membership check has to look at every participant to clear them.
+        newcomer = MemberId(uuid.uuid4())
+
+        def legacy() -> None:
+            check_rules(ConversationCannotBeModifiedIfArchivedRule(is_archived=conversation.is_archived))
+            check_rules(LinearParticipantRule(participants=conversation._participants, participant_id=newcomer))
+
+        def add() -> None:
+            conversation.add_participant(MemberId(uuid.uuid4()), ParticipantRole.VIEWER)
+
+        candidates = {
+            "rule objects": legacy,
+            "rule set": lambda: rule_set.check(conversation, newcomer),
+            "add_participant": add,
+        }
+        baseline = None
+        for label, call in candidates.items():
+            per_call = min(timeit.repeat(call, number=args.rounds, repeat=3)) / args.rounds
+            baseline = baseline or per_call
+            print(f"{size:>7} participants  {label:<16} {per_call * 1e6:10.2f} us  {baseline / per_call:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark command latency against the number of slow event subscribers.
+
+A "command" publishes one event to N subscribers that each spend ``--delay`` ms on I/O
+(a notification, say). Commands run where the mediators run them: on an executor
+thread, with the app loop waiting on the result. Four ways of delivering the event are
+compared:
+
+* ``sync inline``: blocking handlers called by ``EventBus.publish`` (the previous behaviour);
+* ``async unbound``: async handlers published from the executor thread with no loop
+  bound, so ``publish`` runs them to completion on a fresh loop in that thread;
+* ``async bound``: the same with the app loop given to ``EventBus.bind_loop``, so the
+  command only pays for handing them off;
+* ``async gather``: async handlers awaited concurrently via ``publish_async`` on the loop.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_event_bus --subscribers 1 4 16 --delay 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+
+from src.building_blocks.domain.events import DomainEvent
+from src.building_blocks.infrastructure.event_bus import EventBus
+
+
+@dataclass(frozen=True, slots=True)
+class MessageSentEvent(DomainEvent):
+    conversation_id: str
+
+
+def sync_bus(subscribers: int, delay: float) -> EventBus:
+    bus = EventBus()
+    for _ in range(subscribers):
+        bus.subscribe(MessageSentEvent, lambda event: time.sleep(delay))
+    return bus
+
+
+def async_bus(subscribers: int, delay: float) -> EventBus:
+    async def notify(event: MessageSentEvent) -> None:
+        await asyncio.sleep(delay)
+
+    bus = EventBus(handler_timeout=delay * 10)
+    for _ in range(subscribers):
+        bus.subscribe(MessageSentEvent, notify)
+    return bus
+
+
+async def command_latencies(bus: EventBus, mode: str, rounds: int) -> list[float]:
+    loop = asyncio.get_running_loop()
+    if mode == "bound":
+        bus.bind_loop(loop)
+    latencies = []
+    for _ in range(rounds):
+        event = MessageSentEvent(conversation_id="conversation")
+        started = time.perf_counter()
+        if mode == "gather":
+            await bus.publish_async(event)
+        else:
+            await loop.run_in_executor(None, bus.publish, event)
+        latencies.append(time.perf_counter() - started)
+        await bus.drain()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--delay", type=float, default=10.0, help="handler latency in ms")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    delay = args.delay / 1000
+
+    for subscribers in args.subscribers:
+        rows = {
+            "sync inline": asyncio.run(command_latencies(sync_bus(subscribers, delay), "inline", args.rounds)),
+            "async unbound": asyncio.run(command_latencies(async_bus(subscribers, delay), "unbound", args.rounds)),
+            "async bound": asyncio.run(command_latencies(async_bus(subscribers, delay), "bound", args.rounds)),
+            "async gather": asyncio.run(command_latencies(async_bus(subscribers, delay), "gather", args.rounds)),
+        }
+        for mode, latencies in rows.items():
+            print(
+                f"{subscribers:>3} subscribers  {mode:<15} "
+                f"p50 {statistics.median(latencies) * 1e3:8.2f} ms  max {max(latencies) * 1e3:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
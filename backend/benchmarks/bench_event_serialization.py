@@ -0,0 +1,62 @@
+"""
+Benchmark DomainEvent serialization: ``asdict`` + ``json.dumps`` versus compiled serializers.
+
+Rows, per event type:
+
+* ``asdict+json``: the previous path, ``dataclasses.asdict`` then ``json.dumps(default=str)``;
+* ``to_dict``: the compiled serializer alone (JSON-ready dict);
+* ``to_dict+json``: compiled serializer then the standard library encoder;
+* ``dumps_event``: compiled serializer then ``json_codec`` (orjson when installed).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_event_serialization --rounds 200000
+"""
+
+import argparse
+import dataclasses
+import json
+import timeit
+import uuid
+
+from src.building_blocks.infrastructure import json_codec
+from src.modules.accounts.domain.account.events.account_registered_event import AccountRegisteredEvent
+from src.modules.chats.domain.messages.events.message_created import MessageCreatedEvent
+
+
+def legacy(event) -> bytes:
+    return json.dumps(dataclasses.asdict(event), default=str).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200_000)
+    args = parser.parse_args()
+
+    events = {
+        "MessageCreatedEvent": MessageCreatedEvent(
+            message_id=uuid.uuid4(),
+            conversation_id=uuid.uuid4(),
+            sender_id=uuid.uuid4(),
+            text="How do I reset my password?",
+            response="Open Settings, then Security, and choose Reset password.",
+        ),
+        "AccountRegisteredEvent": AccountRegisteredEvent(account_id=str(uuid.uuid4()), email="user@example.com"),
+    }
+    print(f"json backend: {json_codec.BACKEND}")
+    for name, event in events.items():
+        candidates = {
+            "asdict+json": lambda: legacy(event),
+            "to_dict": event.to_dict,
+            "to_dict+json": lambda: json.dumps(event.to_dict()).encode(),
+            "dumps_event": lambda: json_codec.dumps_event(event),
+        }
+        baseline = None
+        for label, call in candidates.items():
+            per_call = min(timeit.repeat(call, number=args.rounds, repeat=3)) / args.rounds
+            baseline = baseline or per_call
+            print(f"{name:<24} {label:<14} {per_call * 1e6:7.2f} us  {baseline / per_call:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
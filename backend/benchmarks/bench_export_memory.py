@@ -0,0 +1,129 @@
+"""
+Benchmark peak memory and throughput of conversation exports as history grows.
+
+Seeds a SQLite database with one user's conversations and ``--messages`` messages
+in total, then exports them as NDJSON and ZIP through the streaming downloaders
+(batches of ``yield_per`` rows, 64 KiB chunks) and, for comparison, the way the
+old export worked: load every message, build the whole document, then send it.
+Peak memory is the ``tracemalloc`` high-water mark while draining the export.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_export_memory --messages 10000 100000
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_tracing_overhead import USER_ID
+from src.building_blocks.infrastructure import json_codec
+from src.database.models import Base
+from src.modules.chats.application.queries.export_conversations.handler import ExportConversationsHandler
+from src.modules.chats.application.queries.export_conversations.query import ExportConversationsQuery, ExportFormat
+from src.modules.chats.infrastructure.persistence.orm.model import ConversationDBModel, MemberDBModel, MessageDBModel
+from src.modules.chats.infrastructure.persistence.read_models.sql_conversation_read_model import (
+    SQLConversationReadModel,
+)
+from src.modules.chats.infrastructure.services.export import DOWNLOADERS
+
+CONTENT = "The quick brown fox jumps over the lazy dog. " * 6
+
+
+def seeded_messages(directory: Path, messages: int, conversations: int) -> sessionmaker:
+    engine = create_engine(f"sqlite:///{directory / f'export-{messages}.db'}")
+    tables = [MemberDBModel, ConversationDBModel, MessageDBModel]
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in tables])
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    started = datetime(2024, 1, 1)
+    ids = [str(uuid.uuid4()) for _ in range(conversations)]
+    with factory() as session:
+        session.add(MemberDBModel(id=str(USER_ID), login="login", first_name="First", last_name="Last"))
+        session.execute(
+            insert(ConversationDBModel),
+            [
+                {"id": id_, "title": f"Conversation {index}", "creator_id": str(USER_ID), "chat_id": "chat"}
+                for index, id_ in enumerate(ids)
+            ],
+        )
+        for offset in range(0, messages, 10_000):
+            session.execute(
+                insert(MessageDBModel),
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "content": CONTENT,
+                        "sender_id": str(USER_ID),
+                        "conversation_id": ids[index % conversations],
+                        "timestamp": started + timedelta(seconds=index),
+                    }
+                    for index in range(offset, min(offset + 10_000, messages))
+                ],
+            )
+        session.commit()
+    return factory
+
+
+def materialized_export(factory: sessionmaker) -> int:
+    """The previous approach: every row in memory, then the whole document, then the response."""
+    with factory() as session:
+        stmt = select(MessageDBModel).join(ConversationDBModel).where(ConversationDBModel.creator_id == str(USER_ID))
+        rows = session.execute(stmt).scalars().all()
+        records = [
+            {
+                "conversation_id": row.conversation_id,
+                "id": row.id,
+                "content": row.content,
+                "created_at": row.timestamp.isoformat(),
+            }
+            for row in rows
+        ]
+    body = json_codec.dumps(records)
+    return len(body)
+
+
+def streamed_export(factory: sessionmaker, export_format: ExportFormat) -> int:
+    handler = ExportConversationsHandler(SQLConversationReadModel(factory), DOWNLOADERS)
+    export = handler.handle(ExportConversationsQuery(user_id=USER_ID, format=export_format))
+    return sum(len(chunk) for chunk in export.chunks)
+
+
+def measure(run) -> tuple[float, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--conversations", type=int, default=50)
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp())
+    print(f"{'messages':>9} {'mode':<14} {'peak MiB':>9} {'seconds':>8} {'output MiB':>11}")
+    for messages in args.messages:
+        factory = seeded_messages(directory, messages, args.conversations)
+        runs = {
+            "materialized": lambda: materialized_export(factory),
+            "ndjson stream": lambda: streamed_export(factory, ExportFormat.NDJSON),
+            "zip stream": lambda: streamed_export(factory, ExportFormat.ZIP),
+        }
+        for label, run in runs.items():
+            peak, elapsed, size = measure(run)
+            print(f"{messages:>9} {label:<14} {peak / 2**20:9.1f} {elapsed:8.2f} {size / 2**20:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Import-time profile of API cold start, parsed from ``python -X importtime``.
+
+Each scenario runs in a fresh interpreter. Reported per scenario: wall time of the
+process, the cumulative import time (sum over top-level imports), the slowest top-level
+packages, and which heavy packages (torch, transformers, llama_index, markdown, bs4, ...)
+were loaded at all.
+
+Default scenarios:
+
+* ``routers: package scan``: ``collect_routers()``, the runtime scan of ``PACKAGE_PATHS``;
+* ``routers: manifest``: ``load_routers()`` from a manifest built beforehand;
+* ``llm backend``: importing the LLM backend containers, whose heavy dependencies now load
+  on first use (skipped with an error line when its packages are not installed).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_import_time --top 8
+    python -m benchmarks.bench_import_time --code "import src.api.main"
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.api.core.utils.route_manifest import discover_routes, write_manifest
+
+HEAVY_PACKAGES = ("torch", "transformers", "llama_index", "sentence_transformers", "markdown", "bs4", "numpy")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass
+class ImportProfile:
+    wall_seconds: float
+    top_level: dict[str, int] = field(default_factory=dict)  # package -> cumulative microseconds
+    loaded: set[str] = field(default_factory=set)
+    error: str | None = None
+
+    @property
+    def cumulative_seconds(self) -> float:
+        return sum(self.top_level.values()) / 1e6
+
+
+def profile(code: str) -> ImportProfile:
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    result = ImportProfile(wall_seconds=time.perf_counter() - started)
+    for line in completed.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        _, cumulative, indent, name = match.groups()
+        result.loaded.add(name)
+        if not indent:
+            result.top_level[name] = result.top_level.get(name, 0) + int(cumulative)
+    if completed.returncode:
+        result.error = completed.stderr.strip().splitlines()[-1]
+    return result
+
+
+def report(label: str, result: ImportProfile, top: int) -> None:
+    heavy = sorted(package for package in HEAVY_PACKAGES if package in result.loaded)
+    print(
+        f"{label:<24} wall {result.wall_seconds * 1e3:8.1f} ms  imports {result.cumulative_seconds * 1e3:8.1f} ms  "
+        f"heavy: {', '.join(heavy) or '-'}"
+    )
+    if result.error:
+        print(f"{'':<24} error: {result.error}")
+    slowest = sorted(result.top_level.items(), key=lambda item: item[1], reverse=True)[:top]
+    for name, cumulative in slowest:
+        print(f"{'':<24}   {cumulative / 1e3:8.1f} ms  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--top", type=int, default=5, help="slowest top-level imports to list per scenario")
+    parser.add_argument("--code", action="append", help="profile this snippet instead of the default scenarios")
+    args = parser.parse_args()
+
+    if args.code:
+        scenarios = {snippet: snippet for snippet in args.code}
+    else:
+        manifest = Path(tempfile.mkdtemp()) / "route_manifest.json"
+        write_manifest(manifest, discover_routes())
+        scenarios = {
+            "routers: package scan": (
+                "from src.api.core.utils.routing_helpers import collect_routers; list(collect_routers())"
+            ),
+            "routers: manifest": (
+                f"from src.api.core.utils.route_manifest import load_routers; load_routers({str(manifest)!r})"
+            ),
+            "llm backend": "import src.modules.llm_backend.infrastructure.configuration.di.containers",
+        }
+    for label, code in scenarios.items():
+        report(label, profile(code), args.top)
+
+
+if __name__ == "__main__":
+    main()
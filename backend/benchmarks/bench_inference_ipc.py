@@ -0,0 +1,85 @@
+"""
+Benchmark the cost of streaming through the inference server instead of calling the model in-process.
+
+Uses the stub backend (no decoding cost), so the numbers are pure overhead: framing, the
+Unix socket and the server's thread hand-off. Rows:
+
+* ``in-process``: iterating ``StubBackend.stream`` directly;
+* ``ipc, 1 client``: the same stream through :class:`InferenceClient`;
+* ``ipc, N clients``: N concurrent streams (one per simulated API worker), per stream.
+
+Reported: time to first chunk, per-chunk cost and whole-stream time, as medians.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_inference_ipc --chunks 256 --clients 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.modules.llm_backend.infrastructure.inference import InferenceClient, InferenceWorker, StubBackend
+
+
+def in_process(prompt: str) -> tuple[float, float]:
+    started = time.perf_counter()
+    first = None
+    for _ in StubBackend().stream(prompt, {}, threading.Event()):
+        first = first or time.perf_counter() - started
+    return first, time.perf_counter() - started
+
+
+async def over_ipc(client: InferenceClient, prompt: str) -> tuple[float, float]:
+    started = time.perf_counter()
+    first = None
+    async for _ in client.stream(prompt):
+        first = first or time.perf_counter() - started
+    return first, time.perf_counter() - started
+
+
+def report(label: str, samples: list[tuple[float, float]], chunks: int) -> None:
+    first = statistics.median(sample[0] for sample in samples)
+    total = statistics.median(sample[1] for sample in samples)
+    print(
+        f"{label:<18} first chunk {first * 1e6:9.1f} us  per chunk {total / chunks * 1e6:8.1f} us  "
+        f"stream {total * 1e3:8.2f} ms"
+    )
+
+
+async def run(worker: InferenceWorker, prompt: str, chunks: int, clients: int, rounds: int) -> None:
+    await worker.wait_ready(timeout=60)
+    report("in-process", [in_process(prompt) for _ in range(rounds)], chunks)
+
+    client = InferenceClient(worker.socket_path)
+    report("ipc, 1 client", [await over_ipc(client, prompt) for _ in range(rounds)], chunks)
+
+    samples = []
+    for _ in range(rounds):
+        streams = (over_ipc(InferenceClient(worker.socket_path), prompt) for _ in range(clients))
+        samples += await asyncio.gather(*streams)
+    report(f"ipc, {clients} clients", samples, chunks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=256, help="chunks per response")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent streams")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    prompt = " ".join(["token"] * args.chunks)
+    worker = InferenceWorker(Path(tempfile.mkdtemp()) / "llm.sock", backend="stub", max_concurrency=args.clients)
+    worker.start()
+    try:
+        asyncio.run(run(worker, prompt, args.chunks, args.clients, args.rounds))
+    finally:
+        worker.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark append-heavy chat history storage: ``JsonFileManager`` against ``JsonLinesStore``.
+
+Each of ``--files`` histories (chat memory, one file id per conversation) grows by
+``--records`` records, appended round-robin as messages would arrive. With
+``JsonFileManager`` an append is a read of the whole file, a list append and a rewrite
+of the whole pretty-printed file; with ``JsonLinesStore`` it is one line, ``fsync``-ed
+in batches (``sync_every``) or after every record (``sync_every=1``). Reports the time
+per append at the start and the end of the run, the total, and the time to read one
+random record back. ``JsonFileManager`` never ``fsync``-s, so the batched store is the
+like-for-like comparison.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_json_store --files 20 --records 1000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+
+from src.modules.chats.infrastructure.configuration.processing.json.jsonl_store import JsonLinesStore
+from src.modules.chats.infrastructure.configuration.processing.json.manager import JsonFileManager
+
+RECORD = {"question": "How do I reset my password?", "answer": "Open settings, then security. " * 8}
+
+
+class FileManagerHistory:
+    """Appending through ``JsonFileManager`` the only way it allows: read, modify, rewrite."""
+
+    def __init__(self, directory: str) -> None:
+        self.manager = JsonFileManager(directory)
+
+    def append(self, file_id: str, record: dict) -> None:
+        history = self.manager.read(file_id) if self.manager.file_exists(file_id) else []
+        history.append(record)
+        self.manager.write(file_id, history)
+
+    def read_record(self, file_id: str, position: int) -> dict:
+        return self.manager.read(file_id)[position]
+
+    def close(self) -> None:
+        pass
+
+
+def run(store, files: int, records: int) -> dict[str, float]:
+    ids = [f"conversation-{index}" for index in range(files)]
+    window = max(files * records // 20, 1)
+    timings = []
+    started = time.perf_counter()
+    for index in range(files * records):
+        began = time.perf_counter()
+        store.append(ids[index % files], RECORD)
+        timings.append(time.perf_counter() - began)
+    total = time.perf_counter() - started
+
+    rng = random.Random(0)
+    reads = []
+    for _ in range(200):
+        began = time.perf_counter()
+        store.read_record(rng.choice(ids), rng.randrange(records))
+        reads.append(time.perf_counter() - began)
+    store.close()
+    return {
+        "first": sum(timings[:window]) / window,
+        "last": sum(timings[-window:]) / window,
+        "total": total,
+        "read": sorted(reads)[len(reads) // 2],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--records", type=int, default=1000)
+    args = parser.parse_args()
+
+    stores = {
+        "JsonFileManager": lambda directory: FileManagerHistory(directory),
+        "jsonl (batched)": lambda directory: JsonLinesStore(directory),
+        "jsonl (fsync/1)": lambda directory: JsonLinesStore(directory, sync_every=1),
+    }
+    print(f"{'store':<17} {'first us':>9} {'last us':>9} {'total s':>8} {'read us':>8}")
+    for label, factory in stores.items():
+        result = run(factory(tempfile.mkdtemp()), args.files, args.records)
+        print(
+            f"{label:<17} {result['first'] * 1e6:9.1f} {result['last'] * 1e6:9.1f} "
+            f"{result['total']:8.2f} {result['read'] * 1e6:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark request latency under a logging-heavy load, with handlers inline or queued.
+
+Each simulated request binds a conversation logger, does a little work and logs a burst
+of records through ``ConversationLogger`` to a rotating log file and a console stream:
+a few INFO events and many DEBUG token events, as a streamed reply would. The console
+discards its output after ``--sink-latency-us`` per write, standing in for stdout
+piped to a container log driver that is applying backpressure (0 for a free sink).
+Requests run ``--concurrency`` at a time on one event loop, so a slow log write
+delays every request sharing the loop. Modes:
+
+* ``inline``: handlers run on the caller's thread (the previous behaviour);
+* ``queued``: handlers behind ``QueueLogging``, the caller only enqueues;
+* ``queued+sampled``: queued, keeping one in ``--sample-every`` DEBUG events.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_logging_latency --requests 2000 --sink-latency-us 50
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import statistics
+import tempfile
+import time
+
+from src.modules.chats.infrastructure.services.logging.config import LoggerConfig
+from src.modules.chats.infrastructure.services.logging.conversation import ConversationLogger
+
+MODES = {
+    "inline": {"use_queue": False},
+    "queued": {"use_queue": True},
+    "queued+sampled": {"use_queue": True},
+}
+
+
+class SlowSink:
+    """A console stream whose writes block for ``latency`` seconds, then discard the text."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def write(self, text: str) -> int:
+        if self.latency:
+            time.sleep(self.latency)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def request(conversation_logger: ConversationLogger, index: int, debug_events: int) -> float:
+    started = time.perf_counter()
+    log = conversation_logger.bind(f"user-{index % 50}", f"conversation-{index}")
+    log.event("message_received")
+    for token in range(debug_events):
+        log.event("token_streamed", level=logging.DEBUG, token=token)
+        if token % 10 == 0:
+            busy(0.00005)
+            await asyncio.sleep(0)
+    log.event("message_sent")
+    log.info("reply completed in %d tokens", debug_events)
+    return time.perf_counter() - started
+
+
+async def load(conversation_logger: ConversationLogger, requests: int, concurrency: int, debug_events: int):
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> float:
+        async with slots:
+            return await request(conversation_logger, index, debug_events)
+
+    return await asyncio.gather(*(one(index) for index in range(requests)))
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--debug-events", type=int, default=50)
+    parser.add_argument("--sample-every", type=int, default=10)
+    parser.add_argument("--sink-latency-us", type=float, default=50.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<16} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8} {'drain s':>8}")
+    for mode, options in MODES.items():
+        sample_every = args.sample_every if mode.endswith("sampled") else 1
+        config = LoggerConfig(level="DEBUG", log_dir=tempfile.mkdtemp(), debug_sample_every=sample_every, **options)
+        # The console handler binds sys.stderr when it is created.
+        with contextlib.redirect_stderr(SlowSink(args.sink_latency_us / 1e6)):
+            conversation_logger = ConversationLogger(config, name=f"bench.{mode}")
+
+            latencies = asyncio.run(load(conversation_logger, args.requests, args.concurrency, args.debug_events))
+            started = time.perf_counter()
+            conversation_logger.close()
+            drained = time.perf_counter() - started
+        print(
+            f"{mode:<16} {statistics.median(latencies) * 1e3:8.2f} {percentile(latencies, 0.99) * 1e3:8.2f} "
+            f"{statistics.fmean(latencies) * 1e3:8.2f} {drained:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark the memory and allocations of rehydrating messages: slotted vs. ``__dict__`` layouts.
+
+Each message is rebuilt the way the repository does it: ``MessageId``, ``ConversationId``,
+``MemberId`` and one ``Content`` value object, then ``Message.rehydrate``. The ``dict``
+rows build the same fields into ``__dict__``-backed twins of those classes (the layout
+before value objects, events and entities were slotted), so both rows hold identical data.
+
+Reported per layout: memory retained by the list of messages, peak traced memory, the
+number of live allocated blocks and the wall time.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_message_rehydration_memory --messages 100000
+"""
+
+import argparse
+import dataclasses
+import gc
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+
+from src.modules.chats.domain.conversations.value_objects.conversation_id import ConversationId
+from src.modules.chats.domain.members.value_objects.member_id import MemberId
+from src.modules.chats.domain.messages.root import Message
+from src.modules.chats.domain.messages.value_objects.content import Content
+from src.modules.chats.domain.messages.value_objects.message_id import MessageId
+
+
+def dict_twin(cls: type) -> type:
+    """A plain dataclass with the fields of ``cls`` and an instance ``__dict__``."""
+    return dataclasses.make_dataclass(f"Dict{cls.__name__}", [field.name for field in dataclasses.fields(cls)])
+
+
+def restore(cls: type, **state) -> object:
+    instance = cls.__new__(cls)
+    for name, value in state.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def rehydrate_slotted(rows: list[tuple], created_at: datetime) -> list[Message]:
+    return [
+        Message.rehydrate(
+            message_id=MessageId(message_id),
+            conversation_id=ConversationId(conversation_id),
+            sender_id=MemberId(sender_id),
+            contents=[Content(_text=text, _response=response)],
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        for message_id, conversation_id, sender_id, text, response in rows
+    ]
+
+
+def rehydrate_dict(rows: list[tuple], created_at: datetime) -> list[object]:
+    message_id_cls, conversation_id_cls, member_id_cls, content_cls, message_cls = (
+        dict_twin(cls) for cls in (MessageId, ConversationId, MemberId, Content, Message)
+    )
+    return [
+        restore(
+            message_cls,
+            _id=restore(message_id_cls, value=message_id),
+            _conversation_id=restore(conversation_id_cls, value=conversation_id),
+            _sender_id=restore(member_id_cls, _value=sender_id),
+            _contents=[restore(content_cls, _text=text, _response=response, _feedback=None)],
+            _created_at=created_at,
+            _updated_at=created_at,
+            _pinned=False,
+            _version=0,
+            _events=[],
+        )
+        for message_id, conversation_id, sender_id, text, response in rows
+    ]
+
+
+def measure(label: str, rehydrate, rows: list[tuple], created_at: datetime) -> None:
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    started = time.perf_counter()
+    messages = rehydrate(rows, created_at)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    count = len(messages)
+    print(
+        f"{label:<8} retained {current / 2**20:8.1f} MiB ({current / count:6.0f} B/msg)  "
+        f"peak {peak / 2**20:8.1f} MiB  blocks {blocks:>10,} ({blocks / count:4.1f}/msg)  {elapsed * 1e3:8.1f} ms"
+    )
+    del messages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=100_000)
+    args = parser.parse_args()
+
+    conversation_id, sender_id = uuid.uuid4(), uuid.uuid4()
+    rows = [
+        (uuid.uuid4(), conversation_id, sender_id, f"question {index}", f"answer {index}")
+        for index in range(args.messages)
+    ]
+    created_at = datetime.now(timezone.utc)
+    measure("dict", rehydrate_dict, rows, created_at)
+    measure("slotted", rehydrate_slotted, rows, created_at)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark the per-request cost of the Prometheus instrumentation, and of a scrape.
+
+Per request, ``MetricsMiddleware`` and the mediator update an in-progress gauge, a
+request counter, a request histogram, the executor queue gauge and a handler
+histogram. This replays exactly those updates, with values in this process and in
+memory-mapped files (``--workers`` mode), and reports them as CPU time against the median
+of a real SQLite-backed ``ListUserConversations`` request. It also times rendering
+``/metrics`` from the files of several workers with a realistic number of series.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_metrics_overhead --requests 100000
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_tracing_overhead import seeded_session_factory, serve
+from src.building_blocks.infrastructure.metrics import configure_metrics, render_metrics
+from src.building_blocks.infrastructure.metrics.instruments import (
+    EXECUTOR_QUEUE_DEPTH,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HandlerTimer,
+)
+from src.modules.chats.application.contracts.command import BaseCommand
+from src.modules.chats.application.contracts.query import BaseQuery
+from src.modules.chats.application.queries.list_user_conversations.handler import ListUserConversationsHandler
+from src.modules.chats.application.queries.list_user_conversations.query import ListUserConversationsQuery
+from src.modules.chats.infrastructure.mediator import Mediator
+from src.modules.chats.infrastructure.persistence.read_models.sql_conversation_read_model import (
+    SQLConversationReadModel,
+)
+
+ROUTES = [f"/api/1.0.0/route{index}/{{id}}" for index in range(30)]
+
+
+def instrument_one_request(message: object, route: str) -> None:
+    in_progress = HTTP_REQUESTS_IN_PROGRESS.labels("GET")
+    in_progress.inc()
+    started = time.perf_counter()
+    EXECUTOR_QUEUE_DEPTH.labels("chats").inc()
+    EXECUTOR_QUEUE_DEPTH.labels("chats").dec()
+    with HandlerTimer("chats", message, BaseCommand, BaseQuery):
+        pass
+    in_progress.dec()
+    HTTP_REQUESTS.labels("GET", route, 200).inc()
+    HTTP_REQUEST_DURATION.labels("GET", route).observe(time.perf_counter() - started)
+
+
+def cpu_per_request(requests: int, rounds: int) -> float:
+    message = ListUserConversationsQuery(user_id=__import__("uuid").uuid4())
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.process_time()
+        for index in range(requests):
+            instrument_one_request(message, ROUTES[index % len(ROUTES)])
+        best = min(best, (time.process_time() - started) / requests)
+    return best
+
+
+def _fill_worker(directory: str, requests: int) -> None:
+    configure_metrics(directory)
+    cpu_per_request(requests, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4, help="worker files aggregated by the scrape")
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp())
+    read_model = SQLConversationReadModel(seeded_session_factory(directory, 50))
+    mediator = Mediator({ListUserConversationsQuery: ListUserConversationsHandler(read_model)})
+    asyncio.run(serve(mediator, 200))
+    request = statistics.median(asyncio.run(serve(mediator, 2000)))
+
+    local = cpu_per_request(args.requests, args.rounds)
+    shared = directory / "metrics"
+    configure_metrics(shared)
+    mmapped = cpu_per_request(args.requests, args.rounds)
+
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_fill_worker, args=(str(shared), 1000)) for _ in range(args.workers - 1)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    scrapes = []
+    for _ in range(20):
+        started = time.perf_counter()
+        body = render_metrics()
+        scrapes.append(time.perf_counter() - started)
+    configure_metrics(None)
+
+    print(f"{'request':<16} {request * 1e6:8.1f} us  (SQLite-backed, median)")
+    for label, cost in (("in-process", local), ("mmap (workers)", mmapped)):
+        print(f"{label:<16} {cost * 1e6:+8.2f} us CPU per request  {cost / request * 100:+6.2f}% of the request")
+    series = sum(1 for line in body.splitlines() if not line.startswith(b"#"))
+    print(f"{'scrape':<16} {statistics.median(scrapes) * 1e3:8.2f} ms for {args.workers} workers, {series} series")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark outbox relay throughput (events/s) against the batch size.
+
+``--events`` messages are staged in the outbox, then drained by ``OutboxRelay.relay_once``
+into an ``EventBus`` with one no-op subscriber, so the figures are the claim, decode,
+publish and bulk-mark cost per event. Runs against a temporary SQLite file unless
+``--database-url`` points elsewhere (e.g. PostgreSQL, to exercise ``SKIP LOCKED``).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_outbox_relay --events 20000 --batch-sizes 1 50 200 1000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker
+
+from src.building_blocks.domain.events import DomainEvent
+from src.building_blocks.infrastructure.event_bus import EventBus
+from src.building_blocks.infrastructure.outbox_relay import OutboxRelay
+from src.building_blocks.infrastructure.sql_outbox import OutboxMessageModel, SQLOutbox
+from src.database.models import Base
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkEvent(DomainEvent):
+    account_id: str
+    sequence: int
+
+
+def fill(outbox: SQLOutbox, events: int) -> None:
+    with outbox.session_factory() as session:
+        session.execute(delete(OutboxMessageModel))
+        outbox.stage(session, (BenchmarkEvent(account_id="account", sequence=i) for i in range(events)))
+        session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 50, 200, 1000])
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.database_url or f"sqlite:///{os.path.join(directory, 'outbox.db')}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine, tables=[OutboxMessageModel.__table__])
+        outbox = SQLOutbox(sessionmaker(bind=engine, expire_on_commit=False))
+        bus = EventBus()
+        bus.subscribe(BenchmarkEvent, lambda event: None)
+
+        for batch_size in args.batch_sizes:
+            fill(outbox, args.events)
+            relay = OutboxRelay(outbox, bus, event_types=[BenchmarkEvent], batch_size=batch_size)
+            started = time.perf_counter()
+            while relay.relay_once():
+                pass
+            elapsed = time.perf_counter() - started
+            print(
+                f"batch {batch_size:>5}  {relay.metrics.relayed / elapsed:10,.0f} events/s  "
+                f"max lag {relay.metrics.max_lag_seconds * 1e3:9.1f} ms"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
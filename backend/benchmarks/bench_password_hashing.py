@@ -0,0 +1,71 @@
+"""
+Benchmark password verification throughput (logins/s) against the number of worker cores.
+
+Each round verifies ``--logins`` passwords concurrently, as a login burst would. The
+``threads`` row runs the synchronous hasher on the event loop's default thread pool
+(the previous behaviour); the ``processes`` rows use ``ProcessPoolPasswordHasher``.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_password_hashing --logins 64 --iterations 390000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from src.modules.accounts.infrastructure.crypto.password_hasher import PBKDF2PasswordHasher
+from src.modules.accounts.infrastructure.crypto.process_pool_hasher import ProcessPoolPasswordHasher
+
+
+async def burst_on_threads(hasher: PBKDF2PasswordHasher, hashed: str, logins: int) -> float:
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    await asyncio.gather(*(loop.run_in_executor(None, hasher.verify, "password", hashed) for _ in range(logins)))
+    return time.perf_counter() - started
+
+
+async def burst_on_processes(service: ProcessPoolPasswordHasher, hashed: str, logins: int) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(service.verify("password", hashed) for _ in range(logins)))
+    return time.perf_counter() - started
+
+
+def worker_counts(cores: int) -> list[int]:
+    counts, workers = [], 1
+    while workers < cores:
+        counts.append(workers)
+        workers *= 2
+    return counts + [cores]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--iterations", type=int, default=390000)
+    parser.add_argument("--cores", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    hasher = PBKDF2PasswordHasher(iterations=args.iterations)
+    hashed = hasher.encode("password")
+
+    elapsed = await burst_on_threads(hasher, hashed, args.logins)
+    print(f"{'threads':<10} {'-':>7}  {args.logins / elapsed:10,.1f} logins/s")
+
+    for workers in worker_counts(args.cores):
+        service = ProcessPoolPasswordHasher(hasher, max_workers=workers)
+        try:
+            await burst_on_processes(service, hashed, workers)  # spawn the workers outside the timing
+            service.metrics.queue_time_total = service.metrics.queue_time_max = 0.0
+            elapsed = await burst_on_processes(service, hashed, args.logins)
+        finally:
+            service.shutdown()
+        print(
+            f"{'processes':<10} {workers:>7}  {args.logins / elapsed:10,.1f} logins/s  "
+            f"max queue {service.metrics.queue_time_max * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""
+Benchmark profanity validation cost against wordlist size.
+
+Rows, per wordlist size:
+
+* ``substring scan``: the previous check, ``word in text`` for every listed word;
+* ``aho-corasick``: ``ProfanityFilter.contains`` (normalization and word boundaries included);
+
+plus the one-off cost of compiling the automaton. Words are random lowercase strings, and
+the message is clean, so every approach has to look at the whole text.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_profanity_filter --words 10 1000 10000 50000
+"""
+
+import argparse
+import random
+import string
+import time
+import timeit
+
+from src.modules.chats.domain.messages.profanity import ProfanityFilter
+
+MESSAGE = (
+    "Hi! I tried to reset my password from the settings page twice today, but the confirmation "
+    "email never arrived. Could you check whether my address is verified and resend the link? "
+    "I am on the mobile app, version 4.2, and I would rather not lose my saved conversations."
+)
+
+
+def wordlist(size: int, rng: random.Random) -> list[str]:
+    return ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10))) for _ in range(size)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, nargs="+", default=[10, 1000, 10000, 50000])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for size in args.words:
+        words = wordlist(size, rng)
+        started = time.perf_counter()
+        matcher = ProfanityFilter(words)
+        compiled = time.perf_counter() - started
+
+        candidates = {
+            "substring scan": lambda: any(word in MESSAGE for word in words),
+            "aho-corasick": lambda: matcher.contains(MESSAGE),
+        }
+        for label, call in candidates.items():
+            per_call = min(timeit.repeat(call, number=args.rounds, repeat=3)) / args.rounds
+            print(f"{size:>7} words  {label:<15} {per_call * 1e6:10.1f} us/message")
+        print(f"{size:>7} words  {'compile':<15} {compiled * 1e3:10.1f} ms once")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark the rate limiter's own overhead per request.
+
+``acquire`` is timed for each backend with a single hot key and with requests spread
+over many keys; the ``middleware`` rows time a full ASGI request through
+``RateLimitMiddleware`` against the same bare app without it. The shared backend runs
+over ``InMemoryCounterStore`` here, so its rows exclude the Redis round trips.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_rate_limiter --requests 200000 --keys 10000
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.api.core.middleware.rate_limit import RateLimitMiddleware
+from src.building_blocks.infrastructure.rate_limiting import (
+    InMemoryCounterStore,
+    InMemoryTokenBucketLimiter,
+    SlidingWindowLimiter,
+)
+
+# High enough that every request is admitted: the admitted path is the common one.
+LIMIT = 10**9
+
+
+def time_acquire(limiter, keys: list[str], requests: int) -> float:
+    acquire, count = limiter.acquire, len(keys)
+    started = time.perf_counter()
+    for i in range(requests):
+        acquire(keys[i % count], LIMIT, 60.0)
+    return (time.perf_counter() - started) / requests
+
+
+async def bare_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"0")]})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def time_asgi(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "path": "/api/v1/chats",
+        "headers": [(b"authorization", b"Bearer benchmark-token")],
+        "client": ("127.0.0.1", 50000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(scope, receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    args = parser.parse_args()
+
+    many_keys = [f"token:{i}" for i in range(args.keys)]
+    backends = {
+        "token bucket": InMemoryTokenBucketLimiter,
+        "sliding window": lambda: SlidingWindowLimiter(InMemoryCounterStore()),
+    }
+    for name, factory in backends.items():
+        for label, keys in (("1 key", ["token:0"]), (f"{args.keys} keys", many_keys)):
+            per_request = time_acquire(factory(), keys, args.requests)
+            print(f"{name:<16} {label:>12}  {per_request * 1e6:8.2f} us/acquire")
+
+    bare = asyncio.run(time_asgi(bare_app, args.requests))
+    limited = RateLimitMiddleware(bare_app, InMemoryTokenBucketLimiter(), requests_per_minute=LIMIT)
+    wrapped = asyncio.run(time_asgi(limited, args.requests))
+    print(f"{'middleware':<16} {'bare':>12}  {bare * 1e6:8.2f} us/request")
+    print(f"{'middleware':<16} {'limited':>12}  {wrapped * 1e6:8.2f} us/request  (+{(wrapped - bare) * 1e6:.2f} us)")
+
+
+if __name__ == "__main__":
+    main()
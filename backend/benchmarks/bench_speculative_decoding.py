@@ -0,0 +1,112 @@
+"""
+Benchmark speculative decoding on CPU: tokens per second and draft acceptance rate.
+
+Builds a randomly initialized Llama-style target model and a draft that shares its
+vocabulary, then decodes the same prompts greedily with the target alone and with the
+draft proposing ``--proposal`` tokens per target pass (constant schedule). The draft is
+either the target's first ``--draft-layers`` layers with its weights (self-speculation,
+which agrees with the target often enough to show the mechanism on random weights) or,
+with ``--draft-layers 0``, an independent tiny model (which mostly disagrees, the worst
+case). Reports tokens/s, target forward passes, tokens per pass and the acceptance rate,
+and checks the outputs are identical.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_speculative_decoding --layers 8 --draft-layers 2 --proposal 4
+"""
+
+import argparse
+import time
+
+import torch
+from transformers import LlamaConfig, LlamaForCausalLM
+
+from src.modules.llm_backend.infrastructure.processing.speculative import (
+    ForwardPassCounter,
+    assisted_generation_kwargs,
+)
+
+
+def build(hidden_size: int, layers: int, vocab_size: int, seed: int) -> LlamaForCausalLM:
+    torch.manual_seed(seed)
+    config = LlamaConfig(
+        vocab_size=vocab_size,
+        hidden_size=hidden_size,
+        intermediate_size=hidden_size * 3,
+        num_hidden_layers=layers,
+        num_attention_heads=max(hidden_size // 64, 1),
+        num_key_value_heads=max(hidden_size // 64, 1),
+        max_position_embeddings=2048,
+        eos_token_id=None,
+        pad_token_id=0,
+    )
+    return LlamaForCausalLM(config).eval()
+
+
+def truncated(target: LlamaForCausalLM, layers: int) -> LlamaForCausalLM:
+    """The target's embeddings, first ``layers`` layers and head, as a model of its own."""
+    config = LlamaConfig.from_dict(target.config.to_dict())
+    config.num_hidden_layers = layers
+    draft = LlamaForCausalLM(config).eval()
+    draft.load_state_dict(target.state_dict(), strict=False)  # the deeper layers are left out
+    return draft
+
+
+def decode(model, prompts, max_new_tokens: int, **kwargs):
+    outputs, passes, new_tokens = [], 0, 0
+    started = time.perf_counter()
+    for input_ids in prompts:
+        with ForwardPassCounter(model) as counter, torch.no_grad():
+            output = model.generate(
+                input_ids,
+                attention_mask=torch.ones_like(input_ids),
+                max_new_tokens=max_new_tokens,
+                do_sample=False,
+                **kwargs,
+            )
+        outputs.append(output)
+        passes += counter.calls
+        new_tokens += output.shape[1] - input_ids.shape[1]
+    return outputs, time.perf_counter() - started, passes, new_tokens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hidden-size", type=int, default=512)
+    parser.add_argument("--layers", type=int, default=8)
+    parser.add_argument("--draft-layers", type=int, default=2, help="0 for an independent tiny draft")
+    parser.add_argument("--vocab-size", type=int, default=4096)
+    parser.add_argument("--proposal", type=int, default=4, help="draft tokens per target pass")
+    parser.add_argument("--prompts", type=int, default=8)
+    parser.add_argument("--prompt-tokens", type=int, default=64)
+    parser.add_argument("--max-new-tokens", type=int, default=64)
+    args = parser.parse_args()
+
+    target = build(args.hidden_size, args.layers, args.vocab_size, seed=0)
+    if args.draft_layers:
+        draft = truncated(target, args.draft_layers)
+    else:
+        draft = build(128, 1, args.vocab_size, seed=1)
+    generator = torch.Generator().manual_seed(0)
+    prompts = [
+        torch.randint(1, args.vocab_size, (1, args.prompt_tokens), generator=generator) for _ in range(args.prompts)
+    ]
+    decode(target, prompts[:1], 4)  # warm-up
+
+    plain, plain_seconds, plain_passes, tokens = decode(target, prompts, args.max_new_tokens)
+    speculation = assisted_generation_kwargs(draft, args.proposal, schedule="constant", confidence_threshold=0.0)
+    assisted, assisted_seconds, assisted_passes, _ = decode(target, prompts, args.max_new_tokens, **speculation)
+
+    identical = all(torch.equal(a, b) for a, b in zip(plain, assisted))
+    per_pass = tokens / assisted_passes
+    print(f"{'mode':<12} {'tokens/s':>9} {'target passes':>14} {'tokens/pass':>12}")
+    print(f"{'plain':<12} {tokens / plain_seconds:9.1f} {plain_passes:>14} {tokens / plain_passes:12.2f}")
+    print(f"{'speculative':<12} {tokens / assisted_seconds:9.1f} {assisted_passes:>14} {per_pass:12.2f}")
+    print(
+        f"acceptance rate ~{(per_pass - 1) / args.proposal:.0%} of proposed tokens, "
+        f"speedup {plain_seconds / assisted_seconds:.2f}x, greedy outputs identical: {identical}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark the per-request cost of tracing on the chats query path.
+
+A request is what ``GET /conversations`` does below the framework: a server span,
+``Mediator.send`` (with its executor hop), ``ListUserConversationsHandler`` and
+``SQLConversationReadModel``, i.e. four spans. Exporters compared:
+
+* ``in-memory``: spans created and kept in a list (the cost of the spans themselves);
+* ``jsonl``: spans written by :class:`JsonLinesSpanExporter`.
+
+Wall-clock differences of a few percent drown in the noise of a shared machine, so the
+cost is measured as CPU time (``time.process_time``, all threads, which includes the
+exporter's background writes and final flush) on the same path with the SQL stubbed out,
+and reported against the median of the real SQLite-backed request with tracing off.
+The target is below 2% per request.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_tracing_overhead --requests 5000
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.building_blocks.infrastructure.tracing import (
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    SpanExporter,
+    SpanKind,
+    configure_tracing,
+    start_span,
+    traced_methods,
+)
+from src.database.models import Base
+from src.modules.chats.application.queries.list_user_conversations.handler import ListUserConversationsHandler
+from src.modules.chats.application.queries.list_user_conversations.query import ListUserConversationsQuery
+from src.modules.chats.infrastructure.mediator import Mediator
+from src.modules.chats.infrastructure.persistence.orm.model import (
+    ConversationDBModel,
+    ConversationSummaryDBModel,
+    MemberDBModel,
+    MessageDBModel,
+)
+from src.modules.chats.infrastructure.persistence.read_models.conversation_summary_projector import (
+    ConversationSummaryProjector,
+)
+from src.modules.chats.infrastructure.persistence.read_models.sql_conversation_read_model import (
+    SQLConversationReadModel,
+)
+
+USER_ID = uuid.uuid4()
+
+
+def seeded_session_factory(directory: Path, conversations: int):
+    # A file, not ``sqlite://``: in-memory databases are per connection, and handlers run on executor threads.
+    engine = create_engine(f"sqlite:///{directory / 'chats.db'}")
+    tables = [MemberDBModel, ConversationDBModel, MessageDBModel, ConversationSummaryDBModel]
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in tables])
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with factory() as session:
+        session.add(MemberDBModel(id=str(USER_ID), login="login", first_name="First", last_name="Last"))
+        for index in range(conversations):
+            session.add(
+                ConversationDBModel(
+                    id=str(uuid.uuid4()),
+                    title=f"Conversation {index}",
+                    creator_id=str(USER_ID),
+                    chat_id="chat",
+                    created_at=started + timedelta(minutes=index),
+                    updated_at=started + timedelta(minutes=index),
+                )
+            )
+        session.commit()
+    ConversationSummaryProjector(factory).rebuild()
+    return factory
+
+
+@traced_methods("read_model")
+class StubReadModel:
+    """The read model's traced surface without the SQL, so only tracing costs vary."""
+
+    def list_summaries(self, user_id, **params):
+        return None
+
+
+async def serve(mediator: Mediator, requests: int) -> list[float]:
+    query = ListUserConversationsQuery(user_id=USER_ID, limit=20)
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        with start_span("GET /api/conversations", kind=SpanKind.SERVER):
+            await mediator.send(query)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def cpu_per_request(mediator: Mediator, requests: int, exporter: SpanExporter | None) -> float:
+    configure_tracing(exporter)
+    started = time.process_time()
+    try:
+        asyncio.run(serve(mediator, requests))
+    finally:
+        configure_tracing(None)
+        if exporter is not None:
+            exporter.shutdown()
+    return (time.process_time() - started) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--conversations", type=int, default=50)
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp())
+    read_model = SQLConversationReadModel(seeded_session_factory(directory, args.conversations))
+    real = Mediator({ListUserConversationsQuery: ListUserConversationsHandler(read_model)})
+    stubbed = Mediator({ListUserConversationsQuery: ListUserConversationsHandler(StubReadModel())})
+    path = directory / "traces.jsonl"
+    modes = {
+        "off": lambda: None,
+        "in-memory": InMemorySpanExporter,
+        "jsonl": lambda: JsonLinesSpanExporter(path, service_name="bench"),
+    }
+
+    asyncio.run(serve(real, 200))  # warm-up: connection pool, statement cache
+    request = statistics.median(asyncio.run(serve(real, min(args.requests, 2000))))
+    costs: dict[str, list[float]] = {label: [] for label in modes}
+    # Interleave the modes round by round so drift hits all of them alike; keep the best round.
+    for _ in range(args.rounds):
+        for label, make_exporter in modes.items():
+            costs[label].append(cpu_per_request(stubbed, args.requests, make_exporter()))
+
+    print(f"{'request':<10} {request * 1e6:8.1f} us  (SQLite-backed, tracing off, median)")
+    baseline = min(costs["off"])
+    for label in ("in-memory", "jsonl"):
+        added = min(costs[label]) - baseline
+        print(f"{label:<10} {added * 1e6:+8.1f} us CPU per request  {added / request * 100:+6.2f}% of the request")
+
+
+if __name__ == "__main__":
+    main()
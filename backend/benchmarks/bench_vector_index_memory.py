@@ -0,0 +1,133 @@
+"""
+Per-worker memory and start-up time of the vector index: private in-memory copy vs mmap.
+
+Builds a synthetic corpus (random embeddings, ~400 byte texts) in two formats and starts
+N worker processes per format, all resident at the same time:
+
+* ``json (private)``: what the in-memory llama_index store holds; each worker parses the
+  persisted JSON (``embedding_dict`` of float lists, plus node texts) into its own heap;
+* ``mmap (shared)``: :class:`MmapVectorIndex` over the flat files.
+
+Each worker loads the index, runs a few searches (touching every embedding page), waits
+for the others, then reports its start-up time, RSS, and PSS (RSS with shared pages split
+between the processes that map them; from ``/proc/self/smaps_rollup``). The page cache is
+warmed once before the timed runs, as it would be on a node that has served before.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_vector_index_memory --nodes 20000 --dim 384 --workers 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import statistics
+import string
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.modules.llm_backend.infrastructure.processing.mmap_index import MmapVectorIndex, write_mmap_index
+
+
+def memory_kib() -> dict[str, int]:
+    fields = {}
+    with open("/proc/self/smaps_rollup") as rollup:
+        for line in rollup:
+            name, _, value = line.partition(":")
+            if name in ("Rss", "Pss", "Private_Clean", "Private_Dirty", "Shared_Clean"):
+                fields[name] = int(value.split()[0])
+    return fields
+
+
+def load_json(directory: Path, dim: int) -> tuple[dict, dict]:
+    vectors = json.loads((directory / "vector_store.json").read_text())["embedding_dict"]
+    nodes = json.loads((directory / "docstore.json").read_text())
+    query = [1.0] * dim
+    # The llama_index simple store scores in Python; score a sample so the timing stays bounded.
+    sample = list(vectors.items())[:1000]
+    sorted(((sum(a * b for a, b in zip(query, vector)), key) for key, vector in sample), reverse=True)[:4]
+    return vectors, nodes
+
+
+def load_mmap(directory: Path, dim: int) -> MmapVectorIndex:
+    index = MmapVectorIndex.open(directory)
+    for seed in range(3):
+        index.search(np.random.default_rng(seed).normal(size=dim), top_k=4)
+    return index
+
+
+LOADERS = {"json (private)": load_json, "mmap (shared)": load_mmap}
+
+
+def worker(label: str, directory: str, dim: int, barrier, results) -> None:
+    started = time.perf_counter()
+    index = LOADERS[label](Path(directory), dim)  # noqa: F841 - kept alive while memory is measured
+    elapsed = time.perf_counter() - started
+    barrier.wait()
+    results.put((elapsed, memory_kib()))
+    barrier.wait()
+
+
+def build_corpus(root: Path, nodes: int, dim: int) -> dict[str, Path]:
+    rng = np.random.default_rng(0)
+    letters = random.Random(0)
+    embeddings = rng.normal(size=(nodes, dim)).astype(np.float32)
+    vocabulary = ["".join(letters.choices(string.ascii_lowercase, k=letters.randint(3, 9))) for _ in range(2000)]
+    texts = [" ".join(letters.choices(vocabulary, k=64)) for _ in range(nodes)]
+    sources = [f"docs/file_{i % 500}.md" for i in range(nodes)]
+
+    json_dir = root / "json"
+    json_dir.mkdir()
+    keys = [f"node-{i}" for i in range(nodes)]
+    (json_dir / "vector_store.json").write_text(json.dumps({"embedding_dict": dict(zip(keys, embeddings.tolist()))}))
+    (json_dir / "docstore.json").write_text(
+        json.dumps({key: {"text": text, "file_path": source} for key, text, source in zip(keys, texts, sources)})
+    )
+    write_mmap_index(root / "mmap", embeddings, texts, sources)
+    return {"json (private)": json_dir, "mmap (shared)": root / "mmap"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp())
+    directories = build_corpus(root, args.nodes, args.dim)
+    for label, directory in directories.items():
+        size = sum(path.stat().st_size for path in directory.iterdir())
+        print(f"{label:<16} on disk {size / 2**20:8.1f} MiB")
+        for path in directory.iterdir():
+            path.read_bytes()  # warm the page cache
+
+    context = multiprocessing.get_context("spawn")
+    for label, directory in directories.items():
+        barrier, results = context.Barrier(args.workers), context.Queue()
+        processes = [
+            context.Process(target=worker, args=(label, str(directory), args.dim, barrier, results))
+            for _ in range(args.workers)
+        ]
+        for process in processes:
+            process.start()
+        samples = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        startup = statistics.median(elapsed for elapsed, _ in samples)
+        rss = statistics.median(memory["Rss"] for _, memory in samples) / 1024
+        pss = statistics.median(memory["Pss"] for _, memory in samples) / 1024
+        private = statistics.median(memory["Private_Clean"] + memory["Private_Dirty"] for _, memory in samples) / 1024
+        print(
+            f"{label:<16} {args.workers} workers  start-up {startup * 1e3:8.1f} ms  RSS {rss:8.1f} MiB  "
+            f"PSS {pss:8.1f} MiB  private {private:8.1f} MiB  (per worker, median)"
+        )
+
+
+if __name__ == "__main__":
+    main()
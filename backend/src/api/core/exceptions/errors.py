@@ -1,3 +1,4 @@
+import math
 from typing import Optional
 
 from fastapi import HTTPException, status
@@ -7,6 +8,7 @@ class APIError(HTTPException):
     def __init__(self, status_code: int, error_code: str, message: str, details: Optional[list[dict]] = None):
         super().__init__(status_code=status_code, detail=message)
         self.error_code = error_code
+        self.message = message
         self.details = details or []
         self.documentation_url = f"https://docs.example.com/errors#{error_code}"
 
@@ -40,3 +42,11 @@ class InternalServerError(APIError):
             message=message,
             details=details,
         )
+
+
+class TooManyRequestsError(APIError):
+    """Error for callers over their rate limit"""
+
+    def __init__(self, retry_after: float, message: str = "Too many requests"):
+        super().__init__(status_code=status.HTTP_429_TOO_MANY_REQUESTS, error_code="rate_limited", message=message)
+        self.headers = {"Retry-After": str(math.ceil(retry_after))}
@@ -1,7 +1,9 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
-from .errors import APIError
+from src.building_blocks.domain.exceptions import RateLimitExceededException
+
+from .errors import APIError, TooManyRequestsError
 from .schemas import ErrorDetail, ErrorResponse
 
 
@@ -16,6 +18,14 @@ async def global_exception_handler(request: Request, error: APIError) -> JSONRes
 
     return JSONResponse(
         content=err.model_dump(),
-        status_code=getattr(err, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
-        headers={"Content-Type": "application/problem+json", "X-Error-Code": error.error_code},
+        status_code=getattr(error, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
+        headers={
+            **(getattr(error, "headers", None) or {}),
+            "Content-Type": "application/problem+json",
+            "X-Error-Code": error.error_code,
+        },
     )
+
+
+async def rate_limit_exception_handler(request: Request, error: RateLimitExceededException) -> JSONResponse:
+    return await global_exception_handler(request, TooManyRequestsError(error.retry_after, message=error.message))
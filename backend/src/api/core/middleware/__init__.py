@@ -1,4 +1,14 @@
 from .logging import LoggingMiddleware
+from .metrics import MetricsMiddleware, metrics_endpoint
+from .rate_limit import RateLimitMiddleware
 from .security import SecurityHeadersMiddleware
+from .tracing import TracingMiddleware
 
-__all__ = ["SecurityHeadersMiddleware", "LoggingMiddleware"]
+__all__ = [
+    "SecurityHeadersMiddleware",
+    "LoggingMiddleware",
+    "RateLimitMiddleware",
+    "TracingMiddleware",
+    "MetricsMiddleware",
+    "metrics_endpoint",
+]
@@ -1,10 +1,36 @@
+import logging
+import time
+
+
 class LoggingMiddleware:
-    def __init__(self, app):
+    """
+    Logs one line per HTTP request: method, path, status and duration.
+
+    Goes through the standard logging pipeline, so with queue logging on (see
+    ``QueueLogging``) the request only pays for enqueueing the record.
+    """
+
+    def __init__(self, app, logger_name: str = "chatbot"):
         self.app = app
+        self.logger = logging.getLogger(f"{logger_name}.requests")
 
     async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            method = scope["method"]
-            path = scope["path"]
-            print(f"Request: {method} {path}")
-        await self.app(scope, receive, send)
+        if scope["type"] != "http" or not self.logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.logger.info(
+                "%s %s %d %.1fms", scope["method"], scope["path"], status, (time.perf_counter() - started) * 1000
+            )
@@ -0,0 +1,58 @@
+import time
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.building_blocks.infrastructure.metrics import CONTENT_TYPE_LATEST, render_metrics
+from src.building_blocks.infrastructure.metrics.instruments import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Records rate, errors and duration of each HTTP request, labelled by route template.
+
+    Paths that match no route are counted under ``unmatched`` so scanners cannot create
+    a series per URL. ``excluded_paths`` (the scrape endpoint itself) are not measured.
+    """
+
+    def __init__(self, app, excluded_paths: tuple[str, ...] = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = scope.get("route")
+            template = route.path if route is not None else UNMATCHED_ROUTE
+            HTTP_REQUESTS.labels(method, template, status).inc()
+            HTTP_REQUEST_DURATION.labels(method, template).observe(elapsed)
+
+
+def metrics_endpoint(request: Request) -> Response:
+    """The scrape endpoint; synchronous, so reading the workers' files happens off the event loop."""
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
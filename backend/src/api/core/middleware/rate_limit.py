@@ -0,0 +1,79 @@
+import json
+import math
+from typing import Callable, Iterable, Optional
+
+from src.building_blocks.application.rate_limiter import RateLimitDecision, RateLimiter
+
+
+def rate_limit_headers(decision: RateLimitDecision) -> list[tuple[bytes, bytes]]:
+    headers = [
+        (b"x-ratelimit-limit", str(decision.limit).encode()),
+        (b"x-ratelimit-remaining", str(max(decision.remaining, 0)).encode()),
+    ]
+    if not decision.allowed:
+        headers.append((b"retry-after", str(math.ceil(decision.retry_after)).encode()))
+    return headers
+
+
+class RateLimitMiddleware:
+    """
+    Per-client request limit for every HTTP route.
+
+    Clients are keyed by the subject of a bearer token that ``subject_resolver``
+    verifies, or by peer address otherwise, so minting a fresh unverifiable token
+    per request does not buy a fresh allowance. Rejected requests get ``429`` with
+    ``Retry-After`` without reaching the application.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: RateLimiter,
+        requests_per_minute: int,
+        subject_resolver: Optional[Callable[[str], Optional[str]]] = None,
+        exempt_paths: Iterable[str] = ("/docs", "/redoc", "/openapi.json"),
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.limit = requests_per_minute
+        self.subject_resolver = subject_resolver
+        self.exempt_paths = tuple(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+
+        decision = self.limiter.acquire(self._client_key(scope), self.limit, 60.0)
+        if not decision.allowed:
+            await self._reject(send, decision)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *rate_limit_headers(decision)]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _client_key(self, scope) -> str:
+        if self.subject_resolver is not None:
+            for name, value in scope["headers"]:
+                if name == b"authorization" and value[:7].lower() == b"bearer ":
+                    subject = self.subject_resolver(value[7:].decode("latin-1"))
+                    if subject is not None:
+                        return f"user:{subject}"
+                    break
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    @staticmethod
+    async def _reject(send, decision: RateLimitDecision) -> None:
+        body = json.dumps({"error_code": "rate_limited", "message": "Too many requests", "details": []}).encode()
+        headers = [
+            (b"content-type", b"application/problem+json"),
+            (b"content-length", str(len(body)).encode()),
+            *rate_limit_headers(decision),
+        ]
+        await send({"type": "http.response.start", "status": 429, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
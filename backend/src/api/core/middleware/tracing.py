@@ -0,0 +1,59 @@
+from src.building_blocks.infrastructure.tracing import (
+    Span,
+    SpanKind,
+    StatusCode,
+    format_traceparent,
+    parse_traceparent,
+    start_span,
+)
+
+
+class TracingMiddleware:
+    """
+    Opens the root server span of each HTTP request.
+
+    A caller's W3C ``traceparent`` header makes the request part of the caller's trace;
+    the response carries this span's ``traceparent`` so clients can look the trace up.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                parent = parse_traceparent(value.decode("latin-1"))
+                break
+
+        method = scope["method"]
+        with start_span(
+            f"{method} {scope['path']}",
+            {"http.request.method": method, "url.path": scope["path"]},
+            kind=SpanKind.SERVER,
+            parent=parent,
+        ) as span:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    span.set_attribute("http.response.status_code", status)
+                    if status >= 500:
+                        span.set_status(StatusCode.ERROR)
+                    if isinstance(span, Span):
+                        message["headers"] = [
+                            *message.get("headers", ()),
+                            (b"traceparent", format_traceparent(span).encode()),
+                        ]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+            route = scope.get("route")
+            if route is not None and isinstance(span, Span):
+                # Name by the route template, as OpenTelemetry does, so spans group across ids.
+                span.name = f"{method} {route.path}"
+                span.set_attribute("http.route", route.path)
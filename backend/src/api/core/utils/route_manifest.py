@@ -0,0 +1,69 @@
+"""
+Build-time route manifest.
+
+Scanning ``PACKAGE_PATHS`` imports every module of every router package and inspects all
+of their members. The manifest records, once at build time, which module attribute holds
+each router, so a worker started with ``APP_ROUTE_MANIFEST_PATH`` imports only those
+modules. Build it with::
+
+    python -m src.api.core.utils.route_manifest --output src/api/route_manifest.json
+"""
+
+import argparse
+import importlib
+import json
+from inspect import getmembers
+from pathlib import Path
+
+from fastapi import APIRouter
+
+from .import_helpers import import_modules_from_package
+from .routing_helpers import PACKAGE_PATHS
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_PATH = Path(__file__).resolve().parents[2] / "route_manifest.json"
+
+
+def discover_routes(package_paths: list[str] = PACKAGE_PATHS) -> list[dict[str, str]]:
+    """Scan the router packages, as ``collect_routers`` does, and return where each router lives."""
+    entries, seen = [], set()
+    for package_path in package_paths:
+        for module in import_modules_from_package(package_path):
+            for name, member in getmembers(module, lambda member: isinstance(member, APIRouter)):
+                if id(member) not in seen:
+                    seen.add(id(member))
+                    entries.append({"module": module.__name__, "attribute": name})
+    return entries
+
+
+def write_manifest(path: str | Path, entries: list[dict[str, str]]) -> None:
+    manifest = {"version": MANIFEST_VERSION, "routers": entries}
+    Path(path).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def load_routers(path: str | Path) -> list[APIRouter]:
+    """Import exactly the routers listed in the manifest at ``path``, in order."""
+    manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise RuntimeError(f"Route manifest {path} has version {manifest.get('version')}; rebuild it.")
+    routers = []
+    for entry in manifest["routers"]:
+        router = getattr(importlib.import_module(entry["module"]), entry["attribute"], None)
+        if not isinstance(router, APIRouter):
+            raise RuntimeError(f"Route manifest {path} is stale: no router at {entry['module']}.{entry['attribute']}")
+        routers.append(router)
+    return routers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write the route manifest used by APP_ROUTE_MANIFEST_PATH.")
+    parser.add_argument("--output", default=str(DEFAULT_MANIFEST_PATH))
+    args = parser.parse_args()
+
+    entries = discover_routes()
+    write_manifest(args.output, entries)
+    print(f"Wrote {len(entries)} routers to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
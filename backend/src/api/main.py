@@ -1,17 +1,27 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.modules.accounts.infrastructure.configuration.startup import AccountsStartUp
-from src.modules.chats.infrastructure.configuration.startup import ChatsStartUp
+from src.building_blocks.domain.exceptions import RateLimitExceededException
+from src.building_blocks.infrastructure.logging_pipeline import QueueLogging
+from src.building_blocks.infrastructure.metrics import configure_metrics, mark_process_dead, reset_multiprocess_dir
+from src.building_blocks.infrastructure.rate_limiting import create_rate_limiter
+from src.building_blocks.infrastructure.tracing import (
+    JsonLinesSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporter,
+    configure_tracing,
+)
 
 from .core import middleware
 from .core.config import get_settings
 from .core.config.base import ApiSettings
 from .core.exceptions.errors import APIError
-from .core.exceptions.handlers import global_exception_handler
+from .core.exceptions.handlers import global_exception_handler, rate_limit_exception_handler
+from .core.utils.route_manifest import load_routers
 from .core.utils.routing_helpers import collect_routers
 
 
@@ -24,27 +34,49 @@ class APIFactory:
     def create_app(self) -> FastAPI:
         settings = self.settings
         settings.configure()
+        configure_metrics(settings.METRICS_MULTIPROC_DIR)
+        span_exporter = self._create_span_exporter()
+        configure_tracing(span_exporter)
 
         @asynccontextmanager
         async def lifespan(app: FastAPI):
+            # Module composition roots pull in their whole dependency graph; import them only
+            # when the app actually starts, not whenever ``src.api.main`` is imported.
+            from src.modules.accounts.infrastructure.configuration.startup import AccountsStartUp
+            from src.modules.chats.infrastructure.configuration.startup import ChatsStartUp
+
             startups: list[object] = []
             modules: dict[str, object] = {}
+            # Started here, after uvicorn has applied its own logging config, so its loggers are queued too.
+            log_queue = QueueLogging([None, settings.LOGGER_NAME, "uvicorn.error", "uvicorn.access"])
+            if settings.LOG_QUEUE_ENABLED:
+                log_queue.start()
             try:
                 accounts = AccountsStartUp().initialize(
                     database_url=settings.DATABASE_URL,
                     enable_registration=settings.ACCOUNTS_ENABLE_REGISTRATION,
                     default_role=settings.ACCOUNTS_DEFAULT_ROLE,
+                    password_hashing_workers=settings.ACCOUNTS_PASSWORD_HASHING_WORKERS,
+                    session_sweep_interval_seconds=settings.ACCOUNTS_SESSION_SWEEP_INTERVAL_SECONDS,
+                    outbox_poll_interval_seconds=settings.ACCOUNTS_OUTBOX_POLL_INTERVAL_SECONDS,
                 )
                 startups.append(accounts)
                 modules["accounts"] = accounts
+                accounts.start_outbox_relay()
 
                 chats = ChatsStartUp().initialize(
                     database_url=settings.DATABASE_URL,
                     max_active_chats_per_user=settings.CHATS_MAX_ACTIVE_CHATS_PER_USER,
+                    profanity_wordlist_path=settings.CHATS_PROFANITY_WORDLIST_PATH,
                 )
                 startups.append(chats)
                 modules["chats"] = chats
 
+                # Commands run on executor threads; their async event handlers are handed to this loop.
+                loop = asyncio.get_running_loop()
+                for module in (accounts, chats):
+                    module.container.event_bus().bind_loop(loop)
+
                 app.state.backend_modules = modules
                 yield
             finally:
@@ -53,6 +85,13 @@ class APIFactory:
                         startup.stop()
                     except Exception:
                         pass
+                if span_exporter is not None:
+                    configure_tracing(None)
+                    span_exporter.shutdown()
+                if settings.METRICS_MULTIPROC_DIR:
+                    # This worker's gauges describe a process that is going away; its counters still count.
+                    mark_process_dead()
+                log_queue.stop()
 
         self.app = FastAPI(
             title=settings.PROJECT_NAME,
@@ -69,9 +108,14 @@ class APIFactory:
         self._configure_middleware()
         self._register_exception_handlers()
         self._register_routers()
+        if settings.METRICS_ENABLED:
+            self.app.add_route(settings.METRICS_PATH, middleware.metrics_endpoint, include_in_schema=False)
         return self.app
 
     def run(self, **uvicorn_kwargs):
+        if self.settings.METRICS_MULTIPROC_DIR:
+            # Once, in the parent: the workers' files must start from zero on every launch.
+            reset_multiprocess_dir(self.settings.METRICS_MULTIPROC_DIR)
         if not self.app:
             self.create_app()
         uvicorn.run(
@@ -86,6 +130,17 @@ class APIFactory:
 
     def _configure_middleware(self):
         self.app.add_middleware(middleware.SecurityHeadersMiddleware)
+        if self.settings.LOG_REQUESTS:
+            self.app.add_middleware(middleware.LoggingMiddleware, logger_name=self.settings.LOGGER_NAME)
+        if self.settings.RATE_LIMIT_ENABLED:
+            from .routers.accounts.v1.security.jwt import verified_subject
+
+            self.app.add_middleware(
+                middleware.RateLimitMiddleware,
+                limiter=create_rate_limiter(self.settings.REDIS_URL),
+                requests_per_minute=self.settings.RATE_LIMIT_PER_MINUTE,
+                subject_resolver=verified_subject,
+            )
         if self.settings.CORS_ENABLED:
             self.app.add_middleware(
                 CORSMiddleware,
@@ -94,9 +149,27 @@ class APIFactory:
                 allow_methods=self.settings.CORS_ALLOW_METHODS,
                 allow_headers=self.settings.CORS_ALLOW_HEADERS,
             )
+        if self.settings.METRICS_ENABLED:
+            self.app.add_middleware(middleware.MetricsMiddleware, excluded_paths=(self.settings.METRICS_PATH,))
+        if self.settings.TRACING_EXPORTER:
+            # Added last so it is the outermost middleware and its span covers the others.
+            self.app.add_middleware(middleware.TracingMiddleware)
+
+    def _create_span_exporter(self) -> SpanExporter | None:
+        settings = self.settings
+        if settings.TRACING_EXPORTER == "jsonl":
+            return JsonLinesSpanExporter(settings.TRACING_JSONL_PATH, service_name=settings.PROJECT_NAME)
+        if settings.TRACING_EXPORTER == "otlp":
+            return OtlpHttpSpanExporter(settings.TRACING_OTLP_ENDPOINT, service_name=settings.PROJECT_NAME)
+        if settings.TRACING_EXPORTER:
+            raise ValueError(f"Unknown APP_TRACING_EXPORTER: {settings.TRACING_EXPORTER!r}")
+        return None
 
     def _register_routers(self):
-        routers = collect_routers()
+        if self.settings.ROUTE_MANIFEST_PATH:
+            routers = load_routers(self.settings.ROUTE_MANIFEST_PATH)
+        else:
+            routers = collect_routers()
         for router in routers:
             self.app.include_router(
                 router,
@@ -107,6 +180,7 @@ class APIFactory:
     def _register_exception_handlers(self):
         for error in APIError.__subclasses__():
             self.app.add_exception_handler(error, global_exception_handler)
+        self.app.add_exception_handler(RateLimitExceededException, rate_limit_exception_handler)
         self.app.add_exception_handler(Exception, global_exception_handler)
 
 
@@ -17,3 +17,8 @@ class AccountResponse(BaseModel):
             is_verified=account.is_verified,
             is_active=account.is_active,
         )
+
+
+class AccountListResponse(BaseModel):
+    items: list[AccountResponse]
+    next_cursor: str | None = None
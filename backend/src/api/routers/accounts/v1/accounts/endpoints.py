@@ -1,12 +1,12 @@
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from src.building_blocks.domain.result import Result
 from ......modules.accounts.domain.account import Account
 from ......modules.accounts.infrastructure.accounts_module import AccountsModule
 from ..security import jwt
-from .account_response import AccountResponse
+from .account_response import AccountListResponse, AccountResponse
 from .get_account import GetAccountRequest
 from .list_accounts import ListAccountsRequest
 from .login_request import LoginRequest
@@ -78,7 +78,10 @@ async def login(
     return result.match(
         on_success=lambda data: LoginResponse(
             user=AccountResponse.from_domain(data[0]),
-            access_token=jwt.create_access_token({"sub": str(data[0].id.value)}, expires_delta=timedelta(minutes=30)),
+            # Bound to the session, so logging out or revoking it also refuses the access token.
+            access_token=jwt.create_access_token(
+                {"sub": str(data[0].id.value), "sid": str(data[1].session_id)}, expires_delta=timedelta(minutes=30)
+            ),
             refresh_token=data[1].refresh_token,
             session_id=data[1].session_id,
         ),
@@ -105,16 +108,21 @@ async def get_account(
 
 @router.get(
     "/",
-    response_model=list[AccountResponse],
-    summary="List all accounts",
+    response_model=AccountListResponse,
+    summary="List accounts, one page at a time",
 )
 async def list_accounts(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description="`next_cursor` returned by the previous page"),
     current_user: Account = Depends(jwt.get_current_user),
     accounts_module: AccountsModule = Depends(AccountsModule),
-) -> list[AccountResponse]:
-    result: Result = await accounts_module.execute_query_async(command=ListAccountsRequest())
+) -> AccountListResponse:
+    result: Result = await accounts_module.execute_query_async(command=ListAccountsRequest(limit=limit, cursor=cursor))
     return result.match(
-        on_success=lambda accounts: [AccountResponse.from_domain(account) for account in accounts],
+        on_success=lambda page: AccountListResponse(
+            items=[AccountResponse.from_domain(account) for account in page.items],
+            next_cursor=page.next_cursor,
+        ),
         on_failure=_raise_http(status.HTTP_400_BAD_REQUEST),
     )
 
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ListAccountsRequest(BaseModel):
-    pass
+    limit: int = Field(default=50, ge=1, le=200)
+    cursor: str | None = None
@@ -6,17 +6,30 @@ import base64
 import hashlib
 import hmac
 import json
+import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from src.building_blocks.infrastructure.cache import TTLCache
+from src.modules.accounts.domain.account import Account, AccountId
+from src.modules.accounts.domain.session import SessionId
+from src.modules.accounts.infrastructure.caching.principal_cache import Principal
+
 # In production these values should be provided via configuration.
 SECRET_KEY = "change-me-to-a-secure-random-string"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# Verified token -> claims. Bounded, and each entry expires no later than the token's ``exp``,
+# so repeated requests with the same bearer token skip the decode and HMAC check.
+VERIFIED_TOKEN_CACHE_SIZE = 10_000
+_verified_tokens: TTLCache[str, Dict[str, Any]] = TTLCache(
+    maxsize=VERIFIED_TOKEN_CACHE_SIZE, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60, name="verified_tokens"
+)
+
 
 def _b64url_encode(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode("utf-8")
@@ -47,6 +60,16 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
+    cached = _verified_tokens.get(token)
+    if cached is not None:
+        # Entries never outlive ``exp``, so a hit is a token that was verified and is still valid.
+        return dict(cached)
+    payload = _verify_access_token(token)
+    _verified_tokens.set(token, payload, ttl=payload["exp"] - datetime.utcnow().timestamp())
+    return dict(payload)
+
+
+def _verify_access_token(token: str) -> Dict[str, Any]:
     parts = token.split(".")
     if len(parts) != 3:
         raise HTTPException(
@@ -94,11 +117,7 @@ _bearer = HTTPBearer()
 _optional_bearer = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(_bearer),
-):
-    token = credentials.credentials
-    payload = decode_access_token(token)
+def _subject(payload: Dict[str, Any]) -> str:
     user_id = payload.get("sub")
     if user_id is None:
         raise HTTPException(
@@ -106,58 +125,85 @@ def get_current_user(
             detail="Invalid token payload",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    from src.modules.accounts.infrastructure.configuration.startup import AccountsStartUp
-    from src.modules.accounts.domain.aggregates.account.account import Account as DomainUser
+    return str(user_id)
+
+
+def verified_subject(token: str) -> Optional[str]:
+    """The ``sub`` claim of a valid access token, or ``None`` when the token does not verify."""
+    try:
+        return _subject(decode_access_token(token))
+    except HTTPException:
+        return None
 
-    AccountsStartUp.initialize()
-    service = AccountsStartUp.service
-    if service is None:
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _resolve_principal(request: Request, payload: Dict[str, Any]) -> Account:
+    """
+    The account behind verified claims, checked against the account and, for tokens bound
+    to a session (``sid``), against that session.
+
+    The verified-token cache only skips the signature check; this runs on every request,
+    so a deactivated account or a revoked session is refused as soon as its event has
+    evicted the cached principal, however long the token itself stays valid.
+    """
+    accounts = getattr(request.app.state, "backend_modules", {}).get("accounts")
+    if accounts is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Accounts service not available",
         )
-    user = service.get_user(user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    return user
+    user_id, session_id = _subject(payload), payload.get("sid")
+    principals = accounts.container.principal_cache()
+    principal: Optional[Principal] = principals.get(user_id)
+    if principal is not None and (session_id is None or session_id in principal.session_ids):
+        return principal.to_account()
+
+    if principal is None:
+        try:
+            account_id = AccountId(uuid.UUID(user_id))
+        except ValueError:
+            account_id = None
+        user = accounts.container.account_repository().get_by_id(account_id) if account_id else None
+        if not user or not user.is_active:
+            raise _unauthorized("User not found")
+        principal = Principal.of(user)
+    if session_id is not None:
+        _check_session(accounts.container.session_repository(), principal.account_id, str(session_id))
+        principal = principal.with_session(str(session_id))
+    principals.put(user_id, principal)
+    return principal.to_account()
+
+
+def _check_session(sessions: Any, account_id: AccountId, session_id: str) -> None:
+    try:
+        session = sessions.get_by_id(SessionId(uuid.UUID(session_id)))
+    except ValueError:
+        session = None
+    if not session or session.account_id != account_id or not session.is_active or session.is_expired():
+        raise _unauthorized("Session is no longer active")
+
+
+def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(_bearer),
+) -> Account:
+    return _resolve_principal(request, decode_access_token(credentials.credentials))
 
 
 def get_current_user_optional(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(_optional_bearer),
-):
+) -> Optional[Account]:
     if credentials is None:
         return None
-    token = credentials.credentials
-    payload = decode_access_token(token)
-    user_id = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    from src.modules.accounts.infrastructure.configuration.startup import AccountsStartUp
-    from src.modules.accounts.domain.aggregates.account.account import Account as DomainUser
-
-    AccountsStartUp.initialize()
-    service = AccountsStartUp.service
-    if service is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Accounts service not available",
-        )
-    user = service.get_user(user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    return user
+    return _resolve_principal(request, decode_access_token(credentials.credentials))
 
 
 __all__ = [
@@ -166,6 +212,7 @@ __all__ = [
     "ACCESS_TOKEN_EXPIRE_MINUTES",
     "create_access_token",
     "decode_access_token",
+    "verified_subject",
     "get_current_user",
     "get_current_user_optional",
 ]
@@ -1,13 +1,21 @@
+from typing import AsyncIterator, Generator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 
+from src.modules.accounts.domain.account import Account
 from src.modules.chats.application.conversation_lifecycle.start_conversation.command import StartConversationCommand
+from src.modules.chats.application.queries.export_conversations.dto import ConversationExportDTO
+from src.modules.chats.application.queries.export_conversations.query import ExportConversationsQuery, ExportFormat
 from src.building_blocks.domain.result import Result
 from src.modules.chats.infrastructure.chat_module import ChatsModule
 
 from .....core.exceptions.errors import APIError
+from ....accounts.v1.security import jwt
 
 # from src.building_blocks.domain.result import Result
 # from src.modules.chats.application.contracts.mediator import IMediator
@@ -133,7 +141,58 @@ async def create_conversation(
 #     )
 
 
-# TODO: Conversation download endpoint can be reintroduced once supporting query/handlers are implemented.
+async def _stream(chunks: Generator[bytes, None, None]) -> AsyncIterator[bytes]:
+    """
+    Pull each chunk on a worker thread, so database reads stay off the loop.
+
+    Starlette abandons a sync iterator when the client disconnects; closing it here instead
+    releases the export's database session as soon as the response is cancelled.
+    """
+    try:
+        async for chunk in iterate_in_threadpool(chunks):
+            yield chunk
+    finally:
+        with anyio.CancelScope(shield=True):
+            await run_in_threadpool(chunks.close)
+
+
+def _download(export: ConversationExportDTO | None) -> StreamingResponse:
+    if export is None:
+        raise APIError(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
+    return StreamingResponse(
+        _stream(export.chunks),
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
+
+
+@router.get("/export", summary="Download all of the user's conversations")
+async def export_conversations(
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    current_user: Account = Depends(jwt.get_current_user),
+    chats_module: ChatsModule = Depends(ChatsModule),
+) -> StreamingResponse:
+    """
+    Stream every conversation the user created as NDJSON, Markdown or a ZIP of Markdown files.
+    """
+    query = ExportConversationsQuery(user_id=current_user.id.value, format=export_format)
+    return _download(await chats_module.execute_query_async(query))
+
+
+@router.get("/{conversation_id}/export", summary="Download a conversation")
+async def export_conversation(
+    conversation_id: UUID,
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    current_user: Account = Depends(jwt.get_current_user),
+    chats_module: ChatsModule = Depends(ChatsModule),
+) -> StreamingResponse:
+    """
+    Stream one of the user's conversations as NDJSON, Markdown or a ZIP with one Markdown file.
+    """
+    query = ExportConversationsQuery(
+        user_id=current_user.id.value, conversation_id=conversation_id, format=export_format
+    )
+    return _download(await chats_module.execute_query_async(query))
 
 
 # @chat_page.route("/")
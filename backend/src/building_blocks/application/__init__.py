@@ -3,6 +3,7 @@
 from .bus import CommandBus, QueryBus
 from .command import Command, CommandHandler
 from .query import Query, QueryHandler
+from .rate_limiter import RateLimitDecision, RateLimiter
 
 __all__ = [
     "Command",
@@ -11,4 +12,6 @@ __all__ = [
     "Query",
     "QueryHandler",
     "QueryBus",
+    "RateLimitDecision",
+    "RateLimiter",
 ]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimitDecision:
+    """Outcome of a rate-limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0  # seconds until the request would be admitted; 0 when allowed
+
+
+class RateLimiter(ABC):
+    """Port for admission control; implementations live in the infrastructure layer."""
+
+    @abstractmethod
+    def acquire(self, key: str, limit: int, period_seconds: float, cost: int = 1) -> RateLimitDecision:
+        """
+        Consume ``cost`` units of ``key``'s allowance of ``limit`` per ``period_seconds``.
+
+        A denied request consumes nothing, so retrying after ``retry_after`` succeeds.
+        """
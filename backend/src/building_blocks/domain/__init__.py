@@ -5,11 +5,14 @@ from .entity import Entity
 from .events import DomainEvent
 from .exceptions import (
     BusinessRuleValidationException,
+    BusinessRuleViolationsException,
     DomainException,
     EntityNotFoundException,
+    RateLimitExceededException,
     RepositoryException,
 )
 from .rule import BaseBusinessRule
+from .rule_set import RuleSet
 from .value_object import ValueObject
 
 __all__ = [
@@ -18,8 +21,11 @@ __all__ = [
     "DomainEvent",
     "DomainException",
     "BusinessRuleValidationException",
+    "BusinessRuleViolationsException",
     "EntityNotFoundException",
     "RepositoryException",
+    "RateLimitExceededException",
     "BaseBusinessRule",
+    "RuleSet",
     "ValueObject",
 ]
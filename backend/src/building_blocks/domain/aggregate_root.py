@@ -6,7 +6,7 @@ from typing import TypeVar
 from .entity import Entity, TEntityId
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class AggregateRoot(Entity[TEntityId]):
     """Aggregate root marker that extends :class:`Entity`."""
 
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field, replace
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Self, TypeVar
 
 from .events import DomainEvent
 from .exceptions import BusinessRuleValidationException
 from .rule import BaseBusinessRule
+from .serialization import serializer_for
 
 TEntityId = TypeVar("TEntityId")
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Entity(Generic[TEntityId]):
     """Base class for all domain entities."""
 
@@ -57,10 +58,27 @@ class Entity(Generic[TEntityId]):
         return replace(self, **changes)
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize the entity (recursively) into a dict."""
-        raw = asdict(self)
-        raw.pop("_events", None)
-        return {key: value.to_dict() if isinstance(value, Entity) else value for key, value in raw.items()}
+        """Serialize the entity (recursively) into a JSON-ready dict; pending events are left out."""
+        return serializer_for(type(self))(self)
+
+    # ------------------------------------------------------------------ #
+    # Rehydration
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def _restore(cls, **state: Any) -> Self:
+        """
+        Build an instance directly from persisted state.
+
+        ``__init__`` is bypassed, so no default factories, business rules or
+        domain events run. Every field must be passed by its attribute name;
+        the pending event list always starts empty.
+        """
+        instance = cls.__new__(cls)
+        set_attribute = object.__setattr__
+        for name, value in state.items():
+            set_attribute(instance, name, value)
+        set_attribute(instance, "_events", [])
+        return instance
 
     # ------------------------------------------------------------------ #
     # Domain events
@@ -10,6 +10,7 @@ class ErrorType(Enum):
     CONFLICT_ERROR = "ConflictError"
     UNAUTHORIZED_ACCESS = "UnauthorizedAccess"
     FORBIDDEN_ACCESS = "ForbiddenAccess"
+    RATE_LIMITED = "RateLimited"
     INFRASTRUCTURE_ERROR = "InfrastructureError"
     INTERNAL_ERROR = "InternalError"
 
@@ -29,3 +30,4 @@ class ErrorCode(Enum):
     INVALID_PASSWORD = "InvalidPassword"
     VALIDATION_ERROR = "ValidationError"
     SESSION_EXPIRATION_INVALID = "SessionExpirationInvalid"
+    RATE_LIMIT_EXCEEDED = "RateLimitExceeded"
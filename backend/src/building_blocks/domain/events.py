@@ -1,11 +1,17 @@
 import datetime
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 
+from .serialization import serializer_for
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
-    """Base class for the domain event"""
+    """
+    Base class for the domain event.
+
+    Events are immutable facts: subclasses are declared ``@dataclass(frozen=True, slots=True)``.
+    """
 
     # Auto-populate identifiers; keep them out of __init__ so subclasses can add required fields.
     _event_id: uuid.UUID = field(default_factory=uuid.uuid4, init=False)
@@ -24,8 +30,5 @@ class DomainEvent:
         return self._occurred_on
 
     def to_dict(self) -> dict:
-        """Serialize the event for logging or the outbox."""
-        raw = asdict(self)
-        raw["event_id"] = str(self._event_id)
-        raw["occurred_on"] = self._occurred_on.isoformat()
-        return raw
+        """Serialize the event into a JSON-ready dict for logging or the outbox."""
+        return serializer_for(type(self))(self)
@@ -26,6 +26,20 @@ class BusinessRuleValidationException(DomainException):
         super().__init__(message=rule.message, code=rule.code, error_type=rule.error_type)
 
 
+class BusinessRuleViolationsException(BusinessRuleValidationException):
+    """
+    Raised by ``RuleSet.check_all`` with every broken rule; ``rule`` is the first of them.
+
+    A subclass, so handlers of :class:`BusinessRuleValidationException` also catch it.
+    """
+
+    def __init__(self, rules: list[BaseBusinessRule]):
+        super().__init__(rules[0])
+        self.rules = rules
+        self.message = " ".join(rule.message for rule in rules)
+        self.args = (self.message,)
+
+
 class EntityNotFoundException(DomainException):
     """Raised when an aggregate or entity cannot be found."""
 
@@ -46,3 +60,15 @@ class RepositoryException(DomainException):
             code=code or ErrorCode.INFRASTRUCTURE_FAILURE,
             error_type=ErrorType.INFRASTRUCTURE_ERROR,
         )
+
+
+class RateLimitExceededException(DomainException):
+    """Raised when a caller has used up its request allowance; ``retry_after`` is in seconds."""
+
+    def __init__(self, retry_after: float, message: str = "Rate limit exceeded."):
+        self.retry_after = retry_after
+        super().__init__(
+            message=message,
+            code=ErrorCode.RATE_LIMIT_EXCEEDED,
+            error_type=ErrorType.RATE_LIMITED,
+        )
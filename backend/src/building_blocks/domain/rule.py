@@ -15,3 +15,13 @@ class BaseBusinessRule(ABC):
     @abstractmethod
     def is_broken(self) -> bool:
         """Check if the business rule is satisfied."""
+
+    @classmethod
+    def is_broken_for(cls, *values) -> bool:
+        """
+        Evaluate the rule for the constructor ``values`` without keeping an instance.
+
+        Rules used on hot paths override this with a ``staticmethod`` holding the check and
+        let ``is_broken`` delegate to it, so a ``RuleSet`` allocates nothing while they hold.
+        """
+        return cls(*values).is_broken()
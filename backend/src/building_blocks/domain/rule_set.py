@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from .exceptions import BusinessRuleValidationException, BusinessRuleViolationsException
+from .rule import BaseBusinessRule
+
+RuleArguments = Callable[..., tuple]
+
+
+class RuleSet:
+    """
+    Reusable validator for one aggregate operation.
+
+    Built once (typically at module level) from ``(rule class, arguments)`` pairs.
+    ``arguments`` maps the operation's arguments to the rule's constructor values, which
+    are checked with the rule's own :meth:`~BaseBusinessRule.is_broken_for`; a rule
+    instance is only created for the exception once the rule is broken.
+
+    For example, ``(TitleCannotBeEmptyRule, lambda conversation, title: (title,))`` checks
+    a rename's new title; see the rule sets in ``chats.domain.conversations.conversation``.
+    """
+
+    __slots__ = ("_rules",)
+
+    def __init__(self, *rules: tuple[type[BaseBusinessRule], RuleArguments]) -> None:
+        self._rules = tuple(rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def check(self, *args) -> None:
+        """Raise for the first broken rule, in declaration order; later rules are not evaluated."""
+        for rule, arguments in self._rules:
+            values = arguments(*args)
+            if rule.is_broken_for(*values):
+                raise BusinessRuleValidationException(rule(*values))
+
+    def violations(self, *args) -> list[BaseBusinessRule]:
+        """Evaluate every rule and return the broken ones, in declaration order."""
+        broken = []
+        for rule, arguments in self._rules:
+            values = arguments(*args)
+            if rule.is_broken_for(*values):
+                broken.append(rule(*values))
+        return broken
+
+    def check_all(self, *args) -> None:
+        """Raise a single :class:`BusinessRuleViolationsException` listing every broken rule."""
+        broken = self.violations(*args)
+        if broken:
+            raise BusinessRuleViolationsException(broken)
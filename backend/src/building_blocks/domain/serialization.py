@@ -0,0 +1,224 @@
+"""
+Compiled dataclass serializers.
+
+:func:`serializer_for` generates, once per class, a function that turns an instance into
+a JSON-ready ``dict`` with one expression per field, chosen from the field's annotation.
+Compared with ``dataclasses.asdict`` there is no recursive deep copy and no per-value
+type dispatch for the common field types, and the output can be handed straight to any
+JSON encoder.
+
+:func:`deserializer_for` is the inverse: it rebuilds an instance from such a ``dict``
+once it has been through JSON, converting each field back by its annotation (UUIDs,
+datetimes, enums, value objects, collections of them).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import types
+import typing
+import uuid
+from typing import Any, Callable
+
+Serializer = Callable[[Any], dict[str, Any]]
+Deserializer = Callable[[dict[str, Any]], Any]
+
+_serializers: dict[type, Serializer] = {}
+_deserializers: dict[type, Deserializer] = {}
+
+_PASSTHROUGH = (str, int, float, bool, type(None))
+
+_FAST_PATHS: dict[type, str] = {
+    str: "{0}",
+    int: "{0}",
+    float: "{0}",
+    bool: "{0}",
+    uuid.UUID: "str({0})",
+    datetime.datetime: "{0}.isoformat()",
+    datetime.date: "{0}.isoformat()",
+}
+
+_DECODERS: dict[type, str] = {
+    uuid.UUID: "_UUID({0})",
+    datetime.datetime: "_datetime.fromisoformat({0})",
+    datetime.date: "_date.fromisoformat({0})",
+}
+
+
+def to_primitive(value: Any) -> Any:
+    """Convert a value of any supported type; the fallback for fields without usable annotations."""
+    if isinstance(value, _PASSTHROUGH):
+        return value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return to_primitive(value.value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return serializer_for(type(value))(value)
+    if isinstance(value, dict):
+        return {str(key): to_primitive(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [to_primitive(item) for item in value]
+    return str(value)
+
+
+def serializer_for(cls: type) -> Serializer:
+    """Return the compiled serializer for dataclass ``cls``, building it on first use."""
+    serializer = _serializers.get(cls)
+    if serializer is None:
+        serializer = _serializers[cls] = _compile(cls)
+    return serializer
+
+
+def _is_single_value(cls: type) -> bool:
+    # ``AccountId(value=...)``-style value objects serialize as their bare value.
+    names = [field.name for field in dataclasses.fields(cls)]
+    return names == ["value"]
+
+
+def _compile(cls: type) -> Serializer:
+    from .entity import Entity
+    from .events import DomainEvent
+
+    try:
+        hints = typing.get_type_hints(cls)
+    except Exception:  # unresolvable forward references: every field takes the dynamic path
+        hints = {}
+
+    namespace: dict[str, Any] = {"_primitive": to_primitive}
+    namespace.update({f"_{fast_type.__name__}": fast_type for fast_type in _FAST_PATHS})
+    items: list[str] = []
+    for field in dataclasses.fields(cls):
+        name = field.name
+        if issubclass(cls, Entity) and name == "_events":
+            continue
+        key = name
+        if issubclass(cls, DomainEvent) and name in ("_event_id", "_occurred_on"):
+            key = name[1:]
+        items.append(f"{key!r}: {_expression(hints.get(name, Any), f'obj.{name}')}")
+
+    if _is_single_value(cls) and not issubclass(cls, (Entity, DomainEvent)):
+        body = f"    return {_expression(hints.get('value', Any), 'obj.value')}"
+    else:
+        body = "    return {" + ", ".join(items) + "}"
+    source = f"def serialize(obj):\n{body}\n"
+    exec(compile(source, f"<serializer {cls.__qualname__}>", "exec"), namespace)
+    serialize = namespace["serialize"]
+    serialize.__qualname__ = f"serializer_for({cls.__qualname__})"
+    return serialize
+
+
+def _expression(annotation: Any, value: str, depth: int = 0) -> str:
+    """Python expression converting ``value`` (typed ``annotation``) to a JSON-ready value."""
+    origin = typing.get_origin(annotation)
+    arguments = typing.get_args(annotation)
+
+    if origin in (typing.Union, types.UnionType):
+        members = [argument for argument in arguments if argument is not type(None)]
+        if len(members) == 1:
+            return f"(None if {value} is None else {_expression(members[0], value, depth)})"
+        return f"_primitive({value})"
+    if origin in (list, set, frozenset) and len(arguments) == 1:
+        item_type = arguments[0]
+    elif origin is tuple and len(arguments) == 2 and arguments[1] is Ellipsis:
+        item_type = arguments[0]
+    else:
+        item_type = None
+    if item_type is not None:
+        item = f"item{depth}"
+        return f"[{_expression(item_type, item, depth + 1)} for {item} in {value}]"
+
+    fast = _FAST_PATHS.get(annotation)
+    if fast is not None:
+        # Annotations are not enforced (an id field may well hold a value object), so the
+        # fast conversion is guarded by an exact type check with the dynamic path as fallback.
+        return f"({fast.format(value)} if {value}.__class__ is _{annotation.__name__} else _primitive({value}))"
+    # Dataclasses (value objects, nested entities), enums and anything unannotated dispatch on
+    # the runtime type, so a subclass instance is serialized with its own fields.
+    return f"_primitive({value})"
+
+
+def deserializer_for(cls: type) -> Deserializer:
+    """Return the compiled inverse of :func:`serializer_for` for dataclass ``cls``, building it on first use."""
+    deserializer = _deserializers.get(cls)
+    if deserializer is None:
+        deserializer = _deserializers[cls] = _compile_deserializer(cls)
+    return deserializer
+
+
+def _compile_deserializer(cls: type) -> Deserializer:
+    from .events import DomainEvent
+
+    try:
+        hints = typing.get_type_hints(cls)
+    except Exception:  # unresolvable forward references: values are passed through as decoded
+        hints = {}
+
+    namespace: dict[str, Any] = {"_cls": cls, "_set": object.__setattr__, "_nested": _decode_nested}
+    namespace.update({f"_{decoded_type.__name__}": decoded_type for decoded_type in _DECODERS})
+    lines = ["    kwargs = {}"]
+    restored: list[str] = []
+    for field in dataclasses.fields(cls):
+        name = field.name
+        key = name[1:] if issubclass(cls, DomainEvent) and name in ("_event_id", "_occurred_on") else name
+        expression = _decode_expression(hints.get(name, Any), f"data[{key!r}]", namespace)
+        if not field.init:
+            # Set the way ``__init__`` sets them (events are frozen); left to the default when absent.
+            restored.append(f"    if {key!r} in data: _set(obj, {name!r}, {expression})")
+        elif field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING:
+            lines.append(f"    kwargs[{name!r}] = {expression}")
+        else:
+            lines.append(f"    if {key!r} in data: kwargs[{name!r}] = {expression}")
+    body = "\n".join([*lines, "    obj = _cls(**kwargs)", *restored, "    return obj"])
+    source = f"def deserialize(data):\n{body}\n"
+    exec(compile(source, f"<deserializer {cls.__qualname__}>", "exec"), namespace)
+    deserialize = namespace["deserialize"]
+    deserialize.__qualname__ = f"deserializer_for({cls.__qualname__})"
+    return deserialize
+
+
+def _decode_nested(cls: type, value: Any) -> Any:
+    # Resolved per call rather than at compile time, so self-referencing classes compile.
+    return deserializer_for(cls)(value)
+
+
+def _decode_expression(annotation: Any, value: str, namespace: dict[str, Any], depth: int = 0) -> str:
+    """Python expression rebuilding a value typed ``annotation`` from its JSON-decoded form ``value``."""
+    origin = typing.get_origin(annotation)
+    arguments = typing.get_args(annotation)
+
+    if origin in (typing.Union, types.UnionType):
+        members = [argument for argument in arguments if argument is not type(None)]
+        if len(members) == 1:
+            return f"(None if {value} is None else {_decode_expression(members[0], value, namespace, depth)})"
+        return value
+    if origin in (list, set, frozenset) and len(arguments) == 1:
+        container, item_type = origin, arguments[0]
+    elif origin is tuple and len(arguments) == 2 and arguments[1] is Ellipsis:
+        container, item_type = tuple, arguments[0]
+    else:
+        container = item_type = None
+    if container is not None:
+        item = f"item{depth}"
+        items = f"{_decode_expression(item_type, item, namespace, depth + 1)} for {item} in {value}"
+        return f"[{items}]" if container is list else f"{container.__name__}({items})"
+
+    decoder = _DECODERS.get(annotation)
+    if decoder is not None:
+        return decoder.format(value)
+    if isinstance(annotation, type) and (issubclass(annotation, enum.Enum) or dataclasses.is_dataclass(annotation)):
+        name = f"_type{len(namespace)}"
+        namespace[name] = annotation
+        if issubclass(annotation, enum.Enum):
+            return f"{name}({value})"
+        if _is_single_value(annotation):
+            # Serialized as the bare value, e.g. ``AccountId`` as its UUID string.
+            value_hint = typing.get_type_hints(annotation).get("value", Any)
+            return f"{name}({_decode_expression(value_hint, value, namespace, depth)})"
+        return f"_nested({name}, {value})"
+    # Primitives and anything unannotated come back from JSON as they were written.
+    return value
@@ -1,30 +1,57 @@
+import dataclasses
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable
 
 from .exceptions import BusinessRuleValidationException
 from .rule import BaseBusinessRule
 
+# Per-class getter returning the field values, as a tuple (or the bare value for one field).
+_field_getters: dict[type, Callable[[Any], Any]] = {}
+
 
-@dataclass
 class ValueObject(ABC):
-    """Abstract base class for value objects."""
+    """
+    Abstract base class for value objects.
+
+    Subclasses are declared as ``@dataclass(frozen=True, slots=True, eq=False)``: equality
+    and hashing come from this class, comparing the dataclass fields of instances of the
+    same class. The hash is computed once and cached in the ``_hash`` slot, so value
+    objects used as dict or set keys (ids, mostly) do not rebuild it on every lookup.
+    """
+
+    __slots__ = ("_hash",)
+
+    def _values(self) -> Any:
+        getter = _field_getters.get(self.__class__)
+        if getter is None:
+            names = [field.name for field in dataclasses.fields(self)]
+            getter = _field_getters[self.__class__] = attrgetter(*names) if names else lambda obj: ()
+        return getter(self)
 
     def __eq__(self, other: Any) -> bool:
         """Check equality based on the value object properties."""
-        if not isinstance(other, ValueObject):
-            return False
-        return self.__dict__ == other.__dict__
+        if other is self:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
 
     def __hash__(self) -> int:
-        """Return the hash of the value object."""
-        return hash(tuple(sorted(self.__dict__.items())))
+        """Return the hash of the value object, computed on first use."""
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash(self._values())
+            object.__setattr__(self, "_hash", value)
+            return value
 
     def __str__(self) -> str:
         """Return the string representation of the value object."""
-        return str(self.__dict__)
+        return repr(self)
 
-    def check_rules(self, *rules: BaseBusinessRule) -> None:
+    @classmethod
+    def check_rules(cls, *rules: BaseBusinessRule) -> None:
         """Ensure that the supplied business rules hold true."""
         for rule in rules:
             if rule.is_broken():
@@ -1,7 +1,23 @@
 """Infrastructure primitives shared by bounded contexts."""
 
-from .event_bus import EventBus
+from .cache import TTLCache
+from .event_bus import BatchEventHandler, EventBus, HandlerFailure, HandlerMetrics
 from .outbox import Outbox, OutboxMessage
+from .outbox_relay import OutboxRelay, OutboxRelayMetrics
+from .sql_outbox import OutboxMessageModel, SQLOutbox
 from .unit_of_work import UnitOfWork
 
-__all__ = ["EventBus", "Outbox", "OutboxMessage", "UnitOfWork"]
+__all__ = [
+    "BatchEventHandler",
+    "EventBus",
+    "HandlerFailure",
+    "HandlerMetrics",
+    "Outbox",
+    "OutboxMessage",
+    "OutboxMessageModel",
+    "OutboxRelay",
+    "OutboxRelayMetrics",
+    "SQLOutbox",
+    "TTLCache",
+    "UnitOfWork",
+]
@@ -1,27 +1,230 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import logging
+import threading
+import time
 from collections import defaultdict
-from typing import Callable, DefaultDict, Generic, Iterable, Type, TypeVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, DefaultDict, Iterable, Optional, Protocol, Sequence, Type, TypeVar, Union
 
 from src.building_blocks.domain.events import DomainEvent
 
+logger = logging.getLogger(__name__)
+
 TDomainEvent = TypeVar("TDomainEvent", bound=DomainEvent)
-EventHandler = Callable[[TDomainEvent], None]
+EventHandler = Callable[[TDomainEvent], Union[None, Awaitable[None]]]
+
+
+class BatchEventHandler(Protocol[TDomainEvent]):
+    """Subscriber that opts into batch delivery: one call per published batch and event type."""
+
+    def handle_many(self, events: Sequence[TDomainEvent]) -> Union[None, Awaitable[None]]: ...
+
+
+@dataclass(slots=True)
+class HandlerMetrics:
+    calls: int = 0
+    events: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass(slots=True, frozen=True)
+class HandlerFailure:
+    handler: str
+    events: tuple[DomainEvent, ...]
+    error: BaseException
+
+
+# (handler, events, batch): a batch handler receives all events in one call.
+_Call = tuple[Callable[..., Any], tuple[DomainEvent, ...], bool]
+
+
+def _handler_name(handler: Callable[..., Any]) -> str:
+    return getattr(handler, "__qualname__", None) or type(handler).__qualname__
+
+
+def _is_async(handler: Callable[..., Any]) -> bool:
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(getattr(handler, "__call__", None))
 
 
 class EventBus:
-    """In-memory domain event bus with pub/sub semantics."""
+    """
+    In-memory domain event bus with pub/sub semantics.
 
-    def __init__(self) -> None:
+    Handlers may be plain callables, coroutine functions, or objects with ``handle_many``
+    (batch delivery). :meth:`publish` runs synchronous handlers inline, in order, and
+    isolates them: a failure is logged and returned as a :class:`HandlerFailure`, and the
+    remaining handlers still run. Async handlers are never awaited by the publisher; they are scheduled in the background on the
+    running loop or, from a worker thread (commands run in the mediator's executor), on
+    the loop given to :meth:`bind_loop`, so a slow subscriber does not add to the latency
+    of the command that raised the event. Only with neither do they run to completion
+    in the publishing thread.
+
+    :meth:`publish_many_async` delivers to every handler concurrently and isolates them:
+    each async call is bounded by ``handler_timeout`` and failures are captured and
+    returned instead of aborting the remaining handlers. Synchronous handlers still run
+    inline on the loop there, so they should stay cheap.
+    """
+
+    def __init__(self, handler_timeout: Optional[float] = None) -> None:
         self._subscribers: DefaultDict[Type[DomainEvent], list[EventHandler]] = defaultdict(list)
+        self._batch_subscribers: DefaultDict[Type[DomainEvent], list[Callable[..., Any]]] = defaultdict(list)
+        self._handler_timeout = handler_timeout
+        self._background: set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Handlers run on the loop and on executor threads alike; counters are updated under the lock.
+        self._metrics_lock = threading.Lock()
+        self.metrics: dict[str, HandlerMetrics] = {}
+
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Hand async handlers published from threads without a loop to ``loop`` (the app's)."""
+        self._loop = loop
+
+    def subscribe(
+        self,
+        event_type: Type[TDomainEvent],
+        handler: Union[EventHandler[TDomainEvent], BatchEventHandler[TDomainEvent]],
+    ) -> None:
+        if hasattr(handler, "handle_many"):
+            self._batch_subscribers[event_type].append(handler.handle_many)
+        else:
+            self._subscribers[event_type].append(handler)  # type: ignore[arg-type]
+
+    def publish(self, event: DomainEvent) -> list[HandlerFailure]:
+        return self.publish_many((event,))
+
+    def publish_many(self, events: Iterable[DomainEvent]) -> list[HandlerFailure]:
+        """Deliver ``events``; returns the failures of the synchronous handlers (async ones run in the background)."""
+        events = tuple(events)
+        deferred: list[_Call] = []
+        failures: list[HandlerFailure] = []
+        for event in events:
+            for handler in self._subscribers.get(type(event), ()):
+                if _is_async(handler):
+                    deferred.append((handler, (event,), False))
+                else:
+                    failures.extend(self._call_inline(handler, (event,), batch=False))
+        for event_type, batch in self._group(events).items():
+            for handler in self._batch_subscribers.get(event_type, ()):
+                if _is_async(handler):
+                    deferred.append((handler, batch, True))
+                else:
+                    failures.extend(self._call_inline(handler, batch, batch=True))
+        if deferred:
+            self._run_in_background(deferred)
+        return failures
+
+    async def publish_async(self, event: DomainEvent) -> list[HandlerFailure]:
+        return await self.publish_many_async((event,))
 
-    def subscribe(self, event_type: Type[TDomainEvent], handler: EventHandler[TDomainEvent]) -> None:
-        self._subscribers[event_type].append(handler)  # type: ignore[arg-type]
+    async def publish_many_async(self, events: Iterable[DomainEvent]) -> list[HandlerFailure]:
+        events = tuple(events)
+        calls: list[_Call] = [
+            (handler, (event,), False) for event in events for handler in self._subscribers.get(type(event), ())
+        ]
+        for event_type, batch in self._group(events).items():
+            calls.extend((handler, batch, True) for handler in self._batch_subscribers.get(event_type, ()))
+        return await self._deliver(calls)
 
-    def publish(self, event: DomainEvent) -> None:
-        for handler in self._subscribers.get(type(event), []):
-            handler(event)  # type: ignore[arg-type]
+    async def drain(self) -> None:
+        """Wait for handlers scheduled in the background by :meth:`publish`."""
+        while self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
 
-    def publish_many(self, events: Iterable[DomainEvent]) -> None:
+    # Delivery ---------------------------------------------------------------
+    @staticmethod
+    def _group(events: tuple[DomainEvent, ...]) -> dict[Type[DomainEvent], tuple[DomainEvent, ...]]:
+        grouped: DefaultDict[Type[DomainEvent], list[DomainEvent]] = defaultdict(list)
         for event in events:
-            self.publish(event)
+            grouped[type(event)].append(event)
+        return {event_type: tuple(batch) for event_type, batch in grouped.items()}
+
+    def _metrics_for(self, handler: Callable[..., Any]) -> HandlerMetrics:
+        name = _handler_name(handler)
+        metrics = self.metrics.get(name)
+        if metrics is None:
+            with self._metrics_lock:
+                metrics = self.metrics.setdefault(name, HandlerMetrics())
+        return metrics
+
+    def _record(
+        self, metrics: HandlerMetrics, events: int, started: float, failed: bool = False, timed_out: bool = False
+    ) -> None:
+        elapsed = time.perf_counter() - started
+        with self._metrics_lock:
+            metrics.calls += 1
+            metrics.events += events
+            metrics.failures += failed
+            metrics.timeouts += timed_out
+            metrics.total_seconds += elapsed
+            if elapsed > metrics.max_seconds:
+                metrics.max_seconds = elapsed
+
+    def _call_inline(
+        self, handler: Callable[..., Any], events: tuple[DomainEvent, ...], batch: bool
+    ) -> list[HandlerFailure]:
+        metrics = self._metrics_for(handler)
+        started = time.perf_counter()
+        try:
+            if batch:
+                handler(events)
+            else:
+                handler(events[0])
+        except Exception as ex:
+            self._record(metrics, len(events), started, failed=True)
+            logger.exception("Event handler %s failed", _handler_name(handler))
+            return [HandlerFailure(_handler_name(handler), events, ex)]
+        self._record(metrics, len(events), started)
+        return []
+
+    def _run_in_background(self, calls: list[_Call]) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            loop = self._loop
+            if loop is not None and loop.is_running():
+                # A worker thread (e.g. a repository called via ``run_in_executor``): hand off to the app loop.
+                loop.call_soon_threadsafe(self._schedule, calls)
+            else:
+                # No loop to hand off to (scripts, CLI): run to completion here.
+                asyncio.run(self._deliver(calls))
+            return
+        self._schedule(calls)
+
+    def _schedule(self, calls: list[_Call]) -> None:
+        task = asyncio.get_running_loop().create_task(self._deliver(calls))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _deliver(self, calls: list[_Call]) -> list[HandlerFailure]:
+        results = await asyncio.gather(*(self._invoke(handler, events, batch) for handler, events, batch in calls))
+        return [failure for failure in results if failure is not None]
+
+    async def _invoke(
+        self, handler: Callable[..., Any], events: tuple[DomainEvent, ...], batch: bool
+    ) -> Optional[HandlerFailure]:
+        metrics = self._metrics_for(handler)
+        started = time.perf_counter()
+        try:
+            result = handler(events) if batch else handler(events[0])
+            if inspect.isawaitable(result):
+                await asyncio.wait_for(result, self._handler_timeout)
+        except asyncio.TimeoutError as ex:
+            self._record(metrics, len(events), started, timed_out=True)
+            logger.warning("Event handler %s timed out after %ss", _handler_name(handler), self._handler_timeout)
+            return HandlerFailure(_handler_name(handler), events, ex)
+        except Exception as ex:
+            self._record(metrics, len(events), started, failed=True)
+            logger.exception("Event handler %s failed", _handler_name(handler))
+            return HandlerFailure(_handler_name(handler), events, ex)
+        self._record(metrics, len(events), started)
+        return None
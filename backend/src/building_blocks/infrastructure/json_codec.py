@@ -0,0 +1,35 @@
+"""
+JSON encoding for serialized events and entities.
+
+Uses ``orjson`` when it is installed (it ships with ``fastapi[all]``) and the standard
+library otherwise; both produce compact UTF-8 bytes from the JSON-ready dicts built by
+:mod:`src.building_blocks.domain.serialization`.
+"""
+
+import json
+from typing import Any, Union
+
+from src.building_blocks.domain.events import DomainEvent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only where orjson is absent
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_event(event: DomainEvent) -> bytes:
+    return dumps(event.to_dict())
@@ -0,0 +1,146 @@
+"""
+Non-blocking logging: handlers run on background threads, callers only enqueue.
+
+:class:`QueueLogging` moves the handlers of the given loggers behind a ``QueueHandler``
+and drains the queue with a ``QueueListener``, so a log call on the request path costs a
+record and a queue put; formatting, console writes and file I/O happen on the listener
+thread. :class:`ContextLogger` carries structured context bound once (``user_id``,
+``conversation_id``, ...) instead of rebuilding an ``extra`` dict per call, and
+:class:`SamplingFilter` keeps one in N of high-volume debug records.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterable, Mapping
+
+
+class _DeferredFormattingQueueHandler(QueueHandler):
+    """
+    Enqueues records as they are, after resolving what cannot wait for another thread.
+
+    The stock ``prepare`` formats every record on the calling thread; here the message
+    arguments are merged (they may be mutated after the call returns) and a traceback is
+    rendered (it holds frames), and formatting is left to the listener's handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class QueueLogging:
+    """
+    Put the handlers of ``loggers`` (names or loggers; the root logger by default) behind
+    queues drained by background listeners, until :meth:`stop` puts them back.
+
+    Loggers sharing the same handlers share one queue and listener. ``filters`` are added
+    to the queue handlers, so records they reject never reach the queue.
+    """
+
+    def __init__(
+        self,
+        loggers: Iterable[logging.Logger | str | None] = (None,),
+        filters: Iterable[logging.Filter] = (),
+    ) -> None:
+        self._loggers = [
+            logger if isinstance(logger, logging.Logger) else logging.getLogger(logger) for logger in loggers
+        ]
+        self._filters = list(filters)
+        self._original: list[tuple[logging.Logger, list[logging.Handler]]] = []
+        self._listeners: list[QueueListener] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._listeners)
+
+    def start(self) -> QueueLogging:
+        if self.running:
+            return self
+        queue_handlers: dict[tuple[int, ...], QueueHandler] = {}
+        for logger in self._loggers:
+            handlers = [handler for handler in logger.handlers if not isinstance(handler, QueueHandler)]
+            if not handlers:
+                continue
+            group = tuple(id(handler) for handler in handlers)
+            queue_handler = queue_handlers.get(group)
+            if queue_handler is None:
+                records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+                queue_handler = queue_handlers[group] = _DeferredFormattingQueueHandler(records)
+                for record_filter in self._filters:
+                    queue_handler.addFilter(record_filter)
+                listener = QueueListener(records, *handlers, respect_handler_level=True)
+                listener.start()
+                self._listeners.append(listener)
+            self._original.append((logger, list(logger.handlers)))
+            logger.handlers = [queue_handler]
+        return self
+
+    def stop(self) -> None:
+        """Restore the original handlers, then write out whatever is still queued."""
+        for logger, handlers in reversed(self._original):
+            logger.handlers = handlers
+        self._original.clear()
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners.clear()
+
+    def __enter__(self) -> QueueLogging:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.stop()
+
+
+class ContextLogger(logging.LoggerAdapter):
+    """
+    A logger whose records all carry ``context`` as attributes (and so as JSON fields).
+
+    The context dict is built once, when the logger is bound, and reused by every call;
+    per-call ``extra`` is merged over it only when given.
+    """
+
+    def __init__(self, logger: logging.Logger, context: Mapping[str, Any] | None = None) -> None:
+        super().__init__(logger, dict(context or {}))
+
+    def bind(self, **context: Any) -> ContextLogger:
+        return ContextLogger(self.logger, {**self.extra, **context})
+
+    def process(self, msg: Any, kwargs: dict[str, Any]) -> tuple[Any, dict[str, Any]]:
+        extra = kwargs.get("extra")
+        kwargs["extra"] = self.extra if extra is None else {**self.extra, **extra}
+        return msg, kwargs
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep one in ``every`` records at or below ``max_level`` (DEBUG by default), counted
+    per call site (and ``event_name``, when the record has one) so a rare debug message is
+    not crowded out by a frequent one. Records above ``max_level`` always pass.
+    """
+
+    def __init__(self, every: int, max_level: int = logging.DEBUG) -> None:
+        super().__init__()
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self.max_level = max_level
+        self._counters: dict[tuple[str, int, Any], itertools.count] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.every == 1:
+            return True
+        # Call sites and event names are bounded by the code, unlike formatted messages.
+        key = (record.pathname, record.lineno, getattr(record, "event_name", None))
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, itertools.count())
+        # next() on itertools.count is atomic under the GIL, so concurrent callers never share a tick.
+        return next(counter) % self.every == 0
@@ -0,0 +1,31 @@
+"""Prometheus-format metrics, aggregated across worker processes through memory-mapped files."""
+
+from .registry import (
+    CONTENT_TYPE_LATEST,
+    DEFAULT_BUCKETS,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    configure_metrics,
+    mark_process_dead,
+    multiprocess_dir,
+    render_metrics,
+    reset_multiprocess_dir,
+)
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "DEFAULT_BUCKETS",
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "configure_metrics",
+    "mark_process_dead",
+    "multiprocess_dir",
+    "render_metrics",
+    "reset_multiprocess_dir",
+]
@@ -0,0 +1,124 @@
+"""
+The service's cross-cutting metrics: HTTP requests, mediator handlers, the executor
+they run on, database connection pools and in-process caches.
+
+Label values are bounded: routes are templates, messages are class names.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from .registry import Counter, Gauge, Histogram
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+HTTP_REQUESTS = Counter(
+    "http_requests",
+    "HTTP requests served, by route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve an HTTP request, until the response has been sent.",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being served right now.",
+    ("method",),
+)
+
+HANDLER_DURATION = Histogram(
+    "mediator_handler_duration_seconds",
+    "Time spent in the handler of a command or query, excluding the wait for an executor thread.",
+    ("module", "kind", "message"),
+)
+HANDLER_FAILURES = Counter(
+    "mediator_handler_failures",
+    "Commands and queries whose handler raised.",
+    ("module", "kind", "message"),
+)
+EXECUTOR_QUEUE_DEPTH = Gauge(
+    "mediator_executor_queue_depth",
+    "Messages handed to the executor that no thread has picked up yet.",
+    ("module",),
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Connections currently lent out by the pool.",
+    ("database",),
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_connections",
+    "Connections the pool holds, lent out or idle.",
+    ("database",),
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond the pool size (negative while the pool is not full).",
+    ("database",),
+)
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts",
+    "Connections handed out by the pool.",
+    ("database",),
+)
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups",
+    "Lookups in named in-process caches, by result (hit or miss); the hit ratio is hit / all.",
+    ("cache", "result"),
+)
+
+
+class HandlerTimer:
+    """Context manager observing a handler's duration, and its failure if it raises."""
+
+    __slots__ = ("_labels", "_started")
+
+    def __init__(self, module: str, message: object, command_type: type, query_type: type) -> None:
+        if isinstance(message, command_type):
+            kind = "command"
+        elif isinstance(message, query_type):
+            kind = "query"
+        else:
+            kind = "message"
+        self._labels = (module, kind, type(message).__name__)
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        HANDLER_DURATION.labels(*self._labels).observe(time.perf_counter() - self._started)
+        if exc is not None:
+            HANDLER_FAILURES.labels(*self._labels).inc()
+
+
+def instrument_pool(engine: Engine) -> None:
+    """Keep the pool gauges of ``engine`` current from its checkout and checkin events."""
+    from sqlalchemy import event
+
+    database = engine.url.render_as_string(hide_password=True)
+
+    def update() -> None:
+        pool = engine.pool  # replaced on dispose()
+        # Only queue pools have a size; NullPool and StaticPool just count checkouts.
+        if hasattr(pool, "checkedout") and hasattr(pool, "overflow"):
+            checked_out = pool.checkedout()
+            DB_POOL_CHECKED_OUT.labels(database).set(checked_out)
+            DB_POOL_SIZE.labels(database).set(checked_out + pool.checkedin())
+            DB_POOL_OVERFLOW.labels(database).set(pool.overflow())
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        DB_POOL_CHECKOUTS.labels(database).inc()
+        update()
+
+    def on_checkin(dbapi_connection, connection_record) -> None:
+        update()
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
@@ -0,0 +1,107 @@
+"""
+Per-process metric values in a memory-mapped file.
+
+Each worker owns its files and is their only writer; whoever serves ``/metrics`` reads
+every worker's files and aggregates them (see :mod:`.registry`). The layout is an
+8-byte header (bytes used, little-endian u32, then padding) followed by append-only
+entries::
+
+    u32 key length | key (UTF-8, padded to a multiple of 8 with the length) | f64 value
+
+Updating a value is a single ``pack_into`` on the mapping, with no syscall. An entry is
+written in full before the header moves past it, so readers never see half of one.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterator
+
+_INITIAL_SIZE = 1 << 16
+_HEADER = struct.Struct("<I4x")
+_KEY_LENGTH = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+
+
+class MmapValues:
+    """A ``key -> float`` map persisted in a file that other processes can read."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "a+b")
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.truncate(_INITIAL_SIZE)
+        self._capacity = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+        self._offsets: dict[str, int] = {}
+        self._used = _HEADER.unpack_from(self._map, 0)[0] or _HEADER.size
+        for key, value, offset in _entries(self._map, self._used):
+            self._offsets[key] = offset
+
+    def offset(self, key: str) -> int:
+        """Where ``key``'s value lives, so hot paths can update it without the dict lookup."""
+        offset = self._offsets.get(key)
+        return self._append(key) if offset is None else offset
+
+    def add(self, offset: int, amount: float) -> None:
+        _VALUE.pack_into(self._map, offset, _VALUE.unpack_from(self._map, offset)[0] + amount)
+
+    def write(self, offset: int, value: float) -> None:
+        _VALUE.pack_into(self._map, offset, value)
+
+    def read(self, offset: int) -> float:
+        return _VALUE.unpack_from(self._map, offset)[0]
+
+    def items(self) -> Iterator[tuple[str, float]]:
+        for key, value, _ in _entries(self._map, self._used):
+            yield key, value
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode()
+        padded = len(encoded) + (-(_KEY_LENGTH.size + len(encoded)) % 8)
+        entry_size = _KEY_LENGTH.size + padded + _VALUE.size
+        while self._used + entry_size > self._capacity:
+            self._grow()
+        start = self._used
+        _KEY_LENGTH.pack_into(self._map, start, len(encoded))
+        self._map[start + _KEY_LENGTH.size : start + _KEY_LENGTH.size + len(encoded)] = encoded
+        offset = start + _KEY_LENGTH.size + padded
+        _VALUE.pack_into(self._map, offset, 0.0)
+        self._used += entry_size
+        _HEADER.pack_into(self._map, 0, self._used)
+        self._offsets[key] = offset
+        return offset
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        self._file.truncate(self._capacity)
+        self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+
+
+def read_values(path: str | Path) -> Iterator[tuple[str, float]]:
+    """Read another process's file without mapping it for writing."""
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        return
+    used = _HEADER.unpack_from(data, 0)[0]
+    for key, value, _ in _entries(data, used):
+        yield key, value
+
+
+def _entries(buffer, used: int) -> Iterator[tuple[str, float, int]]:
+    position = _HEADER.size
+    while position < used:
+        length = _KEY_LENGTH.unpack_from(buffer, position)[0]
+        key_start = position + _KEY_LENGTH.size
+        key = bytes(buffer[key_start : key_start + length]).decode()
+        offset = key_start + length + (-(_KEY_LENGTH.size + length) % 8)
+        yield key, _VALUE.unpack_from(buffer, offset)[0], offset
+        position = offset + _VALUE.size
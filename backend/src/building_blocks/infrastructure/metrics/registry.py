@@ -0,0 +1,452 @@
+"""
+Counters, gauges and histograms rendered in the Prometheus text format.
+
+Values live in this process by default. Under ``uvicorn --workers N`` each worker only
+sees its own requests, so call :func:`configure_metrics` with a directory shared by the
+workers: every value then lives in a memory-mapped file per worker (see
+:mod:`.mmap_values`), and :func:`render_metrics` in any worker aggregates all of them.
+Counters and histograms are summed across workers; gauges are combined according to
+their ``mode``. Empty the directory before the workers start (:func:`reset_multiprocess_dir`)
+and drop a worker's gauges when it exits (:func:`mark_process_dead`).
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import os
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from .mmap_values import MmapValues, read_values
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+GAUGE_MODES = ("sum", "max", "min", "all")
+
+LabelPairs = tuple[tuple[str, str], ...]
+
+
+class _LocalValue:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, amount: float) -> None:
+        with self._lock:
+            self._value += amount
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def get(self) -> float:
+        return self._value
+
+
+class _MmapValue:
+    __slots__ = ("_values", "_offset", "_lock")
+
+    def __init__(self, values: MmapValues, key: str, lock: threading.Lock) -> None:
+        self._values = values
+        self._offset = values.offset(key)
+        self._lock = lock
+
+    def add(self, amount: float) -> None:
+        with self._lock:
+            self._values.add(self._offset, amount)
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._values.write(self._offset, value)
+
+    def get(self) -> float:
+        return self._values.read(self._offset)
+
+
+class _MultiprocessStore:
+    """This process's value files in the shared directory, one per metric kind (and gauge mode)."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.pid = os.getpid()
+        self._files: dict[str, MmapValues] = {}
+        self._lock = threading.Lock()
+
+    def value(self, file_kind: str, sample: str, labels: LabelPairs) -> _MmapValue:
+        key = json.dumps([sample, labels], separators=(",", ":"))
+        with self._lock:
+            values = self._files.get(file_kind)
+            if values is None:
+                values = self._files[file_kind] = MmapValues(self.directory / f"{file_kind}_{self.pid}.db")
+            # One lock for all files: an append may remap a file, and updates must not interleave with it.
+            return _MmapValue(values, key, self._lock)
+
+    def close(self) -> None:
+        with self._lock:
+            for values in self._files.values():
+                values.close()
+            self._files.clear()
+
+
+_store: _MultiprocessStore | None = None
+
+
+class Metric:
+    kind: str
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), registry: MetricsRegistry | None = None
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lookup: dict[tuple[object, ...], object] = {}
+        self._lock = threading.Lock()
+        (REGISTRY if registry is None else registry).register(self)
+
+    def labels(self, *values: object, **named: object):
+        """The child for one combination of label values (positional, or by name)."""
+        if not named:
+            # Fast path on the values exactly as passed, before they are converted to strings.
+            child = self._lookup.get(values)
+            if child is not None:
+                return child
+        else:
+            values = tuple(named[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child(tuple(zip(self.labelnames, key)))
+            self._lookup[values] = child
+        return child
+
+    def reset(self) -> None:
+        """Forget every child, so they are recreated in the store configured now."""
+        with self._lock:
+            self._children.clear()
+            self._lookup.clear()
+
+    @property
+    def file_kind(self) -> str:
+        return self.kind
+
+    def _value(self, sample: str, labels: LabelPairs) -> _LocalValue | _MmapValue:
+        if _store is None:
+            return _LocalValue()
+        return _store.value(self.file_kind, sample, labels)
+
+    def _new_child(self, labels: LabelPairs):
+        raise NotImplementedError
+
+    def _samples(self) -> Iterable[tuple[str, LabelPairs, float]]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("_value",)
+
+    def __init__(self, value) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._value.add(amount)
+
+    def get(self) -> float:
+        return self._value.get()
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _new_child(self, labels: LabelPairs) -> _CounterChild:
+        return _CounterChild(self._value(f"{self.name}_total", labels))
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            yield f"{self.name}_total", tuple(zip(self.labelnames, key)), child.get()
+
+
+class _GaugeChild:
+    __slots__ = ("_value",)
+
+    def __init__(self, value) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._value.add(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._value.add(-amount)
+
+    def set(self, value: float) -> None:
+        self._value.set(value)
+
+    def get(self) -> float:
+        return self._value.get()
+
+
+class Gauge(Metric):
+    """
+    A value that goes up and down.
+
+    ``mode`` says how workers' values combine: ``sum`` (in-flight counts, queue depths),
+    ``max``/``min``, or ``all`` (one series per worker, labelled ``pid``).
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry | None = None,
+        mode: str = "sum",
+    ) -> None:
+        if mode not in GAUGE_MODES:
+            raise ValueError(f"Unknown gauge mode {mode!r}; expected one of {GAUGE_MODES}")
+        self.mode = mode
+        super().__init__(name, documentation, labelnames, registry)
+
+    @property
+    def file_kind(self) -> str:
+        return f"gauge_{self.mode}"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _new_child(self, labels: LabelPairs) -> _GaugeChild:
+        return _GaugeChild(self._value(self.name, labels))
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            yield self.name, tuple(zip(self.labelnames, key)), child.get()
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_buckets", "_sum")
+
+    def __init__(self, bounds: tuple[float, ...], buckets: list, total) -> None:
+        self._bounds = bounds
+        self._buckets = buckets
+        self._sum = total
+
+    def observe(self, amount: float) -> None:
+        # Buckets are stored non-cumulatively, so an observation touches one bucket, not all above it.
+        self._buckets[bisect.bisect_left(self._bounds, amount)].add(1.0)
+        self._sum.add(amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry | None = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        bounds = sorted(float(bound) for bound in buckets)
+        if not bounds or bounds[-1] != math.inf:
+            bounds.append(math.inf)
+        self.bounds = tuple(bounds)
+        super().__init__(name, documentation, labelnames, registry)
+
+    def observe(self, amount: float) -> None:
+        self.labels().observe(amount)
+
+    def _new_child(self, labels: LabelPairs) -> _HistogramChild:
+        buckets = [self._value(f"{self.name}_bucket", (*labels, ("le", _format_bound(b)))) for b in self.bounds]
+        return _HistogramChild(self.bounds, buckets, self._value(f"{self.name}_sum", labels))
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            labels = tuple(zip(self.labelnames, key))
+            for bound, bucket in zip(self.bounds, child._buckets):
+                yield f"{self.name}_bucket", (*labels, ("le", _format_bound(bound))), bucket.get()
+            yield f"{self.name}_sum", labels, child._sum.get()
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name!r} is already registered")
+            self._metrics[metric.name] = metric
+
+    def unregister(self, metric: Metric) -> None:
+        with self._lock:
+            self._metrics.pop(metric.name, None)
+
+    def metrics(self) -> list[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+
+REGISTRY = MetricsRegistry()
+
+
+def configure_metrics(multiprocess_dir: str | Path | None, registry: MetricsRegistry | None = None) -> None:
+    """
+    Keep values in files under ``multiprocess_dir`` (shared by all workers), or in this
+    process when ``None``. Existing children are dropped and recreated on next use.
+    """
+    global _store
+    if _store is not None:
+        _store.close()
+    if multiprocess_dir is None:
+        _store = None
+    else:
+        Path(multiprocess_dir).mkdir(parents=True, exist_ok=True)
+        _store = _MultiprocessStore(multiprocess_dir)
+    for metric in (REGISTRY if registry is None else registry).metrics():
+        metric.reset()
+
+
+def multiprocess_dir() -> Path | None:
+    return None if _store is None else _store.directory
+
+
+def reset_multiprocess_dir(directory: str | Path) -> None:
+    """Create ``directory`` or empty it of a previous run's files; call it before workers start."""
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    for file in path.glob("*.db"):
+        file.unlink()
+
+
+def mark_process_dead(pid: int | None = None, directory: str | Path | None = None) -> None:
+    """
+    Drop a worker's gauges once it has exited; its counters and histograms stay, since
+    the totals they contributed remain part of the aggregate.
+    """
+    pid = os.getpid() if pid is None else pid
+    directory = Path(directory) if directory is not None else multiprocess_dir()
+    if directory is None:
+        return
+    for file in directory.glob(f"gauge_*_{pid}.db"):
+        file.unlink(missing_ok=True)
+
+
+def render_metrics(registry: MetricsRegistry | None = None) -> bytes:
+    """Every metric in the Prometheus text exposition format (version 0.0.4)."""
+    registry = REGISTRY if registry is None else registry
+    families: dict[str, tuple[str, str, dict[tuple[str, LabelPairs], float]]] = {}
+    for metric in registry.metrics():
+        families[metric.name] = (metric.kind, metric.documentation, {})
+    if _store is None:
+        for metric in registry.metrics():
+            samples = families[metric.name][2]
+            for sample, labels, value in metric._samples():
+                samples[sample, labels] = value
+    else:
+        _collect_files(_store.directory, families)
+    return "".join(_render_family(name, *family) for name, family in sorted(families.items())).encode()
+
+
+def _collect_files(directory: Path, families: dict) -> None:
+    combined: dict[str, dict[tuple[str, LabelPairs], list[float]]] = defaultdict(lambda: defaultdict(list))
+    modes: dict[str, str] = {}
+    for path in sorted(directory.glob("*.db")):
+        file_kind, _, pid = path.stem.rpartition("_")
+        for key, value in read_values(path):
+            sample, labels = json.loads(key)
+            labels = tuple(tuple(pair) for pair in labels)
+            name = _family_name(sample)
+            if file_kind == "gauge_all":
+                labels = (*labels, ("pid", pid))
+            modes[name] = file_kind
+            combined[name][sample, labels].append(value)
+    for name, samples in combined.items():
+        mode = modes[name]
+        combine = max if mode == "gauge_max" else min if mode == "gauge_min" else sum
+        kind = "gauge" if mode.startswith("gauge") else mode
+        family = families.setdefault(name, (kind, "", {}))
+        for key, values in samples.items():
+            family[2][key] = combine(values)
+
+
+def _family_name(sample: str) -> str:
+    for suffix in ("_bucket", "_sum", "_total"):
+        if sample.endswith(suffix):
+            return sample[: -len(suffix)]
+    return sample
+
+
+def _render_family(name: str, kind: str, documentation: str, samples: dict[tuple[str, LabelPairs], float]) -> str:
+    lines = []
+    if documentation:
+        lines.append(f"# HELP {name} {_escape(documentation, quotes=False)}\n")
+    lines.append(f"# TYPE {name} {kind}\n")
+    if kind != "histogram":
+        for (sample, labels), value in sorted(samples.items()):
+            lines.append(f"{sample}{_format_labels(labels)} {_format_value(value)}\n")
+        return "".join(lines)
+
+    # Stored per bucket; Prometheus wants cumulative buckets plus a count.
+    series: dict[LabelPairs, dict[str, float]] = defaultdict(dict)
+    sums: dict[LabelPairs, float] = {}
+    for (sample, labels), value in samples.items():
+        if sample.endswith("_bucket"):
+            *rest, (_, bound) = labels
+            series[tuple(rest)][bound] = value
+        else:
+            sums[labels] = value
+    for labels in sorted(series):
+        cumulative = 0.0
+        for bound, count in sorted(series[labels].items(), key=lambda item: float(item[0])):
+            cumulative += count
+            lines.append(f"{name}_bucket{_format_labels((*labels, ('le', bound)))} {_format_value(cumulative)}\n")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(sums.get(labels, 0.0))}\n")
+        lines.append(f"{name}_count{_format_labels(labels)} {_format_value(cumulative)}\n")
+    return "".join(lines)
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: LabelPairs) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: str, quotes: bool = True) -> str:
+    value = value.replace("\\", r"\\").replace("\n", r"\n")
+    return value.replace('"', r"\"") if quotes else value
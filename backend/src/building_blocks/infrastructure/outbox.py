@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import json
 import uuid
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Deque, Iterable
-from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Type, TypeVar
 
 from src.building_blocks.domain.events import DomainEvent
+from src.building_blocks.domain.serialization import deserializer_for
+
+from . import json_codec
+
+TDomainEvent = TypeVar("TDomainEvent", bound=DomainEvent)
 
 
 @dataclass
@@ -25,31 +28,35 @@ class OutboxMessage:
         return cls(
             id=event.id,
             event_name=event.__class__.__name__,
-            payload=json.dumps(event.to_dict()),
+            payload=json_codec.dumps_event(event).decode(),
             occurred_on=event.occurred_on,
         )
 
+    def to_event(self, event_type: Type[TDomainEvent]) -> TDomainEvent:
+        """Rebuild the event from its payload, fields typed as declared and with the original id and timestamp."""
+        return deserializer_for(event_type)(json_codec.loads(self.payload))
+
 
 class Outbox:
     """In-memory outbox store suitable for tests and small services."""
 
     def __init__(self) -> None:
-        self._messages: Deque[OutboxMessage] = deque()
+        # Insertion-ordered and keyed by id, so ``mark_processed`` is a lookup rather than a scan.
+        self._messages: dict[uuid.UUID, OutboxMessage] = {}
 
     def add(self, event: DomainEvent) -> OutboxMessage:
         message = OutboxMessage.from_event(event)
-        self._messages.append(message)
+        self._messages[message.id] = message
         return message
 
     def pending(self) -> list[OutboxMessage]:
-        return [msg for msg in self._messages if msg.processed_at is None]
+        return [msg for msg in self._messages.values() if msg.processed_at is None]
 
     def mark_processed(self, message_id: uuid.UUID) -> None:
-        for message in self._messages:
-            if message.id == message_id:
-                message.processed_at = datetime.utcnow()
-                break
+        message = self._messages.get(message_id)
+        if message is not None:
+            message.processed_at = datetime.now(timezone.utc)
 
     def drain(self) -> Iterable[OutboxMessage]:
         while self._messages:
-            yield self._messages.popleft()
+            yield self._messages.pop(next(iter(self._messages)))
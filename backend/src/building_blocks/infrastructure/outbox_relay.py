@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Type
+
+from src.building_blocks.domain.events import DomainEvent
+
+from .event_bus import EventBus
+from .sql_outbox import SQLOutbox
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class OutboxRelayMetrics:
+    """Relay counters; lag is the time from an event occurring to its delivery."""
+
+    relayed: int = 0
+    failed: int = 0
+    batches: int = 0
+    purged: int = 0
+    busy_seconds: float = 0.0
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.relayed / self.busy_seconds if self.busy_seconds else 0.0
+
+
+def _event_types() -> dict[str, Type[DomainEvent]]:
+    found: dict[str, Type[DomainEvent]] = {}
+    stack = list(DomainEvent.__subclasses__())
+    while stack:
+        event_type = stack.pop()
+        found.setdefault(event_type.__name__, event_type)
+        stack.extend(event_type.__subclasses__())
+    return found
+
+
+class OutboxRelay:
+    """
+    Delivers committed outbox messages to the :class:`EventBus`.
+
+    Each batch is claimed, published and marked processed in one transaction, so a crash
+    mid-batch leaves the rows pending for the next claim (at-least-once delivery). A
+    message whose handler raises stays pending and is retried until the outbox's
+    ``max_attempts`` is reached.
+
+    While running, the relay is woken by every commit that staged messages and otherwise
+    polls every ``poll_interval_seconds``. Every ``purge_interval_seconds`` it deletes
+    messages delivered more than ``retention`` ago and dead letters older than
+    ``dead_letter_retention``, so the table holds only the recent tail.
+    """
+
+    def __init__(
+        self,
+        outbox: SQLOutbox,
+        event_bus: EventBus,
+        event_types: Optional[Iterable[Type[DomainEvent]]] = None,
+        batch_size: int = 200,
+        poll_interval_seconds: float = 1.0,
+        retention: timedelta = timedelta(days=7),
+        dead_letter_retention: timedelta = timedelta(days=30),
+        purge_interval_seconds: float = 3600.0,
+        purge_batch_size: int = 1000,
+        max_purge_batches: int = 20,
+    ) -> None:
+        self._outbox = outbox
+        self._event_bus = event_bus
+        self._event_types = {t.__name__: t for t in event_types} if event_types is not None else None
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval_seconds
+        self._retention = retention
+        self._dead_letter_retention = dead_letter_retention
+        self._purge_interval = purge_interval_seconds
+        self._purge_batch_size = purge_batch_size
+        self._max_purge_batches = max_purge_batches
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.metrics = OutboxRelayMetrics()
+
+    def relay_once(self) -> int:
+        """Relay a single batch; returns the number of messages claimed."""
+        if self._event_types is None:
+            # Resolved lazily so that every event module imported by startup is known.
+            self._event_types = _event_types()
+
+        started = time.perf_counter()
+        with self._outbox.session_factory() as session:
+            claimed = self._outbox.claim(session, self._batch_size)
+            if not claimed:
+                return 0
+            delivered: list[int] = []
+            for row_id, message in claimed:
+                try:
+                    # The bus isolates handlers; any failure leaves the message pending for a retry.
+                    failures = self._event_bus.publish(message.to_event(self._event_types[message.event_name]))
+                except Exception:
+                    logger.exception("Relaying outbox message %s (%s) failed", message.id, message.event_name)
+                    continue
+                if failures:
+                    logger.warning(
+                        "Outbox message %s (%s) failed in %d handler(s)", message.id, message.event_name, len(failures)
+                    )
+                else:
+                    delivered.append(row_id)
+            now = datetime.now(timezone.utc)
+            self._outbox.mark_processed(session, delivered, now)
+            session.commit()
+
+        metrics = self.metrics
+        metrics.batches += 1
+        metrics.relayed += len(delivered)
+        metrics.failed += len(claimed) - len(delivered)
+        metrics.busy_seconds += time.perf_counter() - started
+        metrics.last_lag_seconds = (now - claimed[0][1].occurred_on).total_seconds()
+        metrics.max_lag_seconds = max(metrics.max_lag_seconds, metrics.last_lag_seconds)
+        return len(claimed)
+
+    def purge_once(self) -> int:
+        """Delete expired delivered messages and dead letters, in short batches; returns the rows deleted."""
+        now = datetime.now(timezone.utc)
+        deleted = 0
+        for _ in range(self._max_purge_batches):
+            removed = self._outbox.purge(
+                now - self._retention, now - self._dead_letter_retention, self._purge_batch_size
+            )
+            deleted += removed
+            if removed < self._purge_batch_size:
+                break
+        self.metrics.purged += deleted
+        return deleted
+
+    def wake(self) -> None:
+        """Relay now rather than at the next poll; safe to call from any thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:  # the loop has closed; nothing is left to wake
+                pass
+
+    async def run(self) -> None:
+        self._loop, self._wakeup = asyncio.get_running_loop(), asyncio.Event()
+        next_purge = time.monotonic()
+        while True:
+            self._wakeup.clear()
+            if time.monotonic() >= next_purge:
+                try:
+                    await asyncio.to_thread(self.purge_once)
+                except Exception:  # retention is retried on the next interval
+                    logger.exception("Outbox purge failed")
+                next_purge = time.monotonic() + self._purge_interval
+            try:
+                claimed = await asyncio.to_thread(self.relay_once)
+            except Exception:  # a failed batch is rolled back and retried on the next tick
+                logger.exception("Outbox relay batch failed")
+                claimed = 0
+            # Drain a backlog back to back; wait only once the outbox is caught up.
+            if claimed < self._batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Run the relay as a task on the running event loop (e.g. from the app lifespan)."""
+        if self._task is None:
+            self._outbox.add_commit_listener(self.wake)
+            self._task = asyncio.get_running_loop().create_task(self.run(), name="outbox-relay")
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._outbox.remove_commit_listener(self.wake)
+            self._task.cancel()
+            self._task = None
+            self._loop = self._wakeup = None
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from .tracing import start_span
+
 
 class PipelineExecutionError(Exception):
     """Base exception for pipeline processing failures"""
@@ -70,16 +72,18 @@ class Pipeline:
 
         data = initial_data.copy()  # Treat data as immutable
 
-        for stage in self.stages:
-            try:
-                stage_output = stage.process(data)
+        with start_span(f"pipeline {self.__class__.__name__}"):
+            for stage in self.stages:
+                try:
+                    with start_span(f"pipeline.stage {stage.__class__.__name__}"):
+                        stage_output = stage.process(data)
 
-                if not isinstance(stage_output, dict):
-                    raise TypeError(f"Stage output must be a dictionary, got {type(stage_output)} instead.")
+                    if not isinstance(stage_output, dict):
+                        raise TypeError(f"Stage output must be a dictionary, got {type(stage_output)} instead.")
 
-                # Update data with stage output
-                data.update(stage_output)
-            except Exception as e:
-                raise RuntimeError(f"Pipeline execution failed at stage {stage.__class__.__name__}: {e}")
+                    # Update data with stage output
+                    data.update(stage_output)
+                except Exception as e:
+                    raise RuntimeError(f"Pipeline execution failed at stage {stage.__class__.__name__}: {e}")
 
         return data
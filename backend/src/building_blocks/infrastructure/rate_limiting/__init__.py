@@ -0,0 +1,33 @@
+"""Rate limiter backends: a lock-free per-process bucket and a shared sliding window."""
+
+from typing import Optional
+
+from src.building_blocks.application.rate_limiter import RateLimiter
+
+from .sliding_window import CounterStore, InMemoryCounterStore, SlidingWindowLimiter
+from .token_bucket import InMemoryTokenBucketLimiter
+
+
+def create_rate_limiter(redis_url: Optional[str] = None) -> RateLimiter:
+    """
+    Pick the backend for the deployment.
+
+    Without ``redis_url`` each worker process limits on its own; with it all workers
+    share counters in Redis (requires the optional ``redis`` package).
+    """
+    if not redis_url:
+        return InMemoryTokenBucketLimiter()
+    try:
+        import redis
+    except ImportError as ex:
+        raise RuntimeError("A shared rate limiter needs the 'redis' package: pip install redis") from ex
+    return SlidingWindowLimiter(redis.Redis.from_url(str(redis_url)))
+
+
+__all__ = [
+    "CounterStore",
+    "InMemoryCounterStore",
+    "InMemoryTokenBucketLimiter",
+    "SlidingWindowLimiter",
+    "create_rate_limiter",
+]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional, Protocol, Union
+
+from src.building_blocks.application.rate_limiter import RateLimitDecision, RateLimiter
+
+CounterValue = Union[bytes, str, int, None]
+
+
+class CounterStore(Protocol):
+    """
+    The subset of the Redis command set the shared limiter needs.
+
+    A ``redis.Redis`` client satisfies it as-is, so every worker process can share
+    one set of counters.
+    """
+
+    def incr(self, name: str, amount: int = 1) -> int: ...
+
+    def expire(self, name: str, time: int) -> bool: ...
+
+    def get(self, name: str) -> CounterValue: ...
+
+
+class InMemoryCounterStore:
+    """Local stand-in for Redis: same commands and expiry semantics, one process only."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._values: dict[str, tuple[int, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            value, expires_at = self._live(name)
+            value += amount
+            self._values[name] = (value, expires_at)
+            return value
+
+    def expire(self, name: str, time: int) -> bool:
+        with self._lock:
+            if name not in self._values:
+                return False
+            self._values[name] = (self._values[name][0], self._clock() + time)
+            return True
+
+    def get(self, name: str) -> CounterValue:
+        with self._lock:
+            value, _ = self._live(name)
+            return value if name in self._values else None
+
+    def _live(self, name: str) -> tuple[int, Optional[float]]:
+        value, expires_at = self._values.get(name, (0, None))
+        if expires_at is not None and expires_at <= self._clock():
+            del self._values[name]
+            return 0, None
+        return value, expires_at
+
+
+class SlidingWindowLimiter(RateLimiter):
+    """
+    Sliding-window-counter limiter over a shared :class:`CounterStore`.
+
+    The count for the last ``period`` is estimated from the current and previous fixed
+    windows, weighting the previous one by how much of it still overlaps. That needs two
+    integers per key instead of a log of timestamps, and costs one ``INCR`` and one ``GET``
+    per request (plus an ``EXPIRE`` when a window opens).
+    """
+
+    def __init__(self, store: CounterStore, prefix: str = "ratelimit", clock: Callable[[], float] = time.time) -> None:
+        self._store = store
+        self._prefix = prefix
+        self._clock = clock  # wall clock: windows must line up across processes
+
+    def acquire(self, key: str, limit: int, period_seconds: float, cost: int = 1) -> RateLimitDecision:
+        now = self._clock()
+        window, offset = divmod(now, period_seconds)
+        current_key = f"{self._prefix}:{key}:{int(window)}"
+        previous_key = f"{self._prefix}:{key}:{int(window) - 1}"
+
+        current = self._store.incr(current_key, cost)
+        if current == cost:
+            self._store.expire(current_key, int(period_seconds * 2) + 1)
+        previous = int(self._store.get(previous_key) or 0)
+
+        overlap = 1.0 - offset / period_seconds
+        estimated = previous * overlap + current
+        if estimated <= limit:
+            return RateLimitDecision(allowed=True, limit=limit, remaining=int(limit - estimated))
+
+        self._store.incr(current_key, -cost)  # denied requests do not count against the caller
+        return RateLimitDecision(
+            allowed=False,
+            limit=limit,
+            remaining=0,
+            retry_after=self._retry_after(previous, current, limit, offset, period_seconds),
+        )
+
+    @staticmethod
+    def _retry_after(previous: int, current: int, limit: int, offset: float, period: float) -> float:
+        if current > limit or previous == 0:
+            # Only the next window can admit the request.
+            return period - offset
+        # Wait until enough of the previous window has slid out: previous * (1 - t / period) + current <= limit.
+        overlap_needed = (limit - current) / previous
+        return max(0.0, (1.0 - overlap_needed) * period - offset)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from src.building_blocks.application.rate_limiter import RateLimitDecision, RateLimiter
+
+
+class InMemoryTokenBucketLimiter(RateLimiter):
+    """
+    Per-process token bucket, implemented as GCRA (generic cell rate algorithm).
+
+    Each key holds a single float, its *theoretical arrival time*, so a check is one dict
+    read, a little arithmetic and one dict write, with no lock. Under free-threaded or
+    multi-threaded callers two racing requests for the same key may both be admitted;
+    that bounded over-admission is the price of staying lock-free on the hot path.
+
+    Keys whose bucket has refilled are dropped once more than ``max_keys`` are tracked.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic) -> None:
+        self._arrivals: dict[str, float] = {}
+        self._max_keys = max_keys
+        self._clock = clock
+
+    def acquire(self, key: str, limit: int, period_seconds: float, cost: int = 1) -> RateLimitDecision:
+        now = self._clock()
+        interval = period_seconds / limit
+        arrival = self._arrivals.get(key, now)
+        if arrival < now:
+            arrival = now
+        next_arrival = arrival + interval * cost
+        # A full bucket lets ``limit`` requests through back to back, i.e. one period of credit.
+        admit_at = next_arrival - period_seconds
+        if admit_at > now:
+            remaining = int((now - (arrival - period_seconds)) / interval)
+            return RateLimitDecision(allowed=False, limit=limit, remaining=remaining, retry_after=admit_at - now)
+
+        self._arrivals[key] = next_arrival
+        if len(self._arrivals) > self._max_keys:
+            self._prune(now)
+        return RateLimitDecision(allowed=True, limit=limit, remaining=int((now - admit_at) / interval))
+
+    def _prune(self, now: float) -> None:
+        # A key whose arrival time has passed has a full bucket: forgetting it changes nothing.
+        self._arrivals = {key: arrival for key, arrival in self._arrivals.items() if arrival > now}
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Sequence
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, delete, func, insert, select, text, update
+from sqlalchemy.orm import Session
+
+from src.building_blocks.domain.events import DomainEvent
+from src.database.models import BaseSQLModel
+
+from .outbox import OutboxMessage
+
+
+class OutboxMessageModel(BaseSQLModel):
+    __tablename__ = "outbox_messages"
+
+    event_id = Column(String(36), unique=True, nullable=False)
+    event_name = Column(String(255), nullable=False)
+    payload = Column(Text, nullable=False)
+    occurred_on = Column(DateTime(timezone=True), nullable=False)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+    # Claims so far; rows that reach ``max_attempts`` stay in the table as dead letters until purged.
+    attempts = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Only the pending tail is ever scanned by the relay.
+        Index(
+            "ix_outbox_messages_pending",
+            "id",
+            sqlite_where=text("processed_at IS NULL"),
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+        # Delivered rows are purged oldest first by the retention step.
+        Index("ix_outbox_messages_processed_at", "processed_at"),
+    )
+
+
+class SQLOutbox:
+    """
+    Durable outbox table.
+
+    Repositories call :meth:`stage` with the session that writes the aggregate, so events
+    are committed (or rolled back) together with the state change that raised them;
+    :class:`OutboxRelay` delivers them afterwards. Once they have committed, repositories
+    call :meth:`notify_committed`, which wakes the relay instead of leaving the events to
+    its next poll.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], max_attempts: int = 5) -> None:
+        self.session_factory = session_factory
+        self.max_attempts = max_attempts
+        self._commit_listeners: list[Callable[[], None]] = []
+
+    def add_commit_listener(self, listener: Callable[[], None]) -> None:
+        self._commit_listeners.append(listener)
+
+    def remove_commit_listener(self, listener: Callable[[], None]) -> None:
+        if listener in self._commit_listeners:
+            self._commit_listeners.remove(listener)
+
+    def notify_committed(self) -> None:
+        """Tell the listeners (the relay) that staged messages have been committed."""
+        for listener in list(self._commit_listeners):
+            listener()
+
+    def stage(self, session: Session, events: Iterable[DomainEvent]) -> None:
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "event_id": str(message.id),
+                "event_name": message.event_name,
+                "payload": message.payload,
+                "occurred_on": message.occurred_on,
+                "attempts": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for message in map(OutboxMessage.from_event, events)
+        ]
+        if rows:
+            session.execute(insert(OutboxMessageModel), rows)
+
+    def claim(self, session: Session, limit: int) -> list[tuple[int, OutboxMessage]]:
+        """
+        Claim up to ``limit`` pending messages, oldest first, until ``session`` ends.
+
+        On PostgreSQL the batch is picked with ``FOR UPDATE SKIP LOCKED``, so concurrent
+        relays take disjoint batches without waiting on each other. SQLite ignores the
+        locking clause; there the claiming ``UPDATE`` takes the database write lock, which
+        serialises relays instead.
+        """
+        batch = (
+            select(OutboxMessageModel.id)
+            .where(OutboxMessageModel.processed_at.is_(None), OutboxMessageModel.attempts < self.max_attempts)
+            .order_by(OutboxMessageModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id.in_(batch.scalar_subquery()))
+            .values(attempts=OutboxMessageModel.attempts + 1)
+            .returning(
+                OutboxMessageModel.id,
+                OutboxMessageModel.event_id,
+                OutboxMessageModel.event_name,
+                OutboxMessageModel.payload,
+                OutboxMessageModel.occurred_on,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = sorted(session.execute(stmt).all())
+        return [
+            (
+                row.id,
+                OutboxMessage(
+                    id=uuid.UUID(row.event_id),
+                    event_name=row.event_name,
+                    payload=row.payload,
+                    occurred_on=_as_utc(row.occurred_on),
+                ),
+            )
+            for row in rows
+        ]
+
+    def mark_processed(self, session: Session, ids: Sequence[int], processed_at: datetime) -> None:
+        if not ids:
+            return
+        session.execute(
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id.in_(ids))
+            .values(processed_at=processed_at, updated_at=processed_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    def purge(self, processed_before: datetime, dead_before: datetime, limit: int) -> int:
+        """
+        Delete up to ``limit`` messages: those delivered before ``processed_before``, then
+        dead letters (out of attempts, never delivered) that occurred before ``dead_before``.
+        """
+        delivered = (
+            select(OutboxMessageModel.id)
+            .where(OutboxMessageModel.processed_at < processed_before)
+            .order_by(OutboxMessageModel.processed_at)
+            .limit(limit)
+        )
+        dead = (
+            select(OutboxMessageModel.id)
+            .where(
+                OutboxMessageModel.processed_at.is_(None),
+                OutboxMessageModel.attempts >= self.max_attempts,
+                OutboxMessageModel.occurred_on < dead_before,
+            )
+            .order_by(OutboxMessageModel.id)
+        )
+        with self.session_factory() as session:  # type: Session
+            ids = list(session.execute(delivered).scalars())
+            if len(ids) < limit:
+                ids.extend(session.execute(dead.limit(limit - len(ids))).scalars())
+            if not ids:
+                return 0
+            session.execute(delete(OutboxMessageModel).where(OutboxMessageModel.id.in_(ids)))
+            session.commit()
+        return len(ids)
+
+    def pending_count(self) -> int:
+        with self.session_factory() as session:  # type: Session
+            stmt = (
+                select(func.count())
+                .select_from(OutboxMessageModel)
+                .where(OutboxMessageModel.processed_at.is_(None), OutboxMessageModel.attempts < self.max_attempts)
+            )
+            return session.execute(stmt).scalar_one()
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for ``DateTime(timezone=True)`` columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,47 @@
+"""Request-scoped tracing: contextvars-propagated spans exported as JSON lines or OTLP."""
+
+from .exporters import (
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporter,
+    to_otlp_json,
+)
+from .tracer import (
+    NOOP_SPAN,
+    Span,
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    configure_tracing,
+    current_span,
+    format_traceparent,
+    in_current_context,
+    parse_traceparent,
+    start_span,
+    traced,
+    traced_methods,
+    tracing_enabled,
+)
+
+__all__ = [
+    "NOOP_SPAN",
+    "InMemorySpanExporter",
+    "JsonLinesSpanExporter",
+    "OtlpHttpSpanExporter",
+    "Span",
+    "SpanContext",
+    "SpanExporter",
+    "SpanKind",
+    "StatusCode",
+    "configure_tracing",
+    "current_span",
+    "format_traceparent",
+    "in_current_context",
+    "parse_traceparent",
+    "start_span",
+    "to_otlp_json",
+    "traced",
+    "traced_methods",
+    "tracing_enabled",
+]
@@ -0,0 +1,104 @@
+"""
+Local stand-in for an OpenTelemetry collector.
+
+Accepts OTLP/JSON posts on ``/v1/traces`` (what :class:`OtlpHttpSpanExporter` sends) and
+appends each span to a JSON lines file, in the same record shape as
+:class:`JsonLinesSpanExporter`. Enough to try the OTLP path without a collector::
+
+    python -m src.building_blocks.infrastructure.tracing.collector --port 4318 --output traces.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+
+from .. import json_codec
+from .tracer import SpanKind, StatusCode
+
+
+def _attribute_value(value: dict[str, Any]) -> Any:
+    if "intValue" in value:
+        return int(value["intValue"])
+    for key in ("boolValue", "doubleValue", "stringValue"):
+        if key in value:
+            return value[key]
+    return None
+
+
+def flatten_otlp_json(body: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """The spans of an OTLP/JSON export request, as flat records."""
+    for resource_spans in body.get("resourceSpans", ()):
+        resource = {
+            item["key"]: _attribute_value(item["value"])
+            for item in resource_spans.get("resource", {}).get("attributes", ())
+        }
+        for scope_spans in resource_spans.get("scopeSpans", ()):
+            for span in scope_spans.get("spans", ()):
+                status = span.get("status", {})
+                yield {
+                    "name": span["name"],
+                    "kind": SpanKind(span.get("kind", 1)).name,
+                    "trace_id": span["traceId"],
+                    "span_id": span["spanId"],
+                    "parent_span_id": span.get("parentSpanId") or None,
+                    "start_time_unix_nano": int(span["startTimeUnixNano"]),
+                    "end_time_unix_nano": int(span["endTimeUnixNano"]),
+                    "attributes": {
+                        item["key"]: _attribute_value(item["value"]) for item in span.get("attributes", ())
+                    },
+                    "status": StatusCode(status.get("code", 0)).name,
+                    "status_message": status.get("message") or None,
+                    "service": resource.get("service.name"),
+                }
+
+
+class CollectorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], output: str | Path) -> None:
+        super().__init__(address, _CollectorHandler)
+        self.output = Path(output)
+        self.lock = threading.Lock()
+        self.received = 0
+
+
+class _CollectorHandler(BaseHTTPRequestHandler):
+    server: CollectorServer
+
+    def do_POST(self) -> None:
+        if self.path != "/v1/traces":
+            self.send_error(404)
+            return
+        body = json_codec.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        records = list(flatten_otlp_json(body))
+        with self.server.lock, open(self.server.output, "ab") as file:
+            file.writelines(json_codec.dumps(record) + b"\n" for record in records)
+            self.server.received += len(records)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Receive OTLP/JSON spans and append them to a JSON lines file.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--output", default="traces.jsonl")
+    args = parser.parse_args()
+
+    server = CollectorServer((args.host, args.port), args.output)
+    print(f"Collecting spans on http://{args.host}:{server.server_port}/v1/traces into {args.output}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Span exporters.
+
+* :class:`JsonLinesSpanExporter` appends one JSON record per finished span to a file,
+  written in batches from a background thread;
+* :class:`OtlpHttpSpanExporter` batches spans on a background thread and posts them as
+  OTLP/JSON (``/v1/traces``) to an OpenTelemetry collector, or to the stand-in in
+  :mod:`.collector`;
+* :class:`InMemorySpanExporter` keeps them in a list, for tests.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import urllib.request
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from .. import json_codec
+
+if TYPE_CHECKING:
+    from .tracer import Span
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Called once per span, from the thread that ended it."""
+
+    def flush(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        self.flush()
+
+
+class InMemorySpanExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """
+    Appends ``Span.to_dict()`` records, tagged with the service name, to ``path``.
+
+    ``export`` only queues the span; a daemon thread serializes and writes the queue every
+    ``flush_interval`` seconds, which keeps JSON encoding and file writes off the request path.
+    """
+
+    def __init__(self, path: str | Path, service_name: str, flush_interval: float = 1.0) -> None:
+        self.path = Path(path)
+        self.service_name = service_name
+        self.flush_interval = flush_interval
+        self._pending: deque[Span] = deque()
+        self._write_lock = threading.Lock()
+        self._file = open(self.path, "ab")
+        self._stopped = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="jsonl-span-exporter", daemon=True)
+        self._writer.start()
+
+    def export(self, span: Span) -> None:
+        # deque.append and popleft are thread-safe, so exporting threads never take the lock.
+        self._pending.append(span)
+
+    def flush(self) -> None:
+        with self._write_lock:
+            pending, service, lines = self._pending, self.service_name, []
+            while pending:
+                record = pending.popleft().to_dict()
+                record["service"] = service
+                lines.append(json_codec.dumps(record))
+            if lines:
+                self._file.write(b"\n".join(lines) + b"\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self._writer.join()
+        self.flush()
+        self._file.close()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp_json(spans: Iterable[Span], service_name: str) -> dict[str, Any]:
+    """An OTLP/JSON ``ExportTraceServiceRequest`` body for ``spans``."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "src.building_blocks.tracing"},
+                        "spans": [
+                            {
+                                "traceId": f"{span.trace_id:032x}",
+                                "spanId": f"{span.span_id:016x}",
+                                "parentSpanId": f"{span.parent_span_id:016x}" if span.parent_span_id else "",
+                                "name": span.name,
+                                "kind": span.kind.value,
+                                "startTimeUnixNano": str(span.start_time_unix_nano),
+                                "endTimeUnixNano": str(span.end_time_unix_nano),
+                                "attributes": [
+                                    {"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()
+                                ],
+                                "status": {"code": span.status.value, "message": span.status_message or ""},
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """
+    Posts batches of spans as OTLP/JSON over HTTP from a daemon thread.
+
+    Spans beyond ``max_queue_size`` are dropped (and counted in ``dropped``) rather than
+    slowing requests down while the collector is slow or unreachable.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        max_batch_size: int = 512,
+        export_interval: float = 1.0,
+        max_queue_size: int = 4096,
+        timeout: float = 5.0,
+    ) -> None:
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.max_batch_size = max_batch_size
+        self.export_interval = export_interval
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue: queue.Queue[Span | None] = queue.Queue(max_queue_size)
+        self._flushed = threading.Condition()
+        self._pending = 0
+        self._worker = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._worker.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+            return
+        with self._flushed:
+            self._pending += 1
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait until every span exported so far has been posted (or given up on)."""
+        with self._flushed:
+            self._flushed.wait_for(lambda: self._pending == 0, timeout or self.timeout * 2)
+
+    def shutdown(self) -> None:
+        self.flush()
+        self._queue.put(None)
+        self._worker.join(self.timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch: list[Span] = []
+            try:
+                span = self._queue.get(timeout=self.export_interval)
+            except queue.Empty:
+                continue
+            while span is not None:
+                batch.append(span)
+                if len(batch) >= self.max_batch_size:
+                    break
+                try:
+                    span = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._post(batch)
+            with self._flushed:
+                self._pending -= len(batch)
+                self._flushed.notify_all()
+            if span is None:
+                return
+
+    def _post(self, batch: list[Span]) -> None:
+        if not batch:
+            return
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json_codec.dumps(to_otlp_json(batch, self.service_name)),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except OSError as error:
+            logger.warning("Dropped %d spans: OTLP export to %s failed: %s", len(batch), self.endpoint, error)
@@ -0,0 +1,269 @@
+"""
+Request-scoped spans propagated through :mod:`contextvars`.
+
+The active span lives in a context variable, so it follows ``await`` chains and tasks
+for free. Thread hops need the context to be carried explicitly: hand work to an executor
+with :func:`in_current_context` (or ``contextvars.copy_context().run``), since
+``loop.run_in_executor`` does not copy it the way ``asyncio.to_thread`` does.
+
+Identifiers and the ``traceparent`` header follow W3C Trace Context and OpenTelemetry
+(128-bit trace ids, 64-bit span ids, hex-encoded), so spans join traces started by, or
+exported to, OpenTelemetry tooling. When no exporter is configured, :func:`start_span`
+returns a shared no-op span and the decorators call straight through.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import random
+import re
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from .exporters import SpanExporter
+
+T = TypeVar("T")
+
+# Bound once: spans are created several times per request.
+_random_bits = random.getrandbits
+_time_ns = time.time_ns
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class SpanKind(Enum):
+    """OpenTelemetry span kinds (the values are the OTLP enum numbers)."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+class StatusCode(Enum):
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+@dataclass(frozen=True, slots=True)
+class SpanContext:
+    """The identity of a span, as carried across process boundaries."""
+
+    trace_id: int
+    span_id: int
+
+
+class Span:
+    """One timed operation; use it as a context manager to make it the current span."""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "start_time_unix_nano",
+        "end_time_unix_nano",
+        "attributes",
+        "status",
+        "status_message",
+        "_exporter",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        kind: SpanKind,
+        parent: SpanContext | Span | None,
+        attributes: dict[str, Any] | None,
+        exporter: SpanExporter,
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        if parent is None:
+            self.trace_id = _random_bits(128) or 1
+            self.parent_span_id = None
+        else:
+            self.trace_id = parent.trace_id
+            self.parent_span_id = parent.span_id
+        self.span_id = _random_bits(64) or 1
+        self.attributes = attributes if attributes is not None else {}
+        self.status = StatusCode.UNSET
+        self.status_message: str | None = None
+        self.start_time_unix_nano = _time_ns()
+        self.end_time_unix_nano: int | None = None
+        self._exporter = exporter
+        self._token: contextvars.Token | None = None
+
+    @property
+    def context(self) -> SpanContext:
+        return SpanContext(self.trace_id, self.span_id)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: StatusCode, message: str | None = None) -> None:
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, error: BaseException) -> None:
+        self.attributes["exception.type"] = type(error).__name__
+        self.attributes["exception.message"] = str(error)
+        self.set_status(StatusCode.ERROR, str(error))
+
+    def end(self) -> None:
+        if self.end_time_unix_nano is None:
+            self.end_time_unix_nano = _time_ns()
+            self._exporter.export(self)
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc is not None:
+            self.record_exception(exc)
+        _current_span.reset(self._token)
+        self.end()
+
+    def to_dict(self) -> dict[str, Any]:
+        """The span as a flat, JSON-ready record (what the JSON lines exporter writes)."""
+        return {
+            "name": self.name,
+            "kind": self.kind.name,
+            "trace_id": f"{self.trace_id:032x}",
+            "span_id": f"{self.span_id:016x}",
+            "parent_span_id": f"{self.parent_span_id:016x}" if self.parent_span_id is not None else None,
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": self.end_time_unix_nano,
+            "attributes": self.attributes,
+            "status": self.status.name,
+            "status_message": self.status_message,
+        }
+
+
+class _NoOpSpan:
+    """Returned while tracing is off; every operation is free."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_status(self, status: StatusCode, message: str | None = None) -> None:
+        pass
+
+    def record_exception(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> _NoOpSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        pass
+
+
+NOOP_SPAN = _NoOpSpan()
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar("current_span", default=None)
+_exporter: SpanExporter | None = None
+
+
+def configure_tracing(exporter: SpanExporter | None) -> None:
+    """Install the process-wide exporter; ``None`` turns tracing off."""
+    global _exporter
+    _exporter = exporter
+
+
+def tracing_enabled() -> bool:
+    return _exporter is not None
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def start_span(
+    name: str,
+    attributes: dict[str, Any] | None = None,
+    kind: SpanKind = SpanKind.INTERNAL,
+    parent: SpanContext | None = None,
+) -> Span | _NoOpSpan:
+    """A new span, child of ``parent`` or else of the current span; a no-op while tracing is off."""
+    exporter = _exporter
+    if exporter is None:
+        return NOOP_SPAN
+    return Span(name, kind, parent or _current_span.get(), attributes, exporter)
+
+
+def in_current_context(fn: Callable[..., T]) -> Callable[..., T]:
+    """Bind ``fn`` to a copy of the caller's context, so it can run on another thread."""
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+def traced(
+    name: str | None = None, kind: SpanKind = SpanKind.INTERNAL
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Run each call of the decorated function (sync or async) in a span named ``name``."""
+
+    def decorate(fn: Callable[..., T]) -> Callable[..., T]:
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _exporter is None:
+                    return await fn(*args, **kwargs)
+                with start_span(span_name, kind=kind):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return fn(*args, **kwargs)
+            with start_span(span_name, kind=kind):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def traced_methods(prefix: str) -> Callable[[type[T]], type[T]]:
+    """Class decorator: a span ``"<prefix> <Class>.<method>"`` around each public method the class defines."""
+
+    def decorate(cls: type[T]) -> type[T]:
+        for attribute, member in list(vars(cls).items()):
+            if attribute.startswith("_") or not inspect.isfunction(member):
+                continue
+            setattr(cls, attribute, traced(f"{prefix} {cls.__name__}.{attribute}")(member))
+        return cls
+
+    return decorate
+
+
+def format_traceparent(span: Span | SpanContext) -> str:
+    return f"00-{span.trace_id:032x}-{span.span_id:016x}-01"
+
+
+def parse_traceparent(header: str | None) -> SpanContext | None:
+    """The remote parent from a W3C ``traceparent`` header, or ``None`` when absent or malformed."""
+    match = _TRACEPARENT.match(header.strip().lower()) if header else None
+    if match is None:
+        return None
+    trace_id, span_id = int(match.group(1), 16), int(match.group(2), 16)
+    if not trace_id or not span_id:
+        return None
+    return SpanContext(trace_id, span_id)
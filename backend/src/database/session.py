@@ -5,6 +5,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
+from src.building_blocks.infrastructure.metrics.instruments import instrument_pool
+
 
 class SQLAlchemySessionFactory:
     """Utility that returns singleton engines and session factories per DB URL."""
@@ -25,6 +27,7 @@ class SQLAlchemySessionFactory:
                 engine = cls._engines.get(url)
                 if engine is None:
                     engine = create_engine(url, pool_pre_ping=True, future=True)
+                    instrument_pool(engine)
                     cls._engines[url] = engine
 
                 factory = sessionmaker(
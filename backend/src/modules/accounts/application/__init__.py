@@ -10,6 +10,7 @@ from .account import (  # noqa: F401
 )
 from .authentication.login.handler import LoginHandler  # noqa: F401
 from .authentication.logout.handler import LogoutHandler  # noqa: F401
+from .authentication.refresh_session.handler import RefreshSessionHandler  # noqa: F401
 from .registration.register_account.handler import RegisterAccountHandler  # noqa: F401
 
 __all__ = [
@@ -21,5 +22,6 @@ __all__ = [
     "VerifyAccountHandler",
     "LoginHandler",
     "LogoutHandler",
+    "RefreshSessionHandler",
     "RegisterAccountHandler",
 ]
@@ -14,6 +14,12 @@ class AccountDTO:
     roles: tuple[str, ...]
 
 
+@dataclass(slots=True, frozen=True)
+class AccountPageDTO:
+    items: tuple[AccountDTO, ...]
+    next_cursor: str | None = None
+
+
 def to_account_dto(account: Account) -> AccountDTO:
     """Map an account aggregate to a transport-friendly DTO."""
     role_ids = tuple(str(role_id.value) for role_id in account.role_ids)
@@ -1,8 +1,8 @@
-"""Query handler that lists all accounts."""
+"""Query handler that lists accounts one page at a time."""
 
 from __future__ import annotations
 
-from src.modules.accounts.application.account.dto import AccountDTO, to_account_dto
+from src.modules.accounts.application.account.dto import AccountPageDTO, to_account_dto
 from src.modules.accounts.domain.interfaces.account_repository import AccountRepository
 
 from .query import ListAccountsQuery
@@ -12,6 +12,9 @@ class ListAccountsHandler:
     def __init__(self, account_repository: AccountRepository) -> None:
         self._accounts = account_repository
 
-    def __call__(self, query: ListAccountsQuery) -> tuple[AccountDTO, ...]:
-        accounts = (to_account_dto(account) for account in self._accounts.list_accounts())
-        return tuple(accounts)
+    def __call__(self, query: ListAccountsQuery) -> AccountPageDTO:
+        page = self._accounts.list_accounts(limit=query.limit, cursor=query.cursor)
+        return AccountPageDTO(
+            items=tuple(to_account_dto(account) for account in page.items),
+            next_cursor=page.next_cursor,
+        )
@@ -5,4 +5,5 @@ from dataclasses import dataclass
 
 @dataclass(slots=True, frozen=True)
 class ListAccountsQuery:
-    pass
+    limit: int = 50
+    cursor: str | None = None
@@ -1,14 +1,16 @@
+import asyncio
 import secrets
 from datetime import datetime, timedelta, timezone
 
 from src.modules.accounts.domain.account.account import Account
 from src.modules.accounts.domain.account.value_objects.email import Email
+from src.modules.accounts.domain.account.value_objects.hashed_password import HashedPassword
 from src.modules.accounts.domain.interfaces.account_repository import AccountRepository
 from src.modules.accounts.domain.interfaces.session_repository import SessionRepository
 from src.modules.accounts.domain.session.session import Session
 from src.modules.accounts.domain.session.value_objects.refresh_token import RefreshToken
 
-from ...interfaces.password_hasher import IPasswordHasher
+from ...interfaces.password_hasher import IAsyncPasswordHasher
 from .command import LoginCommand
 from .dto import LoginResultDTO
 
@@ -18,7 +20,7 @@ class LoginHandler:
         self,
         account_repository: AccountRepository,
         session_repository: SessionRepository,
-        password_hasher: IPasswordHasher,
+        password_hasher: IAsyncPasswordHasher,
         session_ttl: timedelta | None = None,
     ) -> None:
         self._accounts = account_repository
@@ -26,21 +28,26 @@ class LoginHandler:
         self._hasher = password_hasher
         self._session_ttl = session_ttl or timedelta(hours=12)
 
-    def __call__(self, command: LoginCommand) -> tuple[Account, LoginResultDTO]:
+    async def __call__(self, command: LoginCommand) -> tuple[Account, LoginResultDTO]:
+        # Hashing runs in the hasher's worker pool; blocking repository calls go to a thread.
         email = Email.create(command.email)
-        account = self._accounts.get_by_email(str(email))
-        if not account or not self._hasher.verify(command.password, account.hashed_password.value):
+        account = await asyncio.to_thread(self._accounts.get_by_email, str(email))
+        if not account or not await self._hasher.verify(command.password, account.hashed_password.value):
             raise ValueError("Invalid credentials")
         if not account.is_verified:
             raise ValueError("Account not verified")
         if not account.is_active:
             raise ValueError("Account inactive")
+        if self._hasher.needs_rehash(account.hashed_password.value):
+            # The plaintext is only available here, so outdated hashes are upgraded on login.
+            account.upgrade_password_hash(HashedPassword.create(await self._hasher.encode(command.password)))
+            await asyncio.to_thread(self._accounts.update, account)
 
         refresh_value = secrets.token_urlsafe(48)
         refresh_token = RefreshToken.create(refresh_value)
         expires_at = datetime.now(timezone.utc) + self._session_ttl
         session = Session.issue(account_id=account.id, refresh_token=refresh_token, expires_at=expires_at)
-        self._sessions.add(session)
+        await asyncio.to_thread(self._sessions.add, session)
         dto = LoginResultDTO(
             account_id=str(account.id.value),
             email=str(account.email),
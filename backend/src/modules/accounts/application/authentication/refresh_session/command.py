@@ -0,0 +1,8 @@
+"""Command for exchanging a refresh token for a new one."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class RefreshSessionCommand:
+    refresh_token: str
@@ -0,0 +1,10 @@
+"""DTO returned after a refresh token has been rotated."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class RefreshedSessionDTO:
+    account_id: str
+    session_id: str
+    refresh_token: str
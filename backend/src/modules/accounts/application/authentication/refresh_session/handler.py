@@ -0,0 +1,56 @@
+"""Handler that rotates a session's refresh token."""
+
+from __future__ import annotations
+
+import secrets
+from datetime import datetime, timedelta, timezone
+
+from src.modules.accounts.domain.interfaces.session_repository import SessionRepository
+from src.modules.accounts.domain.session.session import Session
+from src.modules.accounts.domain.session.value_objects.refresh_token import RefreshToken
+from src.modules.accounts.domain.session.value_objects.refresh_token_digest import RefreshTokenDigest
+
+from .command import RefreshSessionCommand
+from .dto import RefreshedSessionDTO
+
+
+class RefreshTokenReuseError(ValueError):
+    """A refresh token was presented after it had already been rotated."""
+
+
+class RefreshSessionHandler:
+    def __init__(self, session_repository: SessionRepository, session_ttl: timedelta | None = None) -> None:
+        self._sessions = session_repository
+        self._session_ttl = session_ttl or timedelta(hours=12)
+
+    def __call__(self, command: RefreshSessionCommand) -> RefreshedSessionDTO:
+        presented = RefreshTokenDigest.of(command.refresh_token)
+        session = self._sessions.get_by_refresh_token(presented)
+        if session is None:
+            retired_by = self._sessions.get_by_retired_refresh_token(presented)
+            if retired_by is not None:
+                self._revoke(retired_by)
+                raise RefreshTokenReuseError("Refresh token reuse detected; session revoked")
+            raise ValueError("Invalid refresh token")
+
+        now = datetime.now(timezone.utc)
+        if not session.is_active or session.is_expired(now):
+            raise ValueError("Session expired")
+
+        refresh_token = RefreshToken.create(secrets.token_urlsafe(48))
+        previous = session.rotate(refresh_token, expires_at=now + self._session_ttl)
+        if not self._sessions.rotate_refresh_token(session, previous):
+            # Someone else rotated this token between our read and write: the same token was used twice.
+            self._revoke(session)
+            raise RefreshTokenReuseError("Refresh token reuse detected; session revoked")
+
+        return RefreshedSessionDTO(
+            account_id=str(session.account_id.value),
+            session_id=str(session.id.value),
+            refresh_token=refresh_token.value,
+        )
+
+    def _revoke(self, session: Session) -> None:
+        # A leaked token may belong to either party, so the whole session (token family) is ended.
+        session.revoke()
+        self._sessions.update(session)
@@ -6,4 +6,4 @@ hashing.
 """
 
 from .notification_service import INotificationService  # noqa: F401
-from .password_hasher import IPasswordHasher  # noqa: F401
+from .password_hasher import IAsyncPasswordHasher, IPasswordHasher  # noqa: F401
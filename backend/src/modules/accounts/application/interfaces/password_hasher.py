@@ -34,3 +34,30 @@ class IPasswordHasher(ABC):
         Returns:
             bool: True if the passwords match, False otherwise.
         """
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Tell whether a stored hash was produced with outdated parameters.
+
+        Args:
+            hashed_password: The stored hashed password.
+
+        Returns:
+            bool: True if the hash should be re-encoded with the current settings.
+        """
+
+
+class IAsyncPasswordHasher(ABC):
+    """Password hashing service that keeps CPU-bound work off the event loop and request threads."""
+
+    @abstractmethod
+    async def encode(self, password: str) -> str:
+        """Hash a plaintext password; see :meth:`IPasswordHasher.encode`."""
+
+    @abstractmethod
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a plaintext password; see :meth:`IPasswordHasher.verify`."""
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Cheap, in-process check; see :meth:`IPasswordHasher.needs_rehash`."""
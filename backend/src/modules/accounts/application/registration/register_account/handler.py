@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from src.modules.accounts.domain.account.account import Account
 from src.modules.accounts.domain.account.value_objects.email import Email
 from src.modules.accounts.domain.account.value_objects.hashed_password import HashedPassword
@@ -9,7 +11,7 @@ from src.modules.accounts.domain.account.value_objects.password import Password
 from src.modules.accounts.domain.interfaces.account_repository import AccountRepository
 
 from ...interfaces.notification_service import INotificationService
-from ...interfaces.password_hasher import IPasswordHasher
+from ...interfaces.password_hasher import IAsyncPasswordHasher
 from .command import RegisterAccountCommand
 from .dto import RegisteredAccountDTO
 
@@ -18,21 +20,21 @@ class RegisterAccountHandler:
     def __init__(
         self,
         account_repository: AccountRepository,
-        password_hasher: IPasswordHasher,
+        password_hasher: IAsyncPasswordHasher,
         notification_service: INotificationService,
     ) -> None:
         self._accounts = account_repository
         self._hasher = password_hasher
         self._notifications = notification_service
 
-    def __call__(self, command: RegisterAccountCommand) -> tuple[Account, RegisteredAccountDTO]:
+    async def __call__(self, command: RegisterAccountCommand) -> tuple[Account, RegisteredAccountDTO]:
         email_vo = Email.create(command.email)
         password_vo = Password.create(command.password)
-        if self._accounts.exists_by_email(str(email_vo)):
+        if await asyncio.to_thread(self._accounts.exists_by_email, str(email_vo)):
             raise ValueError("An account with this email already exists")
-        hashed = HashedPassword.create(self._hasher.encode(password_vo.value))
+        hashed = HashedPassword.create(await self._hasher.encode(password_vo.value))
         account = Account.register(email=email_vo, hashed_password=hashed)
-        self._accounts.add(account)
+        await asyncio.to_thread(self._accounts.add, account)
         self._notifications.send_welcome_email(str(email_vo))
         dto = RegisteredAccountDTO(
             id=str(account.id.value),
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Iterable
 
 from src.building_blocks.domain.aggregate_root import AggregateRoot
@@ -14,7 +15,7 @@ from .value_objects.email import Email
 from .value_objects.hashed_password import HashedPassword
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Account(AggregateRoot[AccountId]):
     """Aggregate root representing an account within the system."""
 
@@ -56,6 +57,30 @@ class Account(AggregateRoot[AccountId]):
         account.record_event(AccountRegisteredEvent(account_id=str(account.id.value), email=str(email)))
         return account
 
+    @classmethod
+    def rehydrate(
+        cls,
+        account_id: AccountId,
+        email: Email,
+        hashed_password: HashedPassword,
+        status: AccountStatus,
+        role_ids: Iterable[RoleId],
+        created_at: datetime,
+        updated_at: datetime,
+        version: int = 0,
+    ) -> "Account":
+        """Rebuild an account from persisted state without recording events."""
+        return cls._restore(
+            _id=account_id,
+            _email=email,
+            _password=hashed_password,
+            _status=status,
+            _role_ids=set(role_ids),
+            _created_at=created_at,
+            _updated_at=updated_at,
+            _version=version,
+        )
+
     def verify(self) -> None:
         if not self._status.is_verified:
             self._status = self._status.mark_verified()
@@ -80,6 +105,12 @@ class Account(AggregateRoot[AccountId]):
             self._password = new_hashed_password
             self.record_event(PasswordChangedEvent(account_id=str(self.id.value)))
 
+    def upgrade_password_hash(self, rehashed_password: HashedPassword) -> None:
+        """Replace the stored hash of the *same* password, e.g. after raising the work factor."""
+        if self._password != rehashed_password:
+            self._password = rehashed_password
+            self.touch()
+
     def assign_role(self, role_id: RoleId) -> None:
         if role_id not in self._role_ids:
             self._role_ids.add(role_id)
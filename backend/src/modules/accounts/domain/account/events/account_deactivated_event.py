@@ -5,6 +5,6 @@ from dataclasses import dataclass
 from src.building_blocks.domain.events import DomainEvent
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class AccountDeactivatedEvent(DomainEvent):
     account_id: str
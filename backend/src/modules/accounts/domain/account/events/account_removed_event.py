@@ -0,0 +1,10 @@
+"""Domain event emitted when an account is removed."""
+
+from dataclasses import dataclass
+
+from src.building_blocks.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True)
+class AccountRemovedEvent(DomainEvent):
+    account_id: str
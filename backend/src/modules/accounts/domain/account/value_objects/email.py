@@ -8,7 +8,7 @@ from src.building_blocks.domain.value_object import ValueObject
 from ..rules.email_must_be_valid_rule import EmailMustBeValidRule
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Email(ValueObject):
     """Email value object used by the account aggregate."""
 
@@ -10,7 +10,7 @@ from src.building_blocks.domain.value_object import ValueObject
 from ..rules.hashed_password_must_be_set_rule import HashedPasswordMustBeSetRule
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class HashedPassword(ValueObject):
     value: str
 
@@ -10,7 +10,7 @@ from src.building_blocks.domain.value_object import ValueObject
 from ..rules.password_must_meet_policy_rule import PasswordMustMeetPolicyRule
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Password(ValueObject):
     value: str
 
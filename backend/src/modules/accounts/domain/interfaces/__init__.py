@@ -1,5 +1,5 @@
-from .account_repository import AccountRepository
+from .account_repository import AccountPage, AccountRepository
 from .role_repository import RoleRepository
 from .session_repository import SessionRepository
 
-__all__ = ["AccountRepository", "RoleRepository", "SessionRepository"]
+__all__ = ["AccountPage", "AccountRepository", "RoleRepository", "SessionRepository"]
@@ -1,11 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from dataclasses import dataclass
+from typing import Optional
 
 from ..account.account import Account
 from ..account.value_objects.account_id import AccountId
 from ..role.value_objects.role_id import RoleId
 
 
+@dataclass(slots=True, frozen=True)
+class AccountPage:
+    """One page of accounts plus the opaque cursor of the next page (``None`` on the last page)."""
+
+    items: tuple[Account, ...]
+    next_cursor: Optional[str] = None
+
+
 class AccountRepository(ABC):
     @abstractmethod
     def add(self, account: Account) -> None:
@@ -28,8 +37,8 @@ class AccountRepository(ABC):
         """Return ``True`` when an account already uses the email."""
 
     @abstractmethod
-    def list_accounts(self) -> Iterable[Account]:
-        """Return all accounts sorted by creation date."""
+    def list_accounts(self, limit: int = 50, cursor: Optional[str] = None) -> AccountPage:
+        """Return up to ``limit`` accounts sorted by creation date, starting after ``cursor``."""
 
     @abstractmethod
     def remove(self, account_id: AccountId) -> None:
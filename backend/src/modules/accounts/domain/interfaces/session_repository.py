@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Iterable, Optional
 
 from ..account.value_objects.account_id import AccountId
 from ..session.session import Session
+from ..session.value_objects.refresh_token_digest import RefreshTokenDigest
 from ..session.value_objects.session_id import SessionId
 
 
@@ -30,3 +32,28 @@ class SessionRepository(ABC):
     @abstractmethod
     def revoke_all_for_account(self, account_id: AccountId) -> None:
         """Revoke all active sessions for the account."""
+
+    @abstractmethod
+    def get_by_refresh_token(self, digest: RefreshTokenDigest) -> Optional[Session]:
+        """Return the session whose *current* refresh token has this digest."""
+
+    @abstractmethod
+    def get_by_retired_refresh_token(self, digest: RefreshTokenDigest) -> Optional[Session]:
+        """Return the session that issued this refresh token before rotating it away."""
+
+    @abstractmethod
+    def rotate_refresh_token(self, session: Session, previous: RefreshTokenDigest) -> bool:
+        """
+        Persist a rotated session and retire ``previous``.
+
+        The write only succeeds while the stored token is still ``previous``; ``False``
+        means another request rotated the same token first.
+        """
+
+    @abstractmethod
+    def purge_inactive(self, now: datetime, revoked_before: datetime, limit: int) -> int:
+        """Delete up to ``limit`` sessions expired by ``now`` or revoked before ``revoked_before``."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of stored sessions."""
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from src.building_blocks.domain.events import DomainEvent
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RoleCreatedEvent(DomainEvent):
     role_id: str
     name: str
@@ -13,7 +13,7 @@ from .value_objects.role_id import RoleId
 from .value_objects.role_name import RoleName
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Role(AggregateRoot[RoleId]):
     _id: RoleId
     _name: RoleName
@@ -20,7 +20,7 @@ class RoleNameCannotBeEmptyRule(BaseBusinessRule):
         return not self.value or not self.value.strip()
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class RoleName(ValueObject):
     value: str
 
@@ -0,0 +1,10 @@
+"""Event emitted when every active session of an account is revoked at once."""
+
+from dataclasses import dataclass
+
+from src.building_blocks.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True)
+class AllSessionsRevokedEvent(DomainEvent):
+    account_id: str
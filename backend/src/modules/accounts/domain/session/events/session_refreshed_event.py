@@ -0,0 +1,11 @@
+"""Event emitted when a session's refresh token is rotated."""
+
+from dataclasses import dataclass
+
+from src.building_blocks.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRefreshedEvent(DomainEvent):
+    session_id: str
+    account_id: str
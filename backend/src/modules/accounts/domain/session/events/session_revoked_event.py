@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from src.building_blocks.domain.events import DomainEvent
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class SessionRevokedEvent(DomainEvent):
     session_id: str
     account_id: str
@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from src.building_blocks.domain.enums import ErrorCode, ErrorType
+from src.building_blocks.domain.rule import BaseBusinessRule
+
+
+@dataclass(slots=True)
+class SessionMustBeActiveRule(BaseBusinessRule):
+    is_active: bool
+    expires_at: datetime
+    code: ErrorCode = field(default=ErrorCode.UNAUTHORIZED_ACCESS, init=False)
+    message: str = field(default="Session has been revoked or has expired", init=False)
+    error_type: ErrorType = field(default=ErrorType.UNAUTHORIZED_ACCESS, init=False)
+
+    def is_broken(self) -> bool:
+        return not self.is_active or self.expires_at <= datetime.now(timezone.utc)
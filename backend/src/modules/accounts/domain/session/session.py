@@ -1,25 +1,28 @@
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.building_blocks.domain.aggregate_root import AggregateRoot
 
 from ..account.value_objects.account_id import AccountId
 from .events.session_expired_event import SessionExpiredEvent
 from .events.session_issued_event import SessionIssuedEvent
+from .events.session_refreshed_event import SessionRefreshedEvent
 from .events.session_revoked_event import SessionRevokedEvent
 from .rules.session_expiration_must_be_future_rule import SessionExpirationMustBeFutureRule
+from .rules.session_must_be_active_rule import SessionMustBeActiveRule
 from .value_objects.refresh_token import RefreshToken
+from .value_objects.refresh_token_digest import RefreshTokenDigest
 from .value_objects.session_id import SessionId
 from .value_objects.session_status import SessionStatus
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Session(AggregateRoot[SessionId]):
     """Session aggregate representing an authenticated session for an account."""
 
     _id: SessionId
     _account_id: AccountId
-    _refresh_token: RefreshToken
+    _refresh_token_digest: RefreshTokenDigest
     _expires_at: datetime
     _status: SessionStatus = field(default_factory=SessionStatus.active)
 
@@ -28,8 +31,8 @@ class Session(AggregateRoot[SessionId]):
         return self._account_id
 
     @property
-    def refresh_token(self) -> RefreshToken:
-        return self._refresh_token
+    def refresh_token_digest(self) -> RefreshTokenDigest:
+        return self._refresh_token_digest
 
     @property
     def expires_at(self) -> datetime:
@@ -39,18 +42,58 @@ class Session(AggregateRoot[SessionId]):
     def is_active(self) -> bool:
         return self._status.is_active
 
+    def is_expired(self, now: datetime | None = None) -> bool:
+        return self._expires_at <= (now or datetime.now(timezone.utc))
+
     @classmethod
     def issue(cls, account_id: AccountId, refresh_token: RefreshToken, expires_at: datetime) -> "Session":
         cls.check_rules(SessionExpirationMustBeFutureRule(expires_at=expires_at))
         session = cls(
             _id=SessionId.create(),
             _account_id=account_id,
-            _refresh_token=refresh_token,
+            _refresh_token_digest=refresh_token.digest(),
             _expires_at=expires_at,
         )
         session.record_event(SessionIssuedEvent(session_id=str(session.id.value), account_id=str(account_id.value)))
         return session
 
+    @classmethod
+    def rehydrate(
+        cls,
+        session_id: SessionId,
+        account_id: AccountId,
+        refresh_token_digest: RefreshTokenDigest,
+        expires_at: datetime,
+        status: SessionStatus,
+        created_at: datetime,
+        updated_at: datetime,
+        version: int = 0,
+    ) -> "Session":
+        """Rebuild a session from persisted state, skipping the expiry rule and events."""
+        return cls._restore(
+            _id=session_id,
+            _account_id=account_id,
+            _refresh_token_digest=refresh_token_digest,
+            _expires_at=expires_at,
+            _status=status,
+            _created_at=created_at,
+            _updated_at=updated_at,
+            _version=version,
+        )
+
+    def rotate(self, refresh_token: RefreshToken, expires_at: datetime) -> RefreshTokenDigest:
+        """Swap in a new refresh token and return the digest of the one it replaces."""
+        self.check_rules(
+            SessionMustBeActiveRule(is_active=self.is_active, expires_at=self._expires_at),
+            SessionExpirationMustBeFutureRule(expires_at=expires_at),
+        )
+        previous = self._refresh_token_digest
+        self._refresh_token_digest = refresh_token.digest()
+        self._expires_at = expires_at
+        self.touch()
+        self.record_event(SessionRefreshedEvent(session_id=str(self.id.value), account_id=str(self.account_id.value)))
+        return previous
+
     def revoke(self) -> None:
         if self._status.is_active:
             self._status = self._status.revoke()
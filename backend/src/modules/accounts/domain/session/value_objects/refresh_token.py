@@ -6,9 +6,10 @@ from typing import Self
 from src.building_blocks.domain.value_object import ValueObject
 
 from ..rules.refresh_token_must_be_secure_rule import RefreshTokenMustBeSecureRule
+from .refresh_token_digest import RefreshTokenDigest
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class RefreshToken(ValueObject):
     value: str
 
@@ -17,5 +18,8 @@ class RefreshToken(ValueObject):
         cls.check_rules(RefreshTokenMustBeSecureRule(token=value))
         return cls(value=value)
 
+    def digest(self) -> RefreshTokenDigest:
+        return RefreshTokenDigest.of(self.value)
+
     def __str__(self) -> str:  # pragma: no cover
         return "<refresh-token>"
@@ -0,0 +1,25 @@
+"""Digest of a refresh token, the only form in which the token is persisted."""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Self
+
+from src.building_blocks.domain.value_object import ValueObject
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class RefreshTokenDigest(ValueObject):
+    value: str
+
+    @classmethod
+    def create(cls, value: str) -> Self:
+        return cls(value=value)
+
+    @classmethod
+    def of(cls, token: str) -> Self:
+        # Refresh tokens are high-entropy random strings, so an unsalted SHA-256 is
+        # enough to make a leaked table useless while keeping lookups exact-match.
+        return cls(value=hashlib.sha256(token.encode("utf-8")).hexdigest())
+
+    def __str__(self) -> str:  # pragma: no cover
+        return self.value
@@ -4,12 +4,16 @@ from typing import Self
 from src.building_blocks.domain.value_object import ValueObject
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class SessionStatus(ValueObject):
     """Value object describing the lifecycle of a session."""
 
     is_active: bool = True
 
+    @classmethod
+    def create(cls, is_active: bool = True) -> Self:
+        return cls(is_active=is_active)
+
     @classmethod
     def active(cls) -> Self:
         return cls(is_active=True)
@@ -0,0 +1,5 @@
+"""In-process caches for the accounts module."""
+
+from .principal_cache import PrincipalCache
+
+__all__ = ["PrincipalCache"]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Optional
+
+from src.building_blocks.infrastructure.cache import TTLCache
+from src.building_blocks.infrastructure.event_bus import EventBus
+
+from ...domain.account.account import Account
+from ...domain.account.events.account_deactivated_event import AccountDeactivatedEvent
+from ...domain.account.events.account_removed_event import AccountRemovedEvent
+from ...domain.account.events.password_changed_event import PasswordChangedEvent
+from ...domain.account.value_objects.account_id import AccountId
+from ...domain.account.value_objects.account_status import AccountStatus
+from ...domain.account.value_objects.email import Email
+from ...domain.account.value_objects.hashed_password import HashedPassword
+from ...domain.role.value_objects.role_id import RoleId
+from ...domain.session.events.all_sessions_revoked_event import AllSessionsRevokedEvent
+from ...domain.session.events.session_expired_event import SessionExpiredEvent
+from ...domain.session.events.session_revoked_event import SessionRevokedEvent
+
+AccountEvent = (
+    AccountDeactivatedEvent
+    | AccountRemovedEvent
+    | PasswordChangedEvent
+    | AllSessionsRevokedEvent
+    | SessionExpiredEvent
+    | SessionRevokedEvent
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Immutable snapshot of an authenticated account, with the sessions already checked for it.
+
+    The cache shares one snapshot between concurrent requests; each request gets its own
+    aggregate from :meth:`to_account`, so nothing a handler does to it leaks into others.
+    """
+
+    account_id: AccountId
+    email: Email
+    hashed_password: HashedPassword
+    status: AccountStatus
+    role_ids: tuple[RoleId, ...]
+    created_at: datetime
+    updated_at: datetime
+    version: int
+    session_ids: frozenset[str] = frozenset()
+
+    @classmethod
+    def of(cls, account: Account, session_ids: frozenset[str] = frozenset()) -> Principal:
+        return cls(
+            account_id=account.id,
+            email=account.email,
+            hashed_password=account.hashed_password,
+            status=AccountStatus.create(is_verified=account.is_verified, is_active=account.is_active),
+            role_ids=tuple(account.role_ids),
+            created_at=account.created_at,
+            updated_at=account.updated_at,
+            version=account.version,
+            session_ids=session_ids,
+        )
+
+    def with_session(self, session_id: str) -> Principal:
+        return replace(self, session_ids=self.session_ids | {session_id})
+
+    def to_account(self) -> Account:
+        return Account.rehydrate(
+            account_id=self.account_id,
+            email=self.email,
+            hashed_password=self.hashed_password,
+            status=self.status,
+            role_ids=self.role_ids,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            version=self.version,
+        )
+
+
+class PrincipalCache:
+    """
+    Short-lived cache of authenticated principals keyed by the token subject (account id).
+
+    Entries are dropped when the outbox relay delivers an event that can change the
+    outcome of authentication (logout, session revocation, deactivation, removal, password
+    change); commits wake the relay, so that is shortly after the commit. Each event is
+    relayed by one worker process, so the TTL bounds staleness in the other workers and
+    for changes that publish no event.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 30.0) -> None:
+        self._accounts: TTLCache[str, Principal] = TTLCache(maxsize=maxsize, ttl=ttl_seconds, name="principals")
+
+    def get(self, account_id: str) -> Optional[Principal]:
+        return self._accounts.get(account_id)
+
+    def put(self, account_id: str, principal: Principal) -> None:
+        self._accounts.set(account_id, principal)
+
+    def invalidate(self, account_id: str) -> None:
+        self._accounts.pop(account_id)
+
+    def clear(self) -> None:
+        self._accounts.clear()
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        for event_type in (
+            AccountDeactivatedEvent,
+            AccountRemovedEvent,
+            PasswordChangedEvent,
+            AllSessionsRevokedEvent,
+            SessionExpiredEvent,
+            SessionRevokedEvent,
+        ):
+            event_bus.subscribe(event_type, self.on_account_changed)
+
+    def on_account_changed(self, event: AccountEvent) -> None:
+        self.invalidate(event.account_id)
@@ -1,6 +1,13 @@
 from dependency_injector import containers, providers
 
+from src.building_blocks.infrastructure.event_bus import EventBus
+from src.building_blocks.infrastructure.outbox_relay import OutboxRelay
+from src.building_blocks.infrastructure.sql_outbox import SQLOutbox
+
+from ..caching.principal_cache import PrincipalCache
 from ..crypto.password_hasher import PBKDF2PasswordHasher
+from ..crypto.process_pool_hasher import init_password_hashing_service
+from ..maintenance.session_sweeper import init_session_sweeper
 from ..mediator import Mediator
 from ..messaging.email_notifier import ConsoleNotificationService
 from ..persistence.repositories.sql_account_repo import SQLAccountRepository
@@ -17,13 +24,31 @@ class AccountsDIContainer(containers.DeclarativeContainer):
 
     session_factory = providers.Dependency()  # wired in via AccountsStartUp
 
+    # Repositories stage their events in the outbox with the aggregate; the relay (started
+    # from the app lifespan) delivers committed events to the bus's subscribers.
+    event_bus = providers.Singleton(EventBus)
+    outbox = providers.Singleton(SQLOutbox, session_factory=session_factory)
+    outbox_relay = providers.Singleton(
+        OutboxRelay,
+        outbox=outbox,
+        event_bus=event_bus,
+        poll_interval_seconds=config.outbox_poll_interval_seconds,
+    )
+
     account_repository = providers.Singleton(
         SQLAccountRepository,
         session_factory=session_factory,
+        outbox=outbox,
     )
     session_repository = providers.Singleton(
         SQLSessionRepository,
         session_factory=session_factory,
+        outbox=outbox,
+    )
+    session_sweeper = providers.Resource(
+        init_session_sweeper,
+        repository=session_repository,
+        interval_seconds=config.session_sweep_interval_seconds,
     )
     role_repository = providers.Singleton(
         SQLRoleRepository,
@@ -31,9 +56,16 @@ class AccountsDIContainer(containers.DeclarativeContainer):
     )
 
     password_hasher = providers.Singleton(PBKDF2PasswordHasher)
-    
+    password_hashing_service = providers.Resource(
+        init_password_hashing_service,
+        hasher=password_hasher,
+        max_workers=config.password_hashing_workers,
+    )
+
     notification_service = providers.Singleton(ConsoleNotificationService)
 
+    principal_cache = providers.Singleton(PrincipalCache)
+
     mediator = providers.Singleton(Mediator, handlers=handlers)
 
     wiring_config = containers.WiringConfiguration(
@@ -7,6 +7,7 @@ class AccountsStartUp:
     def __init__(self) -> None:
         self._container: AccountsDIContainer | None = None
         self._session_factory = None
+        self._database_url: str | None = None
 
     @property
     def container(self) -> AccountsDIContainer:
@@ -20,6 +21,9 @@ class AccountsStartUp:
         database_url: str,
         enable_registration: bool,
         default_role: str,
+        password_hashing_workers: int | None = None,
+        session_sweep_interval_seconds: float = 300.0,
+        outbox_poll_interval_seconds: float = 1.0,
     ) -> "AccountsStartUp":
         if not database_url:
             raise ValueError("Accounts configuration requires a 'database_url'")
@@ -27,12 +31,18 @@ class AccountsStartUp:
         config = {
             "enable_registration": enable_registration,
             "default_role": default_role,
+            # ``None`` sizes the hashing pool to the number of cores.
+            "password_hashing_workers": password_hashing_workers or None,
+            "session_sweep_interval_seconds": session_sweep_interval_seconds,
+            "outbox_poll_interval_seconds": outbox_poll_interval_seconds,
         }
 
         try:
+            self._database_url = database_url
             self._session_factory = SQLAlchemySessionFactory.acquire(database_url)
             self._container = AccountsDIContainer(config=config, session_factory=self._session_factory)
             self._container.init_resources()
+            self._container.principal_cache().subscribe(self._container.event_bus())
             self._container.wire(
                 packages=[
                     "src.contexts.accounts.application",
@@ -43,9 +53,14 @@ class AccountsStartUp:
         except Exception as ex:
             raise RuntimeError("Accounts module bootstrap failed") from ex
 
+    def start_outbox_relay(self) -> None:
+        """Start relaying the outbox on the running event loop; call from the app lifespan."""
+        self.container.outbox_relay().start()
+
     def stop(self) -> None:
         try:
             if self._container:
+                self._container.outbox_relay().stop()
                 self._container.shutdown_resources()
                 self._container.unwire()
         finally:
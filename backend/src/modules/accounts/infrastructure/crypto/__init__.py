@@ -1,5 +1,6 @@
 """Cryptographic helpers for the accounts module."""
 
 from .password_hasher import PBKDF2PasswordHasher
+from .process_pool_hasher import PasswordHashingMetrics, ProcessPoolPasswordHasher
 
-__all__ = ["PBKDF2PasswordHasher"]
+__all__ = ["PBKDF2PasswordHasher", "PasswordHashingMetrics", "ProcessPoolPasswordHasher"]
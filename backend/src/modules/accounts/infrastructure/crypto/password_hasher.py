@@ -5,6 +5,8 @@ import os
 
 from ...application.interfaces import IPasswordHasher
 
+ALGORITHM = "pbkdf2_sha256"
+
 
 class PBKDF2PasswordHasher(IPasswordHasher):  # type: ignore[misc]
     """Simple PBKDF2 based password hasher.
@@ -22,12 +24,16 @@ class PBKDF2PasswordHasher(IPasswordHasher):  # type: ignore[misc]
         digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, self._iterations)
         encoded_salt = base64.urlsafe_b64encode(salt).decode("ascii")
         encoded_hash = base64.urlsafe_b64encode(digest).decode("ascii")
-        return f"pbkdf2_sha256${self._iterations}${encoded_salt}${encoded_hash}"
+        return f"{ALGORITHM}${self._iterations}${encoded_salt}${encoded_hash}"
+
+    @property
+    def iterations(self) -> int:
+        return self._iterations
 
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         try:
             algorithm, iterations_str, encoded_salt, encoded_hash = hashed_password.split("$")
-            if algorithm != "pbkdf2_sha256":
+            if algorithm != ALGORITHM:
                 return False
             iterations = int(iterations_str)
             salt = base64.urlsafe_b64decode(encoded_salt.encode("ascii"))
@@ -36,3 +42,8 @@ class PBKDF2PasswordHasher(IPasswordHasher):  # type: ignore[misc]
             return False
         digest = hashlib.pbkdf2_hmac("sha256", plain_password.encode("utf-8"), salt, iterations)
         return hmac.compare_digest(digest, expected_hash)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        algorithm, _, rest = hashed_password.partition("$")
+        iterations_str = rest.partition("$")[0]
+        return algorithm != ALGORITHM or iterations_str != str(self._iterations)
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, TypeVar
+
+from ...application.interfaces import IAsyncPasswordHasher
+from .password_hasher import PBKDF2PasswordHasher
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class PasswordHashingMetrics:
+    """Counters for the hashing service; queue time is the wait for a free worker slot."""
+
+    completed: int = 0
+    waiting: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    queue_time_total: float = 0.0
+    queue_time_max: float = 0.0
+
+    @property
+    def queue_time_mean(self) -> float:
+        started = self.completed + self.in_flight
+        return self.queue_time_total / started if started else 0.0
+
+
+class ProcessPoolPasswordHasher(IAsyncPasswordHasher):
+    """
+    Runs :class:`PBKDF2PasswordHasher` in a dedicated process pool.
+
+    ``hashlib.pbkdf2_hmac`` keeps the GIL for much of its work, so hashing on threads
+    competes with every other request served by the process. Worker processes scale with
+    cores instead, and the semaphore caps how many hashes run at once so a login burst
+    queues here (measured by :attr:`metrics`) rather than in the shared thread pool.
+    """
+
+    def __init__(
+        self,
+        hasher: PBKDF2PasswordHasher,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self._hasher = hasher
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor = executor or ProcessPoolExecutor(max_workers=self._max_workers)
+        # By default the cap equals the pool size, so the semaphore is the only queue.
+        self._slots = asyncio.Semaphore(max_concurrency or self._max_workers)
+        self.metrics = PasswordHashingMetrics()
+
+    async def encode(self, password: str) -> str:
+        return await self._run(self._hasher.encode, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(self._hasher.verify, plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._hasher.needs_rehash(hashed_password)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        metrics = self.metrics
+        queued_at = time.perf_counter()
+        metrics.waiting += 1
+        async with self._slots:
+            waited = time.perf_counter() - queued_at
+            metrics.waiting -= 1
+            metrics.in_flight += 1
+            metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+            metrics.queue_time_total += waited
+            metrics.queue_time_max = max(metrics.queue_time_max, waited)
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+            finally:
+                metrics.in_flight -= 1
+                metrics.completed += 1
+
+
+def init_password_hashing_service(
+    hasher: PBKDF2PasswordHasher, max_workers: Optional[int] = None
+) -> Iterator[ProcessPoolPasswordHasher]:
+    """Container resource: start the worker pool and shut it down with the module."""
+    service = ProcessPoolPasswordHasher(hasher, max_workers=max_workers)
+    try:
+        yield service
+    finally:
+        service.shutdown()
@@ -0,0 +1,5 @@
+"""Background maintenance jobs for the accounts module."""
+
+from .session_sweeper import SessionSweeper, SessionSweepMetrics
+
+__all__ = ["SessionSweeper", "SessionSweepMetrics"]
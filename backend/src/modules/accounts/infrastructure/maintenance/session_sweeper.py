@@ -0,0 +1,95 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+from ...domain.interfaces.session_repository import SessionRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SessionSweepMetrics:
+    table_size: int = 0
+    sweeps: int = 0
+    total_deleted: int = 0
+    last_deleted: int = 0
+    last_duration_seconds: float = 0.0
+
+
+class SessionSweeper:
+    """
+    Deletes expired sessions, and revoked ones once ``revoked_grace`` has passed.
+
+    Each pass removes at most ``batch_size * max_batches`` rows in short transactions,
+    so a large backlog is worked off over several intervals without long locks.
+    Revoked sessions are kept for a grace period so that replaying one of their
+    refresh tokens is still reported as reuse rather than as an unknown token.
+    """
+
+    def __init__(
+        self,
+        repository: SessionRepository,
+        interval_seconds: float = 300.0,
+        batch_size: int = 500,
+        max_batches: int = 20,
+        revoked_grace: timedelta = timedelta(days=1),
+    ) -> None:
+        self._repository = repository
+        self._interval = interval_seconds
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._revoked_grace = revoked_grace
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.metrics = SessionSweepMetrics()
+
+    def sweep_once(self) -> int:
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        deleted = 0
+        for _ in range(self._max_batches):
+            removed = self._repository.purge_inactive(now, now - self._revoked_grace, self._batch_size)
+            deleted += removed
+            if removed < self._batch_size or self._stop.is_set():
+                break
+
+        metrics = self.metrics
+        metrics.sweeps += 1
+        metrics.last_deleted = deleted
+        metrics.total_deleted += deleted
+        metrics.last_duration_seconds = time.perf_counter() - started
+        metrics.table_size = self._repository.count()
+        return deleted
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="session-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.sweep_once()
+            except Exception:  # keep sweeping on the next tick; a failed pass is not fatal
+                logger.exception("Session sweep failed")
+
+
+def init_session_sweeper(repository: SessionRepository, interval_seconds: float = 300.0) -> Iterator[SessionSweeper]:
+    """Container resource: run the sweeper for the lifetime of the module."""
+    sweeper = SessionSweeper(repository, interval_seconds=interval_seconds)
+    sweeper.start()
+    try:
+        yield sweeper
+    finally:
+        sweeper.stop()
@@ -1,12 +1,17 @@
 import asyncio
-from typing import Any, Callable, Mapping, MutableMapping, Type
+import inspect
+from typing import Any, Awaitable, Callable, Mapping, MutableMapping, Type
 
+from src.building_blocks.infrastructure.metrics.instruments import EXECUTOR_QUEUE_DEPTH, HandlerTimer
+from src.building_blocks.infrastructure.tracing import in_current_context, start_span
 from src.modules.chats.application.contracts.command import BaseCommand
 from src.modules.chats.application.contracts.mediator import IMediator
 from src.modules.chats.application.contracts.query import BaseQuery
 
 Handler = Callable[[Any], Any]
 
+MODULE = "accounts"
+
 
 class Mediator(IMediator):
     """Lightweight mediator that routes commands/queries to registered handlers."""
@@ -22,14 +27,29 @@ class Mediator(IMediator):
         handler = self._handlers.get(type(message))
         if not handler:
             raise ValueError(f"No handler registered for {type(message)!r}")
-        if hasattr(handler, "handle"):
-            return handler.handle(message)  # type: ignore[no-any-return]
-        return handler(message)
+        with start_span(f"handler {_handler_name(handler)}"), HandlerTimer(MODULE, message, BaseCommand, BaseQuery):
+            if hasattr(handler, "handle"):
+                return handler.handle(message)  # type: ignore[no-any-return]
+            return handler(message)
+
+    def _dispatch_queued(self, message: Any) -> Any:
+        EXECUTOR_QUEUE_DEPTH.labels(MODULE).dec()
+        return self._dispatch(message)
 
     async def send(self, message: Any) -> Any:
         """Async-friendly entry point used by the ChatsModule."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._dispatch, message)
+        handler = self._handlers.get(type(message))
+        with start_span(f"mediator.send {type(message).__name__}"):
+            fn = _async_callable(handler) if handler is not None else None
+            if fn is not None:
+                # Async handlers offload their own blocking work; awaiting them keeps the executor free.
+                timer = HandlerTimer(MODULE, message, BaseCommand, BaseQuery)
+                with start_span(f"handler {_handler_name(handler)}"), timer:
+                    return await fn(message)
+            loop = asyncio.get_running_loop()
+            # run_in_executor does not carry contextvars; bind them so handler spans join the trace.
+            EXECUTOR_QUEUE_DEPTH.labels(MODULE).inc()
+            return await loop.run_in_executor(None, in_current_context(self._dispatch_queued), message)
 
     # IMediator compatibility -------------------------------------------------
     def execute_command(self, command: BaseCommand):
@@ -37,3 +57,17 @@ class Mediator(IMediator):
 
     def execute_query(self, query: BaseQuery):
         return self._dispatch(query)
+
+
+def _handler_name(handler: Handler) -> str:
+    return type(handler).__name__ if hasattr(handler, "handle") else getattr(handler, "__qualname__", repr(handler))
+
+
+def _async_callable(handler: Handler) -> Callable[[Any], Awaitable[Any]] | None:
+    """The coroutine function ``handler`` dispatches to (``handle`` or ``__call__``), if it has one."""
+    fn = getattr(handler, "handle", None) or handler
+    if inspect.iscoroutinefunction(fn):
+        return fn
+    # Handler instances with ``async def __call__`` are not coroutine functions themselves.
+    call = getattr(fn, "__call__", None)
+    return call if inspect.iscoroutinefunction(call) else None
@@ -1,11 +1,13 @@
+from datetime import datetime
 from typing import Dict, Iterable, Optional
 
-from src.modules.accounts.domain.interfaces import AccountRepository, SessionRepository
+from src.modules.accounts.domain.interfaces import AccountPage, AccountRepository, SessionRepository
 
 from ....accounts.domain.account.account import Account
 from ....accounts.domain.account.value_objects.account_id import AccountId
 from ....accounts.domain.role.value_objects.role_id import RoleId
 from ....accounts.domain.session.session import Session
+from ....accounts.domain.session.value_objects.refresh_token_digest import RefreshTokenDigest
 from ....accounts.domain.session.value_objects.session_id import SessionId
 
 
@@ -36,8 +38,18 @@ class InMemoryAccountRepository(AccountRepository):
     def exists_by_email(self, email: str) -> bool:
         return email in self._by_email
 
-    def list_accounts(self) -> Iterable[Account]:
-        return list(self._by_id.values())
+    def list_accounts(self, limit: int = 50, cursor: Optional[str] = None) -> AccountPage:
+        # The cursor is the id of the last account of the previous page.
+        ordered = sorted(self._by_id.values(), key=lambda account: (account.created_at, str(account.id.value)))
+        start = 0
+        if cursor is not None:
+            keys = [str(account.id.value) for account in ordered]
+            if cursor not in keys:
+                raise ValueError("Invalid cursor")
+            start = keys.index(cursor) + 1
+        items = tuple(ordered[start : start + limit])
+        has_more = start + limit < len(ordered)
+        return AccountPage(items=items, next_cursor=str(items[-1].id.value) if has_more else None)
 
     def remove(self, account_id: AccountId) -> None:
         key = str(account_id.value)
@@ -56,11 +68,14 @@ class InMemorySessionRepository(SessionRepository):
     def __init__(self) -> None:
         self._sessions: Dict[str, Session] = {}
         self._by_account: Dict[str, set[str]] = {}
+        self._by_digest: Dict[str, str] = {}
+        self._retired: Dict[str, str] = {}
 
     def add(self, session: Session) -> None:
         key = str(session.id.value)
         self._sessions[key] = session
         self._by_account.setdefault(str(session.account_id.value), set()).add(key)
+        self._by_digest[session.refresh_token_digest.value] = key
 
     def update(self, session: Session) -> None:
         self._sessions[str(session.id.value)] = session
@@ -76,3 +91,37 @@ class InMemorySessionRepository(SessionRepository):
         for session in self.list_for_account(account_id):
             session.revoke()
             self.update(session)
+
+    def get_by_refresh_token(self, digest: RefreshTokenDigest) -> Optional[Session]:
+        key = self._by_digest.get(digest.value)
+        return self._sessions.get(key) if key else None
+
+    def get_by_retired_refresh_token(self, digest: RefreshTokenDigest) -> Optional[Session]:
+        key = self._retired.get(digest.value)
+        return self._sessions.get(key) if key else None
+
+    def rotate_refresh_token(self, session: Session, previous: RefreshTokenDigest) -> bool:
+        key = str(session.id.value)
+        if self._by_digest.get(previous.value) != key:
+            return False
+        del self._by_digest[previous.value]
+        self._retired[previous.value] = key
+        self._by_digest[session.refresh_token_digest.value] = key
+        self._sessions[key] = session
+        return True
+
+    def purge_inactive(self, now: datetime, revoked_before: datetime, limit: int) -> int:
+        doomed = [
+            key
+            for key, session in self._sessions.items()
+            if session.is_expired(now) or (not session.is_active and session.updated_at < revoked_before)
+        ][:limit]
+        for key in doomed:
+            session = self._sessions.pop(key)
+            self._by_account.get(str(session.account_id.value), set()).discard(key)
+            self._by_digest = {digest: owner for digest, owner in self._by_digest.items() if owner != key}
+            self._retired = {digest: owner for digest, owner in self._retired.items() if owner != key}
+        return len(doomed)
+
+    def count(self) -> int:
+        return len(self._sessions)
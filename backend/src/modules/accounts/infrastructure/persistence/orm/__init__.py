@@ -1,11 +1,12 @@
 """ORM models for the accounts persistence adapters."""
 
-from .models import AccountModel, CredentialModel, RoleModel, SessionModel, account_roles
+from .models import AccountModel, CredentialModel, RetiredRefreshTokenModel, RoleModel, SessionModel, account_roles
 
 __all__ = [
     "AccountModel",
     "CredentialModel",
     "SessionModel",
+    "RetiredRefreshTokenModel",
     "RoleModel",
     "account_roles",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Table, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Table, Text, text
 from sqlalchemy.orm import relationship
 
 from ......database.models import BaseSQLModel
@@ -39,6 +39,8 @@ class User(BaseSQLModel):
 
 class AccountModel(BaseSQLModel):  # type: ignore[misc]
     __tablename__ = "accounts"
+    # Keyset pagination order for account listings.
+    __table_args__ = (Index("ix_accounts_created_at_id", "created_at", "id"),)
 
     uuid = Column(String(36), unique=True, nullable=False, index=True)
     email = Column(String(320), unique=True, nullable=False, index=True)
@@ -66,16 +68,43 @@ class CredentialModel(BaseSQLModel):  # type: ignore[misc]
 
 class SessionModel(BaseSQLModel):  # type: ignore[misc]
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Partial index: only live sessions are looked up per account (revocation, listing active sessions).
+        Index(
+            "ix_sessions_account_id_active",
+            "account_id",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active"),
+        ),
+        # The sweeper deletes by expiry, and revoked sessions by age once their grace period is over.
+        Index("ix_sessions_expires_at", "expires_at"),
+        Index(
+            "ix_sessions_revoked_updated_at",
+            "updated_at",
+            sqlite_where=text("is_active = 0"),
+            postgresql_where=text("NOT is_active"),
+        ),
+    )
 
     session_uuid = Column(String(36), unique=True, nullable=False, index=True)
     account_id = Column(ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False, index=True)
-    refresh_token = Column(String(512), nullable=False)
+    # SHA-256 hex digest of the current refresh token; the raw token is never stored.
+    refresh_token_hash = Column(String(64), unique=True, nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
 
     account = relationship("AccountModel", back_populates="sessions")
 
 
+class RetiredRefreshTokenModel(BaseSQLModel):  # type: ignore[misc]
+    """Digests of refresh tokens that were rotated away; presenting one again means it leaked."""
+
+    __tablename__ = "retired_refresh_tokens"
+
+    token_hash = Column(String(64), unique=True, nullable=False)
+    session_id = Column(ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+
+
 class RoleModel(BaseSQLModel):  # type: ignore[misc]
     __tablename__ = "roles"
 
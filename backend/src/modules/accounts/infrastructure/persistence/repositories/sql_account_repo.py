@@ -1,40 +1,68 @@
+import base64
+import binascii
 import uuid
+from datetime import datetime
 from typing import Callable, Iterable, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from src.building_blocks.domain.events import DomainEvent
+from src.building_blocks.infrastructure.sql_outbox import SQLOutbox
+from src.building_blocks.infrastructure.tracing import traced_methods
 
 from .....accounts.domain.account.account import Account
+from .....accounts.domain.account.events.account_removed_event import AccountRemovedEvent
 from .....accounts.domain.account.value_objects.account_id import AccountId
 from .....accounts.domain.account.value_objects.account_status import AccountStatus
 from .....accounts.domain.account.value_objects.email import Email
 from .....accounts.domain.account.value_objects.hashed_password import HashedPassword
-from .....accounts.domain.interfaces.account_repository import AccountRepository
+from .....accounts.domain.interfaces.account_repository import AccountPage, AccountRepository
 from .....accounts.domain.role.value_objects.role_id import RoleId
 from ..orm.models import AccountModel, CredentialModel, RoleModel
 
 
+# Everything ``_to_domain`` touches, loaded up front: one JOIN for the 1:1 credential and
+# one extra IN query for all roles of the batch, instead of two lazy loads per account.
+_AGGREGATE_LOAD_OPTIONS = (joinedload(AccountModel.credential), selectinload(AccountModel.roles))
+
+
+def _encode_cursor(record: AccountModel) -> str:
+    raw = f"{record.created_at.isoformat()}|{record.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as ex:
+        raise ValueError("Invalid cursor") from ex
+
+
+@traced_methods("repository")
 class SQLAccountRepository(AccountRepository):
     """SQLAlchemy implementation of :class:`AccountRepository`."""
 
-    def __init__(self, session_factory: Callable[[], Session]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        outbox: SQLOutbox | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._outbox = outbox
 
     def _to_domain(self, record: AccountModel) -> Account:
-        email = Email.create(record.email)
-        account_id = AccountId(uuid.UUID(record.uuid))
-        hashed = HashedPassword.create(record.credential.hashed_password)
-        status = AccountStatus.create(is_verified=record.is_verified, is_active=record.is_active)
-        role_ids = {RoleId(uuid.UUID(role.uuid)) for role in record.roles}
-        account = Account(
-            _id=account_id,
-            _email=email,
-            _password=hashed,
-            _status=status,
-            _role_ids=role_ids,
+        # Persisted values were validated on the way in, so value objects are built directly.
+        return Account.rehydrate(
+            account_id=AccountId(uuid.UUID(record.uuid)),
+            email=Email(value=record.email),
+            hashed_password=HashedPassword(value=record.credential.hashed_password),
+            status=AccountStatus(is_verified=record.is_verified, is_active=record.is_active),
+            role_ids=(RoleId(uuid.UUID(role.uuid)) for role in record.roles),
+            created_at=record.created_at,
+            updated_at=record.updated_at,
         )
-        account._created_at = record.created_at  # type: ignore[attr-defined]
-        account._updated_at = record.updated_at  # type: ignore[attr-defined]
-        return account
 
     def _apply_domain(self, account: Account, record: AccountModel) -> None:
         record.email = str(account.email)
@@ -56,7 +84,9 @@ class SQLAccountRepository(AccountRepository):
             )
             record.credential = CredentialModel(hashed_password=account.hashed_password.value)
             session.add(record)
+            events = self._stage_events(session, account.pull_events())
             session.commit()
+        self._notify_committed(events)
 
     def update(self, account: Account) -> None:
         with self._session_factory() as session:  # type: Session
@@ -64,33 +94,65 @@ class SQLAccountRepository(AccountRepository):
             if not db_account:
                 raise ValueError("Account not found")
             self._apply_domain(account, db_account)
+            events = self._stage_events(session, account.pull_events())
             session.commit()
+        self._notify_committed(events)
 
     def get_by_id(self, account_id: AccountId) -> Optional[Account]:
         with self._session_factory() as session:  # type: Session
-            record = session.query(AccountModel).filter(AccountModel.uuid == str(account_id.value)).one_or_none()
+            record = (
+                session.query(AccountModel)
+                .options(*_AGGREGATE_LOAD_OPTIONS)
+                .filter(AccountModel.uuid == str(account_id.value))
+                .one_or_none()
+            )
             return self._to_domain(record) if record else None
 
     def get_by_email(self, email: str) -> Optional[Account]:
         with self._session_factory() as session:  # type: Session
-            record = session.query(AccountModel).filter(AccountModel.email == email).one_or_none()
+            record = (
+                session.query(AccountModel)
+                .options(*_AGGREGATE_LOAD_OPTIONS)
+                .filter(AccountModel.email == email)
+                .one_or_none()
+            )
             return self._to_domain(record) if record else None
 
     def exists_by_email(self, email: str) -> bool:
         with self._session_factory() as session:  # type: Session
             return session.query(AccountModel.uuid).filter(AccountModel.email == email).first() is not None
 
-    def list_accounts(self) -> Iterable[Account]:
+    def list_accounts(self, limit: int = 50, cursor: Optional[str] = None) -> AccountPage:
+        # Keyset pagination on (created_at, id): every page is an index range read, however deep.
+        stmt = select(AccountModel).options(*_AGGREGATE_LOAD_OPTIONS)
+        if cursor is not None:
+            created_at, record_id = _decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    AccountModel.created_at > created_at,
+                    and_(AccountModel.created_at == created_at, AccountModel.id > record_id),
+                )
+            )
+        # One extra row tells whether a next page exists without a COUNT.
+        stmt = stmt.order_by(AccountModel.created_at.asc(), AccountModel.id.asc()).limit(limit + 1)
+
         with self._session_factory() as session:  # type: Session
-            records = session.query(AccountModel).order_by(AccountModel.created_at.asc()).all()
-            return [self._to_domain(record) for record in records]
+            records = session.execute(stmt).unique().scalars().all()
+            page, has_more = records[:limit], len(records) > limit
+            return AccountPage(
+                items=tuple(self._to_domain(record) for record in page),
+                next_cursor=_encode_cursor(page[-1]) if has_more else None,
+            )
 
     def remove(self, account_id: AccountId) -> None:
         with self._session_factory() as session:  # type: Session
             record = session.query(AccountModel).filter(AccountModel.uuid == str(account_id.value)).one_or_none()
-            if record:
-                session.delete(record)
-                session.commit()
+            if not record:
+                return
+            session.delete(record)
+            events = self._stage_events(session, [AccountRemovedEvent(account_id=str(account_id.value))])
+            session.commit()
+        self._notify_committed(events)
 
     def assign_role(self, account_id: AccountId, role_id: RoleId) -> None:
         with self._session_factory() as session:  # type: Session
@@ -101,3 +163,15 @@ class SQLAccountRepository(AccountRepository):
             if role not in account.roles:
                 account.roles.append(role)
             session.commit()
+
+    def _stage_events(self, session: Session, events: Iterable[DomainEvent]) -> list[DomainEvent]:
+        # Events commit atomically with the aggregate; the outbox relay is their only delivery path.
+        events = list(events)
+        if self._outbox is not None:
+            self._outbox.stage(session, events)
+        return events
+
+    def _notify_committed(self, events: list[DomainEvent]) -> None:
+        # Called after commit: wake the relay so subscribers (e.g. the principal cache) hear promptly.
+        if self._outbox is not None and events:
+            self._outbox.notify_committed()
@@ -3,6 +3,8 @@ from typing import Callable, Iterable, Optional
 
 from sqlalchemy.orm import Session
 
+from src.building_blocks.infrastructure.tracing import traced_methods
+
 from .....accounts.domain.interfaces.role_repository import RoleRepository
 from .....accounts.domain.role.role import Role
 from .....accounts.domain.role.value_objects.role_id import RoleId
@@ -10,6 +12,7 @@ from .....accounts.domain.role.value_objects.role_name import RoleName
 from ..orm.models import RoleModel
 
 
+@traced_methods("repository")
 class SQLRoleRepository(RoleRepository):
     """SQLAlchemy repository for role aggregates."""
 
@@ -1,39 +1,52 @@
 import uuid
+from datetime import datetime, timezone
 from typing import Callable, Iterable, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, false, func, insert, or_, select, true, update
+from sqlalchemy.orm import Session, contains_eager
+
+from src.building_blocks.domain.events import DomainEvent
+from src.building_blocks.infrastructure.sql_outbox import SQLOutbox
+from src.building_blocks.infrastructure.tracing import traced_methods
 
 from .....accounts.domain.account.value_objects.account_id import AccountId
 from .....accounts.domain.interfaces.session_repository import SessionRepository
+from .....accounts.domain.session.events.all_sessions_revoked_event import AllSessionsRevokedEvent
 from .....accounts.domain.session.session import Session as DomainSession
-from .....accounts.domain.session.value_objects.refresh_token import RefreshToken
+from .....accounts.domain.session.value_objects.refresh_token_digest import RefreshTokenDigest
 from .....accounts.domain.session.value_objects.session_id import SessionId
 from .....accounts.domain.session.value_objects.session_status import SessionStatus
-from ..orm.models import AccountModel, SessionModel
+from ..orm.models import AccountModel, RetiredRefreshTokenModel, SessionModel
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for ``DateTime(timezone=True)`` columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
 
 
+@traced_methods("repository")
 class SQLSessionRepository(SessionRepository):
     """SQLAlchemy repository for session aggregates."""
 
-    def __init__(self, session_factory: Callable[[], Session]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        outbox: SQLOutbox | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._outbox = outbox
 
     def _to_domain(self, record: SessionModel) -> DomainSession:
-        account_uuid = record.account.uuid  # type: ignore[union-attr]
-        account_id = AccountId(uuid.UUID(account_uuid))
-        session_id = SessionId(uuid.UUID(record.session_uuid))
-        refresh = RefreshToken.create(record.refresh_token)
-        status = SessionStatus(is_active=record.is_active)
-        session = DomainSession(
-            _id=session_id,
-            _account_id=account_id,
-            _refresh_token=refresh,
-            _expires_at=record.expires_at,
-            _status=status,
+        # Persisted values were validated on the way in, so value objects are built directly.
+        return DomainSession.rehydrate(
+            session_id=SessionId(uuid.UUID(record.session_uuid)),
+            account_id=AccountId(uuid.UUID(record.account.uuid)),  # type: ignore[union-attr]
+            refresh_token_digest=RefreshTokenDigest(value=record.refresh_token_hash),
+            expires_at=_as_utc(record.expires_at),
+            status=SessionStatus(is_active=record.is_active),
+            created_at=record.created_at,
+            updated_at=record.updated_at,
         )
-        session._created_at = record.created_at  # type: ignore[attr-defined]
-        session._updated_at = record.updated_at  # type: ignore[attr-defined]
-        return session
 
     def add(self, session_domain: DomainSession) -> None:
         with self._session_factory() as session:  # type: Session
@@ -43,12 +56,14 @@ class SQLSessionRepository(SessionRepository):
             record = SessionModel(
                 session_uuid=str(session_domain.id.value),
                 account_id=account_record.id,
-                refresh_token=session_domain.refresh_token.value,
+                refresh_token_hash=session_domain.refresh_token_digest.value,
                 expires_at=session_domain.expires_at,
                 is_active=session_domain.is_active,
             )
             session.add(record)
+            events = self._stage_events(session, session_domain.pull_events())
             session.commit()
+        self._notify_committed(events)
 
     def update(self, session_domain: DomainSession) -> None:
         with self._session_factory() as session:  # type: Session
@@ -59,39 +74,139 @@ class SQLSessionRepository(SessionRepository):
             )
             if not record:
                 raise ValueError("Session not found")
-            record.refresh_token = session_domain.refresh_token.value
+            record.refresh_token_hash = session_domain.refresh_token_digest.value
             record.expires_at = session_domain.expires_at
             record.is_active = session_domain.is_active
+            events = self._stage_events(session, session_domain.pull_events())
             session.commit()
+        self._notify_committed(events)
 
     def get_by_id(self, session_id: SessionId) -> Optional[DomainSession]:
         with self._session_factory() as session:  # type: Session
             record = (
                 session.query(SessionModel)
                 .join(SessionModel.account)
+                .options(contains_eager(SessionModel.account))
                 .filter(SessionModel.session_uuid == str(session_id.value))
                 .one_or_none()
             )
             return self._to_domain(record) if record else None
 
+    def get_by_refresh_token(self, digest: RefreshTokenDigest) -> Optional[DomainSession]:
+        # Unique index on the digest: a single index probe, whatever the table size.
+        with self._session_factory() as session:  # type: Session
+            record = (
+                session.query(SessionModel)
+                .join(SessionModel.account)
+                .options(contains_eager(SessionModel.account))
+                .filter(SessionModel.refresh_token_hash == digest.value)
+                .one_or_none()
+            )
+            return self._to_domain(record) if record else None
+
+    def get_by_retired_refresh_token(self, digest: RefreshTokenDigest) -> Optional[DomainSession]:
+        with self._session_factory() as session:  # type: Session
+            record = (
+                session.query(SessionModel)
+                .join(RetiredRefreshTokenModel, RetiredRefreshTokenModel.session_id == SessionModel.id)
+                .join(SessionModel.account)
+                .options(contains_eager(SessionModel.account))
+                .filter(RetiredRefreshTokenModel.token_hash == digest.value)
+                .one_or_none()
+            )
+            return self._to_domain(record) if record else None
+
     def list_for_account(self, account_id: AccountId) -> Iterable[DomainSession]:
         with self._session_factory() as session:  # type: Session
             records = (
                 session.query(SessionModel)
                 .join(SessionModel.account)
+                .options(contains_eager(SessionModel.account))
                 .filter(AccountModel.uuid == str(account_id.value))
                 .all()
             )
             return [self._to_domain(record) for record in records]
 
     def revoke_all_for_account(self, account_id: AccountId) -> None:
+        # A single UPDATE; no session rows are loaded into Python.
+        owner_id = select(AccountModel.id).where(AccountModel.uuid == str(account_id.value)).scalar_subquery()
+        stmt = (
+            update(SessionModel)
+            .where(SessionModel.account_id == owner_id, SessionModel.is_active == true())
+            .values(is_active=False, updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
         with self._session_factory() as session:  # type: Session
-            records = (
-                session.query(SessionModel)
-                .join(SessionModel.account)
-                .filter(AccountModel.uuid == str(account_id.value), SessionModel.is_active.is_(True))
-                .all()
+            session.execute(stmt)
+            events = self._stage_events(session, [AllSessionsRevokedEvent(account_id=str(account_id.value))])
+            session.commit()
+        self._notify_committed(events)
+
+    def rotate_refresh_token(self, session_domain: DomainSession, previous: RefreshTokenDigest) -> bool:
+        now = datetime.now(timezone.utc)
+        session_uuid = str(session_domain.id.value)
+        # Compare-and-swap on the old digest, so two requests racing with the same token
+        # cannot both rotate it; the loser sees zero rows and is treated as a reuse.
+        swap = (
+            update(SessionModel)
+            .where(SessionModel.session_uuid == session_uuid, SessionModel.refresh_token_hash == previous.value)
+            .values(
+                refresh_token_hash=session_domain.refresh_token_digest.value,
+                expires_at=session_domain.expires_at,
+                is_active=session_domain.is_active,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        retire = insert(RetiredRefreshTokenModel).values(
+            token_hash=previous.value,
+            session_id=select(SessionModel.id).where(SessionModel.session_uuid == session_uuid).scalar_subquery(),
+            created_at=now,
+            updated_at=now,
+        )
+        with self._session_factory() as session:  # type: Session
+            if session.execute(swap).rowcount != 1:
+                session.rollback()
+                return False
+            session.execute(retire)
+            events = self._stage_events(session, session_domain.pull_events())
+            session.commit()
+        self._notify_committed(events)
+        return True
+
+    def purge_inactive(self, now: datetime, revoked_before: datetime, limit: int) -> int:
+        batch = (
+            select(SessionModel.id)
+            .where(
+                or_(
+                    SessionModel.expires_at <= now,
+                    and_(SessionModel.is_active == false(), SessionModel.updated_at < revoked_before),
+                )
             )
-            for record in records:
-                record.is_active = False
+            .limit(limit)
+        )
+        with self._session_factory() as session:  # type: Session
+            ids = session.execute(batch).scalars().all()
+            if not ids:
+                return 0
+            # Explicit child delete: SQLite only cascades with ``PRAGMA foreign_keys`` enabled.
+            session.execute(delete(RetiredRefreshTokenModel).where(RetiredRefreshTokenModel.session_id.in_(ids)))
+            session.execute(delete(SessionModel).where(SessionModel.id.in_(ids)))
             session.commit()
+        return len(ids)
+
+    def count(self) -> int:
+        with self._session_factory() as session:  # type: Session
+            return session.execute(select(func.count()).select_from(SessionModel)).scalar_one()
+
+    def _stage_events(self, session: Session, events: Iterable[DomainEvent]) -> list[DomainEvent]:
+        # Events commit atomically with the aggregate; the outbox relay is their only delivery path.
+        events = list(events)
+        if self._outbox is not None:
+            self._outbox.stage(session, events)
+        return events
+
+    def _notify_committed(self, events: list[DomainEvent]) -> None:
+        # Called after commit: wake the relay so subscribers (e.g. the principal cache) hear promptly.
+        if self._outbox is not None and events:
+            self._outbox.notify_committed()
@@ -1,6 +1,7 @@
 from .conversation_lifecycle.archive_conversation.handler import ArchiveConversationHandler  # noqa: F401
 from .conversation_lifecycle.rename_conversation.handler import RenameConversationHandler  # noqa: F401
 from .conversation_lifecycle.start_conversation.handler import StartConversationHandler  # noqa: F401
+from .maintenance.rebuild_conversation_summaries.handler import RebuildConversationSummariesHandler  # noqa: F401
 from .membership.add_member.handler import AddMemberHandler  # noqa: F401
 from .membership.change_member_role.handler import ChangeMemberRoleHandler  # noqa: F401
 from .membership.remove_member.handler import RemoveMemberHandler  # noqa: F401
@@ -15,6 +16,7 @@ __all__ = [
     "ArchiveConversationHandler",
     "RenameConversationHandler",
     "StartConversationHandler",
+    "RebuildConversationSummariesHandler",
     "AddMemberHandler",
     "ChangeMemberRoleHandler",
     "RemoveMemberHandler",
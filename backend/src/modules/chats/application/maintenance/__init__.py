@@ -0,0 +1 @@
+"""Maintenance commands for derived read models."""
@@ -0,0 +1 @@
+"""Rebuild the denormalized conversation summaries."""
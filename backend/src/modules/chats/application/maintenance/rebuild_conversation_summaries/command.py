@@ -0,0 +1,8 @@
+import uuid
+
+from src.modules.chats.application.contracts.command import BaseCommand
+
+
+class RebuildConversationSummariesCommand(BaseCommand):
+    # ``None`` rebuilds every summary; otherwise only the listed conversations.
+    conversation_ids: list[uuid.UUID] | None = None
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from src.modules.chats.application.configuration.command_handler import BaseCommandHandler
+from src.modules.chats.application.contracts.command import BaseCommand
+from src.modules.chats.application.queries.read_model import AbstractConversationSummaryProjection
+
+from .command import RebuildConversationSummariesCommand
+
+
+class RebuildConversationSummariesHandler(BaseCommandHandler):
+    def __init__(self, projection: AbstractConversationSummaryProjection) -> None:
+        self._projection = projection
+
+    def handle(self, command: BaseCommand) -> int:
+        assert isinstance(command, RebuildConversationSummariesCommand)
+
+        conversation_ids = command.conversation_ids
+        if conversation_ids is not None:
+            conversation_ids = [str(conversation_id) for conversation_id in conversation_ids]
+        return self._projection.rebuild(conversation_ids)
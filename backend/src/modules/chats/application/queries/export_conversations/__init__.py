@@ -0,0 +1 @@
+"""Export a user's conversations as a byte stream (NDJSON, Markdown or ZIP)."""
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+
+from .dto import Transcript
+
+
+class AbstractConversationDownloader(ABC):
+    """Encodes transcripts into a download incrementally, one bounded chunk at a time."""
+
+    media_type: str
+    extension: str
+
+    @abstractmethod
+    def download(self, transcripts: Iterable[Transcript]) -> Iterator[bytes]:
+        """Yield the encoded export; memory use must not grow with the number of messages."""
+        raise NotImplementedError("Subclasses must implement this method.")
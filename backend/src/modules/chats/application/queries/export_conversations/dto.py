@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generator, Iterator
+
+
+@dataclass(slots=True, frozen=True)
+class ExportedConversationDTO:
+    id: str
+    title: str
+    created_at: datetime | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ExportedMessageDTO:
+    id: str
+    sender_id: str | None
+    content: str
+    created_at: datetime | None = None
+    feedback: str | None = None
+
+
+# A conversation and its messages in chronological order, read lazily: consume the
+# messages before advancing to the next transcript.
+Transcript = tuple[ExportedConversationDTO, Iterator[ExportedMessageDTO]]
+
+
+@dataclass(slots=True, frozen=True)
+class ConversationExportDTO:
+    """
+    A lazily encoded export: nothing is read from the database until ``chunks`` is iterated.
+
+    Close ``chunks`` when abandoning it part-way, so the database session is released.
+    """
+
+    filename: str
+    media_type: str
+    chunks: Generator[bytes, None, None]
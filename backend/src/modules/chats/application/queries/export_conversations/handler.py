@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Generator, Iterator, Mapping
+
+from src.modules.chats.application.configuration.query_handler import BaseQueryHandler
+from src.modules.chats.application.contracts.query import BaseQuery
+from src.modules.chats.application.queries.read_model import AbstractConversationReadModel
+
+from .downloader import AbstractConversationDownloader
+from .dto import ConversationExportDTO, Transcript
+from .query import ExportConversationsQuery, ExportFormat
+
+
+class ExportConversationsHandler(BaseQueryHandler):
+    def __init__(
+        self,
+        read_model: AbstractConversationReadModel,
+        downloaders: Mapping[ExportFormat, AbstractConversationDownloader],
+    ) -> None:
+        self._read_model = read_model
+        self._downloaders = downloaders
+
+    def handle(self, query: BaseQuery) -> ConversationExportDTO | None:
+        """The export of the requested conversations, or ``None`` if the conversation is not the user's."""
+        assert isinstance(query, ExportConversationsQuery)
+
+        if query.conversation_id is not None:
+            # Checked up front: once the response has started streaming it can no longer become a 404.
+            details = self._read_model.get_details(query.conversation_id)
+            if details is None or details.creator_id != str(query.user_id):
+                return None
+            stem = f"conversation-{query.conversation_id}"
+        else:
+            stem = f"conversations-{query.user_id}"
+
+        downloader = self._downloaders[query.format]
+        transcripts = self._read_model.iter_transcripts(query.user_id, conversation_id=query.conversation_id)
+        return ConversationExportDTO(
+            filename=f"{stem}.{downloader.extension}",
+            media_type=downloader.media_type,
+            chunks=_closing(downloader.download(transcripts), transcripts),
+        )
+
+
+def _closing(chunks: Iterator[bytes], transcripts: Generator[Transcript, None, None]) -> Generator[bytes, None, None]:
+    """``chunks``, closing the transcript stream however the download ends, finished or abandoned."""
+    try:
+        yield from chunks
+    finally:
+        transcripts.close()
@@ -0,0 +1,17 @@
+import uuid
+from enum import Enum
+
+from src.modules.chats.application.contracts.query import BaseQuery
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    MARKDOWN = "md"
+    ZIP = "zip"
+
+
+class ExportConversationsQuery(BaseQuery):
+    user_id: uuid.UUID
+    # One conversation, or every conversation the user created when omitted.
+    conversation_id: uuid.UUID | None = None
+    format: ExportFormat = ExportFormat.NDJSON
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Tuple
 
 
@@ -9,3 +10,5 @@ class ConversationDetailsDTO:
     is_archived: bool
     creator_id: str | None = None
     participants: Tuple[dict, ...] = ()
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
@@ -1,4 +1,7 @@
+"""List conversations belonging to a user."""
+
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass(slots=True, frozen=True)
@@ -6,3 +9,15 @@ class ConversationSummaryDTO:
     id: str
     title: str
     is_archived: bool
+    updated_at: datetime | None = None
+    message_count: int = 0
+    last_message_preview: str | None = None
+    last_activity_at: datetime | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ConversationSummaryPageDTO:
+    items: tuple[ConversationSummaryDTO, ...]
+    total: int
+    limit: int
+    offset: int
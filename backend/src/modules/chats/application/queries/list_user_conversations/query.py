@@ -1,7 +1,22 @@
 import uuid
+from enum import Enum
+
+from pydantic import Field
 
 from src.modules.chats.application.contracts.query import BaseQuery
 
 
+class ConversationSortField(str, Enum):
+    TITLE = "title"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    LAST_ACTIVITY_AT = "last_activity_at"
+
+
 class ListUserConversationsQuery(BaseQuery):
     user_id: uuid.UUID
+    limit: int = Field(default=20, ge=1, le=100)
+    offset: int = Field(default=0, ge=0)
+    sort_by: ConversationSortField = ConversationSortField.LAST_ACTIVITY_AT
+    descending: bool = True
+    include_archived: bool = True
@@ -0,0 +1,54 @@
+"""Read-side port for conversation queries.
+
+Implementations project persisted state straight into query DTOs, bypassing
+the ``Conversation`` aggregate entirely.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Generator, Iterable
+from uuid import UUID
+
+from .export_conversations.dto import Transcript
+from .get_conversation_details.dto import ConversationDetailsDTO
+from .list_user_conversations.dto import ConversationSummaryPageDTO
+from .list_user_conversations.query import ConversationSortField
+
+
+class AbstractConversationReadModel(ABC):
+    @abstractmethod
+    def list_summaries(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        offset: int,
+        sort_by: ConversationSortField,
+        descending: bool,
+        include_archived: bool,
+    ) -> ConversationSummaryPageDTO:
+        """Return one page of the user's conversations together with the total count."""
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def get_details(self, conversation_id: UUID) -> ConversationDetailsDTO | None:
+        """Return the details of a single conversation, or ``None`` if it does not exist."""
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def iter_transcripts(
+        self, user_id: UUID, *, conversation_id: UUID | None = None, batch_size: int = 500
+    ) -> Generator[Transcript, None, None]:
+        """
+        Stream the user's conversations (or just ``conversation_id``) with their messages,
+        fetching ``batch_size`` rows at a time rather than materializing the result.
+
+        Close the generator when stopping early; that releases its database resources.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+
+class AbstractConversationSummaryProjection(ABC):
+    @abstractmethod
+    def rebuild(self, conversation_ids: Iterable[str] | None = None) -> int:
+        """Recompute denormalized conversation summaries and return the number of rows written."""
+        raise NotImplementedError("Subclasses must implement this method.")
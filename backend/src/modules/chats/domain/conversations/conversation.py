@@ -1,8 +1,11 @@
 import uuid
 from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable
 
 from src.building_blocks.domain.aggregate_root import AggregateRoot
 from src.building_blocks.domain.exceptions import BusinessRuleValidationException
+from src.building_blocks.domain.rule_set import RuleSet
 
 from ..members.value_objects.member_id import MemberId
 from ..messages.value_objects.message_id import MessageId
@@ -11,6 +14,7 @@ from .entities.participant import Participant
 from .enums.participant_role import ParticipantRole
 from .events import (
     ConversationArchivedEvent,
+    ConversationCreatedEvent,
     ConversationDeletedEvent,
     ConversationRenamedEvent,
     ConversationSharedEvent,
@@ -25,6 +29,7 @@ from .rules import (
     ConversationCannotBeRenamedIfArchivedRule,
     ConversationCannotBeSharedIfArchivedRule,
     CreatorCannotBeRemovedRule,
+    CreatorNameCannotBeEmptyRule,
     MessageCannotBeAddedIfArchivedRule,
     ParticipantCannotBeAddedIfAlreadyExistsRule,
     ParticipantCannotBeRemovedIfNotExistsRule,
@@ -33,7 +38,42 @@ from .rules import (
 from .value_objects.conversation_id import ConversationId
 
 
-@dataclass
+def _archived(conversation: "Conversation", *_) -> tuple:
+    return (conversation._is_archived,)
+
+
+# One precompiled rule set per operation; each entry maps the operation's arguments to the
+# rule's constructor values, and the rule class itself decides whether it is broken.
+_CREATE_RULES = RuleSet(
+    (TitleCannotBeEmptyRule, lambda title, creator_name: (title,)),
+    (CreatorNameCannotBeEmptyRule, lambda title, creator_name: (creator_name,)),
+)
+_ADD_PARTICIPANT_RULES = RuleSet(
+    (ConversationCannotBeModifiedIfArchivedRule, _archived),
+    (
+        ParticipantCannotBeAddedIfAlreadyExistsRule,
+        lambda conversation, member_id: (conversation._participants_by_id, member_id),
+    ),
+)
+_REMOVE_PARTICIPANT_RULES = RuleSet(
+    (ConversationCannotBeModifiedIfArchivedRule, _archived),
+    (
+        ParticipantCannotBeRemovedIfNotExistsRule,
+        lambda conversation, member_id: (conversation._participants_by_id, member_id),
+    ),
+    (CreatorCannotBeRemovedRule, lambda conversation, member_id: (conversation._creator.id, member_id)),
+)
+_MODIFY_RULES = RuleSet((ConversationCannotBeModifiedIfArchivedRule, _archived))
+_DELETE_RULES = RuleSet((ConversationCannotBeDeletedIfArchivedRule, _archived))
+_RENAME_RULES = RuleSet(
+    (ConversationCannotBeRenamedIfArchivedRule, _archived),
+    (TitleCannotBeEmptyRule, lambda conversation, title: (title,)),
+)
+_SHARE_RULES = RuleSet((ConversationCannotBeSharedIfArchivedRule, _archived))
+_ADD_MESSAGE_RULES = RuleSet((MessageCannotBeAddedIfArchivedRule, _archived))
+
+
+@dataclass(slots=True)
 class Conversation(AggregateRoot[ConversationId]):
     _id: ConversationId
     _title: str
@@ -41,6 +81,11 @@ class Conversation(AggregateRoot[ConversationId]):
     _participants: list[Participant] = field(default_factory=list)
     _message_ids: list[MessageId] = field(default_factory=list)
     _is_archived: bool = field(default=False, init=False)
+    # Index over ``_participants`` by member id, for constant-time membership checks.
+    _participants_by_id: dict[MemberId, Participant] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._participants_by_id = {participant.id: participant for participant in self._participants}
 
     # ---------------------------------------------------------------------
     # Properties
@@ -88,15 +133,61 @@ class Conversation(AggregateRoot[ConversationId]):
         Returns:
             Conversation: The newly created conversation.
         """
-        # Validate the title before creating the aggregate
-        if TitleCannotBeEmptyRule(title).is_broken():
-            raise BusinessRuleValidationException(TitleCannotBeEmptyRule(title))
-        # Validate the creator's name
-        if creator_name is None or not creator_name.strip():
-            raise BusinessRuleValidationException("Creator name cannot be empty")
+        _CREATE_RULES.check(title, creator_name)
 
         creator = Creator.create(member_id=creator_id, name=creator_name)
-        return cls(_id=ConversationId.create(id=uuid.uuid4()), _title=title, _creator=creator)
+        conversation = cls(_id=ConversationId.create(id=uuid.uuid4()), _title=title, _creator=creator)
+        conversation.add_event(
+            ConversationCreatedEvent(conversation_id=conversation.id, creator_id=creator_id.value, title=title)
+        )
+        return conversation
+
+    @classmethod
+    def rehydrate(
+        cls,
+        conversation_id: ConversationId,
+        title: str,
+        creator: Creator,
+        created_at: datetime,
+        updated_at: datetime,
+        participants: Iterable[Participant] = (),
+        message_ids: Iterable[MessageId] = (),
+        is_archived: bool = False,
+        version: int = 0,
+    ) -> "Conversation":
+        """
+        Rebuilds a conversation from persisted state.
+
+        Unlike ``create`` this performs no rule validation, generates no
+        identifier and records no events; the state is trusted as-is.
+
+        Args:
+            conversation_id (ConversationId): The persisted conversation ID.
+            title (str): The persisted title.
+            creator (Creator): The rehydrated creator entity.
+            created_at (datetime): The persisted creation timestamp.
+            updated_at (datetime): The persisted modification timestamp.
+            participants (Iterable[Participant]): The persisted participants.
+            message_ids (Iterable[MessageId]): The persisted message identifiers.
+            is_archived (bool): The persisted archived flag.
+            version (int): The persisted aggregate version.
+
+        Returns:
+            Conversation: The rehydrated conversation.
+        """
+        participants = list(participants)
+        return cls._restore(
+            _id=conversation_id,
+            _title=title,
+            _creator=creator,
+            _participants=participants,
+            _participants_by_id={participant.id: participant for participant in participants},
+            _message_ids=list(message_ids),
+            _is_archived=is_archived,
+            _created_at=created_at,
+            _updated_at=updated_at,
+            _version=version,
+        )
 
     def add_participant(self, participant_id: MemberId, role: ParticipantRole) -> None:
         """
@@ -109,15 +200,13 @@ class Conversation(AggregateRoot[ConversationId]):
         Raises:
             BusinessRuleValidationException: If the conversation is archived or the participant already exists.
         """
-        self.check_rules(ConversationCannotBeModifiedIfArchivedRule(is_archived=self._is_archived))
-        self.check_rules(
-            ParticipantCannotBeAddedIfAlreadyExistsRule(participants=self._participants, participant_id=participant_id)
-        )
+        _ADD_PARTICIPANT_RULES.check(self, participant_id)
 
-        participant = Participant.create(participant_id=participant_id, conversation_id=self._id, role=role)
+        participant = Participant.create(member_id=participant_id, conversation_id=self._id.value, role=role)
         self._participants.append(participant)
+        self._participants_by_id[participant_id] = participant
 
-        self.add_event(ParticipantAddedEvent(conversation_id=self._id, participant_id=participant_id))
+        self.add_event(ParticipantAddedEvent(conversation_id=self._id.value, participant_id=participant_id))
 
     def remove_participant(self, participant_id: MemberId) -> None:
         """
@@ -129,14 +218,9 @@ class Conversation(AggregateRoot[ConversationId]):
         Raises:
             BusinessRuleValidationException: If the conversation is archived, the participant does not exist, or the participant is the creator.
         """
-        self.check_rules(ConversationCannotBeModifiedIfArchivedRule(is_archived=self._is_archived))
-        self.check_rules(
-            ParticipantCannotBeRemovedIfNotExistsRule(participants=self._participants, participant_id=participant_id)
-        )
-        # Ensure we are not removing the creator
-        self.check_rules(CreatorCannotBeRemovedRule(creator_id=self._creator.id, participant_id=participant_id))
+        _REMOVE_PARTICIPANT_RULES.check(self, participant_id)
 
-        participant = next((p for p in self._participants if p.id == participant_id), None)
+        participant = self._participants_by_id.pop(participant_id)
         self._participants.remove(participant)
         participant.remove()
 
@@ -151,13 +235,15 @@ class Conversation(AggregateRoot[ConversationId]):
         Raises:
             BusinessRuleValidationException: If the conversation is archived or the participant does not exist.
         """
-        self.check_rules(ConversationCannotBeModifiedIfArchivedRule(is_archived=self._is_archived))
+        _MODIFY_RULES.check(self)
 
-        participant = next((p for p in self._participants if p.id == participant_id), None)
+        participant = self._participants_by_id.get(participant_id)
         if participant:
             participant.change_role(new_role)
             self.add_event(
-                ParticipantRoleChangedEvent(conversation_id=self._id, participant_id=participant_id, new_role=new_role)
+                ParticipantRoleChangedEvent(
+                    conversation_id=self._id.value, participant_id=participant_id, new_role=new_role
+                )
             )
         else:
             raise BusinessRuleValidationException(f"User {participant_id} is not a participant.")
@@ -172,7 +258,7 @@ class Conversation(AggregateRoot[ConversationId]):
         if self._is_archived:
             raise BusinessRuleValidationException("Conversation is already archived.")
         self._is_archived = True
-        self.add_event(ConversationArchivedEvent(conversation_id=self._id))
+        self.add_event(ConversationArchivedEvent(conversation_id=self._id.value))
 
     def delete(self) -> None:
         """
@@ -181,8 +267,8 @@ class Conversation(AggregateRoot[ConversationId]):
         Raises:
             BusinessRuleValidationException: If the conversation is archived.
         """
-        self.check_rules(ConversationCannotBeDeletedIfArchivedRule(is_archived=self._is_archived))
-        self.add_event(ConversationDeletedEvent(conversation_id=self._id))
+        _DELETE_RULES.check(self)
+        self.add_event(ConversationDeletedEvent(conversation_id=self._id.value))
 
     # ------------------------------------------------------------------
     # Additional domain behaviours
@@ -202,11 +288,7 @@ class Conversation(AggregateRoot[ConversationId]):
             BusinessRuleValidationException: If the conversation is archived
                 or the new title is empty.
         """
-        # Disallow renaming if archived
-        self.check_rules(ConversationCannotBeRenamedIfArchivedRule(is_archived=self._is_archived))
-        # Validate the new title is not empty
-        if TitleCannotBeEmptyRule(new_title).is_broken():
-            raise BusinessRuleValidationException(TitleCannotBeEmptyRule(new_title))
+        _RENAME_RULES.check(self, new_title)
 
         # Apply the state change and emit an event
         self._title = new_title
@@ -228,7 +310,7 @@ class Conversation(AggregateRoot[ConversationId]):
         Raises:
             BusinessRuleValidationException: If the conversation is archived.
         """
-        self.check_rules(ConversationCannotBeSharedIfArchivedRule(is_archived=self._is_archived))
+        _SHARE_RULES.check(self)
         # No state change required; event records the action
         self.add_event(ConversationSharedEvent(conversation_id=self._id.value, user_id=user_id))
 
@@ -248,6 +330,6 @@ class Conversation(AggregateRoot[ConversationId]):
         Raises:
             BusinessRuleValidationException: If the conversation is archived.
         """
-        self.check_rules(MessageCannotBeAddedIfArchivedRule(is_archived=self._is_archived))
+        _ADD_MESSAGE_RULES.check(self)
         self._message_ids.append(message_id)
         self.add_event(MessageAddedEvent(conversation_id=self._id.value, message_id=message_id.value))
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from uuid import UUID
 
 from src.building_blocks.domain.entity import Entity
@@ -8,7 +9,7 @@ from ...members.value_objects.member_id import MemberId
 from ..rules import CreatorNameCannotBeEmptyRule
 
 
-@dataclass
+@dataclass(slots=True)
 class Creator(Entity):
     _id: MemberId
     _name: str
@@ -29,6 +30,32 @@ class Creator(Entity):
         cls.check_rules(CreatorNameCannotBeEmptyRule(name))
         return cls(_id=member_id, _name=name)
 
+    @classmethod
+    def rehydrate(
+        cls, member_id: MemberId, name: str, created_at: datetime, updated_at: datetime, is_active: bool = True
+    ) -> "Creator":
+        """
+        Rebuilds a creator from persisted state without validating rules.
+
+        Args:
+            member_id (MemberId): The ID of the user.
+            name (str): The persisted name of the creator.
+            created_at (datetime): The persisted creation timestamp.
+            updated_at (datetime): The persisted modification timestamp.
+            is_active (bool): The persisted activity flag.
+
+        Returns:
+            Creator: The rehydrated creator.
+        """
+        return cls._restore(
+            _id=member_id,
+            _name=name,
+            _is_active=is_active,
+            _created_at=created_at,
+            _updated_at=updated_at,
+            _version=0,
+        )
+
     def change_name(self, new_name: str) -> None:
         """
         Changes the name of the creator.
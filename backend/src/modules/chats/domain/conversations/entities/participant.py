@@ -9,7 +9,7 @@ from ..enums.participant_role import ParticipantRole
 from ..events import ParticipantRoleAssignedEditorEvent, ParticipantRoleAssignedViewerEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class Participant(Entity):
     _id: MemberId
     _role: ParticipantRole
@@ -31,7 +31,7 @@ class Participant(Entity):
         Returns:
             Participant: A new participant instance.
         """
-        return cls(_id=member_id, _conversation_id=conversation_id, _role=role)
+        return cls(_id=member_id, _role=role)
 
     @property
     def is_removed(self) -> bool:
@@ -1,4 +1,5 @@
 from .conversation_archived_event import ConversationArchivedEvent
+from .conversation_created_event import ConversationCreatedEvent
 from .conversation_deleted_event import ConversationDeletedEvent
 from .conversation_renamed_event import ConversationRenamedEvent
 from .conversation_shared_event import ConversationSharedEvent
@@ -23,6 +24,7 @@ __all__ = [
     "CreatorActivatedEvent",
     "CreatorDeactivatedEvent",
     "ConversationArchivedEvent",
+    "ConversationCreatedEvent",
     "ConversationDeletedEvent",
     "ConversationRenamedEvent",
     "ConversationSharedEvent",
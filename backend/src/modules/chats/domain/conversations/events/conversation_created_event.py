@@ -0,0 +1,11 @@
+import uuid
+from dataclasses import dataclass
+
+from src.building_blocks.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True)
+class ConversationCreatedEvent(DomainEvent):
+    conversation_id: uuid.UUID
+    creator_id: uuid.UUID
+    title: str
@@ -4,6 +4,6 @@ from dataclasses import dataclass
 from src.building_blocks.domain.events import DomainEvent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreatorActivatedEvent(DomainEvent):
     creator_id: uuid.UUID
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from src.building_blocks.domain.events import DomainEvent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParticipantRoleAssignedViewerEvent(DomainEvent):
     participant_id: uuid.UUID
     conversation_id: uuid.UUID
@@ -20,5 +20,9 @@ class ConversationCannotBeDeletedIfArchivedRule(BaseBusinessRule):
     error_type = ErrorType.BUSINESS_RULE_VIOLATION
 
     def is_broken(self) -> bool:
+        return self.is_broken_for(self.is_archived)
+
+    @staticmethod
+    def is_broken_for(is_archived: bool) -> bool:
         # Deletion is invalid when the conversation is archived
-        return bool(self.is_archived)
+        return bool(is_archived)
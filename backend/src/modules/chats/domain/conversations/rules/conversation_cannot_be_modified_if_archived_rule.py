@@ -21,5 +21,9 @@ class ConversationCannotBeModifiedIfArchivedRule(BaseBusinessRule):
     error_type = ErrorType.BUSINESS_RULE_VIOLATION
 
     def is_broken(self) -> bool:
+        return self.is_broken_for(self.is_archived)
+
+    @staticmethod
+    def is_broken_for(is_archived: bool) -> bool:
         # If the conversation is archived, modifications are not allowed
-        return bool(self.is_archived)
+        return bool(is_archived)
@@ -23,5 +23,9 @@ class CreatorCannotBeRemovedRule(BaseBusinessRule):
     error_type = ErrorType.BUSINESS_RULE_VIOLATION
 
     def is_broken(self) -> bool:
+        return self.is_broken_for(self.creator_id, self.participant_id)
+
+    @staticmethod
+    def is_broken_for(creator_id: str, participant_id: str) -> bool:
         # It is a violation if the participant slated for removal *is* the creator
-        return self.creator_id == self.participant_id
+        return creator_id == participant_id
@@ -35,4 +35,8 @@ class CreatorNameCannotBeEmptyRule(BaseBusinessRule):
         whitespace. This signals to the calling context that a
         ``BusinessRuleValidationException`` should be raised.
         """
-        return not bool(self.name and self.name.strip())
+        return self.is_broken_for(self.name)
+
+    @staticmethod
+    def is_broken_for(name: str) -> bool:
+        return not bool(name and name.strip())
@@ -20,4 +20,8 @@ class MessageCannotBeAddedIfArchivedRule(BaseBusinessRule):
     error_type = ErrorType.BUSINESS_RULE_VIOLATION
 
     def is_broken(self) -> bool:
-        return bool(self.is_archived)
+        return self.is_broken_for(self.is_archived)
+
+    @staticmethod
+    def is_broken_for(is_archived: bool) -> bool:
+        return bool(is_archived)
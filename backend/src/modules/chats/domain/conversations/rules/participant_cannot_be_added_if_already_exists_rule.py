@@ -1,23 +1,29 @@
-from dataclasses import dataclass
-
 """Business rule that prevents adding a participant who already exists in the conversation.
 
 If the provided participant ID is found in the existing participants list, the
 rule is considered broken. Imports corrected to reference the ``src`` prefix.
 """
 
+from dataclasses import dataclass
+from typing import Any, Container
+
 from src.building_blocks.domain.enums import ErrorCode, ErrorType
 from src.building_blocks.domain.rule import BaseBusinessRule
 
 
 @dataclass
 class ParticipantCannotBeAddedIfAlreadyExistsRule(BaseBusinessRule):
-    participant_id: str
+    participants: Container[Any]
+    participant_id: Any
 
     code = ErrorCode.CONFLICT_ERROR
     message = "Participant cannot be added if they already exist in the conversation."
     error_type = ErrorType.BUSINESS_RULE_VIOLATION
 
     def is_broken(self) -> bool:
-        # The rule is broken if a participant with this ID already exists
-        return any(p.id == self.participant_id for p in self.participants)
+        return self.is_broken_for(self.participants, self.participant_id)
+
+    @staticmethod
+    def is_broken_for(participants: Container[Any], participant_id: Any) -> bool:
+        # ``participants`` is keyed by member id (the conversation's index), so this is a lookup
+        return participant_id in participants
@@ -1,23 +1,29 @@
-from dataclasses import dataclass
-
 """Business rule preventing removal of a participant who is not part of the conversation.
 
 If a participant with the given ID does not exist in the conversation, the rule
 is broken. Imports corrected to reference ``src``.
 """
 
+from dataclasses import dataclass
+from typing import Any, Container
+
 from src.building_blocks.domain.enums import ErrorCode, ErrorType
 from src.building_blocks.domain.rule import BaseBusinessRule
 
 
 @dataclass
 class ParticipantCannotBeRemovedIfNotExistsRule(BaseBusinessRule):
-    participant_id: str
+    participants: Container[Any]
+    participant_id: Any
 
     code = ErrorCode.CONFLICT_ERROR
     message = "Participant cannot be removed if they do not exist in the conversation."
     error_type = ErrorType.BUSINESS_RULE_VIOLATION
 
     def is_broken(self) -> bool:
-        # The rule is broken when no participant with this ID exists in the collection
-        return not any(p.id == self.participant_id for p in self.participants)
+        return self.is_broken_for(self.participants, self.participant_id)
+
+    @staticmethod
+    def is_broken_for(participants: Container[Any], participant_id: Any) -> bool:
+        # ``participants`` is keyed by member id (the conversation's index), so this is a lookup
+        return participant_id not in participants
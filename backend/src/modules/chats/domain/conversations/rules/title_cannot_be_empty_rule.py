@@ -27,5 +27,9 @@ class TitleCannotBeEmptyRule(BaseBusinessRule):
         A title is considered invalid (broken) when it is empty or contains
         only whitespace. Return ``True`` when the rule has been violated.
         """
+        return self.is_broken_for(self.title)
+
+    @staticmethod
+    def is_broken_for(title: str) -> bool:
         # ``strip`` removes surrounding whitespace; an empty string evaluates to False
-        return not bool(self.title and self.title.strip())
+        return not bool(title and title.strip())
@@ -4,7 +4,7 @@ from uuid import UUID
 from src.building_blocks.domain.value_object import ValueObject
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class ConversationId(ValueObject):
     value: UUID
 
@@ -1,7 +0,0 @@
-from abc import ABC, abstractmethod
-
-
-class AbstractConversationDownloader(ABC):
-    @abstractmethod
-    def download():
-        raise NotImplementedError
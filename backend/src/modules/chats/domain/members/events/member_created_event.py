@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.building_blocks.domain.events import DomainEvent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MemberCreatedEvent(DomainEvent):
     member_id: str
     member_name: str
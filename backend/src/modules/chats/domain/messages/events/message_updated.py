@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from src.building_blocks.domain.events import DomainEvent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MessageUpdatedEvent(DomainEvent):
     conversation_id: uuid.UUID
     message_id: uuid.UUID
@@ -0,0 +1,111 @@
+"""
+Profanity matching for message content.
+
+:class:`ProfanityFilter` compiles a wordlist into an Aho-Corasick automaton once; scanning
+a text is then a single pass over its characters, whatever the size of the wordlist.
+Both the wordlist and the scanned text are normalized (NFKC, then case-folded), and by
+default a match only counts when it is a whole word.
+
+One filter is shared by the process (:func:`profanity_filter`); the chats startup installs
+the configured wordlist with :func:`use_profanity_filter`.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from collections import deque
+from typing import Iterable, Iterator
+
+DEFAULT_WORDLIST = ("badword1", "badword2")
+
+
+def normalize(text: str) -> str:
+    """Fold compatibility forms (full-width letters, ligatures) and case, so variants match alike."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _is_word_character(character: str) -> bool:
+    return character.isalnum() or character == "_"
+
+
+class ProfanityFilter:
+    """Aho-Corasick automaton over a normalized wordlist."""
+
+    __slots__ = ("_goto", "_fail", "_outputs", "_whole_words", "size")
+
+    def __init__(self, words: Iterable[str], *, whole_words: bool = True) -> None:
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[tuple[str, ...]] = [()]
+        entries = {normalize(word).strip() for word in words} - {""}
+        for word in entries:
+            state = 0
+            for character in word:
+                following = goto[state].get(character)
+                if following is None:
+                    following = goto[state][character] = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                state = following
+            outputs[state] = (word,)
+
+        # Breadth-first, so each state's failure target (a shorter suffix) is complete before it is used.
+        fail = [0] * len(goto)
+        pending = deque(goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for character, following in goto[state].items():
+                target = fail[state]
+                while target and character not in goto[target]:
+                    target = fail[target]
+                fail[following] = goto[target].get(character, 0)
+                outputs[following] += outputs[fail[following]]
+                pending.append(following)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+        self._whole_words = whole_words
+        self.size = len(entries)
+
+    def contains(self, text: str) -> bool:
+        """Whether ``text`` contains any word of the list."""
+        return next(self._matches(text), None) is not None
+
+    def find(self, text: str) -> list[str]:
+        """The (normalized) listed words found in ``text``, in order of where they end."""
+        return list(self._matches(text))
+
+    def _matches(self, text: str) -> Iterator[str]:
+        text = normalize(text)
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for end, character in enumerate(text, 1):
+            while state and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+            for word in outputs[state]:
+                if not self._whole_words or self._is_whole_word(text, end - len(word), end, word):
+                    yield word
+
+    @staticmethod
+    def _is_whole_word(text: str, start: int, end: int, word: str) -> bool:
+        # Edges made of punctuation ("@$$") need no boundary; word-character edges do.
+        if _is_word_character(word[0]) and start > 0 and _is_word_character(text[start - 1]):
+            return False
+        if _is_word_character(word[-1]) and end < len(text) and _is_word_character(text[end]):
+            return False
+        return True
+
+
+_shared = ProfanityFilter(DEFAULT_WORDLIST)
+
+
+def profanity_filter() -> ProfanityFilter:
+    """The process-wide filter used by the content rules."""
+    return _shared
+
+
+def use_profanity_filter(matcher: ProfanityFilter) -> None:
+    """Replace the process-wide filter; the swap is a single reference assignment."""
+    global _shared
+    _shared = matcher
@@ -14,19 +14,13 @@ from .events import (
     MessagePinnedEvent,
     MessageUpdatedEvent,
 )
-from .rules import (
-    ContentResponseMustBeValidRule,
-    ContentTextMustBeValidRule,
-    ContentTextMustNotContainProfanityRule,
-    FeedbackMustBeValidRule,
-    NonEmptyMessageRule,
-)
+from .rules import CONTENT_RULES, FeedbackMustBeValidRule, NonEmptyMessageRule
 from .value_objects.content import Content
 from .value_objects.feedback import Feedback
 from .value_objects.message_id import MessageId
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Message(AggregateRoot):
     """
     Represents a message containing multiple contents and feedback.
@@ -101,6 +95,48 @@ class Message(AggregateRoot):
 
         return message
 
+    @classmethod
+    def rehydrate(
+        cls,
+        message_id: MessageId,
+        conversation_id: ConversationId,
+        sender_id: MemberId,
+        contents: list[Content],
+        created_at: datetime,
+        updated_at: datetime,
+        pinned: bool = False,
+        version: int = 0,
+    ) -> Self:
+        """
+        Rebuilds a message from persisted state.
+
+        No content rules are validated and no ``MessageCreatedEvent`` is
+        recorded; the persisted timestamps are reused as-is.
+
+        Args:
+            message_id (MessageId): The persisted message ID.
+            conversation_id (ConversationId): The ID of the conversation.
+            sender_id (MemberId): The ID of the sender.
+            contents (list[Content]): The persisted content versions.
+            created_at (datetime): The persisted creation timestamp.
+            updated_at (datetime): The persisted modification timestamp.
+            pinned (bool): The persisted pinned flag.
+            version (int): The persisted aggregate version.
+
+        Returns:
+            Message: The rehydrated message.
+        """
+        return cls._restore(
+            _id=message_id,
+            _conversation_id=conversation_id,
+            _sender_id=sender_id,
+            _contents=list(contents),
+            _created_at=created_at,
+            _updated_at=updated_at,
+            _pinned=pinned,
+            _version=version,
+        )
+
     def append_content(self, content: Content, conversation_id: uuid.UUID) -> Content:
         """
         Appends a new content version to the message and raises an event.
@@ -117,11 +153,7 @@ class Message(AggregateRoot):
         """
         Validates the content against various business rules.
         """
-        self.check_rules(
-            ContentTextMustBeValidRule(text=content.text),
-            ContentResponseMustBeValidRule(response=content.response),
-            ContentTextMustNotContainProfanityRule(text=content.text),
-        )
+        CONTENT_RULES.check(content.text, content.response)
 
     def add_feedback(self, content_index: int, feedback: Feedback) -> Content:
         """
@@ -1,4 +1,5 @@
 from .content_index_must_be_valid_rule import ContentIndexMustBeValidRule
+from .content_rules import CONTENT_RULES
 from .content_response_must_be_valid_rule import ContentResponseMustBeValidRule
 from .content_text_must_be_valid_rule import ContentTextMustBeValidRule
 from .content_text_must_not_contain_profanity_rule import ContentTextMustNotContainProfanityRule
@@ -6,6 +7,7 @@ from .feedback_must_be_valid_rule import FeedbackMustBeValidRule
 from .message_cannot_be_empty_rule import NonEmptyMessageRule
 
 __all__ = [
+    "CONTENT_RULES",
     "ContentIndexMustBeValidRule",
     "ContentTextMustBeValidRule",
     "ContentTextMustNotContainProfanityRule",
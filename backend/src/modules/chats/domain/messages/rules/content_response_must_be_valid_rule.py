@@ -15,4 +15,8 @@ class ContentResponseMustBeValidRule(BaseBusinessRule):
     error_type: ErrorType = field(default=ErrorType.VALIDATION_ERROR, init=False)
 
     def is_broken(self) -> bool:
-        return not self.response or len(self.response) < 5
+        return self.is_broken_for(self.response)
+
+    @staticmethod
+    def is_broken_for(response: str) -> bool:
+        return not response or len(response) < 5
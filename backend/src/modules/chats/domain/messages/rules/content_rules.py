@@ -0,0 +1,12 @@
+from src.building_blocks.domain.rule_set import RuleSet
+
+from .content_response_must_be_valid_rule import ContentResponseMustBeValidRule
+from .content_text_must_be_valid_rule import ContentTextMustBeValidRule
+from .content_text_must_not_contain_profanity_rule import ContentTextMustNotContainProfanityRule
+
+# Validates a question/response pair: ``CONTENT_RULES.check(text, response)``.
+CONTENT_RULES = RuleSet(
+    (ContentTextMustBeValidRule, lambda text, response: (text,)),
+    (ContentResponseMustBeValidRule, lambda text, response: (response,)),
+    (ContentTextMustNotContainProfanityRule, lambda text, response: (text,)),
+)
@@ -22,5 +22,9 @@ class ContentTextMustBeValidRule(BaseBusinessRule):
     error_type: ErrorType = field(default=ErrorType.VALIDATION_ERROR, init=False)
 
     def is_broken(self) -> bool:
+        return self.is_broken_for(self.text)
+
+    @staticmethod
+    def is_broken_for(text: str) -> bool:
         # The rule is broken when the text is empty or contains only whitespace
-        return not bool(self.text and self.text.strip())
+        return not bool(text and text.strip())
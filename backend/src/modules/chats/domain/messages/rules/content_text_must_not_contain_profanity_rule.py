@@ -3,13 +3,20 @@ from dataclasses import dataclass, field
 from src.building_blocks.domain.enums import ErrorCode, ErrorType
 from src.building_blocks.domain.rule import BaseBusinessRule
 
+from ..profanity import profanity_filter
+
+
+def contains_profanity(text: str) -> bool:
+    """Whether ``text`` contains a word of the process-wide profanity wordlist."""
+    return profanity_filter().contains(text)
+
 
 @dataclass
 class ContentTextMustNotContainProfanityRule(BaseBusinessRule):
     """Business rule ensuring a message does not contain profane words.
 
-    The rule is broken when any of the predefined profanities appear in the
-    text. Imports remain correct as they reference ``src.building_blocks``.
+    The rule is broken when any word of the configured profanity wordlist
+    appears in the text; matching is done by ``messages.profanity``.
     """
 
     text: str
@@ -21,6 +28,9 @@ class ContentTextMustNotContainProfanityRule(BaseBusinessRule):
     error_type: ErrorType = field(default=ErrorType.VALIDATION_ERROR, init=False)
 
     def is_broken(self) -> bool:
-        profanities = ["badword1", "badword2"]
+        return self.is_broken_for(self.text)
+
+    @staticmethod
+    def is_broken_for(text: str) -> bool:
         # The rule is broken if the text contains any profane word
-        return any(profanity in self.text for profanity in profanities)
+        return bool(text) and contains_profanity(text)
@@ -3,11 +3,11 @@ from typing import Optional, Self
 
 from src.building_blocks.domain.value_object import ValueObject
 
-from ..rules import ContentResponseMustBeValidRule, ContentTextMustBeValidRule, ContentTextMustNotContainProfanityRule
+from ..rules import CONTENT_RULES
 from .feedback import Feedback
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Content(ValueObject):
     """Represents a user's question and the corresponding generated response."""
 
@@ -39,10 +39,9 @@ class Content(ValueObject):
 
         Returns:
             Content: A new instance of the Content class.
+
+        Raises:
+            BusinessRuleValidationException: For the first content rule the input breaks.
         """
-        cls.check_rules(
-            ContentTextMustBeValidRule(text=text),
-            ContentResponseMustBeValidRule(response=response),
-            ContentTextMustNotContainProfanityRule(text=text),
-        )
+        CONTENT_RULES.check(text, response)
         return cls(_text=text, _response=response, _feedback=feedback)
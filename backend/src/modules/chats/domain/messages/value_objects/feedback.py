@@ -7,7 +7,7 @@ from ..enum.rating import RatingType
 from ..rules.feedback_must_be_valid_rule import FeedbackMustBeValidRule
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Feedback(ValueObject):
     """Represents feedback provided on a message."""
 
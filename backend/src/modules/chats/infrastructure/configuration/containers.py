@@ -3,7 +3,11 @@ import logging
 from dependency_injector import containers, providers
 from sqlalchemy.orm import sessionmaker
 
+from src.building_blocks.infrastructure.event_bus import EventBus
+
 from ..mediator import Mediator
+from ..persistence.read_models.conversation_summary_projector import ConversationSummaryProjector
+from ..persistence.read_models.sql_conversation_read_model import SQLConversationReadModel
 from ..persistence.repositories.sql_conversation_repo import SQLConversationRepository
 from ..persistence.repositories.sql_message_repo import SQLMessageRepository
 
@@ -19,9 +23,12 @@ class ChatDIContainer(containers.DeclarativeContainer):
 
     logger = providers.Singleton(logging.getLogger, name="chat")
 
+    event_bus = providers.Singleton(EventBus)
+
     conversation_repository = providers.Factory(
         SQLConversationRepository,
         session_factory=session_factory,
+        event_bus=event_bus,
     )
 
     message_repository = providers.Factory(
@@ -29,6 +36,16 @@ class ChatDIContainer(containers.DeclarativeContainer):
         session_factory=session_factory,
     )
 
+    conversation_read_model = providers.Factory(
+        SQLConversationReadModel,
+        session_factory=session_factory,
+    )
+
+    conversation_summary_projector = providers.Singleton(
+        ConversationSummaryProjector,
+        session_factory=session_factory,
+    )
+
     mediator = providers.Singleton(Mediator, handlers=handlers)
 
     wiring_config = containers.WiringConfiguration(
@@ -0,0 +1,408 @@
+"""
+Append-only JSON-lines store, an alternative to :class:`JsonFileManager` for history
+that grows one record at a time (chat memory, feedback).
+
+Every change is one line appended to the active segment (``<prefix>00000001.jsonl``,
+rolled over at ``segment_bytes``), so writing a record costs the record, not the
+history. An in-memory index maps each id to the offsets of its lines, so reading a
+record is a single ``pread`` and ``list_files`` never touches the directory.
+
+Durability: appends reach the OS at once and are ``fsync``-ed in batches, every
+``sync_every`` records or ``sync_interval`` seconds, whichever comes first; call
+:meth:`JsonLinesStore.flush` to sync now. On open, a torn last line (a crash mid
+write) is truncated away.
+
+Compaction rewrites the live records into a new segment once superseded lines make up
+``compact_ratio`` of the store. The new segment is written to a temporary file,
+``fsync``-ed and renamed into place; its first line names the segments it replaces, so
+a crash before they are deleted only leaves files that the next open skips and removes.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from src.building_blocks.infrastructure import json_codec
+
+_SUFFIX = ".jsonl"
+_TMP_SUFFIX = ".jsonl.tmp"
+
+# One line per change: ``{"op": ..., "k": file_id, "v": value}``.
+_SET, _ADD, _DEL, _COMPACTED = "set", "add", "del", "compacted"
+
+# (segment number, offset, length) of one line.
+Location = tuple[int, int, int]
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Where the current value of an id lives: a ``set`` line, then one ``add`` line per appended record."""
+
+    base: Location | None = None
+    base_length: int = 0  # records held by ``base`` when it is a list, -1 when it is not
+    items: list[Location] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return max(self.base_length, 0) + len(self.items)
+
+    @property
+    def lines(self) -> int:
+        return (self.base is not None) + len(self.items)
+
+
+class JsonLinesStore:
+    """
+    Stores JSON values by id in append-only, periodically compacted JSON-lines segments.
+
+    Offers the :class:`JsonFileManager` operations (``file_exists``, ``read``, ``write``,
+    ``delete``, ``list_files``) plus ``append`` and ``read_record`` for list values.
+    Safe to share between threads; one process per directory.
+    """
+
+    DEFAULT_PREFIX = "chat_"
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str | None = None,
+        *,
+        segment_bytes: int = 8 * 1024 * 1024,
+        sync_every: int = 64,
+        sync_interval: float = 0.05,
+        compact_ratio: float = 0.5,
+        compact_min_bytes: int = 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            directory (str): The directory holding the segments.
+            prefix (str): Segment file name prefix.
+            segment_bytes (int): Size at which the active segment is closed and a new one started.
+            sync_every (int): Appends between ``fsync`` calls.
+            sync_interval (float): Seconds after which the next append ``fsync``-s regardless.
+            compact_ratio (float): Share of superseded bytes that triggers a compaction.
+            compact_min_bytes (int): Store size below which compaction is never triggered.
+        """
+        self.directory = directory
+        self.prefix = prefix or self.DEFAULT_PREFIX
+        self.segment_bytes = segment_bytes
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+
+        self._lock = threading.RLock()
+        self._index: dict[str, _Entry] = {}
+        self._readers: dict[int, int] = {}  # segment number -> read-only fd
+        self._active = 0
+        self._active_fd = -1
+        self._active_size = 0
+        self._total_bytes = 0
+        self._live_bytes = 0
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._recover()
+
+    # ---------- JsonFileManager operations ----------
+
+    def file_exists(self, file_id: str) -> bool:
+        return file_id in self._index
+
+    def read(self, file_id: str) -> Any:
+        """
+        Returns the value stored under ``file_id``.
+
+        Raises:
+            FileNotFoundError: If nothing is stored under ``file_id``.
+        """
+        with self._lock:
+            entry = self._entry(file_id)
+            value = self._value(entry.base) if entry.base is not None else []
+            if entry.items:
+                value = list(value) + [self._value(location) for location in entry.items]
+            return value
+
+    def write(self, file_id: str, data: Any) -> None:
+        """Replaces the value stored under ``file_id``."""
+        with self._lock:
+            location = self._append(_SET, file_id, data)
+            self._release(self._index.get(file_id))
+            self._index[file_id] = _Entry(location, len(data) if isinstance(data, list) else -1)
+            self._live_bytes += location[2]
+            self._after_write()
+
+    def delete(self, file_id: str) -> None:
+        """
+        Removes ``file_id``.
+
+        Raises:
+            FileNotFoundError: If nothing is stored under ``file_id``.
+        """
+        with self._lock:
+            entry = self._entry(file_id)
+            self._append(_DEL, file_id, None)
+            self._release(entry)
+            del self._index[file_id]
+            self._after_write()
+
+    def list_files(self) -> list[str]:
+        """Returns the stored ids, from the index."""
+        with self._lock:
+            return list(self._index)
+
+    # ---------- Record-level operations ----------
+
+    def append(self, file_id: str, record: Any) -> int:
+        """
+        Appends ``record`` to the list stored under ``file_id`` (a new, empty list if there is
+        none) and returns its position.
+
+        Raises:
+            TypeError: If the value stored under ``file_id`` is not a list.
+        """
+        with self._lock:
+            entry = self._index.get(file_id)
+            if entry is None:
+                entry = self._index[file_id] = _Entry()
+            elif entry.base_length < 0:
+                raise TypeError(f"Value stored under '{file_id}' is not a list.")
+            location = self._append(_ADD, file_id, record)
+            entry.items.append(location)
+            self._live_bytes += location[2]
+            self._after_write()
+            return entry.count - 1
+
+    def read_record(self, file_id: str, position: int) -> Any:
+        """
+        Returns one record of a list value without reading the others (``position`` may be negative).
+
+        Raises:
+            FileNotFoundError: If nothing is stored under ``file_id``.
+            IndexError: If ``position`` is out of range.
+        """
+        with self._lock:
+            entry = self._entry(file_id)
+            if entry.base_length < 0:
+                raise TypeError(f"Value stored under '{file_id}' is not a list.")
+            count = entry.count
+            if position < 0:
+                position += count
+            if not 0 <= position < count:
+                raise IndexError(f"Record {position} of '{file_id}' is out of range.")
+            if position < entry.base_length:
+                # Only a list written whole and not compacted since; compaction splits it into records.
+                return self._value(entry.base)[position]
+            return self._value(entry.items[position - entry.base_length])
+
+    def count(self, file_id: str) -> int:
+        """The number of records in the list stored under ``file_id``."""
+        with self._lock:
+            return self._entry(file_id).count
+
+    # ---------- Durability and maintenance ----------
+
+    def flush(self) -> None:
+        """``fsync`` everything appended so far."""
+        with self._lock:
+            if self._unsynced:
+                os.fsync(self._active_fd)
+                self._unsynced = 0
+            self._synced_at = time.monotonic()
+
+    def compact(self) -> None:
+        """Rewrite the live records into a single new segment and delete the old segments."""
+        with self._lock:
+            self.flush()
+            target = self._active + 1
+            tmp_path = self._path(target) + ".tmp"
+            index: dict[str, _Entry] = {}
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                size = self._write_line(fd, target, 0, _COMPACTED, None, target)[2]
+                for file_id, entry in self._index.items():
+                    if entry.base_length < 0:
+                        location = self._write_line(fd, target, size, _SET, file_id, self._value(entry.base))
+                        index[file_id] = _Entry(location, -1)
+                        size += location[2]
+                        continue
+                    # Lists become one line per record, so every record can be read on its own.
+                    compacted = index[file_id] = _Entry()
+                    for record in self._records(entry):
+                        location = self._write_line(fd, target, size, _ADD, file_id, record)
+                        compacted.items.append(location)
+                        size += location[2]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self._path(target))
+            self._sync_directory()
+
+            old_segments = sorted(self._readers)
+            self._close_files()
+            for segment in old_segments:
+                os.remove(self._path(segment))
+            self._index = index
+            self._open_active(target, size)
+            self._total_bytes = self._live_bytes = size
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._close_files()
+
+    def __enter__(self) -> JsonLinesStore:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    # ---------- Internals ----------
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}{segment:08d}{_SUFFIX}")
+
+    def _entry(self, file_id: str) -> _Entry:
+        entry = self._index.get(file_id)
+        if entry is None:
+            raise FileNotFoundError(f"File with ID '{file_id}' not found.")
+        return entry
+
+    def _value(self, location: Location) -> Any:
+        segment, offset, length = location
+        return json_codec.loads(os.pread(self._readers[segment], length, offset))["v"]
+
+    def _records(self, entry: _Entry) -> Iterator[Any]:
+        if entry.base is not None:
+            yield from self._value(entry.base)
+        for location in entry.items:
+            yield self._value(location)
+
+    def _release(self, entry: _Entry | None) -> None:
+        """Account the lines of a replaced or deleted value as garbage."""
+        if entry is not None:
+            if entry.base is not None:
+                self._live_bytes -= entry.base[2]
+            self._live_bytes -= sum(location[2] for location in entry.items)
+
+    @staticmethod
+    def _write_line(fd: int, segment: int, offset: int, op: str, file_id: str | None, value: Any) -> Location:
+        line = json_codec.dumps({"op": op, "k": file_id, "v": value}) + b"\n"
+        os.write(fd, line)
+        return segment, offset, len(line)
+
+    def _append(self, op: str, file_id: str, value: Any) -> Location:
+        if self._active_size >= self.segment_bytes:
+            self.flush()
+            self._open_active(self._active + 1, 0)
+        location = self._write_line(self._active_fd, self._active, self._active_size, op, file_id, value)
+        self._active_size += location[2]
+        self._total_bytes += location[2]
+        self._unsynced += 1
+        return location
+
+    def _after_write(self) -> None:
+        if self._unsynced >= self.sync_every or time.monotonic() - self._synced_at >= self.sync_interval:
+            self.flush()
+        garbage = self._total_bytes - self._live_bytes
+        if self._total_bytes >= self.compact_min_bytes and garbage >= self.compact_ratio * self._total_bytes:
+            self.compact()
+
+    def _open_active(self, segment: int, size: int) -> None:
+        if self._active_fd >= 0:
+            os.close(self._active_fd)
+        path = self._path(segment)
+        self._active_fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if segment not in self._readers:
+            self._readers[segment] = os.open(path, os.O_RDONLY)
+        self._active, self._active_size = segment, size
+        self._unsynced = 0
+
+    def _close_files(self) -> None:
+        if self._active_fd >= 0:
+            os.close(self._active_fd)
+            self._active_fd = -1
+        for fd in self._readers.values():
+            os.close(fd)
+        self._readers.clear()
+
+    def _sync_directory(self) -> None:
+        if hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _segments(self) -> list[int]:
+        segments = []
+        for filename in os.listdir(self.directory):
+            if filename.startswith(self.prefix) and filename.endswith(_TMP_SUFFIX):
+                # A compaction that never reached its rename.
+                os.remove(os.path.join(self.directory, filename))
+            elif filename.startswith(self.prefix) and filename.endswith(_SUFFIX):
+                number = filename[len(self.prefix) : -len(_SUFFIX)]
+                if number.isdigit():
+                    segments.append(int(number))
+        return sorted(segments)
+
+    def _recover(self) -> None:
+        """Rebuild the index from the segments; the only full scan the store ever does."""
+        segments = self._segments()
+        # Start from the newest compacted segment: whatever precedes it is already folded in.
+        for position in range(len(segments) - 1, -1, -1):
+            if self._is_compacted(segments[position]):
+                for segment in segments[:position]:
+                    os.remove(self._path(segment))
+                segments = segments[position:]
+                break
+
+        size = 0
+        for segment in segments:
+            self._readers[segment] = os.open(self._path(segment), os.O_RDONLY)
+            size = self._replay(segment, last=segment == segments[-1])
+            self._total_bytes += size
+        self._live_bytes = sum(
+            (entry.base[2] if entry.base is not None else 0) + sum(location[2] for location in entry.items)
+            for entry in self._index.values()
+        )
+        self._open_active(segments[-1] if segments else 1, size)
+
+    def _is_compacted(self, segment: int) -> bool:
+        with open(self._path(segment), "rb") as file:
+            first = file.readline()
+        try:
+            return first.endswith(b"\n") and json_codec.loads(first)["op"] == _COMPACTED
+        except ValueError:
+            return False
+
+    def _replay(self, segment: int, last: bool) -> int:
+        offset = 0
+        with open(self._path(segment), "rb") as file:
+            for line in file:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    change = json_codec.loads(line)
+                except ValueError:
+                    if not last:
+                        raise ValueError(f"Corrupt record in '{self._path(segment)}' at offset {offset}.")
+                    # A write torn by a crash: drop it, and everything after it, from the log.
+                    os.truncate(self._path(segment), offset)
+                    break
+                location = (segment, offset, len(line))
+                op, file_id = change["op"], change["k"]
+                if op == _SET:
+                    value = change["v"]
+                    self._index[file_id] = _Entry(location, len(value) if isinstance(value, list) else -1)
+                elif op == _ADD:
+                    self._index.setdefault(file_id, _Entry()).items.append(location)
+                elif op == _DEL:
+                    self._index.pop(file_id, None)
+                offset += len(line)
+        return offset
@@ -20,6 +20,12 @@ from src.modules.chats.application.conversation_lifecycle.start_conversation.com
 from src.modules.chats.application.conversation_lifecycle.start_conversation.handler import (
     StartConversationHandler,
 )
+from src.modules.chats.application.maintenance.rebuild_conversation_summaries.command import (
+    RebuildConversationSummariesCommand,
+)
+from src.modules.chats.application.maintenance.rebuild_conversation_summaries.handler import (
+    RebuildConversationSummariesHandler,
+)
 from src.modules.chats.application.membership.add_member.command import AddMemberCommand
 from src.modules.chats.application.membership.add_member.handler import AddMemberHandler
 from src.modules.chats.application.membership.change_member_role.command import ChangeMemberRoleCommand
@@ -32,6 +38,8 @@ from src.modules.chats.application.messaging.edit_message.command import EditMes
 from src.modules.chats.application.messaging.edit_message.handler import EditMessageHandler
 from src.modules.chats.application.messaging.send_message.command import SendMessageCommand
 from src.modules.chats.application.messaging.send_message.handler import SendMessageHandler
+from src.modules.chats.application.queries.export_conversations.handler import ExportConversationsHandler
+from src.modules.chats.application.queries.export_conversations.query import ExportConversationsQuery
 from src.modules.chats.application.queries.get_conversation_details.handler import GetConversationDetailsHandler
 from src.modules.chats.application.queries.get_conversation_details.query import GetConversationDetailsQuery
 from src.modules.chats.application.queries.list_messages.handler import ListMessagesHandler
@@ -40,6 +48,8 @@ from src.modules.chats.application.queries.list_user_conversations.handler impor
 from src.modules.chats.application.queries.list_user_conversations.query import ListUserConversationsQuery
 from src.modules.chats.domain.messages.interfaces.response_generator import ResponseGenerator
 
+from ..profanity_wordlist import install_wordlist
+from ..services.export import DOWNLOADERS
 from .containers import ChatDIContainer
 
 log = logging.getLogger(__name__)
@@ -82,9 +92,16 @@ HANDLER_REGISTRY: dict[Type[Any], Callable[[ChatDIContainer], object]] = {
     ),
     DeleteMessageCommand: lambda c: DeleteMessageHandler(c.repository.message_repository()),
     # Queries
-    GetConversationDetailsQuery: lambda c: GetConversationDetailsHandler(c.repository.conversation_repository()),
+    GetConversationDetailsQuery: lambda c: GetConversationDetailsHandler(c.repository.conversation_read_model()),
     ListMessagesQuery: lambda c: ListMessagesHandler(c.repository.message_repository()),
-    ListUserConversationsQuery: lambda c: ListUserConversationsHandler(c.repository.conversation_repository()),
+    ListUserConversationsQuery: lambda c: ListUserConversationsHandler(c.repository.conversation_read_model()),
+    ExportConversationsQuery: lambda c: ExportConversationsHandler(
+        c.repository.conversation_read_model(), DOWNLOADERS
+    ),
+    # Maintenance
+    RebuildConversationSummariesCommand: lambda c: RebuildConversationSummariesHandler(
+        c.repository.conversation_summary_projector()
+    ),
 }
 
 
@@ -105,6 +122,7 @@ class ChatsStartUp:
         *,
         database_url: str,
         max_active_chats_per_user: int,
+        profanity_wordlist_path: str | None = None,
     ) -> "ChatsStartUp":
         """Create container, load config dict, init resources, wire."""
         if not database_url:
@@ -115,6 +133,9 @@ class ChatsStartUp:
         }
 
         try:
+            if profanity_wordlist_path:
+                install_wordlist(profanity_wordlist_path)
+
             self._session_factory = SQLAlchemySessionFactory.acquire(database_url)
             self._container = ChatDIContainer(config=config, session_factory=self._session_factory)
             # expected: {"database": {"url": "..."}}
@@ -122,6 +143,9 @@ class ChatsStartUp:
             # Order: init resources, then wire packages using Provide[...] markers
             self._container.init_resources()
 
+            # Keep the conversation summaries read table in step with published domain events
+            self._container.conversation_summary_projector().subscribe(self._container.event_bus())
+
             # Build mediator and register all command/query handlers
             mediator = self._container.mediator()
             for message_type, handler_factory in HANDLER_REGISTRY.items():
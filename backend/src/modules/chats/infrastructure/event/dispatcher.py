@@ -1,25 +1,22 @@
-from .....building_blocks.domain.events import DomainEvent
+from .....building_blocks.infrastructure.event_bus import EventBus
 
 
-class EventDispatcher:
+class EventDispatcher(EventBus):
     """
     Handles the dispatching of domain events to listeners.
-    """
 
-    def __init__(self):
-        self.listeners = {}
+    Kept as the chats-facing name for :class:`EventBus`; listeners may be sync, async
+    or batch (``handle_many``) handlers.
+    """
 
     def register_listener(self, event_type, listener):
         """
         Registers a listener for a specific event type.
         """
-        if event_type not in self.listeners:
-            self.listeners[event_type] = []
-        self.listeners[event_type].append(listener)
+        self.subscribe(event_type, listener)
 
-    def dispatch(self, event: DomainEvent):
+    def dispatch(self, event):
         """
         Dispatches an event to the registered listeners.
         """
-        for listener in self.listeners.get(type(event), []):
-            listener(event)
+        self.publish(event)
@@ -1,16 +1,18 @@
-from ..messages.events.message_pinned import MessageAddedEvent
+from ...domain.conversations.events.message_added import MessageAddedEvent
 
 
 class MessageAddedEventHandler:
-    def handle(self, event: MessageAddedEvent):
+    async def handle(self, event: MessageAddedEvent):
         """
         Handle the MessageAddedEvent and trigger any necessary side effects.
+
+        Async so the bus runs it off the publishing command's path.
         """
         print(f"Message {event.message_id} added to conversation {event.conversation_id}")
         # Perform any necessary actions here, like sending notifications
-        self._send_notification(event)
+        await self._send_notification(event)
 
-    def _send_notification(self, event: MessageAddedEvent):
+    async def _send_notification(self, event: MessageAddedEvent):
         """
         Send a notification after the message has been added.
         """
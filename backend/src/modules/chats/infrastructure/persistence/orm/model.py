@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from ......database.models import BaseSQLModel
@@ -9,6 +9,8 @@ from ......database.models import BaseSQLModel
 
 class ConversationDBModel(BaseSQLModel):
     __tablename__ = "conversations"
+    # Leading creator_id serves the per-user filters; updated_at lets ordered listings skip a sort.
+    __table_args__ = (Index("ix_conversations_creator_id_updated_at", "creator_id", "updated_at"),)
 
     # Override default integer PK with UUID string PK
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -23,6 +25,11 @@ class ConversationDBModel(BaseSQLModel):
 
 class MessageDBModel(BaseSQLModel):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Per-conversation history in chronological order, and the summary "last message" lookup.
+        Index("ix_messages_conversation_id_timestamp", "conversation_id", "timestamp"),
+        Index("ix_messages_sender_id", "sender_id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     content = Column(String, nullable=False)
@@ -48,3 +55,19 @@ class MemberDBModel(BaseSQLModel):
 
     conversations = relationship("ConversationDBModel", back_populates="members")
     messages = relationship("MessageDBModel", back_populates="sender")
+
+
+class ConversationSummaryDBModel(BaseSQLModel):
+    """Denormalized read table for conversation lists, maintained from domain events."""
+
+    __tablename__ = "conversation_summaries"
+    __table_args__ = (Index("ix_conversation_summaries_creator_activity", "creator_id", "last_activity_at"),)
+
+    # Same value as ``conversations.id``; no foreign key so the table can be dropped and rebuilt freely.
+    id = Column(String, primary_key=True)
+    creator_id = Column(String, nullable=False)
+    title = Column(String, default="")
+    is_archived = Column(Boolean, default=False)
+    message_count = Column(Integer, nullable=False, default=0)
+    last_message_preview = Column(String, nullable=True)
+    last_activity_at = Column(DateTime, nullable=True)
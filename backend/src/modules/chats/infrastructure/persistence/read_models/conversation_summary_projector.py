@@ -0,0 +1,168 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from sqlalchemy import delete, exists, func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from src.building_blocks.infrastructure.event_bus import EventBus
+
+from ....application.queries.read_model import AbstractConversationSummaryProjection
+from ....domain.conversations.events import (
+    ConversationArchivedEvent,
+    ConversationCreatedEvent,
+    ConversationDeletedEvent,
+    ConversationRenamedEvent,
+    ConversationTitleUpdatedEvent,
+    ParticipantAddedEvent,
+    ParticipantRoleChangedEvent,
+)
+from ....domain.messages.events import MessageCreatedEvent
+from ..orm.model import ConversationDBModel, ConversationSummaryDBModel, MessageDBModel
+
+PREVIEW_LENGTH = 120
+
+Summary = ConversationSummaryDBModel
+
+
+class ConversationSummaryProjector(AbstractConversationSummaryProjection):
+    """
+    Keeps ``conversation_summaries`` in step with domain events.
+
+    Every handler is a single set-based statement against one summary row, so the
+    cost of an event does not grow with the number of messages in the conversation.
+    A handler that finds no row (e.g. events published before a backfill) rebuilds
+    that conversation's row from the source tables instead.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self._session_factory = session_factory
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        event_bus.subscribe(ConversationCreatedEvent, self.on_conversation_created)
+        event_bus.subscribe(ConversationRenamedEvent, self.on_conversation_renamed)
+        event_bus.subscribe(ConversationTitleUpdatedEvent, self.on_conversation_renamed)
+        event_bus.subscribe(ConversationArchivedEvent, self.on_conversation_archived)
+        event_bus.subscribe(ConversationDeletedEvent, self.on_conversation_deleted)
+        event_bus.subscribe(MessageCreatedEvent, self.on_message_created)
+        event_bus.subscribe(ParticipantAddedEvent, self.on_participant_changed)
+        event_bus.subscribe(ParticipantRoleChangedEvent, self.on_participant_changed)
+
+    # ---------- Event handlers ----------
+
+    def on_conversation_created(self, event: ConversationCreatedEvent) -> None:
+        conversation_id = str(event.conversation_id)
+        row = {
+            "id": conversation_id,
+            "creator_id": str(event.creator_id),
+            "title": event.title,
+            "is_archived": False,
+            "message_count": 0,
+            "last_activity_at": event.occurred_on,
+            "created_at": event.occurred_on,
+            "updated_at": event.occurred_on,
+        }
+        # Insert only when absent: a redelivered event, or an earlier event that already
+        # rebuilt the row from the source tables, leaves the existing (newer) row as it is.
+        source = select(*(literal(value, Summary.__table__.c[name].type) for name, value in row.items())).where(
+            ~exists().where(Summary.id == conversation_id)
+        )
+        with self._session_factory() as session:
+            session.execute(insert(Summary).from_select(list(row), source))
+            session.commit()
+
+    def on_conversation_renamed(self, event: ConversationRenamedEvent | ConversationTitleUpdatedEvent) -> None:
+        title = event.new_name if isinstance(event, ConversationRenamedEvent) else event.new_title
+        self._apply(event.conversation_id, title=title, updated_at=event.occurred_on)
+
+    def on_conversation_archived(self, event: ConversationArchivedEvent) -> None:
+        self._apply(event.conversation_id, is_archived=True, updated_at=event.occurred_on)
+
+    def on_conversation_deleted(self, event: ConversationDeletedEvent) -> None:
+        with self._session_factory() as session:
+            session.execute(delete(Summary).where(Summary.id == str(event.conversation_id)))
+            session.commit()
+
+    def on_message_created(self, event: MessageCreatedEvent) -> None:
+        self._apply(
+            event.conversation_id,
+            message_count=Summary.message_count + 1,
+            last_message_preview=(event.text or "")[:PREVIEW_LENGTH],
+            last_activity_at=event.occurred_on,
+            updated_at=event.occurred_on,
+        )
+
+    def on_participant_changed(self, event: ParticipantAddedEvent | ParticipantRoleChangedEvent) -> None:
+        self._apply(event.conversation_id, last_activity_at=event.occurred_on, updated_at=event.occurred_on)
+
+    # ---------- Backfill ----------
+
+    def rebuild(self, conversation_ids: Iterable[str] | None = None) -> int:
+        """
+        Recompute summary rows from ``conversations`` and ``messages``.
+
+        Args:
+            conversation_ids: Restrict the rebuild to these conversations; ``None`` rebuilds the whole table.
+
+        Returns:
+            int: The number of summary rows written.
+        """
+        ids = None if conversation_ids is None else [str(conversation_id) for conversation_id in conversation_ids]
+
+        message_stats = select(
+            MessageDBModel.conversation_id.label("conversation_id"),
+            func.count().label("message_count"),
+            func.max(MessageDBModel.timestamp).label("last_message_at"),
+        ).group_by(MessageDBModel.conversation_id)
+        if ids is not None:
+            # Aggregate only the requested conversations instead of every message in the table.
+            message_stats = message_stats.where(MessageDBModel.conversation_id.in_(ids))
+        message_stats = message_stats.subquery()
+        last_preview = (
+            select(func.substr(MessageDBModel.content, 1, PREVIEW_LENGTH))
+            .where(MessageDBModel.conversation_id == ConversationDBModel.id)
+            .order_by(MessageDBModel.timestamp.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        source = select(
+            ConversationDBModel.id,
+            ConversationDBModel.creator_id,
+            ConversationDBModel.title,
+            ConversationDBModel.is_archived,
+            func.coalesce(message_stats.c.message_count, 0),
+            last_preview,
+            func.coalesce(message_stats.c.last_message_at, ConversationDBModel.updated_at),
+            ConversationDBModel.created_at,
+            literal(datetime.now(timezone.utc)),
+        ).outerjoin(message_stats, message_stats.c.conversation_id == ConversationDBModel.id)
+
+        clear = delete(Summary)
+        if ids is not None:
+            source = source.where(ConversationDBModel.id.in_(ids))
+            clear = clear.where(Summary.id.in_(ids))
+
+        columns = [
+            "id",
+            "creator_id",
+            "title",
+            "is_archived",
+            "message_count",
+            "last_message_preview",
+            "last_activity_at",
+            "created_at",
+            "updated_at",
+        ]
+        with self._session_factory() as session:
+            session.execute(clear)
+            written = session.execute(insert(Summary).from_select(columns, source)).rowcount
+            session.commit()
+        return written
+
+    def _apply(self, conversation_id: uuid.UUID | str, **values) -> None:
+        stmt = update(Summary).where(Summary.id == str(conversation_id)).values(**values)
+        with self._session_factory() as session:
+            matched = session.execute(stmt).rowcount
+            session.commit()
+        if not matched:
+            self.rebuild([str(conversation_id)])
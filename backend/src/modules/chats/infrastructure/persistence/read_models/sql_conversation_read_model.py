@@ -0,0 +1,182 @@
+import itertools
+from operator import attrgetter
+from typing import Callable, Generator, Iterator
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.building_blocks.infrastructure.tracing import traced_methods
+
+from ....application.queries.export_conversations.dto import (
+    ExportedConversationDTO,
+    ExportedMessageDTO,
+    Transcript,
+)
+from ....application.queries.get_conversation_details.dto import ConversationDetailsDTO
+from ....application.queries.list_user_conversations.dto import ConversationSummaryDTO, ConversationSummaryPageDTO
+from ....application.queries.list_user_conversations.query import ConversationSortField
+from ....application.queries.read_model import AbstractConversationReadModel
+from ..orm.model import ConversationDBModel, ConversationSummaryDBModel, MessageDBModel
+
+Summary = ConversationSummaryDBModel
+
+_SORT_COLUMNS = {
+    ConversationSortField.TITLE: Summary.title,
+    ConversationSortField.CREATED_AT: Summary.created_at,
+    ConversationSortField.UPDATED_AT: Summary.updated_at,
+    ConversationSortField.LAST_ACTIVITY_AT: Summary.last_activity_at,
+}
+
+
+@traced_methods("read_model")
+class SQLConversationReadModel(AbstractConversationReadModel):
+    """
+    Column-only projections into query DTOs.
+
+    Lists are served from the denormalized ``conversation_summaries`` table, so they
+    need no joins or aggregates over ``messages``; details read ``conversations``.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self._session_factory = session_factory
+
+    def list_summaries(
+        self,
+        user_id: UUID,
+        *,
+        limit: int,
+        offset: int,
+        sort_by: ConversationSortField,
+        descending: bool,
+        include_archived: bool,
+    ) -> ConversationSummaryPageDTO:
+        sort_column = _SORT_COLUMNS[sort_by]
+        # The id tie-breaker keeps pages stable when the sort column has duplicates.
+        if descending:
+            ordering = (sort_column.desc(), Summary.id.desc())
+        else:
+            ordering = (sort_column.asc(), Summary.id.asc())
+
+        stmt = select(
+            Summary.id,
+            Summary.title,
+            Summary.is_archived,
+            Summary.updated_at,
+            Summary.message_count,
+            Summary.last_message_preview,
+            Summary.last_activity_at,
+            # Window count: the total travels with every row, so page and count cost one round trip.
+            func.count().over().label("total"),
+        ).where(Summary.creator_id == str(user_id))
+        if not include_archived:
+            stmt = stmt.where(Summary.is_archived.is_(False))
+        stmt = stmt.order_by(*ordering).limit(limit).offset(offset)
+
+        with self._session_factory() as session:
+            rows = session.execute(stmt).all()
+            if rows:
+                total = rows[0].total
+            elif offset:
+                # Past the last page the window has no rows to ride on; only then pay for a separate count.
+                total = session.execute(
+                    select(func.count()).select_from(stmt.order_by(None).limit(None).offset(None).subquery())
+                ).scalar_one()
+            else:
+                total = 0
+
+        items = tuple(
+            ConversationSummaryDTO(
+                id=row.id,
+                title=row.title or "",
+                is_archived=bool(row.is_archived),
+                updated_at=row.updated_at,
+                message_count=row.message_count,
+                last_message_preview=row.last_message_preview,
+                last_activity_at=row.last_activity_at,
+            )
+            for row in rows
+        )
+        return ConversationSummaryPageDTO(items=items, total=int(total), limit=limit, offset=offset)
+
+    def get_details(self, conversation_id: UUID) -> ConversationDetailsDTO | None:
+        stmt = select(
+            ConversationDBModel.id,
+            ConversationDBModel.title,
+            ConversationDBModel.is_archived,
+            ConversationDBModel.creator_id,
+            ConversationDBModel.created_at,
+            ConversationDBModel.updated_at,
+        ).where(ConversationDBModel.id == str(conversation_id))
+
+        with self._session_factory() as session:
+            row = session.execute(stmt).one_or_none()
+
+        if row is None:
+            return None
+        return ConversationDetailsDTO(
+            id=row.id,
+            title=row.title or "",
+            is_archived=bool(row.is_archived),
+            creator_id=row.creator_id,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    def iter_transcripts(
+        self, user_id: UUID, *, conversation_id: UUID | None = None, batch_size: int = 500
+    ) -> Generator[Transcript, None, None]:
+        Conversation, Message = ConversationDBModel, MessageDBModel
+        # One ordered outer join instead of a query per conversation; conversations without
+        # messages still yield a (message-less) transcript.
+        stmt = (
+            select(
+                Conversation.id.label("conversation_id"),
+                Conversation.title,
+                Conversation.created_at.label("conversation_created_at"),
+                Message.id,
+                Message.sender_id,
+                Message.content,
+                Message.timestamp,
+                Message.feedback,
+            )
+            .outerjoin(Message, Message.conversation_id == Conversation.id)
+            .where(Conversation.creator_id == str(user_id))
+            .order_by(Conversation.created_at, Conversation.id, Message.timestamp, Message.id)
+            # yield_per streams results: a server-side cursor where the driver has one, and
+            # never more than batch_size ORM rows buffered either way.
+            .execution_options(yield_per=batch_size)
+        )
+        if conversation_id is not None:
+            stmt = stmt.where(Conversation.id == str(conversation_id))
+
+        # Closed explicitly rather than left to garbage collection: a caller that stops early
+        # (a download cut off by the client) closes the generator, which releases the cursor
+        # and returns the connection straight away.
+        session = self._session_factory()
+        try:
+            rows = session.execute(stmt)
+            try:
+                for _, group in itertools.groupby(rows, key=attrgetter("conversation_id")):
+                    first = next(group)
+                    conversation = ExportedConversationDTO(
+                        id=first.conversation_id, title=first.title or "", created_at=first.conversation_created_at
+                    )
+                    yield conversation, _messages(itertools.chain((first,), group))
+            finally:
+                rows.close()
+        finally:
+            session.close()
+
+
+def _messages(rows) -> Iterator[ExportedMessageDTO]:
+    for row in rows:
+        if row.id is None:  # the outer join's placeholder row for a conversation without messages
+            continue
+        yield ExportedMessageDTO(
+            id=row.id,
+            sender_id=row.sender_id,
+            content=row.content,
+            created_at=row.timestamp,
+            feedback=row.feedback,
+        )
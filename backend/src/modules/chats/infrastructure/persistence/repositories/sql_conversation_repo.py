@@ -5,23 +5,35 @@ from sqlalchemy import delete as sqla_delete
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from src.building_blocks.infrastructure.event_bus import EventBus
+from src.building_blocks.infrastructure.tracing import traced_methods
+
 from ....domain.conversations.conversation import Conversation
+from ....domain.conversations.entities.creator import Creator
 from ....domain.conversations.value_objects.conversation_id import ConversationId
 from ....domain.interfaces.conversation_repository import BaseConversationRepository
 from ....domain.members.value_objects.member_id import MemberId
-from ..orm.model import ConversationDBModel
+from ..orm.model import ConversationDBModel, ConversationSummaryDBModel
 
 
 def map_to_entity(row: ConversationDBModel) -> Conversation:
-    """Map a database row to a domain aggregate."""
+    """Map a database row to a domain aggregate without re-running domain rules or events."""
     if row is None:
         return None
-    creator_id = MemberId.create(row.creator_id)
-    # TODO: Prefer a rehydrate constructor that does not raise domain events.
-    conversation = Conversation.create(creator_id=creator_id, creator_name="", title=row.title)
-    conversation._id = ConversationId.create(uuid.UUID(str(row.id)))  # re-use persisted id
-    conversation._is_archived = row.is_archived  # re-use persisted archived flag
-    return conversation
+    creator = Creator.rehydrate(
+        member_id=MemberId(_value=uuid.UUID(str(row.creator_id))),
+        name="",
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+    return Conversation.rehydrate(
+        conversation_id=ConversationId(value=uuid.UUID(str(row.id))),
+        title=row.title,
+        creator=creator,
+        is_archived=bool(row.is_archived),
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
 
 
 def map_to_db(entity: Conversation) -> ConversationDBModel:
@@ -35,11 +47,13 @@ def map_to_db(entity: Conversation) -> ConversationDBModel:
     )
 
 
+@traced_methods("repository")
 class SQLConversationRepository(BaseConversationRepository):
     """SQL-based repository using an injected SQLAlchemy Session."""
 
-    def __init__(self, session_factory: Callable[[], Session]) -> None:
+    def __init__(self, session_factory: Callable[[], Session], event_bus: EventBus | None = None) -> None:
         self._session_factory = session_factory
+        self._event_bus = event_bus
 
     # ---------- Queries ----------
 
@@ -72,11 +86,13 @@ class SQLConversationRepository(BaseConversationRepository):
         with self._session_factory() as session:
             session.add(map_to_db(conversation))
             session.commit()
+        self._publish_events(conversation)
 
     def update(self, conversation: Conversation) -> None:
         with self._session_factory() as session:
             session.merge(map_to_db(conversation))
             session.commit()
+        self._publish_events(conversation)
 
     def delete(self, conversation_id: str) -> None:
         with self._session_factory() as session:
@@ -84,11 +100,24 @@ class SQLConversationRepository(BaseConversationRepository):
             if not row:
                 raise ValueError(f"Conversation with ID {conversation_id} does not exist.")
             session.delete(row)
+            # The summary row has no foreign key to cascade from; drop it in the same transaction.
+            session.execute(
+                sqla_delete(ConversationSummaryDBModel).where(ConversationSummaryDBModel.id == str(conversation_id))
+            )
             session.commit()
 
     def delete_all(self, user_id: str) -> None:
         # Bulk delete; if you need per-row hooks, load then delete.
         stmt = sqla_delete(ConversationDBModel).where(ConversationDBModel.creator_id == str(user_id))
+        summaries = sqla_delete(ConversationSummaryDBModel).where(
+            ConversationSummaryDBModel.creator_id == str(user_id)
+        )
         with self._session_factory() as session:
             session.execute(stmt)
+            session.execute(summaries)
             session.commit()
+
+    def _publish_events(self, conversation: Conversation) -> None:
+        # Publish only after commit so subscribers never observe uncommitted state.
+        if self._event_bus is not None:
+            self._event_bus.publish_many(conversation.pull_events())
@@ -0,0 +1,22 @@
+"""Loading the profanity wordlist used by the message content rules."""
+
+import logging
+from pathlib import Path
+
+from ..domain.messages.profanity import ProfanityFilter, use_profanity_filter
+
+log = logging.getLogger(__name__)
+
+
+def read_wordlist(path: str | Path) -> list[str]:
+    """One entry per line (UTF-8); blank lines and ``#`` comments are skipped."""
+    with open(path, encoding="utf-8") as wordlist:
+        return [entry for line in wordlist if (entry := line.split("#", 1)[0].strip())]
+
+
+def install_wordlist(path: str | Path, *, whole_words: bool = True) -> ProfanityFilter:
+    """Compile the wordlist at ``path`` and make it the process-wide profanity filter."""
+    matcher = ProfanityFilter(read_wordlist(path), whole_words=whole_words)
+    use_profanity_filter(matcher)
+    log.info("Loaded %d profanity wordlist entries from %s", matcher.size, path)
+    return matcher
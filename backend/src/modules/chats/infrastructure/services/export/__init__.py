@@ -0,0 +1,15 @@
+"""Streaming conversation exports: NDJSON, Markdown and ZIP downloaders."""
+
+from .downloaders import (
+    DOWNLOADERS,
+    MarkdownConversationDownloader,
+    NdjsonConversationDownloader,
+    ZipConversationDownloader,
+)
+
+__all__ = [
+    "DOWNLOADERS",
+    "MarkdownConversationDownloader",
+    "NdjsonConversationDownloader",
+    "ZipConversationDownloader",
+]
@@ -0,0 +1,175 @@
+"""
+Incremental conversation encoders.
+
+Each downloader turns a stream of transcripts into a stream of byte chunks of roughly
+``chunk_size`` bytes, reading one message at a time, so an export of any size is served
+in constant memory. The ZIP archive is written with :mod:`zipfile` onto an unseekable
+sink (sizes go in data descriptors after each entry), which lets entries be compressed
+and emitted while later conversations are still being read.
+"""
+
+import re
+import zipfile
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from src.building_blocks.infrastructure import json_codec
+
+from ....application.queries.export_conversations.downloader import AbstractConversationDownloader
+from ....application.queries.export_conversations.dto import (
+    ExportedConversationDTO,
+    ExportedMessageDTO,
+    Transcript,
+)
+from ....application.queries.export_conversations.query import ExportFormat
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _chunked(parts: Iterable[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Coalesce small writes so the response is not sent one message per frame."""
+    buffer = bytearray()
+    for part in parts:
+        buffer += part
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+class NdjsonConversationDownloader(AbstractConversationDownloader):
+    """One JSON object per line: a ``conversation`` record followed by its ``message`` records."""
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+
+    def download(self, transcripts: Iterable[Transcript]) -> Iterator[bytes]:
+        return _chunked(self._lines(transcripts), self.chunk_size)
+
+    def _lines(self, transcripts: Iterable[Transcript]) -> Iterator[bytes]:
+        dumps = json_codec.dumps
+        for conversation, messages in transcripts:
+            yield (
+                dumps(
+                    {
+                        "type": "conversation",
+                        "id": conversation.id,
+                        "title": conversation.title,
+                        "created_at": _isoformat(conversation.created_at),
+                    }
+                )
+                + b"\n"
+            )
+            for message in messages:
+                yield (
+                    dumps(
+                        {
+                            "type": "message",
+                            "conversation_id": conversation.id,
+                            "id": message.id,
+                            "sender_id": message.sender_id,
+                            "content": message.content,
+                            "created_at": _isoformat(message.created_at),
+                            "feedback": message.feedback,
+                        }
+                    )
+                    + b"\n"
+                )
+
+
+class MarkdownConversationDownloader(AbstractConversationDownloader):
+    """A readable transcript; conversations are separated by horizontal rules."""
+
+    media_type = "text/markdown; charset=utf-8"
+    extension = "md"
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+
+    def download(self, transcripts: Iterable[Transcript]) -> Iterator[bytes]:
+        return _chunked(self._sections(transcripts), self.chunk_size)
+
+    def _sections(self, transcripts: Iterable[Transcript]) -> Iterator[bytes]:
+        for index, (conversation, messages) in enumerate(transcripts):
+            if index:
+                yield b"\n---\n\n"
+            yield from self.render(conversation, messages)
+
+    @staticmethod
+    def render(conversation: ExportedConversationDTO, messages: Iterable[ExportedMessageDTO]) -> Iterator[bytes]:
+        """The Markdown of one conversation, a heading and then one block per message."""
+        started = f", started {_isoformat(conversation.created_at)}" if conversation.created_at else ""
+        title = conversation.title or "Untitled conversation"
+        yield f"# {title}\n\n_Conversation {conversation.id}{started}_\n\n".encode()
+        for message in messages:
+            sent = f" · {_isoformat(message.created_at)}" if message.created_at else ""
+            block = f"**{message.sender_id or 'unknown'}**{sent}\n\n{message.content}\n\n"
+            if message.feedback:
+                block += f"> Feedback: {message.feedback}\n\n"
+            yield block.encode()
+
+
+class _ZipSink:
+    """The write end of a streamed archive; :mod:`zipfile` treats it as unseekable."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+class ZipConversationDownloader(AbstractConversationDownloader):
+    """A deflated ZIP archive with one Markdown file per conversation."""
+
+    media_type = "application/zip"
+    extension = "zip"
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+
+    def download(self, transcripts: Iterable[Transcript]) -> Iterator[bytes]:
+        sink = _ZipSink()
+        # The archive keeps one ZipInfo per entry for the central directory, never the contents.
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for conversation, messages in transcripts:
+                # force_zip64: the entry's size is unknown until it is written.
+                with archive.open(self._entry(conversation), "w", force_zip64=True) as entry:
+                    for part in MarkdownConversationDownloader.render(conversation, messages):
+                        entry.write(part)
+                        if len(sink.buffer) >= self.chunk_size:
+                            yield sink.drain()
+        yield sink.drain()
+
+    @staticmethod
+    def _entry(conversation: ExportedConversationDTO) -> zipfile.ZipInfo:
+        stem = re.sub(r"[^\w\- ]+", "", conversation.title).strip()[:60] or "conversation"
+        info = zipfile.ZipInfo(f"{stem}-{conversation.id}.md")
+        if conversation.created_at is not None and conversation.created_at.year >= 1980:
+            info.date_time = conversation.created_at.timetuple()[:6]
+        info.compress_type = zipfile.ZIP_DEFLATED
+        return info
+
+
+DOWNLOADERS: dict[ExportFormat, AbstractConversationDownloader] = {
+    ExportFormat.NDJSON: NdjsonConversationDownloader(),
+    ExportFormat.MARKDOWN: MarkdownConversationDownloader(),
+    ExportFormat.ZIP: ZipConversationDownloader(),
+}
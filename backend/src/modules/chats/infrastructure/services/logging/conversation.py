@@ -1,37 +1,78 @@
 import logging
+import threading
+from logging.handlers import TimedRotatingFileHandler
+from typing import Any, Optional
 
-from .config import LoggerConfig
+from src.building_blocks.infrastructure.logging_pipeline import ContextLogger, QueueLogging, SamplingFilter
+
+from .config import LoggerConfig, Style
+
+# The queue listener running for each logger name. ``logging.getLogger`` shares a logger
+# between every ConversationLogger on a name, so its listener is tracked per name too.
+_active_queues: dict[str, QueueLogging] = {}
+_active_queues_lock = threading.Lock()
 
 
 class ColoredFormatter(logging.Formatter):
     """Formatter that adds color to log level names."""
 
-    def __init__(self, fmt: str, log_colors: dict):
+    def __init__(self, fmt: str, log_colors: Optional[dict]):
         super().__init__(fmt)
-        self.log_colors = log_colors
+        self.log_colors = log_colors or {}
 
     def format(self, record):
-        log_color = self.log_colors.get(record.levelno, Fore.WHITE)
-        record.levelname_color = f"{log_color}{record.levelname}{Style.RESET_ALL}"
+        log_color = self.log_colors.get(record.levelno)
+        levelname = record.levelname
+        record.levelname_color = f"{log_color}{levelname}{Style.RESET_ALL}" if log_color else levelname
         return super().format(record)
 
 
+class ConversationContextLogger(ContextLogger):
+    """
+    A conversation logger bound to one user and conversation.
+
+    The ids travel as record attributes (``user_id``, ``conversation_id``) and as a message
+    prefix, both built once at bind time.
+    """
+
+    def __init__(self, logger: logging.Logger, context: dict[str, Any]):
+        super().__init__(logger, context)
+        self._prefix = f"Conversation {context.get('conversation_id')} | User {context.get('user_id')}: "
+
+    def bind(self, **context: Any) -> "ConversationContextLogger":
+        return ConversationContextLogger(self.logger, {**self.extra, **context})
+
+    def process(self, msg: Any, kwargs: dict[str, Any]) -> tuple[Any, dict[str, Any]]:
+        return super().process(f"{self._prefix}{msg}", kwargs)
+
+    def event(self, event_name: str, level: int = logging.INFO, stacklevel: int = 1, **extra):
+        """Log a conversation event (e.g. ``message_sent``); DEBUG events are subject to sampling."""
+        if self.logger.isEnabledFor(level):
+            # Attribute the record to the caller, which is also what sampling counts by.
+            extra = {"event_name": event_name, **extra}
+            self.log(level, "Event %s", event_name, extra=extra, stacklevel=stacklevel + 1)
+
+
 class ConversationLogger:
     """
     A unified logger for managing conversation logs. Can log to console, file, or both.
+
+    Handlers run on a background listener thread: a log call only enqueues the record, so
+    console and file I/O stay off the request path. Call :meth:`close` to flush and stop it.
     """
 
-    def __init__(self, config: LoggerConfig):
+    def __init__(self, config: LoggerConfig, name: str = "conversation_logger"):
         """
         Initialize the logger with the provided configuration.
         The logger will be set up based on whether logging is enabled for console and/or file.
         """
         self.config = config
-        self.logger = logging.getLogger("conversation_logger")
+        self.logger = logging.getLogger(name)
+        self._queue_logging: Optional[QueueLogging] = None
         self._configure_logger()
 
     def _configure_logger(self):
-        """Configure the logger with console and file handlers based on the config."""
+        """Configure the logger with console and file handlers, behind a queue, based on the config."""
         handlers = []
         level = self.config.level.upper()
 
@@ -52,13 +93,51 @@ class ConversationLogger:
                 encoding=self.config.encoding,
             )
             file_handler.setLevel(level)
-            file_handler.setFormatter(logging.Formatter(self.config.format))
+            file_handler.setFormatter(ColoredFormatter(self.config.format, log_colors=None))
             handlers.append(file_handler)
 
-        # Add handlers to the logger
+        # Replace, rather than add to, the handlers (and listener) of an earlier ConversationLogger on this name
+        with _active_queues_lock:
+            previous = _active_queues.pop(self.logger.name, None)
+        if previous is not None:
+            previous.stop()
+        self._close_handlers()
         self.logger.setLevel(level)
-        for handler in handlers:
-            self.logger.addHandler(handler)
+        self.logger.propagate = False
+        self.logger.handlers = handlers
+        filters = [SamplingFilter(self.config.debug_sample_every)] if self.config.debug_sample_every > 1 else []
+        if self.config.use_queue:
+            self._queue_logging = QueueLogging([self.logger], filters=filters).start()
+            with _active_queues_lock:
+                _active_queues[self.logger.name] = self._queue_logging
+        else:
+            for record_filter in filters:
+                self.logger.addFilter(record_filter)
+
+    def close(self):
+        """Write out queued records and close the handlers."""
+        if self._queue_logging is not None:
+            with _active_queues_lock:
+                replaced = _active_queues.get(self.logger.name) is not self._queue_logging
+                if not replaced:
+                    del _active_queues[self.logger.name]
+            queue_logging, self._queue_logging = self._queue_logging, None
+            if replaced:
+                # A newer ConversationLogger on this name already stopped our listener and owns the handlers.
+                return
+            queue_logging.stop()
+        self._close_handlers()
+
+    def _close_handlers(self):
+        for handler in self.logger.handlers:
+            handler.close()
+        self.logger.handlers = []
+        self.logger.filters = []
+
+    def bind(self, user_id: str, conversation_id: str, **context) -> ConversationContextLogger:
+        """A logger for one conversation; bind once per request instead of passing ids to every call."""
+        context = {"user_id": user_id, "conversation_id": conversation_id, **context}
+        return ConversationContextLogger(self.logger, context)
 
     def log_message(self, user_id: str, conversation_id: str, message: str, level: int = logging.INFO, **extra):
         """
@@ -71,15 +150,8 @@ class ConversationLogger:
             level (int): The log level (default: logging.INFO).
             **extra: Additional context (e.g., timestamps, IP address, etc.).
         """
-        log_data = {
-            "user_id": user_id,
-            "conversation_id": conversation_id,
-            "message": message,
-        }
-        log_data.update(extra)
-
-        log_message = f"Conversation {conversation_id} | User {user_id}: {message}"
-        self._log(level, log_message, extra=log_data)
+        if self.logger.isEnabledFor(level):
+            self.bind(user_id, conversation_id).log(level, message, extra=extra or None, stacklevel=2)
 
     def log_error(self, error: str, user_id: str = None, conversation_id: str = None, **extra):
         """
@@ -91,27 +163,8 @@ class ConversationLogger:
             conversation_id (str, optional): The ID of the conversation, if applicable.
             **extra: Additional context (e.g., error details, stack traces).
         """
-        log_data = {
-            "error": error,
-            "user_id": user_id,
-            "conversation_id": conversation_id,
-        }
-        log_data.update(extra)
-
-        error_message = f"Conversation error: {error}"
-        self._log(logging.ERROR, error_message, extra=log_data)
-
-    def _log(self, level: int, message: str, extra: dict):
-        """
-        A helper method to log messages at different levels, while adding extra context.
-
-        Args:
-            level (int): The log level.
-            message (str): The log message content.
-            extra (dict): Additional context for the log message.
-        """
-        extra["levelname"] = logging.getLevelName(level)
-        self.logger.log(level, message, extra=extra)
+        context = {"error": error, "user_id": user_id, "conversation_id": conversation_id, **extra}
+        self.logger.error("Conversation error: %s", error, extra=context, stacklevel=2)
 
     def log_event(self, event_name: str, user_id: str, conversation_id: str, **extra):
         """
@@ -124,13 +177,5 @@ class ConversationLogger:
             conversation_id (str): The ID of the conversation.
             **extra: Additional context (e.g., message data, timestamps).
         """
-        log_data = {
-            "event_name": event_name,
-            "user_id": user_id,
-            "conversation_id": conversation_id,
-        }
-        log_data.update(extra)
-
-        event_message = f"Event {event_name} for Conversation {conversation_id} | User {user_id}"
-        self._log(logging.INFO, event_message, extra=log_data)
-        self._log(logging.INFO, event_message, extra=log_data)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.bind(user_id, conversation_id).event(event_name, stacklevel=2, **extra)
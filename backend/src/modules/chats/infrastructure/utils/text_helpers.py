@@ -1,6 +1,3 @@
-import markdown
-
-
 class AnsiColors:
     """
     Class to define ANSI color codes for terminal output.
@@ -85,6 +82,8 @@ def format_text_for_html(text: str) -> str:
         result = format_text_for_html(text)
         # Output: 'This is a line.<br>This is another line.'
     """
+    import markdown
+
     output = markdown.markdown(text, extensions=["fenced_code"])
     output = replacer(output)
     return output
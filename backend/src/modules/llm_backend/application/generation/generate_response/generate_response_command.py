@@ -5,6 +5,7 @@ from ...contracts.command import BaseCommand
 class GenerateResponseCommand(BaseCommand[ResponseGenerator]):
     query: str
     user_id: str
+    token_id: str
 
     class Config:
         schema_extra = {
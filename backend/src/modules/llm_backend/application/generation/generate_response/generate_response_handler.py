@@ -1,14 +1,25 @@
+from src.building_blocks.application.rate_limiter import RateLimiter
+from src.building_blocks.domain.exceptions import RateLimitExceededException
+
 from ....domain import ResponseGenerator, Responses
 from ....domain.model.root import ModelInteraction
+from ....domain.token.repositories import TokenRepository
 from ...configuration.command_handler import BaseCommandHandler
 from .generate_response_command import GenerateResponseCommand
 
 
 class GenerateResponseCommandHandler(BaseCommandHandler[GenerateResponseCommand, str]):
-    def __init__(self, repository: Responses):
+    def __init__(self, repository: Responses, token_repository: TokenRepository, rate_limiter: RateLimiter):
         self._repository = repository
+        self._token_repository = token_repository
+        self._rate_limiter = rate_limiter
 
     def handle(self, command: GenerateResponseCommand) -> str:
+        # Checked before generation so an over-limit token never reaches the model.
+        decision = self._token_repository.get_token(command.token_id).acquire_request(self._rate_limiter)
+        if not decision.allowed:
+            raise RateLimitExceededException(retry_after=decision.retry_after)
+
         response = LLMQueryProcessingPipeline().process(command.query)
 
         model_interaction = ModelInteraction.create(
@@ -0,0 +1,51 @@
+from typing import Any
+
+from dependency_injector.wiring import Provide, inject
+
+from src.building_blocks.infrastructure.pipeline import PipelineExecutionError, PipelineStage
+from src.modules.llm_backend.infrastructure.configuration.di.containers import LLMBackendContainer
+from src.modules.llm_backend.infrastructure.processing.memory import ConversationMemory
+
+
+class ConversationWindowStage(PipelineStage):
+    """Loads the conversation's token-bounded window, for the prompt formatter to carry."""
+
+    @inject
+    def __init__(
+        self, memory: ConversationMemory = Provide[LLMBackendContainer.processing.conversation_memory]
+    ) -> None:
+        self.memory = memory
+
+    def process(self, data: dict[str, Any]) -> dict[str, Any]:
+        try:
+            conversation_id = data.get("conversation_id")
+            if conversation_id is not None:
+                data["conversation_window"] = self.memory.window(str(conversation_id))
+            return data
+        except Exception as e:
+            raise PipelineExecutionError(
+                stage=self.__class__.__name__, message=f"Loading the conversation window failed: {str(e)}"
+            ) from e
+
+
+class ConversationTurnRecorderStage(PipelineStage):
+    """Records the finished turn, so the next prompt of the conversation includes it."""
+
+    @inject
+    def __init__(
+        self, memory: ConversationMemory = Provide[LLMBackendContainer.processing.conversation_memory]
+    ) -> None:
+        self.memory = memory
+
+    def process(self, data: dict[str, Any]) -> dict[str, Any]:
+        try:
+            conversation_id = data.get("conversation_id")
+            if conversation_id is not None:
+                data["conversation_window"] = self.memory.add_turn(
+                    str(conversation_id), data["prompt"], data["formatted_final_response"]
+                )
+            return data
+        except Exception as e:
+            raise PipelineExecutionError(
+                stage=self.__class__.__name__, message=f"Recording the conversation turn failed: {str(e)}"
+            ) from e
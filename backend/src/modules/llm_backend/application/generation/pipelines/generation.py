@@ -1,10 +1,19 @@
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from dependency_injector.wiring import Provide, inject
-from transformers import TextStreamer
 
 from ...infrastructure.configuration.di.llm_backend import LLMBackendContainer
-from ...infrastructure.processing.typedefs import LlmModel
+from ...infrastructure.processing.speculative import (
+    DEFAULT_NUM_ASSISTANT_TOKENS,
+    assisted_generation_kwargs,
+    check_draft_model,
+)
+from ...infrastructure.processing.typedefs import LlmModel, Tokenizer
+
+if TYPE_CHECKING:
+    from transformers import TextStreamer
 
 
 class ResponseGenerator:
@@ -14,13 +23,26 @@ class ResponseGenerator:
     def __init__(
         self,
         language_model: LlmModel = Provide[LLMBackendContainer.models.llm_model],
+        draft_model: LlmModel | None = Provide[LLMBackendContainer.models.draft_model],
+        tokenizer: Tokenizer = Provide[LLMBackendContainer.models.tokenizer],
+        draft_tokenizer: Tokenizer | None = Provide[LLMBackendContainer.models.draft_tokenizer],
+        num_assistant_tokens: int | None = Provide[LLMBackendContainer.config.models.num_assistant_tokens],
     ) -> None:
         """Initializes the ResponseGenerator with essential components.
 
         Args:
             language_model: The core language model for text generation
+            draft_model: Optional small model sharing the tokenizer; turns on speculative decoding
+            tokenizer: The language model's tokenizer, which the draft's must match
+            draft_tokenizer: The draft model's tokenizer
+            num_assistant_tokens: Tokens the draft model proposes per forward pass of the language model
+                (``models.num_assistant_tokens`` in the config; 5 when unset)
         """
+        if draft_model is not None:
+            check_draft_model(tokenizer, draft_tokenizer)
         self.language_model = language_model
+        self.draft_model = draft_model
+        self.num_assistant_tokens = num_assistant_tokens or DEFAULT_NUM_ASSISTANT_TOKENS
         self.default_temperature = 0.6
 
     def generate(
@@ -28,22 +50,30 @@ class ResponseGenerator:
         model_inputs: Any,
         temperature: float,
         streamer: TextStreamer | None = None,
+        do_sample: bool = True,
+        max_new_tokens: int = 512,
     ) -> Any:
         """Generates responses with configured parameters.
 
+        With a draft model, decoding is speculative: the same output under greedy decoding
+        (``do_sample=False``), the same distribution under sampling, in fewer target passes.
+
         Args:
             model_inputs: Preprocessed model inputs (tokenized + formatted)
-            temperature: Creativity control parameter
+            temperature: Creativity control parameter, when sampling
             streamer: Optional streaming interface
+            do_sample: Sample (the default) or decode greedily
+            max_new_tokens: Upper bound on the generated length
 
         Returns:
             Model's raw output for downstream processing
         """
-
+        sampling = {"temperature": temperature or self.default_temperature} if do_sample else {}
         return self.language_model.generate(
             **model_inputs,
-            max_new_tokens=512,
-            do_sample=True,
-            temperature=temperature or self.default_temperature,
+            max_new_tokens=max_new_tokens,
+            do_sample=do_sample,
             streamer=streamer,
+            **sampling,
+            **assisted_generation_kwargs(self.draft_model, self.num_assistant_tokens),
         )
@@ -7,6 +7,8 @@ from src.llm_backend.application.prompt.prompt_engineering import PromptFormatte
 from src.llm_backend.application.prompt.response_formatting import ResponseFormatter
 from src.llm_backend.application.prompt.response_validation import ResponseValidator
 
+from .conversation_memory import ConversationTurnRecorderStage, ConversationWindowStage
+
 
 class ContextDocumentFetcherStage(PipelineStage):
     """Fetches relevant context documents based on the input prompt."""
@@ -39,7 +41,9 @@ class AugmentedPromptFormatterStage(PipelineStage):
         try:
             user_query = data["prompt"]
             context_docs = data["fetched_documents"]
-            enriched_prompt = self.prompt_formatter.format(user_query=user_query, context_docs=context_docs)
+            enriched_prompt = self.prompt_formatter.format(
+                user_query=user_query, context_docs=context_docs, window=data.get("conversation_window")
+            )
             data["enriched_prompt"] = enriched_prompt
             return data
         except Exception as e:
@@ -164,22 +168,26 @@ class LLMQueryProcessingPipeline(Pipeline):
 
     This pipeline defines a clear process flow:
       1. Fetching context documents.
-      2. Enriching and formatting the prompt.
-      3. Tokenizing the prompt for model consumption.
-      4. Generating a response using the LLM.
-      5. Decoding the model's tokenized output.
-      6. Post-processing the decoded response.
-      7. Validating the final response for accuracy and relevance.
+      2. Loading the conversation's bounded history (when ``conversation_id`` is given).
+      3. Enriching and formatting the prompt.
+      4. Tokenizing the prompt for model consumption.
+      5. Generating a response using the LLM.
+      6. Decoding the model's tokenized output.
+      7. Post-processing the decoded response.
+      8. Recording the turn in the conversation's history.
+      9. Validating the final response for accuracy and relevance.
     """
 
     def __init__(self):
         self.stages = [
             ContextDocumentFetcherStage(),  # Fetches relevant context documents.
-            AugmentedPromptFormatterStage(),  # Formats prompt with contextual documents.
+            ConversationWindowStage(),  # Loads the conversation's token-bounded window.
+            AugmentedPromptFormatterStage(),  # Formats prompt with contextual documents and the window.
             ModelInputTokenizerStage(),  # Tokenizes the enriched prompt.
             LLMResponseGeneratorStage(),  # Generates response via LLM.
             ResponseDecoderStage(),  # Decodes tokenized output.
             ResponsePostProcessorStage(),  # Post-processes decoded response.
+            ConversationTurnRecorderStage(),  # Adds the finished turn to the window.
             ResponseAccuracyValidatorStage(),  # Validates response accuracy.
         ]
         super().__init__(self.stages)
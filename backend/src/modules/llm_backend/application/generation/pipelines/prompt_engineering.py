@@ -3,6 +3,7 @@ from typing import Any
 from dependency_injector.wiring import Provide, inject
 
 from ...infrastructure.configuration.di.llm_backend import LLMBackendContainer
+from ...infrastructure.processing.memory import ConversationWindow
 from ...infrastructure.processing.typedefs import LlmModel, Tokenizer
 
 
@@ -67,8 +68,8 @@ class PromptFormatter:
             for doc_index, (path, content, _) in enumerate(selected)
         )
 
-    def _create_chat_template(self, user_query: str, context: str) -> str:
-        """Generates Qwen-specific chat template"""
+    def _create_chat_template(self, user_query: str, context: str, window: ConversationWindow | None = None) -> str:
+        """Generates Qwen-specific chat template, with the conversation window between context and query"""
         return self.tokenizer.apply_chat_template(
             conversation=[
                 {
@@ -80,13 +81,25 @@ class PromptFormatter:
                     "The assistant answers with the correct Latex Code using $...$ for short formulas and $$...$$ for longer formulas.",
                 },
                 {"role": "system", "content": context},
+                *(window.messages() if window is not None else ()),
                 {"role": "user", "content": user_query},
             ],
             tokenize=False,  # Ensure this parameter is set to False, to avoid tokenizing the prompt
             add_generation_prompt=True,  # Enusre this pararmeter is set to True, to format the prompt in way that the model can understand as chat rather than just continuation of the context, so that the model can generate a response
         )
 
-    def format(self, user_query: str, context_docs: list[tuple[str, str, Any]]) -> str:
-        """Complete processing pipeline from raw inputs to model-ready format"""
+    def format(
+        self,
+        user_query: str,
+        context_docs: list[tuple[str, str, Any]],
+        window: ConversationWindow | None = None,
+    ) -> str:
+        """
+        Complete processing pipeline from raw inputs to model-ready format
+
+        Args:
+            window: The conversation so far, from ``ConversationMemory.window``; its token
+                budget is what bounds the prompt as the conversation grows
+        """
         context = self._build_context_from_docs(context_docs)
-        return self._create_chat_template(user_query, context)
+        return self._create_chat_template(user_query, context, window)
@@ -2,8 +2,6 @@
 import re
 from typing import Optional
 
-import markdown
-
 
 class ResponseFormatter:
     """Handles post-generation formatting and sanitization of LLM responses."""
@@ -32,4 +30,6 @@ class ResponseFormatter:
 
     def _convert_to_html(self, text: str) -> str:
         """Converts markdown formatted text to HTML."""
+        import markdown
+
         return markdown.markdown(text, extensions=self.markdown_extensions)
@@ -1,12 +1,15 @@
-from typing import List, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Tuple
 
-from bs4 import BeautifulSoup
 from dependency_injector.wiring import Provide, inject
-from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.core.node_parser.text.sentence import SentenceSplitter
 
 from ...infrastructure.configuration.di.llm_backend import LLMBackendContainer
 
+if TYPE_CHECKING:
+    from llama_index.core.base.embeddings.base import BaseEmbedding
+    from llama_index.core.node_parser.text.sentence import SentenceSplitter
+
 
 class ResponseValidator:
     """Class responsible for validating answers."""
@@ -42,6 +45,8 @@ class ResponseValidator:
         if answer is None or answer == "":
             return [""], [0]
 
+        from bs4 import BeautifulSoup
+
         answer = BeautifulSoup(markup=answer, features="html.parser").get_text()
 
         answer_sentences = self._split_sentences(answer)
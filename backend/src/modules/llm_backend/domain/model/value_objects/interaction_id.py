@@ -1,9 +1,10 @@
+from dataclasses import dataclass
 from uuid import UUID
 
 from src.building_blocks.domain.value_object import ValueObject
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class InteractionId(ValueObject):
     id: UUID
 
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.building_blocks.domain.value_object import ValueObject
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class Metadata(ValueObject):
     """
     Represents metadata about a pre-trained model.
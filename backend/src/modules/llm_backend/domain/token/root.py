@@ -1,21 +1,23 @@
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
+from src.building_blocks.application.rate_limiter import RateLimitDecision, RateLimiter
 from src.building_blocks.domain.aggregate_root import AggregateRoot
 
+RATE_LIMIT_PERIOD_SECONDS = 60.0
 
-@dataclass
-class Token(AggregateRoot):
+
+@dataclass(kw_only=True, eq=False)
+class Token(AggregateRoot[UUID]):
     """
     Represents an API token for accessing models.
     """
 
-    id: UUID
+    _id: UUID
     user_id: UUID
     token: str
     rate_limit: int  # Requests per minute
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     expires_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc) + timedelta(days=30))
 
     def is_valid(self) -> bool:
@@ -27,12 +29,23 @@ class Token(AggregateRoot):
         """
         return datetime.now(timezone.utc) < self.expires_at
 
-    def can_make_request(self) -> bool:
+    def acquire_request(self, limiter: RateLimiter) -> RateLimitDecision:
+        """
+        Spends one request from this token's per-minute allowance.
+
+        Args:
+            limiter (RateLimiter): Limiter holding the per-token counters.
+
+        Returns:
+            RateLimitDecision: Whether the request is admitted and, if not, when to retry.
+        """
+        return limiter.acquire(f"token:{self.id}", self.rate_limit, RATE_LIMIT_PERIOD_SECONDS)
+
+    def can_make_request(self, limiter: RateLimiter) -> bool:
         """
         Checks if the token can make a request based on rate limits.
 
         Returns:
             bool: True if the token can make a request, False otherwise.
         """
-        # Implement rate limiting logic here
-        return True
+        return self.is_valid() and self.acquire_request(limiter).allowed
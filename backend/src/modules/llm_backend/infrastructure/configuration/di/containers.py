@@ -1,10 +1,66 @@
 from dependency_injector import containers, providers
-from llama_index.core.node_parser.text.sentence import SentenceSplitter
 
 from ...processing.indexers import IndexBuilder
 from ...processing.loaders import ModelLoader, TokenizerLoader
 from ...processing.search_engines import VectorSearchEngine
-from ...processing.streamers import ChunkedTextStreamer
+
+
+# ``SentenceSplitter`` and ``ChunkedTextStreamer`` import llama_index and transformers; build them
+# through these functions so the imports happen when the providers are first called.
+def _sentence_splitter(**kwargs):
+    from llama_index.core.node_parser.text.sentence import SentenceSplitter
+
+    return SentenceSplitter(**kwargs)
+
+
+def _chunked_text_streamer(**kwargs):
+    from ...processing.streamers import ChunkedTextStreamer
+
+    return ChunkedTextStreamer(**kwargs)
+
+
+def _draft_model(model_name: str | None):
+    # Speculative decoding is off unless a draft model is configured.
+    if not model_name:
+        return None
+    return ModelLoader.load_llm_model(model_name)
+
+
+def _draft_tokenizer(model_name: str | None):
+    if not model_name:
+        return None
+    return TokenizerLoader.load_tokenizer(model_name)
+
+
+def _conversation_memory_store(store_dir: str | None):
+    # Windows are kept in the in-process cache only unless a directory is configured.
+    if not store_dir:
+        yield None
+        return
+    from src.modules.chats.infrastructure.configuration.processing.json.jsonl_store import JsonLinesStore
+
+    store = JsonLinesStore(store_dir)
+    try:
+        yield store
+    finally:
+        store.close()
+
+
+def _conversation_memory(tokenizer, store, window_tokens: int | None = None, summary_tokens: int | None = None):
+    from ...processing.memory import ConversationMemory, tokenizer_token_counter
+
+    budgets = {"window_tokens": window_tokens, "summary_tokens": summary_tokens}
+    return ConversationMemory(
+        store,
+        count_tokens=tokenizer_token_counter(tokenizer),
+        **{name: tokens for name, tokens in budgets.items() if tokens},
+    )
+
+
+def _mmap_search_engine(**kwargs):
+    from ...processing.mmap_index import MmapVectorSearchEngine
+
+    return MmapVectorSearchEngine(**kwargs)
 
 
 class SearchDIContainer(containers.DeclarativeContainer):
@@ -15,25 +71,47 @@ class SearchDIContainer(containers.DeclarativeContainer):
     embedding_model = providers.Dependency()
     sentence_splitter = providers.Dependency()
 
-    # Index construction
-    index_builder = providers.Resource(
+    # Index construction; only the "memory" format builds it, so it is created on first use.
+    index_builder = providers.Singleton(
         IndexBuilder,
         data_dir=config.processed_data_dir,
         embedding_model=embedding_model,
         sentence_splitter=sentence_splitter,
     )
 
-    # Search engine
-    search_engine = providers.Resource(VectorSearchEngine, index=index_builder.provided.index, top_k=config.top_k)
+    # Search engine. "memory" embeds the documents into a private in-process index; "mmap" maps
+    # the index prebuilt at ``mmap_index_dir`` (see ``mmap_index``), shared by all workers on a node.
+    search_engine = providers.Selector(
+        config.index_format,
+        memory=providers.Singleton(VectorSearchEngine, index=index_builder.provided.index, top_k=config.top_k),
+        mmap=providers.Singleton(
+            _mmap_search_engine,
+            index_dir=config.mmap_index_dir,
+            embedding_model=embedding_model,
+            top_k=config.top_k,
+        ),
+    )
 
 
 class ProcessingDIContainer(containers.DeclarativeContainer):
     """Container for text processing components"""
 
+    config = providers.Configuration()
+
     tokenizer = providers.Dependency()
 
     # Sentence splitting
-    sentence_splitter = providers.Factory(SentenceSplitter, paragraph_separator="\n\n\n", chunk_size=512)
+    sentence_splitter = providers.Factory(_sentence_splitter, paragraph_separator="\n\n\n", chunk_size=512)
+
+    # Token-bounded conversation history for prompts, counted with the model's tokenizer
+    conversation_memory_store = providers.Resource(_conversation_memory_store, config.store_dir)
+    conversation_memory = providers.Singleton(
+        _conversation_memory,
+        tokenizer=tokenizer,
+        store=conversation_memory_store,
+        window_tokens=config.window_tokens,
+        summary_tokens=config.summary_tokens,
+    )
 
 
 class ModelsDIContainer(containers.DeclarativeContainer):
@@ -45,9 +123,15 @@ class ModelsDIContainer(containers.DeclarativeContainer):
 
     llm_model = providers.Resource(ModelLoader.load_llm_model, config.llm_model_name)
 
+    # Small model sharing ``llm_model``'s tokenizer that proposes tokens for it to verify; ``None`` when unset.
+    draft_model = providers.Resource(_draft_model, config.draft_model_name)
+
+    # Checked against ``tokenizer`` before the draft is used; ``None`` when unset.
+    draft_tokenizer = providers.Resource(_draft_tokenizer, config.draft_model_name)
+
     tokenizer = providers.Resource(TokenizerLoader.load_tokenizer, config.llm_tokenizer_name)
 
-    text_streamer = providers.Factory(ChunkedTextStreamer, tokenizer=tokenizer, skip_prompt=config.skip_prompt)
+    text_streamer = providers.Factory(_chunked_text_streamer, tokenizer=tokenizer, skip_prompt=config.skip_prompt)
 
 
 class LLMBackendContainer(containers.DeclarativeContainer):
@@ -64,7 +148,7 @@ class LLMBackendContainer(containers.DeclarativeContainer):
     # Sub-containers
     models = providers.Container(ModelsDIContainer, config=config.models)
 
-    processing = providers.Container(ProcessingDIContainer, tokenizer=models.tokenizer.provided)
+    processing = providers.Container(ProcessingDIContainer, config=config.memory, tokenizer=models.tokenizer.provided)
 
     search = providers.Container(
         SearchDIContainer,
@@ -28,6 +28,8 @@ from .di.containers import (
 #                     "skip_prompt": True,
 #                 },
 #                 "search": {
+#                     "index_format": "mmap",
+#                     "mmap_index_dir": PROCESSED_DATA_DIR / "mmap_index",
 #                     "processed_data_dir": PROCESSED_DATA_DIR / "preprocessed_data",
 #                     "top_k": 4,
 #                 },
@@ -0,0 +1,18 @@
+from .backends import InferenceBackend, StubBackend, TransformersBackend, create_backend
+from .client import InferenceClient
+from .protocol import InferenceError
+from .server import InferenceServer, InferenceServerMetrics, run_server
+from .worker import InferenceWorker
+
+__all__ = [
+    "InferenceBackend",
+    "InferenceClient",
+    "InferenceError",
+    "InferenceServer",
+    "InferenceServerMetrics",
+    "InferenceWorker",
+    "StubBackend",
+    "TransformersBackend",
+    "create_backend",
+    "run_server",
+]
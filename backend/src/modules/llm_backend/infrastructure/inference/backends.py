@@ -0,0 +1,141 @@
+"""
+Model backends owned by the inference server.
+
+A backend loads its weights once (:meth:`InferenceBackend.load`) and then streams text for
+one prompt at a time from a server thread. ``cancelled`` is set when the client goes away,
+so a backend should stop producing as soon as it notices.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Iterator
+
+from ..processing.speculative import DEFAULT_NUM_ASSISTANT_TOKENS, assisted_generation_kwargs, check_draft_model
+
+
+class InferenceBackend(ABC):
+    name: str
+
+    @abstractmethod
+    def load(self) -> None:
+        """Load weights and other resources; called once, before the server reports ready."""
+
+    @abstractmethod
+    def stream(self, prompt: str, params: dict[str, Any], cancelled: threading.Event) -> Iterator[str]:
+        """Yield the response to ``prompt`` in chunks."""
+
+    def close(self) -> None:
+        """Release what :meth:`load` acquired."""
+
+
+class StubBackend(InferenceBackend):
+    """
+    CPU-only stand-in: answers with the words of the prompt, one chunk per word.
+
+    ``load_seconds`` and ``chunk_seconds`` simulate weight loading and decoding time.
+    """
+
+    name = "stub"
+
+    def __init__(self, load_seconds: float = 0.0, chunk_seconds: float = 0.0) -> None:
+        self.load_seconds = load_seconds
+        self.chunk_seconds = chunk_seconds
+
+    def load(self) -> None:
+        time.sleep(self.load_seconds)
+
+    def stream(self, prompt: str, params: dict[str, Any], cancelled: threading.Event) -> Iterator[str]:
+        words = prompt.split()[: params.get("max_new_tokens")]
+        for index, word in enumerate(words):
+            if cancelled.is_set():
+                return
+            time.sleep(self.chunk_seconds)
+            yield word if index == 0 else f" {word}"
+
+
+class TransformersBackend(InferenceBackend):
+    """
+    Serves the models of :class:`ModelsDIContainer`.
+
+    ``config`` is the container's ``models`` section (``llm_model_name``,
+    ``llm_tokenizer_name``, ``embedding_model_name``, ``skip_prompt``, and optionally
+    ``draft_model_name`` and ``num_assistant_tokens`` for speculative decoding).
+    """
+
+    name = "transformers"
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        self.config = config
+        self._container = None
+
+    def load(self) -> None:
+        from ..configuration.di.containers import ModelsDIContainer
+
+        container = ModelsDIContainer()
+        container.config.from_dict(self.config)
+        container.init_resources()
+        if container.draft_model() is not None:
+            check_draft_model(container.tokenizer(), container.draft_tokenizer())
+        self._container = container
+
+    def stream(self, prompt: str, params: dict[str, Any], cancelled: threading.Event) -> Iterator[str]:
+        from transformers import StoppingCriteria, StoppingCriteriaList
+
+        class _StopWhenCancelled(StoppingCriteria):
+            def __call__(self, input_ids, scores, **kwargs) -> bool:
+                return cancelled.is_set()
+
+        model = self._container.llm_model()
+        draft = self._container.draft_model()
+        tokenizer = self._container.tokenizer()
+        streamer = self._container.text_streamer()
+        inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
+
+        do_sample = params.get("do_sample", True)
+        sampling = {"temperature": params.get("temperature", 0.6)} if do_sample else {}
+        num_assistant_tokens = self.config.get("num_assistant_tokens", DEFAULT_NUM_ASSISTANT_TOKENS)
+        speculation = assisted_generation_kwargs(draft, num_assistant_tokens)
+        failures: list[BaseException] = []
+
+        def generate() -> None:
+            try:
+                model.generate(
+                    **inputs,
+                    max_new_tokens=params.get("max_new_tokens", 512),
+                    do_sample=do_sample,
+                    streamer=streamer,
+                    stopping_criteria=StoppingCriteriaList([_StopWhenCancelled()]),
+                    **sampling,
+                    **speculation,
+                )
+            except BaseException as error:
+                failures.append(error)
+            finally:
+                streamer.queue.put(None)
+
+        worker = threading.Thread(target=generate, name="inference-generate", daemon=True)
+        worker.start()
+        while (text := streamer.queue.get()) is not None:
+            if text:
+                yield text
+        worker.join()
+        if failures:
+            raise failures[0]
+
+    def close(self) -> None:
+        if self._container is not None:
+            self._container.shutdown_resources()
+            self._container = None
+
+
+def create_backend(name: str, config: dict[str, Any] | None = None) -> InferenceBackend:
+    """Build a backend by name; ``config`` holds its constructor arguments."""
+    config = config or {}
+    if name == StubBackend.name:
+        return StubBackend(**config)
+    if name == TransformersBackend.name:
+        return TransformersBackend(config)
+    raise ValueError(f"Unknown inference backend: {name!r}")
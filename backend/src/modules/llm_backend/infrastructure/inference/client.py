@@ -0,0 +1,96 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from ..metrics import CHUNKS_PER_SECOND, GENERATIONS, STREAMED_CHUNKS, TIME_TO_FIRST_TOKEN
+from .protocol import InferenceError, read_frame, write_frame
+
+
+class InferenceClient:
+    """
+    API-side handle on the inference server; holds no model state, so every worker can have one.
+
+    Each call opens its own connection, which keeps concurrent streams independent and
+    costs little on a Unix socket.
+    """
+
+    def __init__(self, socket_path: str | Path, connect_timeout: float = 5.0) -> None:
+        self.socket_path = str(socket_path)
+        self.connect_timeout = connect_timeout
+
+    async def stream(self, prompt: str, **params: Any) -> AsyncIterator[str]:
+        """Yield the response chunks as the model produces them."""
+        started = time.perf_counter()
+        first_chunk_at = finished_at = 0.0
+        chunks = 0
+        outcome = "cancelled"  # unless it completes or fails: the caller stopped iterating
+        try:
+            async with self._exchange({"op": "generate", "prompt": prompt, "params": params}) as reader:
+                while True:
+                    reply = await read_frame(reader)
+                    if reply is None:
+                        raise InferenceError("Inference server closed the stream before finishing")
+                    if "chunk" in reply:
+                        if not chunks:
+                            first_chunk_at = time.perf_counter()
+                            TIME_TO_FIRST_TOKEN.observe(first_chunk_at - started)
+                        chunks += 1
+                        yield reply["chunk"]
+                    elif reply.get("done"):
+                        finished_at = time.perf_counter()
+                        outcome = "completed"
+                        return
+                    else:
+                        raise InferenceError(reply.get("error", "Malformed reply from the inference server"))
+        except InferenceError:
+            outcome = "failed"
+            raise
+        finally:
+            GENERATIONS.labels(outcome).inc()
+            if chunks:
+                STREAMED_CHUNKS.inc(chunks)
+            if outcome == "completed" and chunks > 1 and finished_at > first_chunk_at:
+                CHUNKS_PER_SECOND.observe((chunks - 1) / (finished_at - first_chunk_at))
+
+    async def generate(self, prompt: str, **params: Any) -> str:
+        return "".join([chunk async for chunk in self.stream(prompt, **params)])
+
+    async def health(self) -> dict[str, Any]:
+        """Liveness: the server process is up and answering, whether or not the model has loaded."""
+        return await self._status({"op": "health"})
+
+    async def ready(self) -> bool:
+        """Readiness: the model is loaded and generate requests are accepted."""
+        try:
+            return bool((await self._status({"op": "ready"})).get("ready"))
+        except InferenceError:
+            return False
+
+    async def status(self) -> dict[str, Any]:
+        """Readiness flag plus the server's request counters."""
+        return await self._status({"op": "ready"})
+
+    async def _status(self, request: dict[str, Any]) -> dict[str, Any]:
+        async with self._exchange(request) as reader:
+            reply = await read_frame(reader)
+        if reply is None or "error" in reply:
+            raise InferenceError((reply or {}).get("error", "Inference server closed the connection"))
+        return reply
+
+    @asynccontextmanager
+    async def _exchange(self, request: dict[str, Any]) -> AsyncIterator[asyncio.StreamReader]:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path), timeout=self.connect_timeout
+            )
+        except (OSError, asyncio.TimeoutError) as error:
+            raise InferenceError(f"Inference server unreachable at {self.socket_path}: {error}") from error
+        try:
+            await write_frame(writer, request)
+            yield reader
+        except ConnectionError as error:
+            raise InferenceError(f"Lost the connection to the inference server: {error}") from error
+        finally:
+            writer.close()
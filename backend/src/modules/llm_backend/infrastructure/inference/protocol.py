@@ -0,0 +1,47 @@
+"""
+Wire format between API workers and the inference server.
+
+Every message is a JSON object preceded by its length as a 4-byte big-endian integer.
+A connection carries one request and its replies:
+
+* ``{"op": "generate", "prompt": ..., "params": {...}}`` is answered by any number of
+  ``{"chunk": "..."}`` frames, then ``{"done": true}`` or ``{"error": "..."}``;
+* ``{"op": "health"}`` and ``{"op": "ready"}`` are answered by a single status frame.
+"""
+
+import asyncio
+import struct
+from typing import Any
+
+from src.building_blocks.infrastructure import json_codec
+
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+_HEADER = struct.Struct(">I")
+
+
+class InferenceError(RuntimeError):
+    """The inference server is unreachable, not ready, or failed the request."""
+
+
+async def write_frame(writer: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    payload = json_codec.dumps(message)
+    writer.write(_HEADER.pack(len(payload)) + payload)
+    await writer.drain()
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """The next message, or ``None`` when the peer closed the connection between frames."""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+    except asyncio.IncompleteReadError as error:
+        if error.partial:
+            raise InferenceError("Connection closed in the middle of a frame header") from error
+        return None
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_FRAME_BYTES:
+        raise InferenceError(f"Frame of {size} bytes exceeds the {MAX_FRAME_BYTES} byte limit")
+    try:
+        return json_codec.loads(await reader.readexactly(size))
+    except asyncio.IncompleteReadError as error:
+        raise InferenceError("Connection closed in the middle of a frame") from error
@@ -0,0 +1,205 @@
+"""
+Model-owning inference server.
+
+One process loads the weights once and serves every API worker over a Unix socket (see
+:mod:`.protocol`), so ``uvicorn --workers N`` no longer means N copies of the model.
+The socket opens before the weights load: ``health`` answers as soon as the process is
+up, ``ready`` turns true once :meth:`InferenceBackend.load` has returned, and generate
+requests are refused until then. Run it with::
+
+    python -m src.modules.llm_backend.infrastructure.inference.server --socket /tmp/llm.sock
+
+and probe it (exit code 0 when the probe passes) with ``--probe health`` or ``--probe ready``.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .backends import InferenceBackend, create_backend
+from .client import InferenceClient
+from .protocol import InferenceError, read_frame, write_frame
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class InferenceServerMetrics:
+    """Counters reported by the ``ready`` probe."""
+
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    waiting: int = 0
+    in_flight: int = 0
+    load_seconds: float | None = None
+
+
+class InferenceServer:
+    """
+    Serves one :class:`InferenceBackend` on a Unix socket.
+
+    ``max_concurrency`` caps how many generations run on the model at once; other requests
+    wait for a slot (counted in ``metrics.waiting``). One is right for a single GPU model.
+    """
+
+    def __init__(self, backend: InferenceBackend, socket_path: str | Path, max_concurrency: int = 1) -> None:
+        self.backend = backend
+        self.socket_path = Path(socket_path)
+        self.metrics = InferenceServerMetrics()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="inference")
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._ready = False
+        self._stopping: asyncio.Event | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    async def serve(self) -> None:
+        """Listen, load the backend, then serve until :meth:`stop` is called."""
+        self._stopping = asyncio.Event()
+        self.socket_path.unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path))
+        try:
+            started = time.perf_counter()
+            await asyncio.get_running_loop().run_in_executor(self._executor, self.backend.load)
+            self.metrics.load_seconds = time.perf_counter() - started
+            self._ready = True
+            logger.info("Inference backend %s ready in %.1fs", self.backend.name, self.metrics.load_seconds)
+            await self._stopping.wait()
+        finally:
+            self._ready = False
+            server.close()
+            await server.wait_closed()
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self.backend.close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def stop(self) -> None:
+        """Stop serving; call it from the server's event loop."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await read_frame(reader)
+            if request is None:
+                return
+            op = request.get("op") if isinstance(request, dict) else None
+            if op == "health":
+                await write_frame(writer, {"status": "ok", "backend": self.backend.name, "pid": os.getpid()})
+            elif op == "ready":
+                await write_frame(writer, {"ready": self._ready, **asdict(self.metrics)})
+            elif op == "generate":
+                await self._generate(request, writer)
+            else:
+                await write_frame(writer, {"error": f"Unknown op: {op!r}"})
+        except (ConnectionError, InferenceError):
+            # The client went away; nothing is left to answer.
+            pass
+        finally:
+            writer.close()
+
+    async def _generate(self, request: dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        prompt, params = request.get("prompt"), request.get("params") or {}
+        if not isinstance(prompt, str) or not isinstance(params, dict):
+            await write_frame(writer, {"error": "Malformed generate request: needs a string prompt and object params"})
+            return
+        if not self._ready:
+            await write_frame(writer, {"error": "Inference backend is still loading"})
+            return
+
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue[tuple[str, str | None]] = asyncio.Queue()
+        cancelled = threading.Event()
+
+        def produce() -> None:
+            try:
+                for chunk in self.backend.stream(prompt, params, cancelled):
+                    loop.call_soon_threadsafe(chunks.put_nowait, ("chunk", chunk))
+                loop.call_soon_threadsafe(chunks.put_nowait, ("done", None))
+            except Exception as error:
+                logger.exception("Inference request failed")
+                loop.call_soon_threadsafe(chunks.put_nowait, ("error", f"{type(error).__name__}: {error}"))
+
+        metrics = self.metrics
+        metrics.waiting += 1
+        async with self._slots:
+            metrics.waiting -= 1
+            metrics.in_flight += 1
+            producer = loop.run_in_executor(self._executor, produce)
+            outcome = "cancelled"
+            try:
+                while True:
+                    kind, value = await chunks.get()
+                    if kind == "chunk":
+                        await write_frame(writer, {"chunk": value})
+                        continue
+                    outcome = "completed" if kind == "done" else "failed"
+                    await write_frame(writer, {"done": True} if kind == "done" else {"error": value})
+                    break
+            finally:
+                # Stops the backend early when the client disconnected mid-stream.
+                cancelled.set()
+                await producer
+                metrics.in_flight -= 1
+                setattr(metrics, outcome, getattr(metrics, outcome) + 1)
+
+
+def run_server(
+    socket_path: str,
+    backend: str = "transformers",
+    backend_config: dict[str, Any] | None = None,
+    max_concurrency: int = 1,
+) -> None:
+    """Process entry point: serve until SIGTERM or SIGINT."""
+    server = InferenceServer(create_backend(backend, backend_config), socket_path, max_concurrency)
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, server.stop)
+        await server.serve()
+
+    asyncio.run(main())
+
+
+async def _probe(socket_path: str, probe: str) -> bool:
+    client = InferenceClient(socket_path)
+    try:
+        if probe == "ready":
+            return await client.ready()
+        await client.health()
+        return True
+    except InferenceError:
+        return False
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve (or probe) the model-owning inference process.")
+    parser.add_argument("--socket", required=True, help="Unix socket path")
+    parser.add_argument("--backend", default="transformers", choices=["transformers", "stub"])
+    parser.add_argument("--config", default="{}", help="backend configuration as a JSON object")
+    parser.add_argument("--max-concurrency", type=int, default=1)
+    parser.add_argument("--probe", choices=["health", "ready"], help="check a running server instead")
+    args = parser.parse_args()
+
+    if args.probe:
+        sys.exit(0 if asyncio.run(_probe(args.socket, args.probe)) else 1)
+    logging.basicConfig(level=logging.INFO)
+    run_server(args.socket, args.backend, json.loads(args.config), args.max_concurrency)
+
+
+if __name__ == "__main__":
+    main()
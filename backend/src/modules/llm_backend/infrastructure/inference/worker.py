@@ -0,0 +1,65 @@
+import asyncio
+import multiprocessing
+import time
+from pathlib import Path
+from typing import Any
+
+from .client import InferenceClient
+from .protocol import InferenceError
+from .server import run_server
+
+
+class InferenceWorker:
+    """
+    Starts the inference server in a child process and waits for it to warm up.
+
+    For deployments that run the server under their own supervisor (a separate container
+    or systemd unit), start ``python -m ...inference.server`` directly instead; API workers
+    only need :class:`InferenceClient`. The child is started with ``spawn`` so it does not
+    inherit the parent's threads, sockets or event loop.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | Path,
+        backend: str = "transformers",
+        backend_config: dict[str, Any] | None = None,
+        max_concurrency: int = 1,
+    ) -> None:
+        self.socket_path = str(socket_path)
+        self.client = InferenceClient(self.socket_path)
+        self._process = multiprocessing.get_context("spawn").Process(
+            target=run_server,
+            args=(self.socket_path, backend, backend_config, max_concurrency),
+            name="inference-server",
+            daemon=True,
+        )
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def start(self) -> None:
+        self._process.start()
+
+    async def wait_ready(self, timeout: float = 600.0, interval: float = 0.05) -> None:
+        """Poll the readiness probe until the weights are loaded; large models take minutes."""
+        deadline = time.monotonic() + timeout
+        while not await self.client.ready():
+            if not self._process.is_alive():
+                raise InferenceError(f"Inference server exited with code {self._process.exitcode}")
+            if time.monotonic() > deadline:
+                raise InferenceError(f"Inference server not ready after {timeout:.0f}s")
+            await asyncio.sleep(interval)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """SIGTERM (the server drains and unloads), then SIGKILL if it does not exit in time."""
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
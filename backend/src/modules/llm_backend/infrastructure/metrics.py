@@ -0,0 +1,39 @@
+"""
+LLM metrics, recorded in the API workers where responses are streamed and documents
+retrieved.
+
+A chunk is one piece of streamed text as the inference server sends it; with the
+transformers backend that is one decoded token boundary, so chunks per second tracks
+tokens per second.
+"""
+
+from src.building_blocks.infrastructure.metrics import Counter, Histogram
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0)
+RATE_BUCKETS = (1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 50.0, 75.0, 100.0, 200.0)
+
+GENERATIONS = Counter(
+    "llm_generations",
+    "Generation requests sent to the inference server, by outcome (completed, failed, cancelled).",
+    ("outcome",),
+)
+TIME_TO_FIRST_TOKEN = Histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from sending a generation request to receiving its first chunk.",
+    buckets=LATENCY_BUCKETS,
+)
+STREAMED_CHUNKS = Counter(
+    "llm_streamed_chunks",
+    "Chunks of generated text received from the inference server.",
+)
+CHUNKS_PER_SECOND = Histogram(
+    "llm_stream_chunks_per_second",
+    "Decoding rate of a completed generation: chunks after the first over the time they took.",
+    buckets=RATE_BUCKETS,
+)
+RETRIEVAL_DURATION = Histogram(
+    "llm_retrieval_duration_seconds",
+    "Time to embed a query and find its nearest context documents, by search engine.",
+    ("engine",),
+    buckets=LATENCY_BUCKETS,
+)
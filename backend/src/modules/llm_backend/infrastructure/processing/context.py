@@ -1,7 +1,6 @@
 from typing import Optional
 
 from dependency_injector.wiring import Provide, inject
-from llama_index.core import QueryBundle
 
 from src.llm_backend.infrastructure.processing.search_engines import VectorSearchEngine
 
@@ -30,6 +29,8 @@ class DocumentFetcher:
             # processed_query = self.text_processor.format_query(query, context_id)
 
             # Step 2: Convert to query bundle
+            from llama_index.core import QueryBundle
+
             query_bundle = QueryBundle(query)
 
             # Step 3: Execute search
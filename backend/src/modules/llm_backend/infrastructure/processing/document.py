@@ -2,8 +2,6 @@ import os
 import re
 import shutil
 
-from bs4 import BeautifulSoup
-
 
 class DocumentProcessor:
     def __init__(self):
@@ -35,6 +33,8 @@ class DocumentProcessor:
         """
         Replaces HTML tables with CSV formatted text.
         """
+        from bs4 import BeautifulSoup
+
         tables = soup.find_all("table")
         bs = BeautifulSoup()
         for table in tables:
@@ -145,6 +145,8 @@ class DocumentProcessor:
         return text
 
     def preprocessor(self, text):
+        from bs4 import BeautifulSoup
+
         # Convert Markdown to HTML
         soup = BeautifulSoup(text, "html.parser")
         content = soup.findAll("div", {"id": "mc-main-content"})
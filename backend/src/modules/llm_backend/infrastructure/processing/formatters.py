@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from .typedefs import Tokenizer
 
@@ -14,12 +15,15 @@ class ModelInputFormatter(ABC):
 
 class ConversationalModelInputFormatter(ModelInputFormatter):
     @abstractmethod
-    def format(self, user_query: str, context: str, chat_history: list[dict[str, str]]) -> str:
-        pass
+    def format(self, user_query: str, context: str, chat_history: Sequence[dict[str, str]], summary: str = "") -> str:
+        """
+        ``chat_history`` holds the recent turns to carry verbatim (a ``ConversationWindow``'s
+        ``chat_history()``) and ``summary`` the turns folded before them; neither is modified.
+        """
 
 
 class LlamaFormatter(ConversationalModelInputFormatter):
-    def format(self, user_query: str, context: str, chat_history: list[dict[str, str]]) -> str:
+    def format(self, user_query: str, context: str, chat_history: Sequence[dict[str, str]], summary: str = "") -> str:
         system_message = (
             "This is a chat between a user and an artificial intelligence assistant. "
             "The assistant gives helpful, detailed, and polite answers to the user’s questions "
@@ -44,20 +48,24 @@ class LlamaFormatter(ConversationalModelInputFormatter):
         )
 
         context_text = context + "\n\n" if context else ""
-        conversation = "\n\n".join(f"User: {c['question']}\n\nAssistant: {c['answer']}" for c in chat_history)
+        summary_text = f"Summary of the earlier conversation:\n{summary}\n\n" if summary else ""
 
-        if chat_history:
-            chat_history[0]["question"] = instruction + chat_history[0]["question"]
-            conversation += f"\n\nUser: {user_query}\n\nAssistant:"
+        # The instruction leads the first user message in the prompt; the caller's history is not touched.
+        exchanges = [(turn["question"], turn["answer"]) for turn in chat_history]
+        if exchanges:
+            exchanges[0] = (instruction + exchanges[0][0], exchanges[0][1])
         else:
             user_query = instruction + user_query
-            conversation = f"User: {user_query}\n\nAssistant:"
+        exchanges_text = "".join(f"User: {question}\n\nAssistant: {answer}\n\n" for question, answer in exchanges)
+        conversation = f"{exchanges_text}User: {user_query}\n\nAssistant:"
 
-        return f"{system_message}\n\n{context_text}{conversation}"
+        return f"{system_message}\n\n{context_text}{summary_text}{conversation}"
 
 
 class QwenModelInputFormatter(ModelInputFormatter):
-    def format(self, user_query: str, context: str) -> str:
+    def format(
+        self, user_query: str, context: str, chat_history: Sequence[dict[str, str]] = (), summary: str = ""
+    ) -> str:
         messages = [
             {
                 "role": "system",
@@ -71,6 +79,11 @@ class QwenModelInputFormatter(ModelInputFormatter):
                 "The assistant answers with the correct Latex Code using $...$ for short formulas and $$...$$ for longer formulas.",
             },
             {"role": "system", "content": context},
-            {"role": "user", "content": user_query},
         ]
+        if summary:
+            messages.append({"role": "system", "content": f"Summary of the earlier conversation:\n{summary}"})
+        for turn in chat_history:
+            messages.append({"role": "user", "content": turn["question"]})
+            messages.append({"role": "assistant", "content": turn["answer"]})
+        messages.append({"role": "user", "content": user_query})
         return self.tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
@@ -1,12 +1,19 @@
-from llama_index.core import Settings, SimpleDirectoryReader, VectorStoreIndex
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from .typedefs import EmbeddingModel, SentenceSplitter
 
+if TYPE_CHECKING:
+    from llama_index.core import VectorStoreIndex
+
 
 class IndexBuilder:
     """Builds and manages the vector store index"""
 
     def __init__(self, data_dir: str, embedding_model: EmbeddingModel, sentence_splitter: SentenceSplitter):
+        from llama_index.core import Settings
+
         self.data_dir = data_dir
         Settings.embed_model = embedding_model
         Settings.text_splitter = sentence_splitter
@@ -14,5 +21,7 @@ class IndexBuilder:
 
     def _build_index(self) -> VectorStoreIndex:
         """Construct vector index from documents"""
+        from llama_index.core import SimpleDirectoryReader, VectorStoreIndex
+
         documents = SimpleDirectoryReader(input_dir=self.data_dir, recursive=True).load_data()
         return VectorStoreIndex.from_documents(documents, show_progress=True)
@@ -1,10 +1,14 @@
-import torch
-from llama_index.core import Settings
-from llama_index.embeddings.huggingface import HuggingFaceEmbedding
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from .typedefs import EmbeddingModel, LlmModel, Tokenizer
 
+if TYPE_CHECKING:
+    import torch
+
+# torch, transformers and llama_index are imported by the loaders themselves, on first use.
+
 
 class ModelLoader:
     """A class responsible for loading Hugging Face models (LLMs, embeddings)."""
@@ -13,19 +17,23 @@ class ModelLoader:
     def load_llm_model(
         model_name: str,
         device_map: str | None = "auto",
-        torch_dtype: torch.dtype | None = torch.float16,
+        torch_dtype: torch.dtype | str | None = "float16",
     ) -> LlmModel:
         """Loads a Large Language Model (LLM) from Hugging Face.
 
         Args:
             model_name: The name or path of the pre-trained model.
             device_map: The device mapping for the model ("auto" or specific device).
-            torch_dtype: The torch data type for the model.
+            torch_dtype: The torch data type for the model, or its name in ``torch``.
 
         Returns:
             The loaded LLM model.
         """
+        import torch
+        from transformers import AutoModelForCausalLM
 
+        if isinstance(torch_dtype, str):
+            torch_dtype = getattr(torch, torch_dtype)
         return AutoModelForCausalLM.from_pretrained(model_name, torch_dtype=torch_dtype, device_map=device_map)
 
     @staticmethod
@@ -38,6 +46,8 @@ class ModelLoader:
         Returns:
             The loaded embedding model.
         """
+        from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+
         return HuggingFaceEmbedding(model_name=model_name)
 
 
@@ -54,4 +64,6 @@ class TokenizerLoader:
         Returns:
             The loaded tokenizer.
         """
+        from transformers import AutoTokenizer
+
         return AutoTokenizer.from_pretrained(model_name, clean_up_tokenization_spaces=True)
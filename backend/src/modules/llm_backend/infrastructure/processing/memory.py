@@ -0,0 +1,253 @@
+"""
+Conversation memory for multi-turn prompts, bounded in tokens.
+
+:class:`ConversationMemory` keeps each conversation's most recent turns verbatim while
+they fit in ``window_tokens``. When a new turn pushes the window over, the oldest turns
+are folded into a rolling summary of at most ``summary_tokens``, down to
+``fold_to`` of the budget so the summarizer runs once per several turns rather than on
+every one. A prompt built from the window therefore never grows with the length of the
+conversation, only with the budget.
+
+Each turn is counted once, when it is added; the window (summary, turns and their token
+counts) is persisted per conversation through any store with the ``JsonFileManager``
+interface and cached in-process, which assumes a conversation's turns are added by one
+process at a time (as the JSON stores do). Nothing handed to or returned by the memory
+is shared with it: windows are immutable and the chat-history helpers build fresh dicts.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Protocol, Sequence
+
+from src.building_blocks.infrastructure.cache import TTLCache
+
+from .typedefs import Tokenizer
+
+TokenCounter = Callable[[str], int]
+
+
+def approximate_token_count(text: str) -> int:
+    """About four characters per token, for when no tokenizer is at hand."""
+    return (len(text) + 3) // 4
+
+
+def tokenizer_token_counter(tokenizer: Tokenizer) -> TokenCounter:
+    """Count with the model's own tokenizer, without the special tokens a template adds anyway."""
+    return lambda text: len(tokenizer.encode(text, add_special_tokens=False))
+
+
+@dataclass(slots=True, frozen=True)
+class Turn:
+    question: str
+    answer: str
+    tokens: int
+
+    def to_chat(self) -> dict[str, str]:
+        return {"question": self.question, "answer": self.answer}
+
+
+@dataclass(slots=True, frozen=True)
+class ConversationWindow:
+    """What a prompt may carry of a conversation: the summary of folded turns, then recent turns."""
+
+    summary: str = ""
+    summary_tokens: int = 0
+    turns: tuple[Turn, ...] = ()
+    folded_turns: int = 0  # turns already folded into the summary
+
+    @property
+    def tokens(self) -> int:
+        return self.summary_tokens + sum(turn.tokens for turn in self.turns)
+
+    def chat_history(self) -> list[dict[str, str]]:
+        """The recent turns as ``{"question", "answer"}`` dicts, new on every call."""
+        return [turn.to_chat() for turn in self.turns]
+
+    def messages(self) -> list[dict[str, str]]:
+        """The window as chat-template messages: the summary as a system message, then the turns."""
+        messages = []
+        if self.summary:
+            messages.append({"role": "system", "content": f"Summary of the earlier conversation:\n{self.summary}"})
+        for turn in self.turns:
+            messages.append({"role": "user", "content": turn.question})
+            messages.append({"role": "assistant", "content": turn.answer})
+        return messages
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "summary": self.summary,
+            "summary_tokens": self.summary_tokens,
+            "turns": [[turn.question, turn.answer, turn.tokens] for turn in self.turns],
+            "folded_turns": self.folded_turns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ConversationWindow:
+        return cls(
+            summary=data["summary"],
+            summary_tokens=data["summary_tokens"],
+            turns=tuple(Turn(question, answer, tokens) for question, answer, tokens in data["turns"]),
+            folded_turns=data["folded_turns"],
+        )
+
+
+class Summarizer(Protocol):
+    def __call__(self, summary: str, turns: Sequence[Turn]) -> str:
+        """The summary of the conversation so far: ``summary`` extended with ``turns``."""
+        ...
+
+
+class ExtractiveSummarizer:
+    """
+    Model-free summarizer: one line per turn, the first sentence of the question and of the
+    answer, dropping the oldest lines once the summary exceeds ``max_tokens``.
+    """
+
+    _SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+    def __init__(self, max_tokens: int, count_tokens: TokenCounter = approximate_token_count, max_words: int = 30):
+        self.max_tokens = max_tokens
+        self.count_tokens = count_tokens
+        self.max_words = max_words
+
+    def _gist(self, text: str) -> str:
+        sentence = self._SENTENCE_END.split(" ".join(text.split()), maxsplit=1)[0]
+        words = sentence.split()
+        return " ".join(words[: self.max_words]) + (" ..." if len(words) > self.max_words else "")
+
+    def __call__(self, summary: str, turns: Sequence[Turn]) -> str:
+        lines = summary.splitlines() if summary else []
+        lines.extend(
+            f"- User asked: {self._gist(turn.question)} Assistant: {self._gist(turn.answer)}" for turn in turns
+        )
+        while len(lines) > 1 and self.count_tokens("\n".join(lines)) > self.max_tokens:
+            lines.pop(0)
+        return "\n".join(lines)
+
+
+class ModelSummarizer:
+    """Summarizes with the language model; ``generate`` maps a prompt to its completion."""
+
+    def __init__(self, generate: Callable[[str], str], max_tokens: int):
+        self.generate = generate
+        self.max_tokens = max_tokens
+
+    def __call__(self, summary: str, turns: Sequence[Turn]) -> str:
+        transcript = "\n\n".join(f"User: {turn.question}\n\nAssistant: {turn.answer}" for turn in turns)
+        prompt = (
+            f"Update the summary of a conversation with the new exchanges, in at most {self.max_tokens} tokens. "
+            "Keep names, numbers and decisions; drop pleasantries.\n\n"
+            f"Summary so far:\n{summary or '(empty)'}\n\nNew exchanges:\n{transcript}\n\nUpdated summary:"
+        )
+        return self.generate(prompt).strip()
+
+
+class DocumentStore(Protocol):
+    """The part of ``JsonFileManager`` (and ``JsonLinesStore``) the memory persists through."""
+
+    def file_exists(self, file_id: str) -> bool: ...
+
+    def read(self, file_id: str) -> Any: ...
+
+    def write(self, file_id: str, data: Any) -> None: ...
+
+    def delete(self, file_id: str) -> None: ...
+
+
+class ConversationMemory:
+    """
+    Token-bounded, persisted windows over conversations.
+
+    Args:
+        store: Where windows are persisted, one document per conversation; ``None`` keeps
+            them in the cache only.
+        window_tokens: Budget for the verbatim turns.
+        summary_tokens: Budget for the rolling summary.
+        fold_to: Share of ``window_tokens`` the turns are folded down to when over budget.
+        count_tokens: Token counter, ideally the model's (see :func:`tokenizer_token_counter`).
+        summarizer: Folds turns into the summary; extractive by default.
+    """
+
+    def __init__(
+        self,
+        store: DocumentStore | None = None,
+        *,
+        window_tokens: int = 1536,
+        summary_tokens: int = 256,
+        fold_to: float = 0.6,
+        count_tokens: TokenCounter = approximate_token_count,
+        summarizer: Summarizer | None = None,
+        cache_size: int = 1024,
+        cache_ttl: float = 3600.0,
+    ) -> None:
+        if not 0 < fold_to <= 1:
+            raise ValueError("fold_to must be in (0, 1]")
+        self._store = store
+        self.window_tokens = window_tokens
+        self.summary_tokens = summary_tokens
+        self.fold_to = fold_to
+        self.count_tokens = count_tokens
+        self.summarizer = summarizer or ExtractiveSummarizer(summary_tokens, count_tokens)
+        self._cache: TTLCache[str, ConversationWindow] = TTLCache(cache_size, cache_ttl, name="conversation_windows")
+        # Striped, so a slow summarizer holds up only the conversations sharing its stripe.
+        self._locks = [threading.Lock() for _ in range(64)]
+
+    def _document_id(self, conversation_id: str) -> str:
+        return f"memory_{conversation_id}"
+
+    def _fit(self, summary: str) -> tuple[str, int]:
+        """Hold any summarizer to the budget, dropping the oldest words of an overlong summary."""
+        tokens = self.count_tokens(summary)
+        if tokens > self.summary_tokens:
+            words = summary.split(" ")
+            while len(words) > 1 and tokens > self.summary_tokens:
+                words = words[max(len(words) // 8, 1) :]
+                tokens = self.count_tokens(" ".join(words))
+            summary = " ".join(words)
+        return summary, tokens
+
+    def window(self, conversation_id: str) -> ConversationWindow:
+        """The current window of a conversation (empty for one never seen)."""
+        window = self._cache.get(conversation_id)
+        if window is None:
+            window = ConversationWindow()
+            document_id = self._document_id(conversation_id)
+            if self._store is not None and self._store.file_exists(document_id):
+                window = ConversationWindow.from_dict(self._store.read(document_id))
+            self._cache.set(conversation_id, window)
+        return window
+
+    def add_turn(self, conversation_id: str, question: str, answer: str) -> ConversationWindow:
+        """Record a finished turn, folding the oldest turns into the summary if over budget."""
+        turn = Turn(question, answer, self.count_tokens(f"{question}\n{answer}"))
+        with self._locks[hash(conversation_id) % len(self._locks)]:
+            window = self.window(conversation_id)
+            turns = window.turns + (turn,)
+            summary, summary_tokens, folded = window.summary, window.summary_tokens, window.folded_turns
+
+            if sum(t.tokens for t in turns) > self.window_tokens:
+                target = self.fold_to * self.window_tokens
+                kept = len(turns)
+                kept_tokens = sum(t.tokens for t in turns)
+                while kept and kept_tokens > target:
+                    kept -= 1
+                    kept_tokens -= turns[len(turns) - kept - 1].tokens
+                split = len(turns) - kept
+                summary, summary_tokens = self._fit(self.summarizer(summary, turns[:split]))
+                turns, folded = turns[split:], folded + split
+
+            window = ConversationWindow(summary, summary_tokens, turns, folded)
+            if self._store is not None:
+                self._store.write(self._document_id(conversation_id), window.to_dict())
+            self._cache.set(conversation_id, window)
+            return window
+
+    def clear(self, conversation_id: str) -> None:
+        with self._locks[hash(conversation_id) % len(self._locks)]:
+            self._cache.set(conversation_id, ConversationWindow())
+            document_id = self._document_id(conversation_id)
+            if self._store is not None and self._store.file_exists(document_id):
+                self._store.delete(document_id)
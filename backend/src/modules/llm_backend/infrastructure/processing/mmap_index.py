@@ -0,0 +1,212 @@
+"""
+Vector index stored as flat files and memory-mapped read-only.
+
+A llama_index ``VectorStoreIndex`` keeps every embedding as a Python list of floats and
+every node as an object, privately in each process that builds or loads it. This format
+stores the same data in a directory:
+
+* ``embeddings.f32``: the L2-normalized embedding matrix, float32, row-major ``(count, dim)``;
+* ``text_offsets.u64``: ``count + 1`` byte offsets into ``texts.utf8``;
+* ``texts.utf8``: the node texts, concatenated;
+* ``source_ids.u32``: per node, an index into the ``sources`` list of the manifest;
+* ``manifest.json``: format version, ``count``, ``dim`` and the distinct source paths.
+
+:meth:`MmapVectorIndex.open` maps the files instead of reading them, so opening costs the
+same for any corpus size and all workers on a node share one page-cache copy. Searches
+run directly on the mapped NumPy views. Build a directory with :func:`write_mmap_index`,
+or from documents with::
+
+    python -m src.modules.llm_backend.infrastructure.processing.mmap_index \\
+        --data-dir data/processed/preprocessed_data --output data/processed/mmap_index \\
+        --embedding-model BAAI/bge-small-en-v1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+import numpy as np
+
+from ..metrics import RETRIEVAL_DURATION
+from .typedefs import EmbeddingModel
+
+if TYPE_CHECKING:
+    from llama_index.core import QueryBundle, VectorStoreIndex
+
+FORMAT_VERSION = 1
+
+_EMBEDDINGS = "embeddings.f32"
+_TEXT_OFFSETS = "text_offsets.u64"
+_TEXTS = "texts.utf8"
+_SOURCE_IDS = "source_ids.u32"
+_MANIFEST = "manifest.json"
+
+
+def write_mmap_index(
+    directory: str | Path, embeddings: np.ndarray, texts: Sequence[str], sources: Sequence[str]
+) -> None:
+    """
+    Write an index directory; rows of ``embeddings`` pair with ``texts`` and ``sources``.
+
+    The files are written next to ``directory`` and swapped in with one rename, so workers
+    opening the index never see a half-written one.
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if embeddings.ndim != 2 or not len(embeddings) == len(texts) == len(sources):
+        raise ValueError("embeddings must be (count, dim), with one text and one source per row")
+
+    directory = Path(directory)
+    staging = directory.with_name(f".{directory.name}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    (embeddings / np.where(norms == 0, 1, norms)).tofile(staging / _EMBEDDINGS)
+
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    np.cumsum([len(text) for text in encoded], out=offsets[1:])
+    offsets.tofile(staging / _TEXT_OFFSETS)
+    with open(staging / _TEXTS, "wb") as file:
+        file.writelines(encoded)
+
+    distinct = list(dict.fromkeys(sources))
+    positions = {source: position for position, source in enumerate(distinct)}
+    np.fromiter((positions[source] for source in sources), dtype=np.uint32, count=len(sources)).tofile(
+        staging / _SOURCE_IDS
+    )
+
+    manifest = {"version": FORMAT_VERSION, "count": len(texts), "dim": embeddings.shape[1], "sources": distinct}
+    (staging / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+
+    previous = directory.with_name(f".{directory.name}.old")
+    shutil.rmtree(previous, ignore_errors=True)
+    if directory.exists():
+        directory.rename(previous)
+    staging.rename(directory)
+    shutil.rmtree(previous, ignore_errors=True)
+
+
+def export_vector_store_index(index: VectorStoreIndex, directory: str | Path) -> int:
+    """Write the embeddings and nodes of an in-memory llama_index index; returns the node count."""
+    embedding_dict = index.vector_store.data.embedding_dict
+    node_ids = [node_id for node_id in embedding_dict if node_id in index.docstore.docs]
+    nodes = [index.docstore.docs[node_id] for node_id in node_ids]
+    write_mmap_index(
+        directory,
+        np.array([embedding_dict[node_id] for node_id in node_ids], dtype=np.float32),
+        [node.get_content() for node in nodes],
+        [node.metadata.get("file_path", "Unknown") for node in nodes],
+    )
+    return len(nodes)
+
+
+class MmapVectorIndex:
+    """Read-only view over an index directory written by :func:`write_mmap_index`."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        manifest = json.loads((self.directory / _MANIFEST).read_text(encoding="utf-8"))
+        if manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported vector index version {manifest.get('version')} in {directory}")
+        self.count: int = manifest["count"]
+        self.dim: int = manifest["dim"]
+        self.sources: list[str] = manifest["sources"]
+
+        self.embeddings = self._map_array(_EMBEDDINGS, np.float32, (self.count, self.dim))
+        self.text_offsets = self._map_array(_TEXT_OFFSETS, np.uint64, (self.count + 1,))
+        self.source_ids = self._map_array(_SOURCE_IDS, np.uint32, (self.count,))
+        self._texts = self._map(_TEXTS)
+
+    @classmethod
+    def open(cls, directory: str | Path) -> MmapVectorIndex:
+        return cls(directory)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def text(self, position: int) -> str:
+        start, end = int(self.text_offsets[position]), int(self.text_offsets[position + 1])
+        return self._texts[start:end].decode("utf-8")
+
+    def source(self, position: int) -> str:
+        return self.sources[self.source_ids[position]]
+
+    def search(self, query: Sequence[float] | np.ndarray, top_k: int = 4) -> list[tuple[str, str, float]]:
+        """The ``top_k`` nodes by cosine similarity, as ``(source, text, score)``, best first."""
+        if not self.count:
+            return []
+        query = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        scores = self.embeddings @ (query / norm if norm else query)
+        top_k = min(top_k, self.count)
+        best = np.argpartition(scores, -top_k)[-top_k:]
+        best = best[np.argsort(scores[best])[::-1]]
+        return [(self.source(position), self.text(position), float(scores[position])) for position in best]
+
+    def _map(self, name: str) -> mmap.mmap | bytes:
+        with open(self.directory / name, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                # mmap refuses empty files; an empty index has nothing to share anyway.
+                return b""
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _map_array(self, name: str, dtype: type, shape: tuple[int, ...]) -> np.ndarray:
+        buffer = self._map(name)
+        if not buffer:
+            return np.zeros(shape, dtype=dtype)
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
+class MmapVectorSearchEngine:
+    """:class:`VectorSearchEngine` counterpart over a memory-mapped index."""
+
+    def __init__(self, index_dir: str | Path, embedding_model: EmbeddingModel, top_k: int = 4):
+        self.index = MmapVectorIndex.open(index_dir)
+        self._embedding_model = embedding_model
+        self._top_k = top_k
+
+    def find_similar(self, query: QueryBundle | str) -> list[tuple[str, str, float]]:
+        """Find similar documents with scores"""
+        started = time.perf_counter()
+        text = query if isinstance(query, str) else query.query_str
+        results = self.index.search(self._embedding_model.get_query_embedding(text), self._top_k)
+        RETRIEVAL_DURATION.labels("mmap").observe(time.perf_counter() - started)
+        return results
+
+
+def _build(data_dir: str, output: str, embedding_model: str, chunk_size: int) -> int:
+    from llama_index.core.node_parser.text.sentence import SentenceSplitter
+
+    from .indexers import IndexBuilder
+    from .loaders import ModelLoader
+
+    builder = IndexBuilder(
+        data_dir=data_dir,
+        embedding_model=ModelLoader.load_embedding_model(embedding_model),
+        sentence_splitter=SentenceSplitter(paragraph_separator="\n\n\n", chunk_size=chunk_size),
+    )
+    return export_vector_store_index(builder.index, output)
+
+
+def main(argv: Iterable[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Embed documents and write a memory-mappable vector index.")
+    parser.add_argument("--data-dir", required=True)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--embedding-model", default="BAAI/bge-small-en-v1.5")
+    parser.add_argument("--chunk-size", type=int, default=512)
+    args = parser.parse_args(argv)
+
+    count = _build(args.data_dir, args.output, args.embedding_model, args.chunk_size)
+    print(f"Wrote {count} nodes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
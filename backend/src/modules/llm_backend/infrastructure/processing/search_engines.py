@@ -1,17 +1,29 @@
-from llama_index.core import QueryBundle, VectorStoreIndex
-from llama_index.core.retrievers import VectorIndexRetriever
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from ..metrics import RETRIEVAL_DURATION
+
+if TYPE_CHECKING:
+    from llama_index.core import QueryBundle, VectorStoreIndex
 
 
 class VectorSearchEngine:
     """Handles vector-based similarity search operations"""
 
     def __init__(self, index: VectorStoreIndex, top_k: int = 4):
+        from llama_index.core.retrievers import VectorIndexRetriever
+
         self._retriever = VectorIndexRetriever(index=index, similarity_top_k=top_k)
 
     def find_similar(self, query: QueryBundle) -> list[tuple[str, str, float]]:
         """Find similar documents with scores"""
-        return [
+        started = time.perf_counter()
+        results = [
             (node.metadata.get("file_path", "Unknown"), node.text, result.score)
             for result in self._retriever.retrieve(query)
             for node in [result.node]
         ]
+        RETRIEVAL_DURATION.labels("memory").observe(time.perf_counter() - started)
+        return results
@@ -0,0 +1,98 @@
+"""
+Speculative (assisted) decoding with a small draft model.
+
+Plain decoding runs the large target model once per generated token. With a draft model,
+``generate`` lets the draft propose ``num_assistant_tokens`` tokens autoregressively and
+the target score all of them in a single forward pass, keeping the longest prefix it
+agrees with plus one token of its own. Under greedy decoding the output is exactly the
+target's own greedy output; under sampling, rejected proposals are resampled so the
+output follows the target's distribution. Either way, every accepted draft token is a
+target forward pass saved.
+
+The draft must share the target's tokenizer (same vocabulary), and assisted generation
+runs one sequence at a time, which is how the backend serves prompts. The mechanics are
+those of ``transformers``' ``assistant_model``; this module configures it and measures
+it (:class:`ForwardPassCounter`).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .typedefs import LlmModel, Tokenizer
+
+DEFAULT_NUM_ASSISTANT_TOKENS = 5
+
+
+def check_draft_model(target_tokenizer: Tokenizer, draft_tokenizer: Tokenizer) -> None:
+    """
+    Check that the draft proposes token ids that mean the same to the target.
+
+    The tokenizers are compared, not ``config.vocab_size``: checkpoints of one family pad
+    their embeddings differently (Qwen2.5-14B reports 152064, Qwen2.5-0.5B 151936) while
+    sharing a tokenizer.
+
+    Raises:
+        ValueError: If the draft cannot propose tokens for the target (different vocabulary).
+    """
+    target_vocab, draft_vocab = target_tokenizer.get_vocab(), draft_tokenizer.get_vocab()
+    if target_vocab != draft_vocab:
+        raise ValueError(
+            f"Draft tokenizer vocabulary ({len(draft_vocab)} tokens) differs from the target's "
+            f"({len(target_vocab)} tokens); speculative decoding needs a draft that shares the target's tokenizer."
+        )
+
+
+def assisted_generation_kwargs(
+    draft: LlmModel | None,
+    num_assistant_tokens: int = DEFAULT_NUM_ASSISTANT_TOKENS,
+    schedule: str = "heuristic",
+    confidence_threshold: float | None = None,
+) -> dict[str, Any]:
+    """
+    The ``generate`` arguments that turn on speculative decoding, or none without a draft.
+
+    Args:
+        draft: The draft model, or ``None`` for plain decoding.
+        num_assistant_tokens: Tokens the draft proposes per target pass (the initial value
+            when ``schedule`` is ``"heuristic"``).
+        schedule: ``"heuristic"`` grows the proposal length after fully accepted rounds and
+            shrinks it after rejections; ``"constant"`` keeps ``num_assistant_tokens``.
+        confidence_threshold: Stop a proposal early once the draft's confidence in its next
+            token drops below this (``transformers``' default when ``None``; 0 never stops).
+    """
+    if draft is None:
+        return {}
+    # transformers reads the speculation length from the draft's own generation config.
+    draft.generation_config.num_assistant_tokens = num_assistant_tokens
+    draft.generation_config.num_assistant_tokens_schedule = schedule
+    if confidence_threshold is not None:
+        draft.generation_config.assistant_confidence_threshold = confidence_threshold
+    return {"assistant_model": draft}
+
+
+class ForwardPassCounter:
+    """
+    Counts a model's forward passes while active, via a forward hook.
+
+    With ``n`` new tokens from ``p`` target passes, ``n / p`` tokens come from each pass;
+    plain decoding gives 1, and ``(n / p - 1) / k`` estimates the share of the ``k``
+    proposed draft tokens that the target accepted.
+    """
+
+    def __init__(self, model: LlmModel) -> None:
+        self.model = model
+        self.calls = 0
+        self._handle = None
+
+    def _hook(self, module, args, output) -> None:
+        self.calls += 1
+
+    def __enter__(self) -> ForwardPassCounter:
+        self.calls = 0
+        self._handle = self.model.register_forward_hook(self._hook)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._handle.remove()
+        self._handle = None
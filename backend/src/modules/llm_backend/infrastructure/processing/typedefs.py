@@ -1,10 +1,13 @@
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
-from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.core.node_parser.text.sentence import SentenceSplitter
-from transformers import AutoModel, AutoModelForCausalLM, AutoTokenizer
+# The bounds are only for type checkers; importing transformers and llama_index here would
+# load them (and torch) in every process that merely imports the LLM backend.
+if TYPE_CHECKING:
+    from llama_index.core.base.embeddings.base import BaseEmbedding
+    from llama_index.core.node_parser.text.sentence import SentenceSplitter as _SentenceSplitter
+    from transformers import AutoModel, AutoModelForCausalLM, AutoTokenizer
 
-LlmModel = TypeVar("LlmModel", bound=AutoModel | AutoModelForCausalLM)
-EmbeddingModel = TypeVar("EmbeddingModel", bound=BaseEmbedding)
-Tokenizer = TypeVar("Tokenizer", bound=AutoTokenizer)
-SentenceSplitter = TypeVar("SentenceSplitter", bound=SentenceSplitter)
+LlmModel = TypeVar("LlmModel", bound="AutoModel | AutoModelForCausalLM")
+EmbeddingModel = TypeVar("EmbeddingModel", bound="BaseEmbedding")
+Tokenizer = TypeVar("Tokenizer", bound="AutoTokenizer")
+SentenceSplitter = TypeVar("SentenceSplitter", bound="_SentenceSplitter")
@@ -0,0 +1,250 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import HTTPException  # noqa: E402
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+
+from src.api.routers.accounts.v1.security import jwt  # noqa: E402
+from src.building_blocks.infrastructure.cache import TTLCache  # noqa: E402
+from src.building_blocks.infrastructure.event_bus import EventBus  # noqa: E402
+from src.modules.accounts.domain.account.account import Account  # noqa: E402
+from src.modules.accounts.domain.account.value_objects.email import Email  # noqa: E402
+from src.modules.accounts.domain.account.value_objects.hashed_password import HashedPassword  # noqa: E402
+from src.modules.accounts.domain.session.events.session_revoked_event import SessionRevokedEvent  # noqa: E402
+from src.modules.accounts.domain.session.value_objects.session_id import SessionId  # noqa: E402
+from src.modules.accounts.infrastructure.caching.principal_cache import PrincipalCache  # noqa: E402
+from src.modules.accounts.infrastructure.persistence.in_memory_repository import (  # noqa: E402
+    InMemoryAccountRepository,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingAccountRepository(InMemoryAccountRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    def get_by_id(self, account_id):
+        self.lookups += 1
+        return super().get_by_id(account_id)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    jwt._verified_tokens.clear()
+    yield
+    jwt._verified_tokens.clear()
+
+
+@pytest.fixture
+def account() -> Account:
+    account = Account.register(Email.create("user@example.com"), HashedPassword(value="pbkdf2_sha256$1$salt$hash"))
+    account.pull_events()
+    return account
+
+
+@pytest.fixture
+def principals() -> PrincipalCache:
+    return PrincipalCache()
+
+
+@pytest.fixture
+def repository(account) -> CountingAccountRepository:
+    repository = CountingAccountRepository()
+    repository.add(account)
+    return repository
+
+
+class FakeSessionRepository:
+    def __init__(self) -> None:
+        self.sessions: dict = {}
+        self.lookups = 0
+
+    def get_by_id(self, session_id):
+        self.lookups += 1
+        return self.sessions.get(session_id)
+
+
+@pytest.fixture
+def sessions() -> FakeSessionRepository:
+    return FakeSessionRepository()
+
+
+@pytest.fixture
+def request_(principals, repository, sessions):
+    container = SimpleNamespace(
+        principal_cache=lambda: principals, account_repository=lambda: repository, session_repository=lambda: sessions
+    )
+    state = SimpleNamespace(backend_modules={"accounts": SimpleNamespace(container=container)})
+    return SimpleNamespace(app=SimpleNamespace(state=state))
+
+
+def bearer(account: Account, session_id: str | None = None) -> HTTPAuthorizationCredentials:
+    claims = {"sub": str(account.id.value)}
+    if session_id is not None:
+        claims["sid"] = session_id
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=jwt.create_access_token(claims))
+
+
+def active_session(account: Account, is_active: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(account_id=account.id, is_active=is_active, is_expired=lambda: False)
+
+
+class TestTTLCache:
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=60, clock=clock)
+        cache.set("default", 1)
+        cache.set("short", 2, ttl=5)
+
+        clock.now = 10
+        assert cache.get("short") is None
+        assert cache.get("default") == 1
+
+        clock.now = 60
+        assert cache.get("default") is None
+
+    def test_entry_ttl_is_capped_by_default(self):
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=60, clock=clock)
+        cache.set("key", 1, ttl=3600)
+
+        clock.now = 61
+        assert cache.get("key") is None
+
+
+class TestVerifiedTokenCache:
+    def test_repeated_decode_skips_signature_check(self, monkeypatch):
+        token = jwt.create_access_token({"sub": "someone"})
+        calls = []
+        sign = jwt._sign
+        monkeypatch.setattr(jwt, "_sign", lambda message, secret: calls.append(message) or sign(message, secret))
+
+        first = jwt.decode_access_token(token)
+        second = jwt.decode_access_token(token)
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_callers_cannot_mutate_cached_claims(self):
+        token = jwt.create_access_token({"sub": "someone"})
+        jwt.decode_access_token(token)["sub"] = "someone-else"
+
+        assert jwt.decode_access_token(token)["sub"] == "someone"
+
+    def test_tampered_token_is_verified_not_served_from_cache(self):
+        token = jwt.create_access_token({"sub": "someone"})
+        jwt.decode_access_token(token)
+        header, payload, signature = token.split(".")
+        forged = jwt.create_access_token({"sub": "admin"}).split(".")[1]
+
+        with pytest.raises(HTTPException):
+            jwt.decode_access_token(f"{header}.{forged}.{signature}")
+
+    def test_expired_token_is_not_cached(self):
+        token = jwt.create_access_token({"sub": "someone"}, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(HTTPException):
+            jwt.decode_access_token(token)
+        assert len(jwt._verified_tokens) == 0
+
+
+class TestPrincipalCache:
+    def test_authenticated_account_is_loaded_once(self, request_, account, repository):
+        credentials = bearer(account)
+
+        assert jwt.get_current_user(request_, credentials) == account
+        assert jwt.get_current_user(request_, credentials) == account
+        assert repository.lookups == 1
+
+    def test_each_request_gets_its_own_aggregate(self, request_, account):
+        credentials = bearer(account)
+        first = jwt.get_current_user(request_, credentials)
+
+        first.deactivate()
+        second = jwt.get_current_user(request_, credentials)
+
+        assert second is not first
+        assert second.is_active
+        assert second.pull_events() == []
+
+    def test_session_revocation_invalidates_principal(self, request_, account, repository, principals):
+        event_bus = EventBus()
+        principals.subscribe(event_bus)
+        credentials = bearer(account)
+        jwt.get_current_user(request_, credentials)
+
+        event_bus.publish(SessionRevokedEvent(session_id="session", account_id=str(account.id.value)))
+        jwt.get_current_user(request_, credentials)
+
+        assert repository.lookups == 2
+
+    def test_deactivated_account_is_rejected_once_evicted(self, request_, account, repository, principals):
+        event_bus = EventBus()
+        principals.subscribe(event_bus)
+        credentials = bearer(account)
+        jwt.get_current_user(request_, credentials)
+
+        account.deactivate()
+        event_bus.publish_many(account.pull_events())
+
+        with pytest.raises(HTTPException) as exc_info:
+            jwt.get_current_user(request_, credentials)
+        assert exc_info.value.status_code == 401
+
+
+class TestSessionBoundTokens:
+    def test_session_is_checked_once_while_cached(self, request_, account, sessions):
+        session_id = SessionId.create()
+        sessions.sessions[session_id] = active_session(account)
+        credentials = bearer(account, str(session_id.value))
+
+        jwt.get_current_user(request_, credentials)
+        jwt.get_current_user(request_, credentials)
+
+        assert sessions.lookups == 1
+
+    def test_revoked_session_refuses_a_still_valid_token(self, request_, account, sessions, principals):
+        event_bus = EventBus()
+        principals.subscribe(event_bus)
+        session_id = SessionId.create()
+        sessions.sessions[session_id] = active_session(account)
+        credentials = bearer(account, str(session_id.value))
+        jwt.get_current_user(request_, credentials)
+
+        sessions.sessions[session_id] = active_session(account, is_active=False)
+        event_bus.publish(SessionRevokedEvent(session_id=str(session_id.value), account_id=str(account.id.value)))
+
+        with pytest.raises(HTTPException) as exc_info:
+            jwt.get_current_user(request_, credentials)
+        assert exc_info.value.status_code == 401
+
+    def test_session_of_another_account_is_refused(self, request_, account, sessions):
+        other = Account.register(Email.create("other@example.com"), HashedPassword(value="pbkdf2_sha256$1$salt$hash"))
+        session_id = SessionId.create()
+        sessions.sessions[session_id] = active_session(other)
+
+        with pytest.raises(HTTPException):
+            jwt.get_current_user(request_, bearer(account, str(session_id.value)))
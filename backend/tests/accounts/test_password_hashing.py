@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from src.modules.accounts.application.authentication.login.command import LoginCommand
+from src.modules.accounts.application.authentication.login.handler import LoginHandler
+from src.modules.accounts.domain.account.account import Account
+from src.modules.accounts.domain.account.value_objects.email import Email
+from src.modules.accounts.domain.account.value_objects.hashed_password import HashedPassword
+from src.modules.accounts.infrastructure.crypto.password_hasher import PBKDF2PasswordHasher
+from src.modules.accounts.infrastructure.crypto.process_pool_hasher import ProcessPoolPasswordHasher
+from src.modules.accounts.infrastructure.mediator import Mediator
+from src.modules.accounts.infrastructure.persistence.in_memory_repository import (
+    InMemoryAccountRepository,
+    InMemorySessionRepository,
+)
+
+# Keep the work factor low; these tests cover plumbing, not hash strength.
+ITERATIONS = 1_000
+
+
+@pytest.fixture
+def service():
+    service = ProcessPoolPasswordHasher(PBKDF2PasswordHasher(iterations=ITERATIONS), max_workers=2)
+    yield service
+    service.shutdown()
+
+
+def register(repository: InMemoryAccountRepository, hashed_password: str) -> Account:
+    account = Account.register(Email.create("user@example.com"), HashedPassword.create(hashed_password))
+    account.verify()
+    account.pull_events()
+    repository.add(account)
+    return account
+
+
+class TestPBKDF2PasswordHasher:
+    def test_needs_rehash_when_iterations_change(self):
+        hashed = PBKDF2PasswordHasher(iterations=ITERATIONS // 2).encode("secret")
+
+        assert PBKDF2PasswordHasher(iterations=ITERATIONS).needs_rehash(hashed)
+        assert not PBKDF2PasswordHasher(iterations=ITERATIONS // 2).needs_rehash(hashed)
+
+    def test_needs_rehash_for_unknown_format(self):
+        assert PBKDF2PasswordHasher().needs_rehash("bcrypt$whatever")
+
+
+class TestProcessPoolPasswordHasher:
+    def test_round_trip(self, service):
+        async def scenario():
+            hashed = await service.encode("secret")
+            return await service.verify("secret", hashed), await service.verify("wrong", hashed)
+
+        assert asyncio.run(scenario()) == (True, False)
+
+    def test_concurrency_is_capped(self):
+        service = ProcessPoolPasswordHasher(
+            PBKDF2PasswordHasher(iterations=ITERATIONS), max_workers=2, max_concurrency=1
+        )
+        hashed = PBKDF2PasswordHasher(iterations=ITERATIONS).encode("secret")
+
+        async def burst():
+            return await asyncio.gather(*(service.verify("secret", hashed) for _ in range(6)))
+
+        try:
+            assert all(asyncio.run(burst()))
+        finally:
+            service.shutdown()
+        assert service.metrics.max_in_flight == 1
+        assert service.metrics.completed == 6
+        assert service.metrics.waiting == 0
+
+
+class TestRehashOnLogin:
+    def test_outdated_hash_is_upgraded(self, service):
+        accounts = InMemoryAccountRepository()
+        account = register(accounts, PBKDF2PasswordHasher(iterations=ITERATIONS // 2).encode("secret"))
+        handler = LoginHandler(accounts, InMemorySessionRepository(), service)
+
+        asyncio.run(handler(LoginCommand(email="user@example.com", password="secret")))
+
+        stored = accounts.get_by_id(account.id).hashed_password.value
+        assert stored.startswith(f"pbkdf2_sha256${ITERATIONS}$")
+        assert account.get_events() == []  # not a password change
+
+    def test_current_hash_is_left_alone(self, service):
+        accounts = InMemoryAccountRepository()
+        hashed = PBKDF2PasswordHasher(iterations=ITERATIONS).encode("secret")
+        account = register(accounts, hashed)
+        handler = LoginHandler(accounts, InMemorySessionRepository(), service)
+
+        asyncio.run(handler(LoginCommand(email="user@example.com", password="secret")))
+
+        assert account.hashed_password.value == hashed
+
+
+class TestMediatorDispatch:
+    def test_send_awaits_async_call_handlers(self, service):
+        accounts = InMemoryAccountRepository()
+        account = register(accounts, PBKDF2PasswordHasher(iterations=ITERATIONS).encode("secret"))
+        mediator = Mediator({LoginCommand: LoginHandler(accounts, InMemorySessionRepository(), service)})
+
+        logged_in, _ = asyncio.run(mediator.send(LoginCommand(email="user@example.com", password="secret")))
+
+        assert logged_in is account
@@ -0,0 +1,163 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, select, update  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.database.models import Base  # noqa: E402
+from src.modules.accounts.application.authentication.refresh_session.command import (  # noqa: E402
+    RefreshSessionCommand,
+)
+from src.modules.accounts.application.authentication.refresh_session.handler import (  # noqa: E402
+    RefreshSessionHandler,
+    RefreshTokenReuseError,
+)
+from src.modules.accounts.domain.account.account import Account  # noqa: E402
+from src.modules.accounts.domain.account.value_objects.email import Email  # noqa: E402
+from src.modules.accounts.domain.account.value_objects.hashed_password import HashedPassword  # noqa: E402
+from src.modules.accounts.domain.session.session import Session  # noqa: E402
+from src.modules.accounts.domain.session.value_objects.refresh_token import RefreshToken  # noqa: E402
+from src.modules.accounts.infrastructure.maintenance.session_sweeper import SessionSweeper  # noqa: E402
+from src.modules.accounts.infrastructure.persistence.orm.models import SessionModel  # noqa: E402
+from src.modules.accounts.infrastructure.persistence.repositories.sql_account_repo import (  # noqa: E402
+    SQLAccountRepository,
+)
+from src.modules.accounts.infrastructure.persistence.repositories.sql_session_repo import (  # noqa: E402
+    SQLSessionRepository,
+)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def account(session_factory) -> Account:
+    account = Account.register(Email.create("user@example.com"), HashedPassword.create("pbkdf2_sha256$1$salt$hash"))
+    SQLAccountRepository(session_factory).add(account)
+    return account
+
+
+@pytest.fixture
+def sessions(session_factory) -> SQLSessionRepository:
+    return SQLSessionRepository(session_factory)
+
+
+def issue(sessions: SQLSessionRepository, account: Account) -> tuple[Session, str]:
+    raw = secrets.token_urlsafe(48)
+    session = Session.issue(
+        account_id=account.id,
+        refresh_token=RefreshToken.create(raw),
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    sessions.add(session)
+    return session, raw
+
+
+class TestRefreshTokenStorage:
+    def test_only_the_digest_is_stored(self, session_factory, sessions, account):
+        _, raw = issue(sessions, account)
+
+        with session_factory() as db:
+            stored = db.execute(select(SessionModel.refresh_token_hash)).scalar_one()
+        assert stored == hashlib.sha256(raw.encode()).hexdigest()
+        assert raw not in stored
+
+
+class TestRefreshSessionHandler:
+    def test_rotation_issues_a_new_token(self, sessions, account):
+        session, raw = issue(sessions, account)
+
+        result = RefreshSessionHandler(sessions)(RefreshSessionCommand(refresh_token=raw))
+
+        assert result.session_id == str(session.id.value)
+        assert result.refresh_token != raw
+        assert RefreshSessionHandler(sessions)(RefreshSessionCommand(refresh_token=result.refresh_token))
+
+    def test_reusing_a_rotated_token_revokes_the_session(self, sessions, account):
+        session, raw = issue(sessions, account)
+        handler = RefreshSessionHandler(sessions)
+        rotated = handler(RefreshSessionCommand(refresh_token=raw))
+
+        with pytest.raises(RefreshTokenReuseError):
+            handler(RefreshSessionCommand(refresh_token=raw))
+
+        assert not sessions.get_by_id(session.id).is_active
+        with pytest.raises(ValueError):
+            handler(RefreshSessionCommand(refresh_token=rotated.refresh_token))
+
+    def test_unknown_token_is_rejected(self, sessions, account):
+        issue(sessions, account)
+
+        with pytest.raises(ValueError) as exc_info:
+            RefreshSessionHandler(sessions)(RefreshSessionCommand(refresh_token=secrets.token_urlsafe(48)))
+        assert not isinstance(exc_info.value, RefreshTokenReuseError)
+
+    def test_concurrent_rotation_of_one_token_has_a_single_winner(self, sessions, account):
+        session, raw = issue(sessions, account)
+        first = sessions.get_by_refresh_token(RefreshToken(value=raw).digest())
+        second = sessions.get_by_refresh_token(RefreshToken(value=raw).digest())
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        first_previous = first.rotate(RefreshToken.create(secrets.token_urlsafe(48)), expires_at)
+        second_previous = second.rotate(RefreshToken.create(secrets.token_urlsafe(48)), expires_at)
+
+        assert sessions.rotate_refresh_token(first, first_previous) is True
+        assert sessions.rotate_refresh_token(second, second_previous) is False
+
+
+class TestSessionSweeper:
+    def test_deletes_expired_and_stale_revoked_sessions_in_batches(self, session_factory, sessions, account):
+        live, _ = issue(sessions, account)
+        expired, _ = issue(sessions, account)
+        revoked, _ = issue(sessions, account)
+        recently_revoked, _ = issue(sessions, account)
+        long_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        with session_factory() as db:
+            db.execute(
+                update(SessionModel)
+                .where(SessionModel.session_uuid == str(expired.id.value))
+                .values(expires_at=long_ago)
+            )
+            db.execute(
+                update(SessionModel)
+                .where(SessionModel.session_uuid == str(revoked.id.value))
+                .values(is_active=False, updated_at=long_ago)
+            )
+            db.execute(
+                update(SessionModel)
+                .where(SessionModel.session_uuid == str(recently_revoked.id.value))
+                .values(is_active=False)
+            )
+            db.commit()
+
+        sweeper = SessionSweeper(sessions, batch_size=1, max_batches=10)
+        assert sweeper.sweep_once() == 2
+
+        assert sessions.get_by_id(live.id) is not None
+        assert sessions.get_by_id(recently_revoked.id) is not None
+        assert sweeper.metrics.table_size == 2
+        assert sweeper.metrics.sweeps == 1
+        assert sweeper.metrics.last_deleted == 2
+        assert sweeper.metrics.last_duration_seconds > 0
+
+    def test_a_pass_is_bounded(self, session_factory, sessions, account):
+        for _ in range(5):
+            issue(sessions, account)
+        with session_factory() as db:
+            db.execute(update(SessionModel).values(expires_at=datetime.now(timezone.utc) - timedelta(days=1)))
+            db.commit()
+
+        sweeper = SessionSweeper(sessions, batch_size=2, max_batches=2)
+
+        assert sweeper.sweep_once() == 4
+        assert sweeper.metrics.table_size == 1
@@ -0,0 +1,152 @@
+"""
+Query-count guards for the SQL account/session repositories.
+
+The assertions pin the number of statements per call independently of the
+number of rows, so a lazy load slipping back into ``_to_domain`` (N+1) or a
+row-by-row revocation loop fails here.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, event, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.database.models import Base  # noqa: E402
+from src.modules.accounts.domain.account.value_objects.account_id import AccountId  # noqa: E402
+from src.modules.accounts.infrastructure.persistence.orm.models import (  # noqa: E402
+    AccountModel,
+    CredentialModel,
+    RoleModel,
+    SessionModel,
+)
+from src.modules.accounts.infrastructure.persistence.repositories.sql_account_repo import (  # noqa: E402
+    SQLAccountRepository,
+)
+from src.modules.accounts.infrastructure.persistence.repositories.sql_session_repo import (  # noqa: E402
+    SQLSessionRepository,
+)
+
+ACCOUNTS = 25
+SESSIONS_PER_ACCOUNT = 4
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with factory() as session:
+        roles = [RoleModel(uuid=str(uuid.uuid4()), name=name) for name in ("admin", "member")]
+        for index in range(ACCOUNTS):
+            account = AccountModel(uuid=str(uuid.uuid4()), email=f"user{index}@example.com")
+            # Two accounts share every timestamp so pagination must break ties on id.
+            account.created_at = base_time + timedelta(minutes=index // 2)
+            account.credential = CredentialModel(hashed_password="pbkdf2_sha256$1$salt$hash")
+            account.roles = roles
+            account.sessions = [
+                SessionModel(
+                    session_uuid=str(uuid.uuid4()),
+                    refresh_token_hash=uuid.uuid4().hex,
+                    expires_at=base_time + timedelta(days=30),
+                    is_active=True,
+                )
+                for _ in range(SESSIONS_PER_ACCOUNT)
+            ]
+            session.add(account)
+        session.commit()
+    return factory
+
+
+@contextmanager
+def count_queries(engine):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def first_account_uuid(session_factory) -> uuid.UUID:
+    with session_factory() as session:
+        return uuid.UUID(session.execute(select(AccountModel.uuid).limit(1)).scalar_one())
+
+
+class TestSQLAccountRepositoryQueries:
+    def test_list_accounts_query_count_is_independent_of_page_size(self, engine, session_factory):
+        repository = SQLAccountRepository(session_factory)
+
+        with count_queries(engine) as statements:
+            page = repository.list_accounts(limit=ACCOUNTS)
+
+        # accounts JOIN credentials, then a single IN query for the roles of the whole page.
+        assert len(page.items) == ACCOUNTS
+        assert len(statements) == 2
+        assert all(len(account.role_ids) == 2 for account in page.items)
+
+    def test_get_by_id_loads_aggregate_eagerly(self, engine, session_factory):
+        repository = SQLAccountRepository(session_factory)
+        account_uuid = first_account_uuid(session_factory)
+
+        with count_queries(engine) as statements:
+            account = repository.get_by_id(AccountId(account_uuid))
+
+        assert account.hashed_password.value.startswith("pbkdf2_sha256$")
+        assert len(statements) == 2
+
+    def test_cursor_walks_every_account_once(self, session_factory):
+        repository = SQLAccountRepository(session_factory)
+
+        seen, cursor = [], None
+        while True:
+            page = repository.list_accounts(limit=4, cursor=cursor)
+            seen.extend(str(account.id.value) for account in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == ACCOUNTS
+        assert len(set(seen)) == ACCOUNTS
+
+    def test_invalid_cursor_is_rejected(self, session_factory):
+        with pytest.raises(ValueError):
+            SQLAccountRepository(session_factory).list_accounts(cursor="not-a-cursor")
+
+
+class TestSQLSessionRepositoryQueries:
+    def test_revoke_all_for_account_is_a_single_update(self, engine, session_factory):
+        repository = SQLSessionRepository(session_factory)
+        account_id = AccountId(first_account_uuid(session_factory))
+
+        with count_queries(engine) as statements:
+            repository.revoke_all_for_account(account_id)
+
+        assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+        assert not any(session.is_active for session in repository.list_for_account(account_id))
+
+    def test_list_for_account_does_not_lazy_load_the_account(self, engine, session_factory):
+        repository = SQLSessionRepository(session_factory)
+        account_id = AccountId(first_account_uuid(session_factory))
+
+        with count_queries(engine) as statements:
+            sessions = repository.list_for_account(account_id)
+
+        assert len(sessions) == SESSIONS_PER_ACCOUNT
+        assert len(statements) == 1
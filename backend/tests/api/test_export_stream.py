@@ -0,0 +1,37 @@
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from src.api.routers.chats.v1.conversations.endpoints import _stream  # noqa: E402
+
+
+def test_cancelled_response_closes_the_export_straight_away():
+    closed = threading.Event()
+
+    def chunks():
+        try:
+            while True:
+                yield b"chunk"
+        finally:
+            closed.set()
+
+    async def scenario():
+        received = asyncio.Event()
+
+        async def respond():
+            async for _ in _stream(chunks()):
+                received.set()
+
+        # Starlette cancels the streaming task when the client disconnects.
+        task = asyncio.create_task(respond())
+        await received.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Checked before the loop shuts down: garbage collection would close it eventually.
+        return closed.is_set()
+
+    assert asyncio.run(scenario())
@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from src.api.core.utils.route_manifest import MANIFEST_VERSION, discover_routes, load_routers, write_manifest
+from src.api.core.utils.routing_helpers import collect_routers
+
+
+def test_manifest_loads_the_routers_the_package_scan_finds(tmp_path):
+    path = tmp_path / "route_manifest.json"
+    write_manifest(path, discover_routes())
+
+    assert load_routers(path) == list(collect_routers())
+
+
+def test_stale_entry_fails_loudly(tmp_path):
+    path = tmp_path / "route_manifest.json"
+    write_manifest(path, [{"module": "src.api.core.utils.routing_helpers", "attribute": "missing_router"}])
+
+    with pytest.raises(RuntimeError, match="stale"):
+        load_routers(path)
+
+
+def test_manifest_from_another_version_is_rejected(tmp_path):
+    path = tmp_path / "route_manifest.json"
+    path.write_text(json.dumps({"version": MANIFEST_VERSION + 1, "routers": []}), encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="rebuild"):
+        load_routers(path)
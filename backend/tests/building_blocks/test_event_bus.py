@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+from src.building_blocks.domain.events import DomainEvent
+from src.building_blocks.infrastructure.event_bus import EventBus
+
+
+@dataclass(frozen=True, slots=True)
+class PingEvent(DomainEvent):
+    sequence: int
+
+
+@dataclass(frozen=True, slots=True)
+class PongEvent(DomainEvent):
+    sequence: int
+
+
+class BatchRecorder:
+    def __init__(self) -> None:
+        self.batches: list[list[int]] = []
+
+    def handle_many(self, events):
+        self.batches.append([event.sequence for event in events])
+
+
+def test_sync_handlers_run_inline_and_isolate_failures():
+    bus, received, after = EventBus(), [], []
+    bus.subscribe(PingEvent, received.append)
+
+    def fail(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(PingEvent, fail)
+    bus.subscribe(PingEvent, after.append)
+
+    failures = bus.publish(PingEvent(sequence=1))
+
+    assert [event.sequence for event in received] == [1]
+    assert [event.sequence for event in after] == [1]
+    assert [(failure.handler, type(failure.error)) for failure in failures] == [(fail.__qualname__, RuntimeError)]
+    assert bus.metrics[fail.__qualname__].failures == 1
+
+
+def test_metrics_are_consistent_across_publishing_threads():
+    bus = EventBus()
+    bus.subscribe(PingEvent, lambda event: None)
+
+    def publish_all():
+        for sequence in range(500):
+            bus.publish(PingEvent(sequence=sequence))
+
+    threads = [threading.Thread(target=publish_all) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(bus.metrics) == 1
+    assert next(iter(bus.metrics.values())).calls == 8 * 500
+
+
+def test_batch_subscriber_receives_one_call_per_event_type():
+    bus, recorder = EventBus(), BatchRecorder()
+    bus.subscribe(PingEvent, recorder)
+
+    bus.publish_many([PingEvent(sequence=1), PongEvent(sequence=2), PingEvent(sequence=3)])
+
+    assert recorder.batches == [[1, 3]]
+    assert bus.metrics["BatchRecorder.handle_many"].events == 2
+
+
+def test_async_publish_runs_handlers_concurrently():
+    bus = EventBus()
+
+    async def slow(event):
+        await asyncio.sleep(0.05)
+
+    for _ in range(5):
+        bus.subscribe(PingEvent, slow)
+
+    started = time.perf_counter()
+    failures = asyncio.run(bus.publish_async(PingEvent(sequence=1)))
+
+    assert failures == []
+    assert time.perf_counter() - started < 0.2
+    assert bus.metrics[slow.__qualname__].calls == 5
+
+
+def test_async_publish_isolates_failures_and_timeouts():
+    bus, received = EventBus(handler_timeout=0.05), []
+
+    async def hang(event):
+        await asyncio.sleep(10)
+
+    async def fail(event):
+        raise RuntimeError("boom")
+
+    async def record(event):
+        received.append(event.sequence)
+
+    for handler in (hang, fail, record):
+        bus.subscribe(PingEvent, handler)
+
+    failures = asyncio.run(bus.publish_async(PingEvent(sequence=1)))
+
+    assert received == [1]
+    assert {(failure.handler, type(failure.error)) for failure in failures} == {
+        (hang.__qualname__, asyncio.TimeoutError),
+        (fail.__qualname__, RuntimeError),
+    }
+    assert bus.metrics[hang.__qualname__].timeouts == 1
+    assert bus.metrics[fail.__qualname__].failures == 1
+
+
+def test_publish_inside_a_loop_does_not_wait_for_async_handlers():
+    bus, received = EventBus(), []
+
+    async def notify(event):
+        await asyncio.sleep(0.05)
+        received.append(event.sequence)
+
+    bus.subscribe(PingEvent, notify)
+
+    async def command():
+        started = time.perf_counter()
+        bus.publish(PingEvent(sequence=1))
+        elapsed = time.perf_counter() - started
+        assert received == []
+        await bus.drain()
+        return elapsed
+
+    assert asyncio.run(command()) < 0.05
+    assert received == [1]
+
+
+def test_publish_without_a_loop_completes_async_handlers():
+    bus, received = EventBus(), []
+
+    async def record(event):
+        received.append(event.sequence)
+
+    bus.subscribe(PingEvent, record)
+    bus.publish(PingEvent(sequence=1))
+
+    assert received == [1]
+
+
+def test_publish_from_an_executor_thread_hands_off_to_the_bound_loop():
+    bus, received = EventBus(), []
+
+    async def notify(event):
+        await asyncio.sleep(0.05)
+        received.append(event.sequence)
+
+    bus.subscribe(PingEvent, notify)
+
+    def command():
+        started = time.perf_counter()
+        bus.publish(PingEvent(sequence=1))
+        return time.perf_counter() - started
+
+    async def scenario():
+        bus.bind_loop(asyncio.get_running_loop())
+        elapsed = await asyncio.get_running_loop().run_in_executor(None, command)
+        assert received == []
+        await bus.drain()
+        return elapsed
+
+    assert asyncio.run(scenario()) < 0.05
+    assert received == [1]
@@ -0,0 +1,79 @@
+import logging
+import threading
+
+import pytest
+
+from src.building_blocks.infrastructure.logging_pipeline import ContextLogger, QueueLogging, SamplingFilter
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("tests.logging_pipeline")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = RecordingHandler()
+    logger.handlers = [handler]
+    yield logger, handler
+    logger.handlers = []
+
+
+def test_handlers_run_on_the_listener_thread_and_are_restored(logger):
+    logger, handler = logger
+    original = list(logger.handlers)
+    queue_logging = QueueLogging([logger]).start()
+    try:
+        args = ["before"]
+        logger.info("value %s", args)
+        args[0] = "after"  # mutated once the call returned: the record must keep what was logged
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        assert handler not in logger.handlers
+    finally:
+        queue_logging.stop()
+
+    assert logger.handlers == original
+    assert [record.getMessage() for record in handler.records] == ["value ['before']", "failed"]
+    assert "ValueError: boom" in handler.records[1].exc_text
+    assert threading.current_thread().name not in handler.threads
+
+
+def test_context_is_bound_once_and_merged_with_per_call_extra(logger):
+    logger, handler = logger
+    bound = ContextLogger(logger, {"user_id": "u-1"}).bind(conversation_id="c-1")
+
+    bound.info("first")
+    bound.info("second", extra={"attempt": 2})
+
+    first, second = handler.records
+    assert (first.user_id, first.conversation_id) == ("u-1", "c-1")
+    assert (second.conversation_id, second.attempt) == ("c-1", 2)
+    assert not hasattr(first, "attempt")
+
+
+def test_sampling_keeps_one_in_n_debug_records_per_call_site(logger):
+    logger, handler = logger
+    handler.addFilter(SamplingFilter(every=10))
+
+    for _ in range(100):
+        logger.debug("token streamed")
+    for _ in range(3):
+        logger.debug("rare")
+    logger.info("always kept")
+
+    messages = [record.getMessage() for record in handler.records]
+    assert messages.count("token streamed") == 10
+    assert messages.count("rare") == 1
+    assert "always kept" in messages
@@ -0,0 +1,164 @@
+import asyncio
+import multiprocessing
+
+import pytest
+
+from src.building_blocks.infrastructure.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    configure_metrics,
+    mark_process_dead,
+    render_metrics,
+)
+from src.building_blocks.infrastructure.metrics.instruments import (
+    EXECUTOR_QUEUE_DEPTH,
+    HANDLER_DURATION,
+    HANDLER_FAILURES,
+)
+from src.modules.chats.application.contracts.query import BaseQuery
+from src.modules.chats.infrastructure.mediator import Mediator
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    yield registry
+    configure_metrics(None, registry)
+
+
+def define(registry):
+    return (
+        Counter("jobs", "Jobs run.", ("queue",), registry=registry),
+        Gauge("workers_busy", "Busy workers.", registry=registry),
+        Gauge("worker_heap_bytes", "Heap per worker.", registry=registry, mode="all"),
+        Histogram("job_seconds", "Job duration.", buckets=(0.1, 1.0), registry=registry),
+    )
+
+
+def lines(registry):
+    return render_metrics(registry).decode().splitlines()
+
+
+def test_renders_the_prometheus_text_format(registry):
+    jobs, busy, _, duration = define(registry)
+
+    jobs.labels("mail").inc()
+    jobs.labels(queue='quo"te').inc(2)
+    busy.inc(3)
+    busy.dec()
+    for seconds in (0.05, 0.5, 0.5, 3.0):
+        duration.observe(seconds)
+
+    output = lines(registry)
+    assert "# HELP jobs Jobs run." in output and "# TYPE jobs counter" in output
+    assert 'jobs_total{queue="mail"} 1.0' in output
+    assert 'jobs_total{queue="quo\\"te"} 2.0' in output
+    assert "workers_busy 2.0" in output
+    assert "# TYPE job_seconds histogram" in output
+    assert [line for line in output if line.startswith("job_seconds")] == [
+        'job_seconds_bucket{le="0.1"} 1.0',
+        'job_seconds_bucket{le="1.0"} 3.0',
+        'job_seconds_bucket{le="+Inf"} 4.0',
+        "job_seconds_sum 4.05",
+        "job_seconds_count 4.0",
+    ]
+    with pytest.raises(ValueError):
+        jobs.labels("a", "b")
+
+
+def _worker(directory, queue_name, jobs_run):
+    registry = MetricsRegistry()
+    jobs, busy, heap, duration = define(registry)
+    configure_metrics(directory, registry)
+    for _ in range(jobs_run):
+        jobs.labels(queue_name).inc()
+        duration.observe(0.5)
+    busy.set(1)
+    heap.set(100 * jobs_run)
+
+
+def test_workers_aggregate_through_the_shared_directory(registry, tmp_path):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_worker, args=(tmp_path, "mail", runs)) for runs in (2, 3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    jobs, *_ = define(registry)
+    configure_metrics(tmp_path, registry)
+    jobs.labels("mail").inc()
+
+    output = lines(registry)
+    assert 'jobs_total{queue="mail"} 6.0' in output
+    assert "workers_busy 2.0" in output
+    assert 'job_seconds_bucket{le="1.0"} 5.0' in output and "job_seconds_count 5.0" in output
+    heaps = {f'worker_heap_bytes{{pid="{worker.pid}"}} {100.0 * runs}' for worker, runs in zip(workers, (2, 3))}
+    assert heaps <= set(output)
+
+    mark_process_dead(workers[0].pid)
+    output = lines(registry)
+    assert "workers_busy 1.0" in output
+    assert 'jobs_total{queue="mail"} 6.0' in output
+
+
+class Ping(BaseQuery):
+    pass
+
+
+class Boom(BaseQuery):
+    pass
+
+
+def boom(message):
+    raise RuntimeError("boom")
+
+
+def test_mediator_records_handler_latency_failures_and_queue_depth():
+    mediator = Mediator({Ping: lambda message: "pong", Boom: boom})
+    ping, failed = HANDLER_DURATION.labels("chats", "query", "Ping"), HANDLER_FAILURES.labels("chats", "query", "Boom")
+    pings_before, failures_before = ping._sum.get(), failed.get()
+
+    async def scenario():
+        assert await mediator.send(Ping()) == "pong"
+        with pytest.raises(RuntimeError):
+            await mediator.send(Boom())
+
+    asyncio.run(scenario())
+
+    assert sum(bucket.get() for bucket in ping._buckets) >= 1 and ping._sum.get() > pings_before
+    assert failed.get() == failures_before + 1
+    assert EXECUTOR_QUEUE_DEPTH.labels("chats").get() == 0
+
+
+def test_http_metrics_use_route_templates_and_the_endpoint_serves_them():
+    pytest.importorskip("httpx")
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+    from starlette.testclient import TestClient
+
+    from src.api.core.middleware.metrics import MetricsMiddleware, metrics_endpoint
+
+    app = Starlette(
+        routes=[
+            Route("/items/{item_id}", lambda request: PlainTextResponse("ok")),
+            Route("/metrics", metrics_endpoint),
+        ]
+    )
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+
+    for item_id in range(3):
+        client.get(f"/items/{item_id}")
+    client.get("/nowhere")
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text.splitlines()
+    item_requests = 'http_requests_total{method="GET",route="/items/{item_id}",status="200"}'
+    assert any(line.startswith(item_requests) for line in body)
+    assert any(line.startswith('http_requests_total{method="GET",route="unmatched",status="404"}') for line in body)
+    assert not any('route="/metrics"' in line for line in body)
+    assert 'http_requests_in_progress{method="GET"} 0.0' in body
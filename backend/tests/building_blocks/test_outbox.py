@@ -0,0 +1,233 @@
+import asyncio
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from src.building_blocks.domain.events import DomainEvent  # noqa: E402
+from src.building_blocks.infrastructure.event_bus import EventBus  # noqa: E402
+from src.building_blocks.infrastructure.outbox import Outbox, OutboxMessage  # noqa: E402
+from src.building_blocks.infrastructure.outbox_relay import OutboxRelay  # noqa: E402
+from src.building_blocks.infrastructure.sql_outbox import OutboxMessageModel, SQLOutbox  # noqa: E402
+from src.database.models import Base  # noqa: E402
+from src.modules.accounts.domain.account.account import Account  # noqa: E402
+from src.modules.accounts.domain.account.events.account_registered_event import AccountRegisteredEvent  # noqa: E402
+from src.modules.accounts.domain.account.value_objects.email import Email  # noqa: E402
+from src.modules.accounts.domain.account.value_objects.hashed_password import HashedPassword  # noqa: E402
+from src.modules.accounts.infrastructure.caching.principal_cache import Principal, PrincipalCache  # noqa: E402
+from src.modules.accounts.infrastructure.persistence.repositories.sql_account_repo import (  # noqa: E402
+    SQLAccountRepository,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PingEvent(DomainEvent):
+    sequence: int
+
+
+@dataclass(frozen=True, slots=True)
+class TypedEvent(DomainEvent):
+    subject_id: uuid.UUID
+    due: datetime | None
+
+
+@pytest.fixture
+def session_factory():
+    # One shared connection, so the relay's worker thread sees the same in-memory database.
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+def stage(outbox: SQLOutbox, events) -> None:
+    with outbox.session_factory() as session:
+        outbox.stage(session, events)
+        session.commit()
+
+
+def test_outbox_message_round_trips_the_event():
+    event = PingEvent(sequence=7)
+
+    restored = OutboxMessage.from_event(event).to_event(PingEvent)
+
+    assert restored == event
+    assert (restored.id, restored.occurred_on) == (event.id, event.occurred_on)
+
+
+def test_outbox_message_restores_fields_by_their_annotation():
+    event = TypedEvent(subject_id=uuid.uuid4(), due=datetime(2026, 1, 2, tzinfo=timezone.utc))
+
+    restored = OutboxMessage.from_event(event).to_event(TypedEvent)
+
+    assert restored == event
+    assert isinstance(restored.subject_id, uuid.UUID)
+
+
+def test_in_memory_outbox_marks_by_id_and_drains_in_order():
+    outbox = Outbox()
+    first, second = outbox.add(PingEvent(sequence=1)), outbox.add(PingEvent(sequence=2))
+
+    outbox.mark_processed(first.id)
+    outbox.mark_processed(uuid.uuid4())
+
+    assert outbox.pending() == [second]
+    assert list(outbox.drain()) == [first, second]
+    assert outbox.pending() == []
+
+
+def test_repository_events_are_delivered_only_by_the_relay(session_factory):
+    bus, received = EventBus(), []
+    bus.subscribe(AccountRegisteredEvent, received.append)
+    outbox = SQLOutbox(session_factory)
+    repository = SQLAccountRepository(session_factory, outbox=outbox)
+
+    account = Account.register(Email.create("user@example.com"), HashedPassword.create("hashed-password"))
+    repository.add(account)
+
+    assert received == []
+    assert outbox.pending_count() == 1
+
+    OutboxRelay(outbox, bus).relay_once()
+
+    assert [event.account_id for event in received] == [str(account.id.value)]
+    assert outbox.pending_count() == 0
+
+
+def test_commit_wakes_the_relay_to_invalidate_the_principal_cache(session_factory):
+    bus, principals = EventBus(), PrincipalCache()
+    principals.subscribe(bus)
+    outbox = SQLOutbox(session_factory)
+    repository = SQLAccountRepository(session_factory, outbox=outbox)
+    account = Account.register(Email.create("user@example.com"), HashedPassword.create("hashed-password"))
+    repository.add(account)
+    # A poll interval far beyond the test's wait: only the commit's wake-up can deliver in time.
+    relay = OutboxRelay(outbox, bus, poll_interval_seconds=60)
+
+    async def scenario():
+        relay.start()
+        try:
+            await asyncio.sleep(0.05)
+            principals.put(str(account.id.value), Principal.of(account))
+            account.deactivate()
+            await asyncio.to_thread(repository.update, account)
+            for _ in range(200):
+                if principals.get(str(account.id.value)) is None:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            relay.stop()
+
+    asyncio.run(scenario())
+    assert principals.get(str(account.id.value)) is None
+
+
+def test_staged_events_roll_back_with_the_transaction(session_factory):
+    outbox = SQLOutbox(session_factory)
+    with session_factory() as session:
+        outbox.stage(session, [PingEvent(sequence=1)])
+        session.rollback()
+
+    assert outbox.pending_count() == 0
+
+
+def test_relay_publishes_in_order_and_marks_the_batch_processed(session_factory):
+    bus, received = EventBus(), []
+    bus.subscribe(PingEvent, received.append)
+    outbox = SQLOutbox(session_factory)
+    stage(outbox, [PingEvent(sequence=index) for index in range(5)])
+    relay = OutboxRelay(outbox, bus, event_types=[PingEvent], batch_size=3)
+
+    assert relay.relay_once() == 3
+    assert relay.relay_once() == 2
+    assert relay.relay_once() == 0
+
+    assert [event.sequence for event in received] == [0, 1, 2, 3, 4]
+    with session_factory() as session:
+        assert session.execute(select(OutboxMessageModel.processed_at.is_not(None))).scalars().all() == [True] * 5
+    assert relay.metrics.relayed == 5
+    assert relay.metrics.batches == 2
+    assert relay.metrics.max_lag_seconds >= 0
+    assert relay.metrics.events_per_second > 0
+
+
+def test_failed_messages_are_retried_until_max_attempts(session_factory):
+    bus = EventBus()
+
+    def fail(event):
+        raise RuntimeError("handler down")
+
+    bus.subscribe(PingEvent, fail)
+    outbox = SQLOutbox(session_factory, max_attempts=2)
+    stage(outbox, [PingEvent(sequence=1)])
+    relay = OutboxRelay(outbox, bus, event_types=[PingEvent])
+
+    assert relay.relay_once() == 1
+    assert relay.relay_once() == 1
+    assert relay.relay_once() == 0
+    assert relay.metrics.failed == 2
+    assert outbox.pending_count() == 0
+    with session_factory() as session:
+        row = session.execute(select(OutboxMessageModel)).scalar_one()
+        assert (row.attempts, row.processed_at) == (2, None)
+
+
+def test_relay_worker_delivers_in_the_background(session_factory):
+    bus, received = EventBus(), []
+    bus.subscribe(PingEvent, received.append)
+    outbox = SQLOutbox(session_factory)
+    relay = OutboxRelay(outbox, bus, event_types=[PingEvent], poll_interval_seconds=0.01)
+
+    async def scenario():
+        relay.start()
+        try:
+            stage(outbox, [PingEvent(sequence=1)])
+            for _ in range(200):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            relay.stop()
+
+    asyncio.run(scenario())
+    assert [event.sequence for event in received] == [1]
+
+
+def test_purge_deletes_expired_delivered_messages_and_dead_letters(session_factory):
+    bus = EventBus()
+    bus.subscribe(PingEvent, lambda event: None)
+    outbox = SQLOutbox(session_factory, max_attempts=1)
+    stage(outbox, [PingEvent(sequence=index) for index in range(3)])
+    OutboxRelay(outbox, bus, event_types=[PingEvent]).relay_once()
+    stage(outbox, [PingEvent(sequence=3)])
+    bus.subscribe(PingEvent, lambda event: 1 / 0)
+    OutboxRelay(outbox, bus, event_types=[PingEvent]).relay_once()  # the last message becomes a dead letter
+    stage(outbox, [PingEvent(sequence=4)])
+    now = datetime.now(timezone.utc)
+
+    assert outbox.purge(now - timedelta(hours=1), now - timedelta(hours=1), limit=10) == 0
+    assert outbox.purge(now + timedelta(seconds=1), now - timedelta(hours=1), limit=2) == 2
+    assert outbox.purge(now + timedelta(seconds=1), now + timedelta(seconds=1), limit=10) == 2
+
+    with session_factory() as session:
+        remaining = session.execute(select(OutboxMessageModel.payload)).scalars().all()
+    assert len(remaining) == 1 and '"sequence":4' in remaining[0].replace(" ", "")
+
+
+def test_relay_purges_on_its_interval(session_factory):
+    bus = EventBus()
+    bus.subscribe(PingEvent, lambda event: None)
+    outbox = SQLOutbox(session_factory)
+    stage(outbox, [PingEvent(sequence=index) for index in range(5)])
+    relay = OutboxRelay(outbox, bus, event_types=[PingEvent], retention=timedelta(0), purge_batch_size=2)
+    relay.relay_once()
+
+    assert relay.purge_once() == 5
+    assert relay.metrics.purged == 5
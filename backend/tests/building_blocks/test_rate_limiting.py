@@ -0,0 +1,161 @@
+import uuid
+
+import pytest
+
+from src.building_blocks.infrastructure.rate_limiting import (
+    InMemoryCounterStore,
+    InMemoryTokenBucketLimiter,
+    SlidingWindowLimiter,
+)
+from src.modules.llm_backend.domain.token.root import Token
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_a_burst_of_limit_then_denies_with_retry_after():
+    clock = FakeClock()
+    limiter = InMemoryTokenBucketLimiter(clock=clock)
+
+    decisions = [limiter.acquire("client", limit=3, period_seconds=60) for _ in range(4)]
+
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+    assert decisions[3].retry_after == pytest.approx(20.0)
+
+
+def test_token_bucket_refills_one_request_per_interval():
+    clock = FakeClock()
+    limiter = InMemoryTokenBucketLimiter(clock=clock)
+    for _ in range(3):
+        limiter.acquire("client", limit=3, period_seconds=60)
+
+    clock.now = 19.9
+    assert not limiter.acquire("client", limit=3, period_seconds=60).allowed
+    clock.now = 20.0
+    assert limiter.acquire("client", limit=3, period_seconds=60).allowed
+    assert not limiter.acquire("client", limit=3, period_seconds=60).allowed
+
+
+def test_token_bucket_keeps_keys_independent_and_prunes_full_buckets():
+    clock = FakeClock()
+    limiter = InMemoryTokenBucketLimiter(max_keys=2, clock=clock)
+    limiter.acquire("a", limit=1, period_seconds=60)
+
+    assert limiter.acquire("b", limit=1, period_seconds=60).allowed
+    assert not limiter.acquire("a", limit=1, period_seconds=60).allowed
+
+    clock.now = 120.0
+    limiter.acquire("c", limit=1, period_seconds=60)
+    assert len(limiter._arrivals) == 1
+
+
+def test_sliding_window_weights_the_previous_window_by_its_overlap():
+    clock = FakeClock(now=600.0)
+    limiter = SlidingWindowLimiter(InMemoryCounterStore(clock=clock), clock=clock)
+    for _ in range(4):
+        assert limiter.acquire("client", limit=4, period_seconds=60).allowed
+    assert not limiter.acquire("client", limit=4, period_seconds=60).allowed
+
+    # Halfway through the next window half of the previous count still applies.
+    clock.now = 690.0
+    assert limiter.acquire("client", limit=4, period_seconds=60).allowed
+    assert limiter.acquire("client", limit=4, period_seconds=60).allowed
+    denied = limiter.acquire("client", limit=4, period_seconds=60)
+    assert not denied.allowed
+    assert denied.retry_after == pytest.approx(15.0)
+
+
+def test_sliding_window_does_not_count_denied_requests():
+    clock = FakeClock(now=600.0)
+    store = InMemoryCounterStore(clock=clock)
+    limiter = SlidingWindowLimiter(store, clock=clock)
+    for _ in range(10):
+        limiter.acquire("client", limit=2, period_seconds=60)
+
+    assert int(store.get("ratelimit:client:10")) == 2
+
+
+def test_counter_store_expires_keys():
+    clock = FakeClock()
+    store = InMemoryCounterStore(clock=clock)
+    store.incr("key")
+    store.expire("key", 10)
+
+    clock.now = 10.0
+    assert store.get("key") is None
+    assert store.incr("key") == 1
+
+
+def test_token_can_make_request_spends_its_own_allowance():
+    limiter = InMemoryTokenBucketLimiter(clock=FakeClock())
+    token = Token(_id=uuid.uuid4(), user_id=uuid.uuid4(), token="secret", rate_limit=2)
+    other = Token(_id=uuid.uuid4(), user_id=uuid.uuid4(), token="other", rate_limit=2)
+
+    assert [token.can_make_request(limiter) for _ in range(3)] == [True, True, False]
+    assert other.can_make_request(limiter)
+
+
+class TestRateLimitMiddleware:
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("httpx")
+        from starlette.applications import Starlette
+        from starlette.responses import PlainTextResponse
+        from starlette.routing import Route
+        from starlette.testclient import TestClient
+
+        from src.api.core.middleware.rate_limit import RateLimitMiddleware
+
+        app = Starlette(routes=[Route("/ping", lambda request: PlainTextResponse("pong"))])
+        limiter = InMemoryTokenBucketLimiter(clock=FakeClock())
+        subjects = {"first-token": "first", "first-token-renewed": "first", "second-token": "second"}
+        app.add_middleware(RateLimitMiddleware, limiter=limiter, requests_per_minute=2, subject_resolver=subjects.get)
+        return TestClient(app)
+
+    def test_returns_429_with_retry_after_once_the_limit_is_spent(self, client):
+        responses = [client.get("/ping") for _ in range(3)]
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert responses[0].headers["x-ratelimit-remaining"] == "1"
+        assert responses[2].headers["retry-after"] == "30"
+        assert responses[2].json()["error_code"] == "rate_limited"
+
+    def test_limits_each_verified_subject_separately(self, client):
+        client.get("/ping", headers={"Authorization": "Bearer first-token"})
+        client.get("/ping", headers={"Authorization": "Bearer first-token-renewed"})
+
+        assert client.get("/ping", headers={"Authorization": "Bearer first-token"}).status_code == 429
+        assert client.get("/ping", headers={"Authorization": "Bearer second-token"}).status_code == 200
+
+    def test_unverifiable_tokens_share_the_peer_address_allowance(self, client):
+        responses = [client.get("/ping", headers={"Authorization": f"Bearer forged-{i}"}) for i in range(3)]
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+
+
+def test_rate_limit_exception_maps_to_429_with_retry_after():
+    pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from starlette.testclient import TestClient
+
+    from src.api.core.exceptions.handlers import rate_limit_exception_handler
+    from src.building_blocks.domain.exceptions import RateLimitExceededException
+
+    app = FastAPI()
+    app.add_exception_handler(RateLimitExceededException, rate_limit_exception_handler)
+
+    @app.get("/limited")
+    def limited():
+        raise RateLimitExceededException(retry_after=12.3)
+
+    response = TestClient(app).get("/limited")
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "13"
+    assert response.json()["error_code"] == "rate_limited"
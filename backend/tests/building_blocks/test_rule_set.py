@@ -0,0 +1,71 @@
+import pytest
+
+from src.building_blocks.domain.exceptions import BusinessRuleValidationException, BusinessRuleViolationsException
+from src.building_blocks.domain.rule_set import RuleSet
+from src.modules.chats.domain.messages.rules import (
+    CONTENT_RULES,
+    ContentResponseMustBeValidRule,
+    ContentTextMustBeValidRule,
+    ContentTextMustNotContainProfanityRule,
+)
+from src.modules.chats.domain.messages.value_objects.content import Content
+
+
+def test_check_short_circuits_on_the_first_broken_rule():
+    evaluated = []
+
+    def text(text, response):
+        evaluated.append("text")
+        return (text,)
+
+    def response(text, response):
+        evaluated.append("response")
+        return (response,)
+
+    rules = RuleSet((ContentTextMustBeValidRule, text), (ContentResponseMustBeValidRule, response))
+
+    with pytest.raises(BusinessRuleValidationException) as raised:
+        rules.check("", "")
+
+    assert evaluated == ["text"]
+    assert raised.value.rule == ContentTextMustBeValidRule(text="")
+    assert raised.value.message == ContentTextMustBeValidRule.message
+
+
+@pytest.mark.parametrize(
+    ("text", "response"),
+    [("", "Open Settings."), ("Hi there", "ok"), ("badword1", "Open Settings."), ("Hello", "Open Settings.")],
+)
+def test_rule_set_agrees_with_the_rule_instances(text, response):
+    rules = [
+        ContentTextMustBeValidRule(text=text),
+        ContentResponseMustBeValidRule(response=response),
+        ContentTextMustNotContainProfanityRule(text=text),
+    ]
+
+    assert CONTENT_RULES.violations(text, response) == [rule for rule in rules if rule.is_broken()]
+
+
+def test_check_all_reports_every_violation_in_one_pass():
+    with pytest.raises(BusinessRuleViolationsException) as raised:
+        CONTENT_RULES.check_all(" badword1 ", "ok")
+
+    assert [type(rule) for rule in raised.value.rules] == [
+        ContentResponseMustBeValidRule,
+        ContentTextMustNotContainProfanityRule,
+    ]
+    assert isinstance(raised.value.rule, ContentResponseMustBeValidRule)
+    assert ContentTextMustNotContainProfanityRule.message in str(raised.value)
+
+
+def test_content_create_raises_the_first_broken_rule():
+    with pytest.raises(BusinessRuleValidationException) as raised:
+        Content.create(text=" badword1 ", response="ok")
+
+    assert type(raised.value) is BusinessRuleValidationException
+    assert raised.value.rule == ContentResponseMustBeValidRule(response="ok")
+
+
+def test_passing_input_reports_nothing():
+    assert CONTENT_RULES.violations("How do I reset my password?", "Open Settings.") == []
+    CONTENT_RULES.check_all("How do I reset my password?", "Open Settings.")
@@ -0,0 +1,118 @@
+import datetime
+import enum
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.building_blocks.domain.events import DomainEvent
+from src.building_blocks.domain.serialization import deserializer_for, serializer_for
+from src.building_blocks.infrastructure import json_codec
+from src.modules.accounts.domain.account.account import Account
+from src.modules.accounts.domain.account.value_objects.account_id import AccountId
+from src.modules.accounts.domain.account.value_objects.email import Email
+from src.modules.accounts.domain.account.value_objects.hashed_password import HashedPassword
+from src.modules.chats.domain.messages.events.message_created import MessageCreatedEvent
+
+
+class Priority(enum.Enum):
+    LOW = "low"
+    HIGH = "high"
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledEvent(DomainEvent):
+    owner_id: AccountId
+    due: Optional[datetime.datetime]
+    tags: list[str] = field(default_factory=list)
+    attendees: tuple[uuid.UUID, ...] = ()
+    priority: Priority = Priority.LOW
+
+
+def test_event_to_dict_is_json_ready():
+    event = MessageCreatedEvent(
+        message_id=uuid.uuid4(), conversation_id=uuid.uuid4(), sender_id=uuid.uuid4(), text="hi", response="hello"
+    )
+
+    raw = event.to_dict()
+
+    assert raw == {
+        "event_id": str(event.id),
+        "occurred_on": event.occurred_on.isoformat(),
+        "message_id": str(event.message_id),
+        "conversation_id": str(event.conversation_id),
+        "sender_id": str(event.sender_id),
+        "text": "hi",
+        "response": "hello",
+    }
+    assert json.loads(json.dumps(raw)) == raw
+
+
+def test_value_objects_optionals_and_collections_are_converted():
+    owner, attendee = uuid.uuid4(), uuid.uuid4()
+    due = datetime.datetime(2026, 1, 2, 3, 4, tzinfo=datetime.timezone.utc)
+
+    raw = ScheduledEvent(owner_id=AccountId(owner), due=due, tags=["a"], attendees=(attendee,)).to_dict()
+    empty = ScheduledEvent(owner_id=AccountId(owner), due=None).to_dict()
+
+    assert (raw["owner_id"], raw["due"]) == (str(owner), due.isoformat())
+    assert (raw["tags"], raw["attendees"]) == (["a"], [str(attendee)])
+    assert (empty["due"], empty["attendees"]) == (None, [])
+
+
+def test_annotated_fast_path_falls_back_for_other_runtime_types():
+    # Annotated ``uuid.UUID`` but handed a value object, as aggregates sometimes do.
+    message_id = uuid.uuid4()
+    event = MessageCreatedEvent(
+        message_id=AccountId(message_id), conversation_id=uuid.uuid4(), sender_id=uuid.uuid4(), text="", response=""
+    )
+
+    assert event.to_dict()["message_id"] == str(message_id)
+
+
+def test_entity_to_dict_leaves_out_pending_events():
+    account = Account.register(Email.create("user@example.com"), HashedPassword.create("hashed-password"))
+
+    raw = account.to_dict()
+
+    assert account.pull_events()
+    assert "_events" not in raw
+    assert raw["_id"] == str(account.id.value)
+    assert raw["_email"] == "user@example.com"
+    json.dumps(raw)
+
+
+def test_serializers_are_compiled_once_per_class():
+    assert serializer_for(MessageCreatedEvent) is serializer_for(MessageCreatedEvent)
+
+
+def test_json_codec_round_trips_event_bytes():
+    event = ScheduledEvent(owner_id=AccountId(uuid.uuid4()), due=None, tags=["ü"])
+
+    data = json_codec.dumps_event(event)
+
+    assert isinstance(data, bytes)
+    assert json_codec.loads(data) == event.to_dict()
+
+
+def test_deserializer_restores_annotated_types_from_json():
+    due = datetime.datetime(2026, 1, 2, 3, 4, tzinfo=datetime.timezone.utc)
+    event = ScheduledEvent(
+        owner_id=AccountId(uuid.uuid4()), due=due, tags=["a"], attendees=(uuid.uuid4(),), priority=Priority.HIGH
+    )
+
+    restored = deserializer_for(ScheduledEvent)(json_codec.loads(json_codec.dumps_event(event)))
+
+    assert restored == event
+    assert (restored.id, restored.occurred_on) == (event.id, event.occurred_on)
+    assert isinstance(restored.owner_id.value, uuid.UUID)
+    assert isinstance(restored.attendees, tuple)
+
+
+def test_deserializer_keeps_defaults_for_absent_fields_and_none_for_optionals():
+    owner = uuid.uuid4()
+
+    restored = deserializer_for(ScheduledEvent)({"owner_id": str(owner), "due": None})
+
+    assert restored.owner_id == AccountId(owner)
+    assert (restored.due, restored.tags, restored.attendees, restored.priority) == (None, [], (), Priority.LOW)
@@ -0,0 +1,86 @@
+import dataclasses
+import importlib
+import pkgutil
+import sys
+import uuid
+
+import pytest
+
+import src.modules
+from src.building_blocks.domain.entity import Entity
+from src.building_blocks.domain.events import DomainEvent
+from src.building_blocks.domain.value_object import ValueObject
+from src.modules.accounts.domain.account.value_objects.account_id import AccountId
+from src.modules.accounts.domain.role.value_objects.role_id import RoleId
+from src.modules.chats.domain.messages.events.message_created import MessageCreatedEvent
+from src.modules.chats.domain.messages.value_objects.content import Content
+
+
+def _import_domain_modules() -> None:
+    for package in pkgutil.iter_modules(src.modules.__path__):
+        domain = f"src.modules.{package.name}.domain"
+        for module in pkgutil.walk_packages([f"{src.modules.__path__[0]}/{package.name}/domain"], f"{domain}."):
+            try:
+                importlib.import_module(module.name)
+            except Exception:  # unfinished modules that do not import yet; their classes are not checked
+                pass
+
+
+def _subclasses(base: type) -> list[type]:
+    _import_domain_modules()
+    found, pending = set(), [base]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass not in found and subclass.__module__.startswith("src."):
+                found.add(subclass)
+                pending.append(subclass)
+    # ``dataclass(slots=True)`` replaces the class it decorates; only the module-level ones matter.
+    return sorted(
+        (cls for cls in found if getattr(sys.modules[cls.__module__], cls.__name__, None) is cls),
+        key=lambda cls: cls.__qualname__,
+    )
+
+
+def _has_instance_dict(cls: type) -> bool:
+    return any("__dict__" in klass.__dict__ for klass in cls.__mro__ if klass is not object)
+
+
+@pytest.mark.parametrize("cls", _subclasses(ValueObject), ids=lambda cls: cls.__qualname__)
+def test_value_objects_are_frozen_slotted_and_use_the_base_equality(cls):
+    declaration = "@dataclass(frozen=True, slots=True, eq=False)"
+    assert not _has_instance_dict(cls), f"declare {cls.__qualname__} with {declaration}"
+    assert cls.__dataclass_params__.frozen
+    assert cls.__eq__ is ValueObject.__eq__ and cls.__hash__ is ValueObject.__hash__
+
+
+@pytest.mark.parametrize("cls", _subclasses(DomainEvent), ids=lambda cls: cls.__qualname__)
+def test_domain_events_are_frozen_and_slotted(cls):
+    assert not _has_instance_dict(cls), f"declare {cls.__qualname__} with @dataclass(frozen=True, slots=True)"
+    assert cls.__dataclass_params__.frozen
+
+
+def test_building_block_bases_are_slotted():
+    for base in (ValueObject, DomainEvent, Entity):
+        assert not _has_instance_dict(base)
+
+
+def test_value_object_equality_and_cached_hash():
+    value = uuid.uuid4()
+    account_id = AccountId(value)
+
+    assert account_id == AccountId(value) and hash(account_id) == hash(AccountId(value))
+    assert account_id != RoleId(value)
+    assert {RoleId(value), RoleId(value)} == {RoleId(value)}
+    assert account_id._hash == hash(account_id)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        account_id.value = uuid.uuid4()
+    assert Content(_text="q", _response="a") == Content(_text="q", _response="a")
+
+
+def test_events_are_immutable():
+    event = MessageCreatedEvent(
+        message_id=uuid.uuid4(), conversation_id=uuid.uuid4(), sender_id=uuid.uuid4(), text="", response=""
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        event.text = "changed"
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from src.building_blocks.infrastructure.pipeline import Pipeline, PipelineStage
+from src.building_blocks.infrastructure.tracing import (
+    NOOP_SPAN,
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanKind,
+    configure_tracing,
+    format_traceparent,
+    parse_traceparent,
+    start_span,
+    traced_methods,
+)
+from src.building_blocks.infrastructure.tracing.collector import CollectorServer
+from src.modules.chats.infrastructure.mediator import Mediator
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter)
+    yield exporter
+    configure_tracing(None)
+
+
+@traced_methods("repository")
+class FakeRepository:
+    def find(self, key):
+        return {"key": key}
+
+    def _helper(self):
+        return None
+
+
+class Lookup:
+    def __init__(self, key):
+        self.key = key
+
+
+class LookupHandler:
+    def __init__(self, repository):
+        self.repository = repository
+
+    def handle(self, message):
+        return self.repository.find(message.key)
+
+
+class Upper(PipelineStage):
+    def process(self, data):
+        return {"text": data["text"].upper()}
+
+
+def by_name(exporter):
+    return {span.name: span for span in exporter.spans}
+
+
+def test_spans_are_no_ops_while_tracing_is_off():
+    assert start_span("anything") is NOOP_SPAN
+    assert FakeRepository().find(1) == {"key": 1}
+
+
+def test_request_path_forms_one_trace_across_the_executor_hop(exporter):
+    mediator = Mediator({Lookup: LookupHandler(FakeRepository())})
+
+    async def request():
+        with start_span("GET /conversations", kind=SpanKind.SERVER):
+            return await mediator.send(Lookup("c-1"))
+
+    assert asyncio.run(request()) == {"key": "c-1"}
+
+    spans = by_name(exporter)
+    root = spans["GET /conversations"]
+    send, handler, repository = (
+        spans["mediator.send Lookup"],
+        spans["handler LookupHandler"],
+        spans["repository FakeRepository.find"],
+    )
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert send.parent_span_id == root.span_id
+    assert handler.parent_span_id == send.span_id
+    assert repository.parent_span_id == handler.span_id
+    assert "repository FakeRepository._helper" not in spans
+    assert root.parent_span_id is None
+
+
+def test_pipeline_stages_get_spans_and_failures_are_recorded(exporter):
+    assert Pipeline([Upper()]).run({"text": "hi"})["text"] == "HI"
+
+    with pytest.raises(ValueError):
+        with start_span("failing"):
+            raise ValueError("boom")
+
+    spans = by_name(exporter)
+    assert spans["pipeline.stage Upper"].parent_span_id == spans["pipeline Pipeline"].span_id
+    assert spans["failing"].status.name == "ERROR"
+    assert spans["failing"].attributes["exception.type"] == "ValueError"
+
+
+def test_traceparent_round_trip_and_rejection(exporter):
+    with start_span("outgoing") as span:
+        header = format_traceparent(span)
+
+    parent = parse_traceparent(header)
+
+    assert (parent.trace_id, parent.span_id) == (span.trace_id, span.span_id)
+    assert parse_traceparent("00-" + "0" * 32 + "-" + "1" * 16 + "-01") is None
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+def test_jsonl_exporter_writes_one_record_per_span(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonLinesSpanExporter(path, service_name="chatbot")
+    configure_tracing(exporter)
+    try:
+        with start_span("parent", {"user.id": 7}):
+            with start_span("child"):
+                pass
+    finally:
+        configure_tracing(None)
+        exporter.shutdown()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["name"] for record in records] == ["child", "parent"]
+    assert records[0]["parent_span_id"] == records[1]["span_id"]
+    assert records[1]["attributes"] == {"user.id": 7}
+    assert records[1]["service"] == "chatbot"
+
+
+def test_otlp_exporter_reaches_the_collector_stand_in(tmp_path):
+    collector = CollectorServer(("127.0.0.1", 0), tmp_path / "collected.jsonl")
+    threading.Thread(target=collector.serve_forever, daemon=True).start()
+    exporter = OtlpHttpSpanExporter(
+        f"http://127.0.0.1:{collector.server_port}/v1/traces", service_name="chatbot", export_interval=0.05
+    )
+    configure_tracing(exporter)
+    try:
+        with start_span("parent", {"retries": 2, "cached": True}) as parent:
+            with start_span("child"):
+                pass
+        exporter.shutdown()
+    finally:
+        configure_tracing(None)
+        collector.shutdown()
+        collector.server_close()
+
+    records = [json.loads(line) for line in (tmp_path / "collected.jsonl").read_text().splitlines()]
+    expected = parent.to_dict()
+    expected["service"] = "chatbot"
+    assert [record["name"] for record in records] == ["child", "parent"]
+    assert records[1] == expected
+    assert records[0]["parent_span_id"] == records[1]["span_id"]
+
+
+def test_middleware_joins_the_callers_trace(exporter):
+    pytest.importorskip("httpx")
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+    from starlette.testclient import TestClient
+
+    from src.api.core.middleware.tracing import TracingMiddleware
+
+    app = Starlette(routes=[Route("/items/{item_id}", lambda request: PlainTextResponse("ok"))])
+    app.add_middleware(TracingMiddleware)
+    caller = "00-" + "ab" * 16 + "-" + "cd" * 8 + "-01"
+
+    response = TestClient(app).get("/items/42", headers={"traceparent": caller})
+
+    (span,) = exporter.spans
+    assert span.trace_id == int("ab" * 16, 16) and span.parent_span_id == int("cd" * 8, 16)
+    assert span.kind is SpanKind.SERVER
+    assert span.name == "GET /items/{item_id}"
+    assert span.attributes["http.response.status_code"] == 200
+    assert response.headers["traceparent"] == format_traceparent(span)
@@ -0,0 +1,51 @@
+import logging
+import threading
+
+from src.modules.chats.infrastructure.services.logging.config import LoggerConfig
+from src.modules.chats.infrastructure.services.logging.conversation import ConversationLogger
+
+
+def read_log(config: LoggerConfig) -> list[str]:
+    with open(config.log_file_path(), encoding="utf-8") as log:
+        return log.read().splitlines()
+
+
+def test_events_are_logged_once_with_conversation_context(tmp_path):
+    config = LoggerConfig(log_dir=str(tmp_path), log_to_console=False, format="%(levelname)s %(message)s")
+    conversation_logger = ConversationLogger(config)
+    captured = []
+    conversation_logger.logger.handlers[0].addFilter(lambda record: captured.append(record) or True)
+
+    conversation_logger.log_event("message_sent", "u-1", "c-1", size=3)
+    conversation_logger.log_message("u-1", "c-1", "hello")
+    conversation_logger.log_error("model timed out", "u-1", "c-1")
+    conversation_logger.close()
+
+    assert read_log(config) == [
+        "INFO Conversation c-1 | User u-1: Event message_sent",
+        "INFO Conversation c-1 | User u-1: hello",
+        "ERROR Conversation error: model timed out",
+    ]
+    event = captured[0]
+    assert (event.user_id, event.conversation_id, event.event_name, event.size) == ("u-1", "c-1", "message_sent", 3)
+
+
+def test_debug_events_are_sampled_and_reconfiguring_replaces_handlers(tmp_path):
+    config = LoggerConfig(
+        log_dir=str(tmp_path), log_to_console=False, format="%(message)s", debug_sample_every=5, level="DEBUG"
+    )
+    threads = threading.active_count()
+    replaced = ConversationLogger(config)
+    conversation_logger = ConversationLogger(config)
+    bound = conversation_logger.bind("u-1", "c-1")
+
+    for _ in range(20):
+        bound.event("token_streamed", level=logging.DEBUG)
+    bound.event("message_sent")
+    conversation_logger.close()
+
+    assert threading.active_count() == threads
+    replaced.close()  # a no-op once replaced
+    lines = read_log(config)
+    assert lines.count("Conversation c-1 | User u-1: Event token_streamed") == 4
+    assert lines.count("Conversation c-1 | User u-1: Event message_sent") == 1
@@ -0,0 +1,57 @@
+import uuid
+
+import pytest
+
+from src.building_blocks.domain.exceptions import BusinessRuleValidationException
+from src.modules.chats.domain.conversations.conversation import Conversation
+from src.modules.chats.domain.conversations.enums.participant_role import ParticipantRole
+from src.modules.chats.domain.conversations.rules import (
+    ConversationCannotBeModifiedIfArchivedRule,
+    CreatorCannotBeRemovedRule,
+    ParticipantCannotBeAddedIfAlreadyExistsRule,
+    TitleCannotBeEmptyRule,
+)
+from src.modules.chats.domain.members.value_objects.member_id import MemberId
+
+
+def _conversation() -> Conversation:
+    return Conversation.create(creator_id=MemberId(uuid.uuid4()), creator_name="creator", title="Support")
+
+
+def test_participants_are_indexed_by_member_id():
+    conversation = _conversation()
+    member_id = MemberId(uuid.uuid4())
+
+    conversation.add_participant(member_id, ParticipantRole.VIEWER)
+
+    assert [participant.id for participant in conversation.participants] == [member_id]
+    with pytest.raises(BusinessRuleValidationException) as raised:
+        conversation.add_participant(MemberId(member_id.value), ParticipantRole.EDITOR)
+    assert isinstance(raised.value.rule, ParticipantCannotBeAddedIfAlreadyExistsRule)
+
+
+def test_archived_rule_is_checked_before_membership():
+    conversation = _conversation()
+    conversation.archive()
+
+    with pytest.raises(BusinessRuleValidationException) as raised:
+        conversation.add_participant(MemberId(uuid.uuid4()), ParticipantRole.VIEWER)
+
+    assert isinstance(raised.value.rule, ConversationCannotBeModifiedIfArchivedRule)
+
+
+def test_creator_cannot_be_removed():
+    conversation = _conversation()
+    conversation.add_participant(conversation.creator.id, ParticipantRole.EDITOR)
+
+    with pytest.raises(BusinessRuleValidationException) as raised:
+        conversation.remove_participant(conversation.creator.id)
+
+    assert isinstance(raised.value.rule, CreatorCannotBeRemovedRule)
+
+
+def test_create_validates_the_title():
+    with pytest.raises(BusinessRuleValidationException) as raised:
+        Conversation.create(creator_id=MemberId(uuid.uuid4()), creator_name="creator", title="  ")
+
+    assert isinstance(raised.value.rule, TitleCannotBeEmptyRule)
@@ -0,0 +1,47 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from src.modules.chats.domain.conversations.conversation import Conversation
+from src.modules.chats.domain.conversations.entities.creator import Creator
+from src.modules.chats.domain.conversations.value_objects.conversation_id import ConversationId
+from src.modules.chats.domain.members.value_objects.member_id import MemberId
+
+
+class TestConversationRehydration:
+    def _rehydrate(self, **overrides) -> Conversation:
+        created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        state = {
+            "conversation_id": ConversationId(value=uuid.uuid4()),
+            "title": "Persisted",
+            "creator": Creator.rehydrate(
+                member_id=MemberId(_value=uuid.uuid4()), name="", created_at=created_at, updated_at=created_at
+            ),
+            "created_at": created_at,
+            "updated_at": created_at + timedelta(hours=1),
+        }
+        state.update(overrides)
+        return Conversation.rehydrate(**state)
+
+    def test_restores_persisted_state(self):
+        conversation_id = ConversationId(value=uuid.uuid4())
+        conversation = self._rehydrate(conversation_id=conversation_id, is_archived=True, version=3)
+
+        assert conversation.id == conversation_id.value
+        assert conversation.title == "Persisted"
+        assert conversation.is_archived is True
+        assert conversation.version == 3
+        assert conversation.created_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert conversation.updated_at == datetime(2024, 1, 1, 1, tzinfo=timezone.utc)
+
+    def test_records_no_events(self):
+        assert self._rehydrate().get_events() == []
+
+    def test_skips_title_rule(self):
+        # Legacy rows may hold values that today's rules reject; loading them must not fail.
+        assert self._rehydrate(title="").title == ""
+
+    def test_instances_do_not_share_collections(self):
+        first, second = self._rehydrate(), self._rehydrate()
+        first._participants.append(object())
+
+        assert second.participants == []
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from src.modules.chats.infrastructure.configuration.processing.json.jsonl_store import JsonLinesStore
+
+
+def _segments(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".jsonl"))
+
+
+class TestJsonLinesStore:
+    def test_append_read_and_reopen(self, tmp_path):
+        with JsonLinesStore(str(tmp_path), segment_bytes=512) as store:
+            for index in range(50):
+                assert store.append("memory", {"question": f"q{index}", "answer": f"a{index}"}) == index
+            store.write("settings", {"theme": "dark"})
+            store.write("feedback", [{"rating": 1}])
+            store.append("feedback", {"rating": 5})
+
+            assert store.read_record("memory", 17) == {"question": "q17", "answer": "a17"}
+            assert store.read_record("memory", -1)["answer"] == "a49"
+            assert store.read("feedback") == [{"rating": 1}, {"rating": 5}]
+            assert len(_segments(tmp_path)) > 1  # rolled over at segment_bytes
+            with pytest.raises(TypeError):
+                store.append("settings", {})
+            with pytest.raises(IndexError):
+                store.read_record("memory", 50)
+
+        reopened = JsonLinesStore(str(tmp_path))
+        assert sorted(reopened.list_files()) == ["feedback", "memory", "settings"]
+        assert reopened.count("memory") == 50
+        assert reopened.read("memory")[-1] == {"question": "q49", "answer": "a49"}
+        assert reopened.read("settings") == {"theme": "dark"}
+        reopened.delete("settings")
+        assert not reopened.file_exists("settings")
+        with pytest.raises(FileNotFoundError):
+            reopened.read("settings")
+        reopened.close()
+
+    def test_compaction_drops_superseded_lines_and_survives_reopen(self, tmp_path):
+        store = JsonLinesStore(str(tmp_path), compact_min_bytes=4096, compact_ratio=0.5)
+        for version in range(200):
+            store.write("draft", {"version": version, "text": "x" * 40})
+        store.write("history", [1, 2])
+        store.append("history", 3)
+
+        # Garbage passed half the store, so it was compacted along the way.
+        size = sum(os.path.getsize(tmp_path / name) for name in _segments(tmp_path))
+        assert size < 200 * 60
+        store.compact()
+        assert len(_segments(tmp_path)) == 1
+        assert store.read_record("history", 0) == 1  # the whole-list write was split into records
+        store.append("history", 4)
+        store.close()
+
+        reopened = JsonLinesStore(str(tmp_path))
+        assert reopened.read("draft")["version"] == 199
+        assert reopened.read("history") == [1, 2, 3, 4]
+        reopened.close()
+
+    def test_recovery_truncates_a_torn_write_and_skips_replaced_segments(self, tmp_path):
+        store = JsonLinesStore(str(tmp_path))
+        store.append("memory", "first")
+        store.compact()
+        store.append("memory", "second")
+        store.close()
+        (segment,) = _segments(tmp_path)
+        # A segment the compaction replaced but had not deleted yet, and a crash mid-append.
+        with open(tmp_path / "chat_00000000.jsonl", "wb") as stale:
+            stale.write(b'{"op":"add","k":"memory","v":"stale"}\n')
+        with open(tmp_path / segment, "ab") as active:
+            active.write(b'{"op":"add","k":"memo')
+
+        reopened = JsonLinesStore(str(tmp_path))
+        assert reopened.read("memory") == ["first", "second"]
+        assert _segments(tmp_path) == [segment]
+        reopened.append("memory", "third")
+        reopened.close()
+        with JsonLinesStore(str(tmp_path)) as final:
+            assert final.read("memory") == ["first", "second", "third"]
@@ -0,0 +1,47 @@
+import pytest
+
+from src.modules.chats.domain.messages import profanity
+from src.modules.chats.domain.messages.profanity import ProfanityFilter
+from src.modules.chats.domain.messages.rules import ContentTextMustNotContainProfanityRule
+from src.modules.chats.infrastructure.profanity_wordlist import install_wordlist
+
+
+@pytest.fixture
+def restore_shared_filter():
+    shared = profanity.profanity_filter()
+    yield
+    profanity.use_profanity_filter(shared)
+
+
+def test_finds_overlapping_entries_in_one_pass():
+    matcher = ProfanityFilter(["he", "she", "hers", "his"], whole_words=False)
+
+    assert sorted(matcher.find("ushers")) == ["he", "hers", "she"]
+    assert not matcher.contains("hi you")
+
+
+def test_whole_words_only_by_default():
+    matcher = ProfanityFilter(["ass", "@$$"])
+
+    assert matcher.find("you ass!") == ["ass"]
+    assert not matcher.contains("a classic passage")
+    assert matcher.contains("what an @$$hat")
+
+
+def test_case_and_unicode_forms_are_normalized():
+    matcher = ProfanityFilter(["Straße", "badword"])
+
+    assert matcher.contains("STRASSE")
+    assert matcher.contains("ｂａｄｗｏｒｄ")  # full-width letters
+    assert not matcher.contains("badwords")
+
+
+def test_installed_wordlist_drives_the_content_rule(tmp_path, restore_shared_filter):
+    wordlist = tmp_path / "wordlist.txt"
+    wordlist.write_text("# reviewed 2026-10\nfrak\n\nsmeg  # from the appeals queue\n", encoding="utf-8")
+
+    matcher = install_wordlist(wordlist)
+
+    assert matcher.size == 2
+    assert ContentTextMustNotContainProfanityRule(text="Oh, SMEG.").is_broken()
+    assert not ContentTextMustNotContainProfanityRule(text="badword1").is_broken()
@@ -0,0 +1,156 @@
+import io
+import json
+import uuid
+import zipfile
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.database.models import Base  # noqa: E402
+from src.modules.chats.application.queries.export_conversations.handler import (  # noqa: E402
+    ExportConversationsHandler,
+)
+from src.modules.chats.application.queries.export_conversations.query import (  # noqa: E402
+    ExportConversationsQuery,
+    ExportFormat,
+)
+from src.modules.chats.infrastructure.persistence.orm.model import (  # noqa: E402
+    ConversationDBModel,
+    MemberDBModel,
+    MessageDBModel,
+)
+from src.modules.chats.infrastructure.persistence.read_models.sql_conversation_read_model import (  # noqa: E402
+    SQLConversationReadModel,
+)
+from src.modules.chats.infrastructure.services.export import (  # noqa: E402
+    DOWNLOADERS,
+    NdjsonConversationDownloader,
+)
+
+USER_ID = uuid.uuid4()
+OTHER_USER_ID = uuid.uuid4()
+BASE_TIME = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def conversations():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[MemberDBModel.__table__, ConversationDBModel.__table__, MessageDBModel.__table__]
+    )
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+    foreign_id = str(uuid.uuid4())
+    with factory() as session:
+        for member_id in (USER_ID, OTHER_USER_ID):
+            session.add(MemberDBModel(id=str(member_id), login="login", first_name="First", last_name="Last"))
+        for index, conversation_id in enumerate(ids):
+            conversation = ConversationDBModel(
+                id=conversation_id, title=f"Chat {index}", creator_id=str(USER_ID), chat_id="chat"
+            )
+            conversation.created_at = BASE_TIME + timedelta(days=index)
+            session.add(conversation)
+        session.add(ConversationDBModel(id=foreign_id, title="Foreign", creator_id=str(OTHER_USER_ID), chat_id="chat"))
+        # Chat 0 has many messages, inserted out of order; Chat 2 has none.
+        for index in reversed(range(200)):
+            session.add(
+                MessageDBModel(
+                    content=f"message {index}",
+                    sender_id=str(USER_ID),
+                    conversation_id=ids[0],
+                    timestamp=BASE_TIME + timedelta(seconds=index),
+                )
+            )
+        session.add(MessageDBModel(content="hello", sender_id=str(USER_ID), conversation_id=ids[1], feedback="good"))
+        session.add(MessageDBModel(content="secret", sender_id=str(OTHER_USER_ID), conversation_id=foreign_id))
+        session.commit()
+    yield SQLConversationReadModel(factory), ids, foreign_id
+    engine.dispose()
+
+
+def _export(read_model, export_format, conversation_id=None):
+    handler = ExportConversationsHandler(read_model, DOWNLOADERS)
+    query = ExportConversationsQuery(user_id=USER_ID, conversation_id=conversation_id, format=export_format)
+    return handler.handle(query)
+
+
+class TestConversationExport:
+    def test_ndjson_streams_every_conversation_of_the_user_in_order(self, conversations):
+        read_model, ids, _ = conversations
+
+        export = _export(read_model, ExportFormat.NDJSON)
+        records = [json.loads(line) for line in b"".join(export.chunks).splitlines()]
+
+        assert export.filename == f"conversations-{USER_ID}.ndjson"
+        assert [record["id"] for record in records if record["type"] == "conversation"] == ids
+        messages = [record for record in records if record["type"] == "message"]
+        assert [message["content"] for message in messages[:200]] == [f"message {index}" for index in range(200)]
+        assert messages[200]["conversation_id"] == ids[1]
+        assert messages[200]["feedback"] == "good"
+        assert "secret" not in {message["content"] for message in messages}
+
+    def test_chunks_are_bounded_by_the_chunk_size(self, conversations):
+        read_model, ids, _ = conversations
+        downloader = NdjsonConversationDownloader(chunk_size=1024)
+
+        chunks = list(downloader.download(read_model.iter_transcripts(USER_ID, batch_size=16)))
+
+        assert len(chunks) > 10
+        # A chunk is flushed as soon as it reaches the size, so it overshoots by at most one line.
+        assert max(len(chunk) for chunk in chunks) < 1024 + 300
+
+    def test_zip_holds_one_markdown_file_per_conversation(self, conversations):
+        read_model, ids, _ = conversations
+
+        export = _export(read_model, ExportFormat.ZIP)
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(export.chunks)))
+
+        assert export.media_type == "application/zip"
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert names == [f"Chat {index}-{conversation_id}.md" for index, conversation_id in enumerate(ids)]
+        first = archive.read(names[0]).decode()
+        assert first.startswith("# Chat 0\n")
+        assert first.index("message 0\n") < first.index("message 199\n")
+        assert "> Feedback: good" in archive.read(names[1]).decode()
+        assert archive.read(names[2]).decode().startswith("# Chat 2\n")
+
+    def test_single_conversation_export_is_limited_to_the_owner(self, conversations):
+        read_model, ids, foreign_id = conversations
+
+        export = _export(read_model, ExportFormat.MARKDOWN, conversation_id=uuid.UUID(ids[1]))
+        body = b"".join(export.chunks).decode()
+
+        assert export.filename == f"conversation-{ids[1]}.md"
+        assert body.startswith("# Chat 1\n") and "hello" in body and "Chat 0" not in body
+        assert _export(read_model, ExportFormat.MARKDOWN, conversation_id=uuid.UUID(foreign_id)) is None
+        assert _export(read_model, ExportFormat.MARKDOWN, conversation_id=uuid.uuid4()) is None
+
+    def test_abandoning_the_download_closes_the_session(self, conversations):
+        read_model, _, _ = conversations
+        sessions, closed = [], []
+
+        def session_factory():
+            session = read_model._session_factory()
+            sessions.append(session)
+            close = session.close
+            session.close = lambda: (closed.append(session), close())
+            return session
+
+        handler = ExportConversationsHandler(
+            SQLConversationReadModel(session_factory),
+            {ExportFormat.NDJSON: NdjsonConversationDownloader(chunk_size=1024)},
+        )
+        export = handler.handle(ExportConversationsQuery(user_id=USER_ID, format=ExportFormat.NDJSON))
+
+        next(export.chunks)
+        assert len(sessions) == 1 and closed == []
+        export.chunks.close()
+
+        assert closed == sessions
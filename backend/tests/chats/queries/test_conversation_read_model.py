@@ -0,0 +1,114 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.database.models import Base  # noqa: E402
+from src.modules.chats.application.queries.list_user_conversations.query import ConversationSortField  # noqa: E402
+from src.modules.chats.infrastructure.persistence.orm.model import (  # noqa: E402
+    ConversationDBModel,
+    ConversationSummaryDBModel,
+    MemberDBModel,
+    MessageDBModel,
+)
+from src.modules.chats.infrastructure.persistence.read_models.conversation_summary_projector import (  # noqa: E402
+    ConversationSummaryProjector,
+)
+from src.modules.chats.infrastructure.persistence.read_models.sql_conversation_read_model import (  # noqa: E402
+    SQLConversationReadModel,
+)
+
+USER_ID = uuid.uuid4()
+OTHER_USER_ID = uuid.uuid4()
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            MemberDBModel.__table__,
+            ConversationDBModel.__table__,
+            MessageDBModel.__table__,
+            ConversationSummaryDBModel.__table__,
+        ],
+    )
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with factory() as session:
+        for member_id in (USER_ID, OTHER_USER_ID):
+            session.add(MemberDBModel(id=str(member_id), login="login", first_name="First", last_name="Last"))
+        for index in range(5):
+            conversation = ConversationDBModel(
+                id=str(uuid.uuid4()),
+                title=f"Conversation {index}",
+                creator_id=str(USER_ID),
+                chat_id="chat",
+                is_archived=index == 4,
+            )
+            conversation.created_at = base_time + timedelta(minutes=index)
+            conversation.updated_at = base_time + timedelta(minutes=index)
+            session.add(conversation)
+        session.add(
+            ConversationDBModel(id=str(uuid.uuid4()), title="Foreign", creator_id=str(OTHER_USER_ID), chat_id="chat")
+        )
+        session.commit()
+    ConversationSummaryProjector(factory).rebuild()
+    yield factory
+    engine.dispose()
+
+
+def _list(read_model, **overrides):
+    params = {
+        "limit": 2,
+        "offset": 0,
+        "sort_by": ConversationSortField.LAST_ACTIVITY_AT,
+        "descending": True,
+        "include_archived": True,
+    }
+    params.update(overrides)
+    return read_model.list_summaries(USER_ID, **params)
+
+
+class TestSQLConversationReadModel:
+    def test_page_carries_total_count(self, session_factory):
+        page = _list(SQLConversationReadModel(session_factory))
+
+        assert page.total == 5
+        assert [item.title for item in page.items] == ["Conversation 4", "Conversation 3"]
+
+    def test_sorting_and_offset(self, session_factory):
+        read_model = SQLConversationReadModel(session_factory)
+
+        page = _list(read_model, sort_by=ConversationSortField.TITLE, descending=False, offset=2)
+
+        assert [item.title for item in page.items] == ["Conversation 2", "Conversation 3"]
+
+    def test_excluding_archived(self, session_factory):
+        page = _list(SQLConversationReadModel(session_factory), limit=10, include_archived=False)
+
+        assert page.total == 4
+        assert all(not item.is_archived for item in page.items)
+
+    def test_offset_past_last_page_still_reports_total(self, session_factory):
+        page = _list(SQLConversationReadModel(session_factory), offset=50)
+
+        assert page.items == ()
+        assert page.total == 5
+
+    def test_details(self, session_factory):
+        read_model = SQLConversationReadModel(session_factory)
+        summary = _list(read_model, limit=1).items[0]
+
+        details = read_model.get_details(uuid.UUID(summary.id))
+
+        assert details.title == summary.title
+        assert details.creator_id == str(USER_ID)
+        assert read_model.get_details(uuid.uuid4()) is None
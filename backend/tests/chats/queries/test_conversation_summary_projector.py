@@ -0,0 +1,189 @@
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.building_blocks.infrastructure.event_bus import EventBus  # noqa: E402
+from src.database.models import Base  # noqa: E402
+from src.modules.chats.domain.conversations.conversation import Conversation  # noqa: E402
+from src.modules.chats.domain.conversations.events import (  # noqa: E402
+    ConversationArchivedEvent,
+    ConversationCreatedEvent,
+    ConversationDeletedEvent,
+    ConversationTitleUpdatedEvent,
+)
+from src.modules.chats.domain.members.value_objects.member_id import MemberId  # noqa: E402
+from src.modules.chats.domain.messages.events import MessageCreatedEvent  # noqa: E402
+from src.modules.chats.infrastructure.persistence.orm.model import (  # noqa: E402
+    ConversationDBModel,
+    ConversationSummaryDBModel,
+    MemberDBModel,
+    MessageDBModel,
+)
+from src.modules.chats.infrastructure.persistence.read_models.conversation_summary_projector import (  # noqa: E402
+    PREVIEW_LENGTH,
+    ConversationSummaryProjector,
+)
+from src.modules.chats.infrastructure.persistence.repositories.sql_conversation_repo import (  # noqa: E402
+    SQLConversationRepository,
+)
+
+CREATOR_ID = uuid.uuid4()
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            MemberDBModel.__table__,
+            ConversationDBModel.__table__,
+            MessageDBModel.__table__,
+            ConversationSummaryDBModel.__table__,
+        ],
+    )
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def event_bus(session_factory):
+    bus = EventBus()
+    ConversationSummaryProjector(session_factory).subscribe(bus)
+    return bus
+
+
+def _summary(session_factory, conversation_id):
+    with session_factory() as session:
+        return session.execute(
+            select(ConversationSummaryDBModel).where(ConversationSummaryDBModel.id == str(conversation_id))
+        ).scalar_one_or_none()
+
+
+def _message_created(conversation_id, text="Hello"):
+    return MessageCreatedEvent(
+        message_id=uuid.uuid4(), conversation_id=conversation_id, sender_id=CREATOR_ID, text=text, response="Hi"
+    )
+
+
+class TestConversationSummaryProjector:
+    def test_events_maintain_summary_row(self, session_factory, event_bus):
+        conversation_id = uuid.uuid4()
+
+        event_bus.publish(ConversationCreatedEvent(conversation_id=conversation_id, creator_id=CREATOR_ID, title="A"))
+        event_bus.publish(_message_created(conversation_id, text="first"))
+        event_bus.publish(_message_created(conversation_id, text="x" * (PREVIEW_LENGTH + 10)))
+        event_bus.publish(ConversationTitleUpdatedEvent(conversation_id=conversation_id, new_title="B"))
+        event_bus.publish(ConversationArchivedEvent(conversation_id=conversation_id))
+
+        summary = _summary(session_factory, conversation_id)
+        assert summary.title == "B"
+        assert summary.is_archived is True
+        assert summary.message_count == 2
+        assert summary.last_message_preview == "x" * PREVIEW_LENGTH
+        assert summary.creator_id == str(CREATOR_ID)
+
+    def test_deleted_conversation_drops_summary(self, session_factory, event_bus):
+        conversation_id = uuid.uuid4()
+        event_bus.publish(ConversationCreatedEvent(conversation_id=conversation_id, creator_id=CREATOR_ID, title="A"))
+
+        event_bus.publish(ConversationDeletedEvent(conversation_id=conversation_id))
+
+        assert _summary(session_factory, conversation_id) is None
+
+    def test_duplicate_created_event_leaves_the_row_as_it_is(self, session_factory, event_bus):
+        conversation_id = uuid.uuid4()
+        created = ConversationCreatedEvent(conversation_id=conversation_id, creator_id=CREATOR_ID, title="A")
+        event_bus.publish(created)
+        event_bus.publish(_message_created(conversation_id))
+
+        event_bus.publish(created)
+
+        summary = _summary(session_factory, conversation_id)
+        assert (summary.title, summary.message_count) == ("A", 1)
+
+    def test_created_event_after_a_rebuild_does_not_fail(self, session_factory, event_bus):
+        conversation_id = str(uuid.uuid4())
+        with session_factory() as session:
+            session.add(ConversationDBModel(id=conversation_id, title="A", creator_id=str(CREATOR_ID), chat_id="c"))
+            session.add(MessageDBModel(id=str(uuid.uuid4()), content="first", conversation_id=conversation_id))
+            session.commit()
+        # Delivered out of order: the message event finds no row and rebuilds it first.
+        event_bus.publish(_message_created(uuid.UUID(conversation_id)))
+
+        event_bus.publish(
+            ConversationCreatedEvent(conversation_id=uuid.UUID(conversation_id), creator_id=CREATOR_ID, title="A")
+        )
+
+        summary = _summary(session_factory, conversation_id)
+        assert (summary.title, summary.message_count) == ("A", 1)
+
+    def test_rebuild_backfills_from_source_tables(self, session_factory):
+        conversation_id = str(uuid.uuid4())
+        with session_factory() as session:
+            session.add(MemberDBModel(id=str(CREATOR_ID), login="login", first_name="First", last_name="Last"))
+            session.add(ConversationDBModel(id=conversation_id, title="Old", creator_id=str(CREATOR_ID), chat_id="c"))
+            session.add_all(
+                MessageDBModel(id=str(uuid.uuid4()), content=f"message {index}", conversation_id=conversation_id)
+                for index in range(3)
+            )
+            session.commit()
+
+        written = ConversationSummaryProjector(session_factory).rebuild()
+
+        summary = _summary(session_factory, conversation_id)
+        assert written == 1
+        assert summary.title == "Old"
+        assert summary.message_count == 3
+        assert summary.last_activity_at is not None
+
+    def test_event_for_missing_row_triggers_targeted_rebuild(self, session_factory, event_bus):
+        conversation_id = str(uuid.uuid4())
+        with session_factory() as session:
+            session.add(
+                ConversationDBModel(id=conversation_id, title="Legacy", creator_id=str(CREATOR_ID), chat_id="c")
+            )
+            session.commit()
+
+        event_bus.publish(ConversationArchivedEvent(conversation_id=uuid.UUID(conversation_id)))
+
+        summary = _summary(session_factory, conversation_id)
+        assert summary.title == "Legacy"
+
+
+class TestProjectorThroughRepository:
+    @pytest.fixture
+    def repository(self, session_factory, event_bus):
+        with session_factory() as session:
+            session.add(MemberDBModel(id=str(CREATOR_ID), login="login", first_name="First", last_name="Last"))
+            session.commit()
+        return SQLConversationRepository(session_factory, event_bus)
+
+    def test_archiving_an_aggregate_updates_its_summary(self, session_factory, repository):
+        conversation = Conversation.create(creator_id=MemberId(_value=CREATOR_ID), creator_name="First", title="A")
+        repository.save(conversation)
+
+        conversation.archive()
+        repository.update(conversation)
+
+        assert _summary(session_factory, conversation.id).is_archived is True
+
+    def test_repository_deletes_drop_summaries(self, session_factory, repository):
+        first, second = (
+            Conversation.create(creator_id=MemberId(_value=CREATOR_ID), creator_name="First", title=title)
+            for title in ("A", "B")
+        )
+        repository.save(first)
+        repository.save(second)
+
+        repository.delete(str(first.id))
+        assert _summary(session_factory, first.id) is None
+        assert _summary(session_factory, second.id) is not None
+
+        repository.delete_all(str(CREATOR_ID))
+        assert _summary(session_factory, second.id) is None
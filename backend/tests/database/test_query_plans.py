@@ -0,0 +1,202 @@
+"""
+Query-plan regression suite for hot repository paths.
+
+Each test runs a real repository/read-model call against an in-memory SQLite
+database built from the ORM metadata, captures the SQL it emits and runs
+``EXPLAIN QUERY PLAN`` on it. A hot table that is read with a plain ``SCAN``
+(no index) fails the test, so dropping or mis-declaring an index is caught
+before it reaches production.
+"""
+
+import re
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.building_blocks.infrastructure.event_bus import EventBus  # noqa: E402
+from src.building_blocks.infrastructure.outbox_relay import OutboxRelay  # noqa: E402
+from src.building_blocks.infrastructure.sql_outbox import SQLOutbox  # noqa: E402
+from src.database.models import Base  # noqa: E402
+from src.modules.accounts.domain.account.value_objects.account_id import AccountId  # noqa: E402
+from src.modules.accounts.domain.session.value_objects.refresh_token_digest import RefreshTokenDigest  # noqa: E402
+from src.modules.accounts.infrastructure.persistence.orm.models import AccountModel, SessionModel  # noqa: E402
+from src.modules.accounts.infrastructure.persistence.repositories.sql_session_repo import (  # noqa: E402
+    SQLSessionRepository,
+)
+from src.modules.chats.application.queries.list_user_conversations.query import ConversationSortField  # noqa: E402
+from src.modules.chats.infrastructure.persistence.orm.model import (  # noqa: E402
+    ConversationDBModel,
+    MemberDBModel,
+    MessageDBModel,
+)
+from src.modules.chats.infrastructure.persistence.read_models.conversation_summary_projector import (  # noqa: E402
+    ConversationSummaryProjector,
+)
+from src.modules.chats.infrastructure.persistence.read_models.sql_conversation_read_model import (  # noqa: E402
+    SQLConversationReadModel,
+)
+from src.modules.chats.infrastructure.persistence.repositories.sql_conversation_repo import (  # noqa: E402
+    SQLConversationRepository,
+)
+
+HOT_TABLES = {"conversations", "messages", "conversation_summaries", "sessions", "accounts", "outbox_messages"}
+FULL_SCAN = re.compile(r"^SCAN (?P<table>\w+)(?: AS \w+)?$")
+
+ACCOUNT_UUID = uuid.uuid4()
+MEMBER_ID = str(uuid.uuid4())
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def session_factory(engine):
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    now = datetime.now(timezone.utc)
+    with factory() as session:
+        session.add(MemberDBModel(id=MEMBER_ID, login="login", first_name="First", last_name="Last"))
+        for index in range(20):
+            conversation_id = str(uuid.uuid4())
+            session.add(ConversationDBModel(id=conversation_id, title=f"C{index}", creator_id=MEMBER_ID, chat_id="c"))
+            session.add_all(
+                MessageDBModel(
+                    id=str(uuid.uuid4()),
+                    content="hello",
+                    sender_id=MEMBER_ID,
+                    conversation_id=conversation_id,
+                    timestamp=now + timedelta(seconds=offset),
+                )
+                for offset in range(5)
+            )
+        account = AccountModel(uuid=str(ACCOUNT_UUID), email="user@example.com")
+        session.add(account)
+        session.flush()
+        session.add_all(
+            SessionModel(
+                session_uuid=str(uuid.uuid4()),
+                account_id=account.id,
+                refresh_token_hash=uuid.uuid4().hex,
+                expires_at=now + timedelta(days=1),
+                is_active=index % 2 == 0,
+            )
+            for index in range(10)
+        )
+        session.commit()
+    ConversationSummaryProjector(factory).rebuild()
+    return factory
+
+
+@contextmanager
+def captured_statements(engine):
+    statements: list[tuple[str, tuple]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def full_scans(engine, statements) -> list[str]:
+    offenders = []
+    with engine.connect() as connection:
+        raw = connection.connection.driver_connection
+        for statement, parameters in statements:
+            for *_, detail in raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall():
+                match = FULL_SCAN.match(detail)
+                if match and match.group("table") in HOT_TABLES:
+                    offenders.append(f"{detail}  <-  {statement}")
+    return offenders
+
+
+def assert_indexed(engine, call) -> None:
+    with captured_statements(engine) as statements:
+        call()
+    assert statements, "the call emitted no SQL to explain"
+    offenders = full_scans(engine, statements)
+    assert not offenders, "hot query fell back to a full table scan:\n" + "\n".join(offenders)
+
+
+class TestChatsQueryPlans:
+    def test_find_all_conversations_for_creator(self, engine, session_factory):
+        assert_indexed(engine, lambda: SQLConversationRepository(session_factory).find_all(MEMBER_ID))
+
+    def test_count_conversations_for_creator(self, engine, session_factory):
+        assert_indexed(engine, lambda: SQLConversationRepository(session_factory).count(MEMBER_ID))
+
+    def test_list_conversation_summaries(self, engine, session_factory):
+        read_model = SQLConversationReadModel(session_factory)
+        assert_indexed(
+            engine,
+            lambda: read_model.list_summaries(
+                uuid.UUID(MEMBER_ID),
+                limit=20,
+                offset=0,
+                sort_by=ConversationSortField.LAST_ACTIVITY_AT,
+                descending=True,
+                include_archived=True,
+            ),
+        )
+
+    def test_targeted_summary_rebuild(self, engine, session_factory):
+        with session_factory() as session:
+            conversation_id = session.query(ConversationDBModel.id).first().id
+        assert_indexed(engine, lambda: ConversationSummaryProjector(session_factory).rebuild([conversation_id]))
+
+    def test_messages_by_sender(self, engine, session_factory):
+        def load():
+            with session_factory() as session:
+                session.query(MessageDBModel).filter(MessageDBModel.sender_id == MEMBER_ID).all()
+
+        assert_indexed(engine, load)
+
+
+class TestAccountsQueryPlans:
+    def test_list_sessions_for_account(self, engine, session_factory):
+        repository = SQLSessionRepository(session_factory)
+        assert_indexed(engine, lambda: repository.list_for_account(AccountId(ACCOUNT_UUID)))
+
+    def test_revoke_all_sessions_for_account(self, engine, session_factory):
+        repository = SQLSessionRepository(session_factory)
+        assert_indexed(engine, lambda: repository.revoke_all_for_account(AccountId(ACCOUNT_UUID)))
+
+    def test_session_by_refresh_token_digest(self, engine, session_factory):
+        with session_factory() as session:
+            digest = session.query(SessionModel.refresh_token_hash).first().refresh_token_hash
+        repository = SQLSessionRepository(session_factory)
+        assert_indexed(engine, lambda: repository.get_by_refresh_token(RefreshTokenDigest(value=digest)))
+
+    def test_session_by_retired_refresh_token_digest(self, engine, session_factory):
+        repository = SQLSessionRepository(session_factory)
+        assert_indexed(engine, lambda: repository.get_by_retired_refresh_token(RefreshTokenDigest.of("unknown")))
+
+    def test_sweep_inactive_sessions(self, engine, session_factory):
+        long_ago = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        repository = SQLSessionRepository(session_factory)
+        assert_indexed(engine, lambda: repository.purge_inactive(long_ago, long_ago, limit=100))
+
+
+class TestOutboxQueryPlans:
+    def test_claim_pending_outbox_batch(self, engine, session_factory):
+        relay = OutboxRelay(SQLOutbox(session_factory), EventBus(), event_types=[])
+        assert_indexed(engine, relay.relay_once)
+
+    def test_purge_expired_outbox_messages(self, engine, session_factory):
+        relay = OutboxRelay(SQLOutbox(session_factory), EventBus(), event_types=[])
+        assert_indexed(engine, relay.purge_once)
@@ -0,0 +1,136 @@
+import copy
+
+from src.building_blocks.infrastructure.pipeline import Pipeline, PipelineStage
+from src.modules.chats.infrastructure.configuration.processing.json.jsonl_store import JsonLinesStore
+from src.modules.llm_backend.application.generation.pipelines.conversation_memory import (
+    ConversationTurnRecorderStage,
+    ConversationWindowStage,
+)
+from src.modules.llm_backend.infrastructure.configuration.di.containers import ProcessingDIContainer
+from src.modules.llm_backend.infrastructure.processing.formatters import LlamaFormatter, QwenModelInputFormatter
+from src.modules.llm_backend.infrastructure.processing.memory import ConversationMemory, ExtractiveSummarizer
+
+
+class CountingSummarizer(ExtractiveSummarizer):
+    def __init__(self, max_tokens):
+        super().__init__(max_tokens)
+        self.calls = 0
+
+    def __call__(self, summary, turns):
+        self.calls += 1
+        return super().__call__(summary, turns)
+
+
+class TemplateTokenizer:
+    def apply_chat_template(self, messages, tokenize, add_generation_prompt):
+        return messages
+
+
+class WordTokenizer:
+    def encode(self, text, add_special_tokens=True):
+        return text.split()
+
+
+class EchoStage(PipelineStage):
+    """Stands in for prompt formatting and generation: notes the window it was given and answers."""
+
+    def __init__(self):
+        self.windows = []
+
+    def process(self, data):
+        self.windows.append(data.get("conversation_window"))
+        data["formatted_final_response"] = f"Answer to {data['prompt']}"
+        return data
+
+
+def _turn(index):
+    return f"Question {index}? Some more detail here. " * 3, f"Answer {index}. With an explanation. " * 6
+
+
+class TestConversationMemory:
+    def test_window_stays_within_budget_and_folds_in_batches(self):
+        summarizer = CountingSummarizer(max_tokens=120)
+        memory = ConversationMemory(window_tokens=600, summary_tokens=120, summarizer=summarizer)
+
+        for index in range(200):
+            window = memory.add_turn("c1", *_turn(index))
+            assert window.tokens <= 600 + 120
+
+        assert window.folded_turns + len(window.turns) == 200
+        assert window.turns[-1].question.startswith("Question 199?")
+        assert window.summary.splitlines()[-1].startswith(f"- User asked: Question {window.folded_turns - 1}?")
+        # Folding down to 60% of the budget leaves room for several turns before the next fold.
+        assert summarizer.calls < 200 / 3
+        assert memory.window("other").turns == ()
+
+    def test_windows_persist_through_the_store(self, tmp_path):
+        with JsonLinesStore(str(tmp_path)) as store:
+            memory = ConversationMemory(store, window_tokens=300, summary_tokens=80)
+            for index in range(20):
+                expected = memory.add_turn("c1", *_turn(index))
+
+        with JsonLinesStore(str(tmp_path)) as store:
+            restored = ConversationMemory(store, window_tokens=300, summary_tokens=80).window("c1")
+            assert restored == expected
+            ConversationMemory(store).clear("c1")
+            assert not store.file_exists("memory_c1")
+
+    def test_summaries_from_a_model_are_held_to_the_budget(self):
+        memory = ConversationMemory(
+            window_tokens=100, summary_tokens=50, summarizer=lambda summary, turns: "word " * 500
+        )
+        for index in range(10):
+            window = memory.add_turn("c1", *_turn(index))
+        assert window.summary_tokens <= 50
+
+
+class TestFormattersWithHistory:
+    def test_llama_formatter_leaves_the_history_untouched(self):
+        history = [{"question": "What is x?", "answer": "A variable."}, {"question": "And y?", "answer": "Another."}]
+        before = copy.deepcopy(history)
+        formatter = LlamaFormatter(tokenizer=None)
+
+        first = formatter.format("And z?", "ctx", history, summary="- User asked: hello")
+        second = formatter.format("And z?", "ctx", history, summary="- User asked: hello")
+
+        assert history == before
+        assert first == second
+        assert first.count("Please always format variable names") == 1
+        assert "Summary of the earlier conversation:\n- User asked: hello" in first
+        assert first.endswith("User: And y?\n\nAssistant: Another.\n\nUser: And z?\n\nAssistant:")
+
+    def test_qwen_formatter_carries_summary_and_turns(self):
+        memory = ConversationMemory(window_tokens=10_000)
+        window = memory.add_turn("c1", "What is x?", "A variable.")
+
+        messages = QwenModelInputFormatter(TemplateTokenizer()).format("And y?", "ctx", window.chat_history())
+
+        assert [message["role"] for message in messages] == ["system", "system", "user", "assistant", "user"]
+        assert messages[-1]["content"] == "And y?"
+
+
+class TestConversationMemoryWiring:
+    def test_container_builds_a_persisted_memory_counting_with_the_tokenizer(self, tmp_path):
+        container = ProcessingDIContainer(
+            config={"store_dir": str(tmp_path), "window_tokens": 64}, tokenizer=WordTokenizer()
+        )
+        memory = container.conversation_memory()
+
+        window = memory.add_turn("c1", "one two three", "four five")
+        container.shutdown_resources()
+
+        assert (memory.window_tokens, window.tokens) == (64, 5)
+        with JsonLinesStore(str(tmp_path)) as store:
+            assert store.file_exists("memory_c1")
+
+    def test_pipeline_loads_the_window_before_the_prompt_and_records_the_turn(self):
+        memory = ConversationMemory()
+        echo = EchoStage()
+        pipeline = Pipeline([ConversationWindowStage(memory), echo, ConversationTurnRecorderStage(memory)])
+
+        pipeline.run({"conversation_id": "c1", "prompt": "first"})
+        pipeline.run({"conversation_id": "c1", "prompt": "second"})
+
+        assert echo.windows[0].turns == ()
+        assert echo.windows[1].chat_history() == [{"question": "first", "answer": "Answer to first"}]
+        assert [turn.question for turn in memory.window("c1").turns] == ["first", "second"]
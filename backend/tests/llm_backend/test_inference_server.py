@@ -0,0 +1,200 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.modules.llm_backend.infrastructure.inference import (
+    InferenceClient,
+    InferenceError,
+    InferenceServer,
+    InferenceWorker,
+    StubBackend,
+)
+from src.modules.llm_backend.infrastructure.inference.protocol import read_frame, write_frame
+
+
+class GatedBackend(StubBackend):
+    """Stays loading until ``loaded`` is set, so the probes can be observed during warm-up."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.loaded = threading.Event()
+
+    def load(self) -> None:
+        self.loaded.wait(5)
+
+
+class FailingBackend(StubBackend):
+    def stream(self, prompt, params, cancelled):
+        yield "partial"
+        raise ValueError("out of memory")
+
+
+async def serving(server: InferenceServer) -> asyncio.Task:
+    task = asyncio.create_task(server.serve())
+    while not server.socket_path.exists():
+        await asyncio.sleep(0.01)
+    return task
+
+
+async def shut_down(server: InferenceServer, task: asyncio.Task) -> None:
+    server.stop()
+    await task
+
+
+def test_streams_chunks_in_order(tmp_path):
+    async def scenario():
+        server = InferenceServer(StubBackend(), tmp_path / "llm.sock")
+        task = await serving(server)
+        client = InferenceClient(server.socket_path)
+        try:
+            while not await client.ready():
+                await asyncio.sleep(0.01)
+            chunks = [chunk async for chunk in client.stream("how do I reset my password")]
+            truncated = await client.generate("how do I reset my password", max_new_tokens=3)
+        finally:
+            await shut_down(server, task)
+        return chunks, truncated, server.metrics
+
+    chunks, truncated, metrics = asyncio.run(scenario())
+
+    assert chunks == ["how", " do", " I", " reset", " my", " password"]
+    assert truncated == "how do I"
+    assert metrics.completed == 2
+    assert not (tmp_path / "llm.sock").exists()
+
+
+def test_health_answers_while_loading_and_generate_waits_for_readiness(tmp_path):
+    async def scenario():
+        backend = GatedBackend()
+        server = InferenceServer(backend, tmp_path / "llm.sock")
+        task = await serving(server)
+        client = InferenceClient(server.socket_path)
+        try:
+            health = await client.health()
+            ready_while_loading = await client.ready()
+            with pytest.raises(InferenceError, match="still loading"):
+                await client.generate("hello")
+            backend.loaded.set()
+            while not await client.ready():
+                await asyncio.sleep(0.01)
+            reply = await client.generate("hello")
+        finally:
+            backend.loaded.set()
+            await shut_down(server, task)
+        return health, ready_while_loading, reply
+
+    health, ready_while_loading, reply = asyncio.run(scenario())
+
+    assert health["status"] == "ok" and health["backend"] == "stub"
+    assert ready_while_loading is False
+    assert reply == "hello"
+
+
+def test_backend_errors_reach_the_client(tmp_path):
+    async def scenario():
+        server = InferenceServer(FailingBackend(), tmp_path / "llm.sock")
+        task = await serving(server)
+        client = InferenceClient(server.socket_path)
+        received = []
+        try:
+            while not await client.ready():
+                await asyncio.sleep(0.01)
+            with pytest.raises(InferenceError, match="out of memory"):
+                async for chunk in client.stream("anything"):
+                    received.append(chunk)
+        finally:
+            await shut_down(server, task)
+        return received, server.metrics
+
+    received, metrics = asyncio.run(scenario())
+
+    assert received == ["partial"]
+    assert metrics.failed == 1
+
+
+def test_malformed_requests_get_an_error_frame(tmp_path):
+    async def send(socket_path, request):
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        try:
+            await write_frame(writer, request)
+            return await read_frame(reader)
+        finally:
+            writer.close()
+
+    async def scenario():
+        server = InferenceServer(StubBackend(), tmp_path / "llm.sock")
+        task = await serving(server)
+        client = InferenceClient(server.socket_path)
+        try:
+            while not await client.ready():
+                await asyncio.sleep(0.01)
+            replies = [
+                await send(server.socket_path, request)
+                for request in ({"op": "generate"}, {"op": "generate", "prompt": "hi", "params": [1]}, ["generate"])
+            ]
+            still_serving = await client.generate("still serving")
+        finally:
+            await shut_down(server, task)
+        return replies, still_serving, server.metrics
+
+    replies, still_serving, metrics = asyncio.run(scenario())
+
+    assert "Malformed generate request" in replies[0]["error"]
+    assert "Malformed generate request" in replies[1]["error"]
+    assert "Unknown op" in replies[2]["error"]
+    assert still_serving == "still serving"
+    assert metrics.completed == 1 and metrics.failed == 0
+
+
+def test_disconnecting_client_cancels_generation(tmp_path):
+    async def scenario():
+        server = InferenceServer(StubBackend(chunk_seconds=0.01), tmp_path / "llm.sock")
+        task = await serving(server)
+        client = InferenceClient(server.socket_path)
+        try:
+            while not await client.ready():
+                await asyncio.sleep(0.01)
+            stream = client.stream(" ".join(["word"] * 1000))
+            await anext(stream)
+            await stream.aclose()
+            while server.metrics.in_flight:
+                await asyncio.sleep(0.01)
+        finally:
+            await shut_down(server, task)
+        return server.metrics
+
+    metrics = asyncio.run(scenario())
+
+    assert metrics.cancelled == 1
+    assert metrics.completed == 0
+
+
+def test_unreachable_server():
+    async def scenario():
+        client = InferenceClient("/nonexistent/llm.sock", connect_timeout=0.5)
+        with pytest.raises(InferenceError, match="unreachable"):
+            await client.health()
+        return await client.ready()
+
+    assert asyncio.run(scenario()) is False
+
+
+def test_worker_process_serves_api_side_clients(tmp_path):
+    worker = InferenceWorker(tmp_path / "llm.sock", backend="stub")
+    worker.start()
+    try:
+
+        async def scenario():
+            await worker.wait_ready(timeout=30)
+            clients = [InferenceClient(worker.socket_path) for _ in range(4)]
+            replies = await asyncio.gather(*(client.generate("ping pong") for client in clients))
+            return replies, await worker.client.health()
+
+        replies, health = asyncio.run(scenario())
+    finally:
+        worker.stop()
+
+    assert replies == ["ping pong"] * 4
+    assert health["pid"] == worker.pid
+    assert not worker.is_alive()
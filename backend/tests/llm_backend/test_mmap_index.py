@@ -0,0 +1,80 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.modules.llm_backend.infrastructure.configuration.di.containers import SearchDIContainer
+from src.modules.llm_backend.infrastructure.processing.mmap_index import (
+    MmapVectorIndex,
+    MmapVectorSearchEngine,
+    write_mmap_index,
+)
+
+
+class FakeEmbeddingModel:
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self.vectors = vectors
+
+    def get_query_embedding(self, query: str) -> list[float]:
+        return self.vectors[query]
+
+
+@pytest.fixture
+def corpus():
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(500, 16)).astype(np.float32)
+    texts = [f"node {i} – café №{i}" for i in range(500)]
+    sources = [f"doc_{i % 7}.md" for i in range(500)]
+    return embeddings, texts, sources
+
+
+def test_search_matches_brute_force_cosine(tmp_path, corpus):
+    embeddings, texts, sources = corpus
+    write_mmap_index(tmp_path / "index", embeddings, texts, sources)
+    index = MmapVectorIndex.open(tmp_path / "index")
+    query = np.random.default_rng(1).normal(size=16)
+
+    results = index.search(query, top_k=5)
+
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    expected = np.argsort(scores)[::-1][:5]
+    assert [(source, text) for source, text, _ in results] == [(sources[i], texts[i]) for i in expected]
+    assert [score for *_, score in results] == pytest.approx(scores[expected].tolist(), rel=1e-5)
+
+
+def test_views_are_read_only_maps_of_the_files(tmp_path, corpus):
+    write_mmap_index(tmp_path / "index", *corpus)
+    index = MmapVectorIndex.open(tmp_path / "index")
+
+    assert len(index) == 500
+    assert index.text(42) == "node 42 – café №42"
+    assert index.source(42) == "doc_0.md"
+    assert not index.embeddings.flags.writeable
+    with pytest.raises(ValueError):
+        index.embeddings[0, 0] = 1.0
+
+
+def test_rewriting_replaces_the_index_and_empty_indexes_open(tmp_path, corpus):
+    write_mmap_index(tmp_path / "index", *corpus)
+    write_mmap_index(tmp_path / "index", np.zeros((0, 16), dtype=np.float32), [], [])
+
+    index = MmapVectorIndex.open(tmp_path / "index")
+
+    assert len(index) == 0
+    assert index.search(np.ones(16)) == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["index"]
+
+
+def test_container_selects_the_mmap_search_engine(tmp_path, corpus):
+    embeddings, texts, sources = corpus
+    write_mmap_index(tmp_path / "index", embeddings, texts, sources)
+    container = SearchDIContainer(
+        embedding_model=FakeEmbeddingModel({"question": embeddings[7].tolist()}),
+        sentence_splitter=object(),
+    )
+    container.config.from_dict({"index_format": "mmap", "mmap_index_dir": str(tmp_path / "index"), "top_k": 3})
+
+    engine = container.search_engine()
+
+    assert isinstance(engine, MmapVectorSearchEngine)
+    assert engine.find_similar("question")[0][:2] == (sources[7], texts[7])
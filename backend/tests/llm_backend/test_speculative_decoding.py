@@ -0,0 +1,81 @@
+import copy
+
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from src.modules.llm_backend.infrastructure.processing.speculative import (  # noqa: E402
+    ForwardPassCounter,
+    assisted_generation_kwargs,
+    check_draft_model,
+)
+
+VOCAB = 128
+
+
+def tiny_model(hidden_size: int, layers: int, vocab_size: int = VOCAB, seed: int = 0):
+    torch.manual_seed(seed)
+    config = transformers.LlamaConfig(
+        vocab_size=vocab_size,
+        hidden_size=hidden_size,
+        intermediate_size=hidden_size * 2,
+        num_hidden_layers=layers,
+        num_attention_heads=4,
+        num_key_value_heads=4,
+        max_position_embeddings=256,
+        # No end-of-sequence token, so every run produces max_new_tokens.
+        eos_token_id=None,
+        pad_token_id=0,
+    )
+    return transformers.LlamaForCausalLM(config).eval()
+
+
+class VocabTokenizer:
+    def __init__(self, vocab: dict[str, int]) -> None:
+        self.vocab = vocab
+
+    def get_vocab(self) -> dict[str, int]:
+        return dict(self.vocab)
+
+
+def _generate(model, input_ids, **kwargs):
+    with torch.no_grad():
+        return model.generate(input_ids, attention_mask=torch.ones_like(input_ids), max_new_tokens=24, **kwargs)
+
+
+class TestSpeculativeDecoding:
+    def test_greedy_output_is_identical_with_a_draft_model(self):
+        target, draft = tiny_model(64, 4, seed=0), tiny_model(32, 1, seed=1)
+        input_ids = torch.randint(1, VOCAB, (1, 12), generator=torch.Generator().manual_seed(2))
+
+        plain = _generate(target, input_ids, do_sample=False)
+        speculative = _generate(target, input_ids, do_sample=False, **assisted_generation_kwargs(draft, 4))
+
+        assert torch.equal(plain, speculative)
+
+    def test_accepted_proposals_save_target_passes(self):
+        target = tiny_model(64, 2)
+        # A draft that always agrees: every proposal is accepted.
+        draft = copy.deepcopy(target)
+        input_ids = torch.randint(1, VOCAB, (1, 8), generator=torch.Generator().manual_seed(3))
+
+        with ForwardPassCounter(target) as plain_passes:
+            plain = _generate(target, input_ids, do_sample=False)
+        speculation = assisted_generation_kwargs(draft, 4, schedule="constant", confidence_threshold=0.0)
+        with ForwardPassCounter(target) as speculative_passes:
+            speculative = _generate(target, input_ids, do_sample=False, **speculation)
+
+        assert torch.equal(plain, speculative)
+        assert plain_passes.calls == 24
+        # Up to 4 proposed tokens and 1 of the target's own per pass.
+        assert speculative_passes.calls <= 24 // 5 + 2
+
+    def test_draft_must_share_the_tokenizer_not_the_padded_vocab_size(self):
+        shared = {f"token{index}": index for index in range(VOCAB)}
+
+        # Only the tokenizers count, so checkpoints padding their embeddings differently still pair.
+        check_draft_model(VocabTokenizer(shared), VocabTokenizer(dict(shared)))
+        with pytest.raises(ValueError):
+            check_draft_model(VocabTokenizer(shared), VocabTokenizer({**shared, "extra": VOCAB}))
+        assert assisted_generation_kwargs(None) == {}